@@ -0,0 +1,537 @@
+"""The `dsi` command-line tool for parsing and validating the semantic manifest in a directory of YAML files.
+
+Subcommands:
+* `validate`: parses, transforms and validates the manifest, and prints the issues as text, JSON or JSON lines. Exits
+  with 1 if there are errors.
+* `parse`: parses and transforms the manifest, and writes it as JSON.
+* `stats`: prints the number of objects in the manifest, and optionally how much memory they use.
+* `watch`: validates the manifest whenever the files change, and prints the issues that were found or resolved.
+* `bench`: runs the benchmarks in `test_helpers.manifest_benchmarks` on synthetic manifests.
+
+The files can be parsed in parallel with `--jobs`, and the results of parsing each file can be cached in a directory
+with `--cache-dir`, so that only the files that changed are parsed on the next run. e.g.:
+
+    dsi validate path/to/semantic_models --template-variable source_schema=prod --jobs 4 --cache-dir .dsi_cache \
+        --format jsonl
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import click
+
+from dbt_semantic_interfaces.errors import ParsingException
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.manifest_json_stream import write_semantic_manifest_json
+from dbt_semantic_interfaces.parsing.batch_parsing import (
+    FileParsingCache,
+    parse_config_yaml_files,
+)
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    build_semantic_manifest_from_file_parsing_results,
+    collect_yaml_config_file_paths,
+    read_error_to_validation_error,
+    read_yaml_config_file,
+)
+from dbt_semantic_interfaces.parsing.incremental_builder import (
+    IncrementalManifestBuilder,
+)
+from dbt_semantic_interfaces.parsing.manifest_watcher import (
+    ManifestWatcher,
+    WatchUpdate,
+)
+from dbt_semantic_interfaces.parsing.objects import YamlConfigFile
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+from dbt_semantic_interfaces.validations.validator_helpers import (
+    FileContext,
+    SemanticManifestValidationResults,
+    ValidationError,
+    ValidationIssue,
+)
+
+logger = logging.getLogger(__name__)
+
+TEXT_FORMAT = "text"
+JSON_FORMAT = "json"
+JSONL_FORMAT = "jsonl"
+
+
+@dataclass(frozen=True)
+class _LoadResult:
+    """The result of `_load_semantic_manifest`.
+
+    Attributes:
+        semantic_manifest: The manifest, or None if it couldn't be built. It's untransformed if the transformation
+            failed or was skipped because of `fail_fast`.
+        issues: The issues found while parsing, transforming and (if requested) validating the manifest.
+        file_count: The number of files that the manifest was parsed from.
+    """
+
+    semantic_manifest: Optional[PydanticSemanticManifest]
+    issues: SemanticManifestValidationResults
+    file_count: int
+
+
+def _load_semantic_manifest(
+    directory: str,
+    template_mapping: Dict[str, str],
+    jobs: int,
+    cache_dir: Optional[str],
+    validate: bool,
+    fail_fast: bool = False,
+) -> _LoadResult:
+    """Parses, transforms and optionally validates the manifest in the directory.
+
+    With `fail_fast`, the later steps are skipped if a step finds an error. Files that can't be read, e.g. because a
+    template variable isn't given, are reported as errors without parsing the other files.
+    """
+    config_files: List[YamlConfigFile] = []
+    read_errors: List[ValidationError] = []
+    for file_path in collect_yaml_config_file_paths(directory):
+        try:
+            config_files.append(read_yaml_config_file(file_path=file_path, template_mapping=template_mapping))
+        except Exception as e:
+            read_errors.append(read_error_to_validation_error(file_path=file_path, error=e))
+    if read_errors:
+        return _LoadResult(
+            semantic_manifest=None,
+            issues=SemanticManifestValidationResults(errors=tuple(read_errors)),
+            file_count=len(config_files) + len(read_errors),
+        )
+
+    start_time = time.perf_counter()
+    file_parsing_results = parse_config_yaml_files(
+        config_files,
+        max_workers=jobs,
+        cache=FileParsingCache(cache_dir) if cache_dir is not None else None,
+    )
+    logger.info(f"Parsed {len(config_files)} file(s) in {time.perf_counter() - start_time:.3f}s")
+
+    try:
+        build_result = build_semantic_manifest_from_file_parsing_results(file_parsing_results)
+    except ParsingException as e:
+        return _LoadResult(
+            semantic_manifest=None,
+            issues=SemanticManifestValidationResults(
+                errors=(ValidationError(context=FileContext(file_name=directory), message=str(e)),)
+            ),
+            file_count=len(config_files),
+        )
+    if fail_fast and build_result.issues.has_blocking_issues:
+        return _LoadResult(
+            semantic_manifest=build_result.semantic_manifest, issues=build_result.issues, file_count=len(config_files)
+        )
+
+    try:
+        semantic_manifest = PydanticSemanticManifestTransformer.transform(build_result.semantic_manifest)
+    except Exception as e:
+        return _LoadResult(
+            semantic_manifest=build_result.semantic_manifest,
+            issues=SemanticManifestValidationResults.merge(
+                [build_result.issues, SemanticManifestValidationResults(errors=(ValidationError(message=str(e)),))]
+            ),
+            file_count=len(config_files),
+        )
+    if not validate:
+        return _LoadResult(
+            semantic_manifest=semantic_manifest, issues=build_result.issues, file_count=len(config_files)
+        )
+
+    start_time = time.perf_counter()
+    validation_results = SemanticManifestValidator[PydanticSemanticManifest]().validate_semantic_manifest(
+        semantic_manifest, fail_fast=fail_fast
+    )
+    logger.info(f"Validated the semantic manifest in {time.perf_counter() - start_time:.3f}s")
+    return _LoadResult(
+        semantic_manifest=semantic_manifest,
+        issues=SemanticManifestValidationResults.merge([build_result.issues, validation_results]),
+        file_count=len(config_files),
+    )
+
+
+def _truncate_issues(
+    issues: SemanticManifestValidationResults, max_issues: Optional[int]
+) -> SemanticManifestValidationResults:
+    """Returns the first `max_issues` issues, keeping errors before future errors before warnings."""
+    if max_issues is None or len(issues.all_issues) <= max_issues:
+        return issues
+    errors = issues.errors[:max_issues]
+    future_errors = issues.future_errors[: max_issues - len(errors)]
+    warnings = issues.warnings[: max_issues - len(errors) - len(future_errors)]
+    return SemanticManifestValidationResults(errors=errors, future_errors=future_errors, warnings=warnings)
+
+
+def _issue_to_json_line(issue: ValidationIssue, **extra_fields: str) -> str:
+    return json.dumps({**extra_fields, "level": issue.level.name, **json.loads(issue.json())})
+
+
+def _echo_issues(
+    issues: SemanticManifestValidationResults,
+    output_format: str,
+    max_issues: Optional[int],
+    verbose: bool,
+    err: bool = False,
+) -> None:
+    """Prints the issues in the format, and a note to stderr if some of them weren't printed because of `max_issues`."""
+    shown_issues = _truncate_issues(issues, max_issues)
+    if output_format == JSON_FORMAT:
+        click.echo(shown_issues.json(), err=err)
+    elif output_format == JSONL_FORMAT:
+        for issue in shown_issues.all_issues:
+            click.echo(_issue_to_json_line(issue), err=err)
+    else:
+        for issue in shown_issues.all_issues:
+            click.echo(issue.as_cli_formatted_str(verbose=verbose), err=err)
+        click.echo(issues.summary(), err=err)
+
+    omitted_issue_count = len(issues.all_issues) - len(shown_issues.all_issues)
+    if omitted_issue_count > 0:
+        click.echo(f"{omitted_issue_count} more issue(s) were not shown because of --max-issues.", err=True)
+
+
+def _parse_template_variables(
+    ctx: click.Context, param: click.Parameter, template_variables: Sequence[str]
+) -> Dict[str, str]:
+    template_mapping: Dict[str, str] = {}
+    for template_variable in template_variables:
+        key, separator, value = template_variable.partition("=")
+        if not separator:
+            raise click.BadParameter(f"Expected KEY=VALUE, but got {template_variable!r}.")
+        template_mapping[key] = value
+    return template_mapping
+
+
+_directory_argument = click.argument("directory", type=click.Path(exists=True, file_okay=False))
+_template_variable_option = click.option(
+    "--template-variable",
+    "template_mapping",
+    multiple=True,
+    callback=_parse_template_variables,
+    metavar="KEY=VALUE",
+    help="A value for a template variable in the YAML files. Can be given more than once.",
+)
+_jobs_option = click.option(
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of processes to parse the YAML files in.",
+)
+_cache_dir_option = click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help=(
+        "A directory to cache the result of parsing each file in, so that only the files that changed are parsed on "
+        "the next run. The cache is written with pickle, so only use a directory that other users can't write to."
+    ),
+)
+_max_issues_option = click.option(
+    "--max-issues", type=click.IntRange(min=0), help="The maximum number of issues to print, errors first."
+)
+_verbose_option = click.option("--verbose", is_flag=True, help="Print more details about each issue and each step.")
+
+
+def _configure_logging(verbose: bool) -> None:
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING, format="%(message)s")
+
+
+@click.group()
+def cli() -> None:
+    """Parse and validate dbt semantic layer definitions."""
+    pass
+
+
+@cli.command()
+@_directory_argument
+@_template_variable_option
+@_jobs_option
+@_cache_dir_option
+@click.option("--fail-fast", is_flag=True, help="Stop at the first step or validation rule that finds an error.")
+@_max_issues_option
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([TEXT_FORMAT, JSON_FORMAT, JSONL_FORMAT]),
+    default=TEXT_FORMAT,
+    show_default=True,
+    help=(
+        "`json` prints the issues as serialized `SemanticManifestValidationResults`, and `jsonl` prints each issue on "
+        "a line, with its level."
+    ),
+)
+@_verbose_option
+@click.pass_context
+def validate(
+    ctx: click.Context,
+    directory: str,
+    template_mapping: Dict[str, str],
+    jobs: int,
+    cache_dir: Optional[str],
+    fail_fast: bool,
+    max_issues: Optional[int],
+    output_format: str,
+    verbose: bool,
+) -> None:
+    """Parse, transform and validate the semantic manifest in DIRECTORY. Exits with 1 if there are errors."""
+    _configure_logging(verbose)
+    load_result = _load_semantic_manifest(
+        directory=directory,
+        template_mapping=template_mapping,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        validate=True,
+        fail_fast=fail_fast,
+    )
+    _echo_issues(load_result.issues, output_format=output_format, max_issues=max_issues, verbose=verbose)
+    ctx.exit(1 if load_result.issues.has_blocking_issues else 0)
+
+
+@cli.command()
+@_directory_argument
+@_template_variable_option
+@_jobs_option
+@_cache_dir_option
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True),
+    help="The file to write the manifest to. Default: stdout",
+)
+@_max_issues_option
+@_verbose_option
+@click.pass_context
+def parse(
+    ctx: click.Context,
+    directory: str,
+    template_mapping: Dict[str, str],
+    jobs: int,
+    cache_dir: Optional[str],
+    output: Optional[str],
+    max_issues: Optional[int],
+    verbose: bool,
+) -> None:
+    """Parse and transform the semantic manifest in DIRECTORY, and write it as JSON.
+
+    The parsing issues are printed to stderr. Exits with 1 if there are errors, in which case the manifest isn't
+    written.
+    """
+    _configure_logging(verbose)
+    load_result = _load_semantic_manifest(
+        directory=directory, template_mapping=template_mapping, jobs=jobs, cache_dir=cache_dir, validate=False
+    )
+    if load_result.issues.all_issues:
+        _echo_issues(load_result.issues, output_format=TEXT_FORMAT, max_issues=max_issues, verbose=verbose, err=True)
+    if load_result.semantic_manifest is None or load_result.issues.has_blocking_issues:
+        ctx.exit(1)
+    assert load_result.semantic_manifest is not None
+
+    # The manifest is written one object at a time, so the JSON of a large manifest isn't all in memory at once.
+    if output is None:
+        write_semantic_manifest_json(load_result.semantic_manifest, sys.stdout)
+        click.echo()
+    else:
+        with open(output, "w") as f:
+            write_semantic_manifest_json(load_result.semantic_manifest, f)
+
+
+@cli.command()
+@_directory_argument
+@_template_variable_option
+@_jobs_option
+@_cache_dir_option
+@click.option("--memory", is_flag=True, help="Also report the memory used by each category of objects.")
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([TEXT_FORMAT, JSON_FORMAT]),
+    default=TEXT_FORMAT,
+    show_default=True,
+)
+@_verbose_option
+@click.pass_context
+def stats(
+    ctx: click.Context,
+    directory: str,
+    template_mapping: Dict[str, str],
+    jobs: int,
+    cache_dir: Optional[str],
+    memory: bool,
+    output_format: str,
+    verbose: bool,
+) -> None:
+    """Print the number of objects in the semantic manifest in DIRECTORY."""
+    _configure_logging(verbose)
+    load_result = _load_semantic_manifest(
+        directory=directory, template_mapping=template_mapping, jobs=jobs, cache_dir=cache_dir, validate=False
+    )
+    semantic_manifest = load_result.semantic_manifest
+    if semantic_manifest is None:
+        _echo_issues(load_result.issues, output_format=output_format, max_issues=None, verbose=verbose, err=True)
+        ctx.exit(1)
+    assert semantic_manifest is not None
+
+    counts: Dict[str, int] = {
+        "files": load_result.file_count,
+        "semantic_models": len(semantic_manifest.semantic_models),
+        "measures": sum(len(semantic_model.measures) for semantic_model in semantic_manifest.semantic_models),
+        "dimensions": sum(len(semantic_model.dimensions) for semantic_model in semantic_manifest.semantic_models),
+        "entities": sum(len(semantic_model.entities) for semantic_model in semantic_manifest.semantic_models),
+        "metrics": len(semantic_manifest.metrics),
+        "saved_queries": len(semantic_manifest.saved_queries),
+    }
+    metric_counts_by_type: Dict[str, int] = {}
+    for metric in semantic_manifest.metrics:
+        metric_type = metric.type.value
+        metric_counts_by_type[metric_type] = metric_counts_by_type.get(metric_type, 0) + 1
+
+    memory_report = None
+    if memory:
+        # Imported here as it's only needed with `--memory`.
+        from dbt_semantic_interfaces.memory_report import manifest_memory_report
+
+        memory_report = manifest_memory_report(semantic_manifest)
+
+    if output_format == JSON_FORMAT:
+        stats_dict: Dict[str, object] = {**counts, "metrics_by_type": dict(sorted(metric_counts_by_type.items()))}
+        if memory_report is not None:
+            stats_dict["memory"] = memory_report.as_dict()
+        click.echo(json.dumps(stats_dict, indent=2))
+        return
+
+    for name, count in counts.items():
+        click.echo(f"{name:<24}{count:>12}")
+    for metric_type, count in sorted(metric_counts_by_type.items()):
+        click.echo(f"{'  ' + metric_type:<24}{count:>12}")
+    if memory_report is not None:
+        click.echo()
+        click.echo(memory_report.format())
+
+
+@cli.command()
+@_directory_argument
+@_template_variable_option
+@click.option("--poll-interval", type=click.FloatRange(min=0), default=0.5, show_default=True, help="In seconds.")
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=0.3,
+    show_default=True,
+    help="The time in seconds without changes to wait for after a change, before validating.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice([TEXT_FORMAT, JSONL_FORMAT]),
+    default=TEXT_FORMAT,
+    show_default=True,
+    help="`jsonl` prints each issue on a line, with its level and whether it's `new` or `resolved`.",
+)
+@_verbose_option
+def watch(
+    directory: str,
+    template_mapping: Dict[str, str],
+    poll_interval: float,
+    debounce: float,
+    output_format: str,
+    verbose: bool,
+) -> None:
+    """Validate the semantic manifest in DIRECTORY whenever its files change, until interrupted.
+
+    Only the files that changed are parsed again. After each change, the issues that were found or resolved are
+    printed, instead of all issues.
+    """
+    _configure_logging(verbose)
+    watcher = ManifestWatcher(
+        IncrementalManifestBuilder(directory, template_mapping=template_mapping),
+        poll_interval_seconds=poll_interval,
+        debounce_seconds=debounce,
+    )
+    try:
+        watcher.watch(lambda update: _echo_watch_update(update, output_format=output_format, verbose=verbose))
+    except KeyboardInterrupt:
+        pass
+
+
+def _echo_watch_update(update: WatchUpdate, output_format: str, verbose: bool) -> None:
+    issue_diff = update.issue_diff
+    if output_format == JSONL_FORMAT:
+        for change, issues in (("new", issue_diff.new_issues), ("resolved", issue_diff.resolved_issues)):
+            for issue in issues:
+                click.echo(_issue_to_json_line(issue, change=change))
+        return
+
+    for issue in issue_diff.new_issues:
+        click.echo(f"+ {issue.as_cli_formatted_str(verbose=verbose)}")
+    for issue in issue_diff.resolved_issues:
+        click.echo(f"- {issue.as_cli_formatted_str(verbose=verbose)}")
+    build_result = update.build_result
+    click.echo(
+        f"{build_result.issues.summary()} (parsed {len(build_result.reparsed_file_paths)} file(s), removed "
+        f"{len(build_result.removed_file_paths)} file(s) in {build_result.seconds:.2f}s)"
+    )
+
+
+@cli.command()
+@click.option(
+    "--object-count",
+    "object_counts",
+    type=click.IntRange(min=1),
+    multiple=True,
+    help="The number of objects in a synthetic manifest to benchmark. Can be given more than once. Default: 100, 1000",
+)
+@click.option("--rounds", type=click.IntRange(min=1), default=3, show_default=True)
+@click.option("--seed", type=int, default=0, show_default=True)
+@click.option("--output", type=click.Path(dir_okay=False, writable=True), help="The file to write the results to.")
+@click.option("--baseline", type=click.Path(exists=True, dir_okay=False), help="Results to compare against.")
+@click.option("--max-exponent", type=float, default=1.3, show_default=True)
+@click.option("--max-slowdown", type=float, default=1.25, show_default=True)
+@_verbose_option
+@click.pass_context
+def bench(
+    ctx: click.Context,
+    object_counts: Tuple[int, ...],
+    rounds: int,
+    seed: int,
+    output: Optional[str],
+    baseline: Optional[str],
+    max_exponent: float,
+    max_slowdown: float,
+    verbose: bool,
+) -> None:
+    """Benchmark parsing, transforming and validating synthetic manifests.
+
+    Exits with 1 if a benchmark scales super-linearly with the size of the manifest, or is slower than in the baseline.
+    """
+    _configure_logging(verbose)
+    # Imported here as the benchmarks import the synthetic manifest generator, which is only needed here.
+    from dbt_semantic_interfaces.test_helpers.manifest_benchmarks import (
+        run_and_report_manifest_benchmarks,
+    )
+
+    ctx.exit(
+        run_and_report_manifest_benchmarks(
+            object_counts=object_counts or (100, 1000),
+            rounds=rounds,
+            seed=seed,
+            output_path=output,
+            baseline_path=baseline,
+            max_exponent=max_exponent,
+            max_slowdown=max_slowdown,
+        )
+    )
+
+
+if __name__ == "__main__":
+    cli()
@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import dataclasses
 import datetime
+import functools
 import inspect
+import json
 import logging
 from abc import ABC
 from builtins import NameError
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
+    Iterable,
+    List,
     Optional,
     Sequence,
     Set,
@@ -22,20 +28,26 @@ from typing import (
     get_args,
     get_origin,
     get_type_hints,
+    overload,
 )
 
 from typing_extensions import TypeAlias
 
 from dbt_semantic_interfaces.pretty_print import pformat_big_objects
-from dsi_pydantic_shim import BaseModel, create_model
+
+if TYPE_CHECKING:
+    # Pydantic is imported where it's used so that importing `references` doesn't import it.
+    from dsi_pydantic_shim import BaseModel
 
 logger = logging.getLogger(__name__)
 
 
 # Any Pydantic object
-PydanticT = TypeVar("PydanticT", bound=Type[BaseModel])
+PydanticT = TypeVar("PydanticT", bound="Type[BaseModel]")
 # Any value
 AnyValueType: TypeAlias = Any  # type: ignore[misc]
+# Converts a field value to / from the equivalent JSON-compatible value.
+_ValueConverter: TypeAlias = Callable[[AnyValueType], AnyValueType]
 
 
 class UnknownClassError(Exception):
@@ -50,10 +62,34 @@ class DataclassDeserializationError(Exception):
     pass
 
 
+class SerializedSequenceFormat(Enum):
+    """The formats for a serialized sequence of dataclasses.
+
+    JSON_ARRAY: a single JSON array with an element for each dataclass.
+    JSONL: JSON lines, with a line for each dataclass.
+    """
+
+    JSON_ARRAY = "json_array"
+    JSONL = "jsonl"
+
+
+class _FastPathNotApplicableError(Exception):
+    """Raised by a compiled converter when a value needs the Pydantic-based path to get the same result.
+
+    e.g. a value that Pydantic would coerce to the annotated type.
+    """
+
+    pass
+
+
+@functools.lru_cache(maxsize=None)
 def _get_dataclass_field_definitions(
     dataclass_type: Type,
 ) -> Dict[str, FieldDefinition]:
-    """Returns the types of fields in a dataclass. Returns a dict from the name of the field to the type."""
+    """Returns the types of fields in a dataclass. Returns a dict from the name of the field to the type.
+
+    Resolving type hints is relatively slow, so results are cached. The returned dict should not be modified.
+    """
     assert dataclasses.is_dataclass(dataclass_type)
     try:
         type_hints = get_type_hints(dataclass_type, localns={})
@@ -90,6 +126,8 @@ def _is_supported_field_type_in_serializable_dataclass(field_type: Type) -> bool
 
     For container classes, this does not check the type of the type parameter for the container.
     """
+    from dsi_pydantic_shim import BaseModel
+
     return (
         (
             _is_sequence_like_tuple_type(field_type)
@@ -203,6 +241,78 @@ class DataclassSerializer:
 
     def __init__(self) -> None:  # noqa: D
         self._to_pydantic_type_converter = DataClassTypeToPydanticTypeConverter()
+        self._dataclass_type_to_encoder: Dict[Type, _ValueConverter] = {}
+
+    def _get_encoder(self, field_type: Type) -> _ValueConverter:
+        """Returns a function that converts a value of the given type into the value that Pydantic would output.
+
+        The returned function raises `_FastPathNotApplicableError` for values that don't match the annotated type
+        exactly, as Pydantic would coerce those values first.
+        """
+        if not _is_supported_field_type_in_serializable_dataclass(field_type):
+            raise RuntimeError(f"Unsupported field type: {field_type}")
+        elif _is_optional_type(field_type):
+            optional_value_encoder = self._get_encoder(_get_type_parameter_for_optional(field_type))
+            return lambda value: None if value is None else optional_value_encoder(value)
+        elif _is_sequence_like_tuple_type(field_type):
+            tuple_item_encoder = self._get_encoder(_get_type_parameter_for_sequence_like_tuple_type(field_type))
+
+            def _encode_tuple(value: AnyValueType) -> AnyValueType:
+                if not isinstance(value, tuple):
+                    raise _FastPathNotApplicableError()
+                return [tuple_item_encoder(item) for item in value]
+
+            return _encode_tuple
+        elif issubclass(field_type, SerializableDataclass):
+            return self._get_dataclass_encoder(field_type)
+        elif issubclass(field_type, Enum):
+            enum_type = field_type
+
+            def _encode_enum(value: AnyValueType) -> AnyValueType:
+                if not isinstance(value, enum_type):
+                    raise _FastPathNotApplicableError()
+                return value.value
+
+            return _encode_enum
+        elif issubclass(field_type, datetime.datetime):
+            return _exact_type_converter(datetime.datetime, datetime.datetime.isoformat)
+        elif issubclass(field_type, datetime.date):
+            return _exact_type_converter(datetime.date, datetime.date.isoformat)
+        elif issubclass(field_type, datetime.timedelta):
+            return _exact_type_converter(datetime.timedelta, datetime.timedelta.total_seconds)
+        elif field_type in (bool, int, str):
+            return _exact_type_converter(field_type)
+        elif field_type is float:
+            return _float_converter
+        # e.g. Pydantic models or subclasses of primitive types.
+        return _fast_path_not_applicable
+
+    def _get_dataclass_encoder(self, dataclass_type: Type[SerializableDataclass]) -> _ValueConverter:
+        encoder = self._dataclass_type_to_encoder.get(dataclass_type)
+        if encoder is not None:
+            return encoder
+
+        if not dataclasses.is_dataclass(dataclass_type):
+            raise RuntimeError(f"{dataclass_type} is not a dataclass")
+
+        field_encoders: List[Tuple[str, _ValueConverter]] = []
+
+        def _encode_dataclass(value: AnyValueType) -> AnyValueType:
+            if not isinstance(value, SerializableDataclass):
+                raise RuntimeError(f"{value} is not a SerializableDataclass")
+            return {
+                field_name: field_encoder(getattr(value, field_name)) for field_name, field_encoder in field_encoders
+            }
+
+        # Register the encoder before compiling the fields to handle self-referencing dataclasses.
+        self._dataclass_type_to_encoder[dataclass_type] = _encode_dataclass
+        try:
+            for field_name, field_definition in _get_dataclass_field_definitions(dataclass_type).items():
+                field_encoders.append((field_name, self._get_encoder(field_definition.annotated_field_type)))
+        except Exception:
+            del self._dataclass_type_to_encoder[dataclass_type]
+            raise
+        return _encode_dataclass
 
     def _convert_dataclass_instance_to_pydantic_model(
         self, object_type: Type, obj: Optional[AnyValueType] = None
@@ -250,24 +360,151 @@ class DataclassSerializer:
 
         return obj
 
-    def pydantic_serialize(self, obj: SerializableDataclassT) -> str:  # noqa: D
+    def pydantic_serialize(self, obj: SerializableDataclassT) -> str:
+        """Serialize the dataclass to a JSON string.
+
+        The dataclass is converted directly to a JSON-compatible dict using encoders that are compiled once per type.
+        The output is the same as from serializing an equivalent Pydantic model, and values that Pydantic would coerce
+        (e.g. an `int` in a `float` field) are serialized through the Pydantic model to keep it that way.
+        """
         # .__class__ seems to be the approach for new classes and there are differences with type(obj)
         obj_class = obj.__class__
         assert dataclasses.is_dataclass(obj), f"Got object of type: {obj_class.__name__}"
         assert isinstance(obj, SerializableDataclass), f"Got object of type: {obj_class.__name__}"
         assert issubclass(obj_class, SerializableDataclass), f"Got object type: {obj_class.__name__}"
 
+        try:
+            return json.dumps(self._get_dataclass_encoder(obj_class)(obj))
+        except _FastPathNotApplicableError:
+            pass
+
         return self._convert_dataclass_instance_to_pydantic_model(
             object_type=obj_class,
             obj=obj,
         ).json()
 
+    def serialize_many(
+        self,
+        objs: Iterable[SerializableDataclass],
+        sequence_format: SerializedSequenceFormat = SerializedSequenceFormat.JSON_ARRAY,
+    ) -> str:
+        """Serialize a sequence of dataclasses, which can be of different types, to a single string.
+
+        Each element is the same as the output of `pydantic_serialize` for the dataclass. To deserialize the output,
+        use `DataClassDeserializer.deserialize_many` with the types of the dataclasses.
+        """
+        json_values: List[AnyValueType] = []
+        previous_obj_class: Optional[Type] = None
+        encoder: _ValueConverter = _fast_path_not_applicable
+        for obj in objs:
+            obj_class = obj.__class__
+            if obj_class is not previous_obj_class:
+                assert dataclasses.is_dataclass(obj), f"Got object of type: {obj_class.__name__}"
+                assert isinstance(obj, SerializableDataclass), f"Got object of type: {obj_class.__name__}"
+                encoder = self._get_dataclass_encoder(obj_class)
+                previous_obj_class = obj_class
+
+            try:
+                json_values.append(encoder(obj))
+            except _FastPathNotApplicableError:
+                # The JSON output by the Pydantic model is unchanged by a round trip through `json`.
+                json_values.append(
+                    json.loads(
+                        self._convert_dataclass_instance_to_pydantic_model(object_type=obj_class, obj=obj).json()
+                    )
+                )
+
+        if sequence_format is SerializedSequenceFormat.JSON_ARRAY:
+            return json.dumps(json_values)
+        elif sequence_format is SerializedSequenceFormat.JSONL:
+            return "".join(json.dumps(json_value) + "\n" for json_value in json_values)
+        raise ValueError(f"Unhandled sequence format: {sequence_format}")
+
 
 class DataClassDeserializer:
     """Corresponding deserializer for datclasses that were serialized by DataClassSerializer."""
 
     def __init__(self) -> None:  # noqa: D
         self._to_pydantic_type_converter = DataClassTypeToPydanticTypeConverter()
+        self._dataclass_type_to_decoder: Dict[Type, _ValueConverter] = {}
+
+    def _get_decoder(self, field_type: Type) -> _ValueConverter:
+        """Returns a function that converts a JSON-compatible value into a value of the given type.
+
+        The returned function raises `_FastPathNotApplicableError` for values that Pydantic would need to validate or
+        coerce, e.g. a numeric string in an `int` field.
+        """
+        if not _is_supported_field_type_in_serializable_dataclass(field_type):
+            raise RuntimeError(f"Unsupported type: {field_type}")
+        elif _is_optional_type(field_type):
+            optional_value_decoder = self._get_decoder(_get_type_parameter_for_optional(field_type))
+            return lambda value: None if value is None else optional_value_decoder(value)
+        elif _is_sequence_like_tuple_type(field_type):
+            tuple_item_decoder = self._get_decoder(_get_type_parameter_for_sequence_like_tuple_type(field_type))
+
+            def _decode_tuple(value: AnyValueType) -> AnyValueType:
+                if not isinstance(value, list):
+                    raise _FastPathNotApplicableError()
+                return tuple(tuple_item_decoder(item) for item in value)
+
+            return _decode_tuple
+        elif issubclass(field_type, SerializableDataclass):
+            return self._get_dataclass_decoder(field_type)
+        elif issubclass(field_type, Enum):
+            enum_type = field_type
+
+            def _decode_enum(value: AnyValueType) -> AnyValueType:
+                try:
+                    return enum_type(value)
+                except ValueError:
+                    raise _FastPathNotApplicableError()
+
+            return _decode_enum
+        elif issubclass(field_type, datetime.datetime):
+            return _exact_type_converter(str, _datetime_from_isoformat)
+        elif issubclass(field_type, datetime.date):
+            return _exact_type_converter(str, _date_from_isoformat)
+        elif field_type in (bool, int, str):
+            return _exact_type_converter(field_type)
+        elif field_type is float:
+            return _float_converter
+        # e.g. Pydantic models or durations, which Pydantic parses from a variety of formats.
+        return _fast_path_not_applicable
+
+    def _get_dataclass_decoder(self, dataclass_type: Type[SerializableDataclass]) -> _ValueConverter:
+        decoder = self._dataclass_type_to_decoder.get(dataclass_type)
+        if decoder is not None:
+            return decoder
+
+        # Tuples of (field name, decoder, whether the field is required).
+        field_decoders: List[Tuple[str, _ValueConverter, bool]] = []
+
+        def _decode_dataclass(value: AnyValueType) -> AnyValueType:
+            if not isinstance(value, dict):
+                raise _FastPathNotApplicableError()
+            object_args = {}
+            for field_name, field_decoder, is_required in field_decoders:
+                if field_name in value:
+                    object_args[field_name] = field_decoder(value[field_name])
+                elif is_required:
+                    raise _FastPathNotApplicableError()
+            return dataclass_type(**object_args)
+
+        # Register the decoder before compiling the fields to handle self-referencing dataclasses.
+        self._dataclass_type_to_decoder[dataclass_type] = _decode_dataclass
+        try:
+            for field_name, field_definition in _get_dataclass_field_definitions(dataclass_type).items():
+                field_decoders.append(
+                    (
+                        field_name,
+                        self._get_decoder(field_definition.annotated_field_type),
+                        field_definition.default_value is dataclasses.MISSING,
+                    )
+                )
+        except Exception:
+            del self._dataclass_type_to_decoder[dataclass_type]
+            raise
+        return _decode_dataclass
 
     def _convert_field_in_pydantic_object_to_actual_object(
         self, field_type: Type, obj: Optional[AnyValueType] = None
@@ -294,9 +531,12 @@ class DataClassDeserializer:
                 for x in obj
             )
         elif issubclass(field_type, SerializableDataclass):
-            logger.debug(f"Handling field_type={field_type} object={repr(obj)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Handling field_type={field_type} object={repr(obj)}")
             # Redundant assertion is needed for mypy to pass.
             assert issubclass(field_type, SerializableDataclass), f"Got field type: {field_type.__name__}"
+            from dsi_pydantic_shim import BaseModel
+
             assert isinstance(obj, (SerializableDataclass, BaseModel)), f"Got object of type: {obj.__class__.__name__}"
             return self._construct_dataclass_from_dataclass_like_object(
                 dataclass_type=field_type,
@@ -308,7 +548,8 @@ class DataClassDeserializer:
     def _construct_dataclass_from_dataclass_like_object(
         self, dataclass_type: Type[SerializableDataclassT], obj: Union[SerializableDataclass, BaseModel]
     ) -> SerializableDataclassT:
-        logger.debug(f"Constructing dataclass of type {dataclass_type} from {repr(obj)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Constructing dataclass of type {dataclass_type} from {repr(obj)}")
         object_args = {}
         field_dict = _get_dataclass_field_definitions(dataclass_type)
         for field_name, field_definition in field_dict.items():
@@ -319,22 +560,153 @@ class DataClassDeserializer:
 
         return dataclass_type(**object_args)
 
-    def pydantic_deserialize(  # noqa: D
+    def pydantic_deserialize(
         self, dataclass_type: Type[SerializableDataclassT], serialized_obj: str
     ) -> SerializableDataclassT:
+        """Deserialize a JSON string that was produced by `DataclassSerializer`.
+
+        Values are converted directly from the parsed JSON using decoders that are compiled once per type. If the JSON
+        contains values that Pydantic would need to validate or coerce (e.g. it was not produced by the serializer),
+        this falls back to parsing the JSON with an equivalent Pydantic model.
+        """
         try:
-            ClassAsPydantic = self._to_pydantic_type_converter.to_pydantic_type(dataclass_type)
+            try:
+                return self._get_dataclass_decoder(dataclass_type)(json.loads(serialized_obj))
+            except _FastPathNotApplicableError:
+                pass
+
+            return self._deserialize_using_pydantic_model(dataclass_type, serialized_obj)
+
+        except Exception as e:
+            raise DataclassDeserializationError from e
+
+    def _deserialize_using_pydantic_model(
+        self, dataclass_type: Type[SerializableDataclassT], serialized_obj: str
+    ) -> SerializableDataclassT:
+        ClassAsPydantic = self._to_pydantic_type_converter.to_pydantic_type(dataclass_type)
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Serialized object for creation of {ClassAsPydantic} is {serialized_obj}")
-            pydantic_object = ClassAsPydantic.parse_raw(serialized_obj)
-            return self._construct_dataclass_from_dataclass_like_object(
-                dataclass_type=dataclass_type,
-                obj=pydantic_object,
-            )
+        pydantic_object = ClassAsPydantic.parse_raw(serialized_obj)
+        return self._construct_dataclass_from_dataclass_like_object(
+            dataclass_type=dataclass_type,
+            obj=pydantic_object,
+        )
+
+    @overload
+    def deserialize_many(
+        self,
+        dataclass_types: Type[SerializableDataclassT],
+        serialized_objs: str,
+        sequence_format: SerializedSequenceFormat = ...,
+    ) -> Tuple[SerializableDataclassT, ...]:
+        ...
+
+    @overload
+    def deserialize_many(
+        self,
+        dataclass_types: Sequence[Type[SerializableDataclass]],
+        serialized_objs: str,
+        sequence_format: SerializedSequenceFormat = ...,
+    ) -> Tuple[SerializableDataclass, ...]:
+        ...
+
+    def deserialize_many(
+        self,
+        dataclass_types: Union[Type[SerializableDataclass], Sequence[Type[SerializableDataclass]]],
+        serialized_objs: str,
+        sequence_format: SerializedSequenceFormat = SerializedSequenceFormat.JSON_ARRAY,
+    ) -> Tuple[SerializableDataclass, ...]:
+        """Deserialize a string that was produced by `DataclassSerializer.serialize_many`.
+
+        Args:
+            dataclass_types: The type of all dataclasses in the sequence, or the type of each dataclass in order.
+            serialized_objs: The output of `serialize_many`.
+            sequence_format: The format that was passed to `serialize_many`.
+
+        Returns:
+            The dataclasses in the same order as they were serialized.
+        """
+        try:
+            if sequence_format is SerializedSequenceFormat.JSON_ARRAY:
+                json_values = json.loads(serialized_objs)
+                if not isinstance(json_values, list):
+                    raise ValueError(f"Expected a JSON array, but got a {type(json_values).__name__}")
+            elif sequence_format is SerializedSequenceFormat.JSONL:
+                json_values = [json.loads(line) for line in serialized_objs.splitlines() if line.strip()]
+            else:
+                raise ValueError(f"Unhandled sequence format: {sequence_format}")
+
+            if isinstance(dataclass_types, type):
+                dataclass_types = [dataclass_types] * len(json_values)
+            elif len(dataclass_types) != len(json_values):
+                raise ValueError(
+                    f"Got {len(dataclass_types)} dataclass types for a sequence of {len(json_values)} dataclasses"
+                )
+
+            results: List[SerializableDataclass] = []
+            previous_dataclass_type: Optional[Type] = None
+            decoder: _ValueConverter = _fast_path_not_applicable
+            for dataclass_type, json_value in zip(dataclass_types, json_values):
+                if dataclass_type is not previous_dataclass_type:
+                    decoder = self._get_dataclass_decoder(dataclass_type)
+                    previous_dataclass_type = dataclass_type
+
+                try:
+                    results.append(decoder(json_value))
+                except _FastPathNotApplicableError:
+                    results.append(self._deserialize_using_pydantic_model(dataclass_type, json.dumps(json_value)))
+            return tuple(results)
 
         except Exception as e:
             raise DataclassDeserializationError from e
 
 
+def _fast_path_not_applicable(value: AnyValueType) -> AnyValueType:
+    raise _FastPathNotApplicableError()
+
+
+def _exact_type_converter(value_type: Type, convert: Optional[_ValueConverter] = None) -> _ValueConverter:
+    """Returns a converter for values that are exactly of the given type (i.e. not a subclass)."""
+
+    def _convert(value: AnyValueType) -> AnyValueType:
+        if type(value) is not value_type:
+            raise _FastPathNotApplicableError()
+        return value if convert is None else convert(value)
+
+    return _convert
+
+
+def _float_converter(value: AnyValueType) -> AnyValueType:
+    # Pydantic converts an `int` in a `float` field to a `float`.
+    value_type = type(value)
+    if value_type is float:
+        return value
+    elif value_type is int:
+        return float(value)
+    raise _FastPathNotApplicableError()
+
+
+def _datetime_from_isoformat(value: str) -> datetime.datetime:
+    # Only handle the format output by the serializer, as Pydantic's parser accepts a different set of formats.
+    try:
+        parsed_value = datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise _FastPathNotApplicableError()
+    if parsed_value.isoformat() != value:
+        raise _FastPathNotApplicableError()
+    return parsed_value
+
+
+def _date_from_isoformat(value: str) -> datetime.date:
+    try:
+        parsed_value = datetime.date.fromisoformat(value)
+    except ValueError:
+        raise _FastPathNotApplicableError()
+    if parsed_value.isoformat() != value:
+        raise _FastPathNotApplicableError()
+    return parsed_value
+
+
 class DataClassTypeToPydanticTypeConverter:  # noqa: D
     """Class that converts a SerializableDataclass into an equivalent Pydantic object.
 
@@ -355,7 +727,9 @@ class DataClassTypeToPydanticTypeConverter:  # noqa: D
     def _convert_dataclass_type_to_pydantic_type(
         dataclass_type: Type,
     ) -> Type[BaseModel]:  # noqa: D
-        logger.debug(f"Converting {dataclass_type.__name__} to a pydantic class")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(f"Converting {dataclass_type.__name__} to a pydantic class")
         assert issubclass(dataclass_type, SerializableDataclass)
         assert dataclasses.is_dataclass(dataclass_type)
 
@@ -363,19 +737,25 @@ class DataClassTypeToPydanticTypeConverter:  # noqa: D
 
         # Maps the name of the field to (type of field, default value)
         fields_for_pydantic_model: Dict[str, Tuple[Type, AnyValueType]] = {}
-        logger.debug(f"Need to add: {pformat_big_objects(field_dict.keys())}")
+        if debug_enabled:
+            logger.debug(f"Need to add: {pformat_big_objects(field_dict.keys())}")
         for field_name, field_definition in field_dict.items():
             field_definition = DataClassTypeToPydanticTypeConverter._convert_nested_fields(field_definition)
             fields_for_pydantic_model[field_name] = field_definition.as_pydantic_field_tuple()
-            logger.debug(f"Adding {field_name} with type {field_definition.annotated_field_type}")
+            if debug_enabled:
+                logger.debug(f"Adding {field_name} with type {field_definition.annotated_field_type}")
 
         class_name = dataclass_type.__name__ + "AsPydantic"
-        logger.debug(
-            f"Creating Pydantic model {class_name} with fields:\n{pformat_big_objects(fields_for_pydantic_model)}"
-        )
+        if debug_enabled:
+            logger.debug(
+                f"Creating Pydantic model {class_name} with fields:\n{pformat_big_objects(fields_for_pydantic_model)}"
+            )
+        from dsi_pydantic_shim import create_model
+
         pydantic_model = create_model(class_name, **fields_for_pydantic_model)  # type: ignore
-        logger.debug(f"Finished creating Pydantic model {class_name}")
-        logger.debug(f"Finished converting {dataclass_type.__name__} to a pydantic class")
+        if debug_enabled:
+            logger.debug(f"Finished creating Pydantic model {class_name}")
+            logger.debug(f"Finished converting {dataclass_type.__name__} to a pydantic class")
         return pydantic_model
 
     @staticmethod
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from dbt_semantic_interfaces.errors import EntityJoinGraphError
+from dbt_semantic_interfaces.protocols import SemanticManifest, SemanticModel
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    SemanticModelReference,
+)
+from dbt_semantic_interfaces.type_enums import (
+    DimensionType,
+    EntityType,
+    TimeGranularity,
+)
+
+
+@dataclass(frozen=True)
+class SemanticModelJoinEdge:
+    """A join from one semantic model to another through an entity that they both have.
+
+    The right semantic model must have the entity as a linkable entity type (primary, unique or natural) so that the
+    join doesn't fan out the rows of the left semantic model.
+    """
+
+    left_semantic_model: SemanticModelReference
+    right_semantic_model: SemanticModelReference
+    entity: EntityReference
+    left_entity_type: EntityType
+    right_entity_type: EntityType
+
+
+@dataclass(frozen=True)
+class SemanticModelJoinPath:
+    """A sequence of joins starting from a semantic model. A path without any edges is the semantic model itself."""
+
+    left_semantic_model: SemanticModelReference
+    edges: Tuple[SemanticModelJoinEdge, ...] = ()
+
+    @property
+    def right_semantic_model(self) -> SemanticModelReference:
+        """The semantic model at the end of the path."""
+        return self.edges[-1].right_semantic_model if self.edges else self.left_semantic_model
+
+    @property
+    def entity_path(self) -> Tuple[EntityReference, ...]:
+        """The entities used for each join, i.e. the entity links used in dundered names."""
+        return tuple(edge.entity for edge in self.edges)
+
+
+@dataclass(frozen=True)
+class ReachableDimension:
+    """A dimension that can be reached from a semantic model, e.g. `listing__country` from a bookings model.
+
+    Attributes:
+        dimension_reference: The dimension.
+        entity_path: The entity links used to refer to the dimension. For local dimensions, this is one of the
+        linkable entities of the semantic model.
+        join_path: How the semantic model that defines the dimension is joined.
+        dimension_type: The type of the dimension.
+        time_granularity: The granularity that a time dimension is defined at.
+    """
+
+    dimension_reference: DimensionReference
+    entity_path: Tuple[EntityReference, ...]
+    join_path: SemanticModelJoinPath
+    dimension_type: DimensionType
+    time_granularity: Optional[TimeGranularity] = None
+
+
+@dataclass(frozen=True)
+class ReachableEntity:
+    """An entity that can be reached from a semantic model, e.g. `listing__user` from a bookings model.
+
+    Attributes:
+        entity_reference: The entity.
+        entity_path: The entity links used to refer to the entity. For local entities, this is empty.
+        join_path: How the semantic model that defines the entity is joined.
+    """
+
+    entity_reference: EntityReference
+    entity_path: Tuple[EntityReference, ...]
+    join_path: SemanticModelJoinPath
+
+
+class EntityJoinGraph:
+    """The joins that are possible between the semantic models in a semantic manifest through shared entities.
+
+    Each semantic model is a node, and there is an edge from a semantic model to each semantic model that it can be
+    joined to. The edges of a semantic model, the join paths from it, and the dimensions and entities that are
+    reachable through those paths are computed when they are first requested and then cached.
+
+    The traversal follows the conventions for dundered names: local dimensions are qualified by one of the linkable
+    entities of the semantic model, while joined dimensions and entities are qualified by the entities used for the
+    joins. A join path doesn't visit the same semantic model or use the same entity more than once.
+    """
+
+    # The maximum number of joins in a join path, unless otherwise specified.
+    DEFAULT_MAX_JOIN_HOPS = 2
+
+    def __init__(self, semantic_manifest: SemanticManifest) -> None:  # noqa: D107
+        self._semantic_model_index: Dict[SemanticModelReference, SemanticModel] = {}
+        for semantic_model in semantic_manifest.semantic_models:
+            self._semantic_model_index.setdefault(semantic_model.reference, semantic_model)
+
+        self._entity_to_semantic_models: Dict[EntityReference, List[SemanticModelReference]] = {}
+        # The semantic models that have the entity with a linkable entity type, and the entity type in each model.
+        self._entity_to_linkable_semantic_models: Dict[
+            EntityReference, List[Tuple[SemanticModelReference, EntityType]]
+        ] = {}
+        for semantic_model_reference, semantic_model in self._semantic_model_index.items():
+            for entity in semantic_model.entities:
+                semantic_model_references = self._entity_to_semantic_models.setdefault(entity.reference, [])
+                if semantic_model_reference not in semantic_model_references:
+                    semantic_model_references.append(semantic_model_reference)
+                if entity.is_linkable_entity_type:
+                    self._entity_to_linkable_semantic_models.setdefault(entity.reference, []).append(
+                        (semantic_model_reference, entity.type)
+                    )
+
+        self._join_edges: Dict[SemanticModelReference, Tuple[SemanticModelJoinEdge, ...]] = {}
+        self._join_paths: Dict[Tuple[SemanticModelReference, int], Tuple[SemanticModelJoinPath, ...]] = {}
+        self._reachable_dimensions: Dict[Tuple[SemanticModelReference, int], Tuple[ReachableDimension, ...]] = {}
+        self._reachable_entities: Dict[Tuple[SemanticModelReference, int], Tuple[ReachableEntity, ...]] = {}
+
+    @property
+    def semantic_model_references(self) -> Sequence[SemanticModelReference]:
+        """Returns the semantic models in the order that they are defined in the semantic manifest."""
+        return tuple(self._semantic_model_index)
+
+    def get_semantic_model(self, semantic_model_reference: SemanticModelReference) -> SemanticModel:
+        """Returns the semantic model with the given name.
+
+        Raises:
+            EntityJoinGraphError: If the semantic model doesn't exist.
+        """
+        semantic_model = self._semantic_model_index.get(semantic_model_reference)
+        if semantic_model is None:
+            raise EntityJoinGraphError(
+                f"Semantic model '{semantic_model_reference.semantic_model_name}' does not exist in the semantic "
+                f"manifest."
+            )
+        return semantic_model
+
+    def semantic_models_for_entity(self, entity_reference: EntityReference) -> Sequence[SemanticModelReference]:
+        """Returns the semantic models that have the entity, with any entity type."""
+        return tuple(self._entity_to_semantic_models.get(entity_reference, ()))
+
+    def join_edges(self, semantic_model_reference: SemanticModelReference) -> Sequence[SemanticModelJoinEdge]:
+        """Returns the joins from the semantic model to other semantic models, i.e. the adjacency list."""
+        join_edges = self._join_edges.get(semantic_model_reference)
+        if join_edges is not None:
+            return join_edges
+
+        edges: List[SemanticModelJoinEdge] = []
+        for entity in self.get_semantic_model(semantic_model_reference).entities:
+            for right_semantic_model_reference, right_entity_type in self._entity_to_linkable_semantic_models.get(
+                entity.reference, ()
+            ):
+                if right_semantic_model_reference == semantic_model_reference:
+                    continue
+                edges.append(
+                    SemanticModelJoinEdge(
+                        left_semantic_model=semantic_model_reference,
+                        right_semantic_model=right_semantic_model_reference,
+                        entity=entity.reference,
+                        left_entity_type=entity.type,
+                        right_entity_type=right_entity_type,
+                    )
+                )
+        join_edges = tuple(edges)
+        self._join_edges[semantic_model_reference] = join_edges
+        return join_edges
+
+    def join_paths(
+        self, semantic_model_reference: SemanticModelReference, max_hops: int = DEFAULT_MAX_JOIN_HOPS
+    ) -> Sequence[SemanticModelJoinPath]:
+        """Returns the join paths from the semantic model with at most `max_hops` joins, shortest paths first.
+
+        The first path is the semantic model itself.
+        """
+        cache_key = (semantic_model_reference, max_hops)
+        join_paths = self._join_paths.get(cache_key)
+        if join_paths is not None:
+            return join_paths
+
+        if max_hops > 0:
+            # The paths with fewer joins are a prefix of the result.
+            shorter_join_paths = self.join_paths(semantic_model_reference, max_hops - 1)
+            paths = list(shorter_join_paths)
+            for join_path in shorter_join_paths:
+                if len(join_path.edges) != max_hops - 1:
+                    continue
+                visited_semantic_models: Set[SemanticModelReference] = {semantic_model_reference}
+                visited_semantic_models.update(edge.right_semantic_model for edge in join_path.edges)
+                entity_path = join_path.entity_path
+                for edge in self.join_edges(join_path.right_semantic_model):
+                    if edge.right_semantic_model in visited_semantic_models or edge.entity in entity_path:
+                        continue
+                    paths.append(
+                        SemanticModelJoinPath(
+                            left_semantic_model=semantic_model_reference, edges=join_path.edges + (edge,)
+                        )
+                    )
+            join_paths = tuple(paths)
+        else:
+            self.get_semantic_model(semantic_model_reference)
+            join_paths = (SemanticModelJoinPath(left_semantic_model=semantic_model_reference),)
+
+        self._join_paths[cache_key] = join_paths
+        return join_paths
+
+    def local_entity_links(self, semantic_model_reference: SemanticModelReference) -> Sequence[EntityReference]:
+        """Returns the entities that can be used to qualify the local dimensions of the semantic model."""
+        semantic_model = self.get_semantic_model(semantic_model_reference)
+        entity_links: List[EntityReference] = []
+        if semantic_model.primary_entity_reference is not None:
+            entity_links.append(semantic_model.primary_entity_reference)
+        for entity in semantic_model.entities:
+            if entity.is_linkable_entity_type and entity.reference not in entity_links:
+                entity_links.append(entity.reference)
+        return tuple(entity_links)
+
+    def reachable_dimensions(
+        self, semantic_model_reference: SemanticModelReference, max_hops: int = DEFAULT_MAX_JOIN_HOPS
+    ) -> Sequence[ReachableDimension]:
+        """Returns the dimensions reachable from the semantic model with at most `max_hops` joins."""
+        cache_key = (semantic_model_reference, max_hops)
+        reachable_dimensions = self._reachable_dimensions.get(cache_key)
+        if reachable_dimensions is not None:
+            return reachable_dimensions
+
+        dimensions: List[ReachableDimension] = []
+        for join_path in self.join_paths(semantic_model_reference, max_hops):
+            entity_paths = (
+                tuple((entity_link,) for entity_link in self.local_entity_links(semantic_model_reference))
+                if len(join_path.edges) == 0
+                else (join_path.entity_path,)
+            )
+            for dimension in self.get_semantic_model(join_path.right_semantic_model).dimensions:
+                time_granularity = (
+                    dimension.type_params.time_granularity
+                    if dimension.type is DimensionType.TIME and dimension.type_params is not None
+                    else None
+                )
+                for entity_path in entity_paths:
+                    dimensions.append(
+                        ReachableDimension(
+                            dimension_reference=dimension.reference,
+                            entity_path=entity_path,
+                            join_path=join_path,
+                            dimension_type=dimension.type,
+                            time_granularity=time_granularity,
+                        )
+                    )
+        reachable_dimensions = tuple(dimensions)
+        self._reachable_dimensions[cache_key] = reachable_dimensions
+        return reachable_dimensions
+
+    def reachable_entities(
+        self, semantic_model_reference: SemanticModelReference, max_hops: int = DEFAULT_MAX_JOIN_HOPS
+    ) -> Sequence[ReachableEntity]:
+        """Returns the entities reachable from the semantic model with at most `max_hops` joins.
+
+        The entity used for the last join isn't included for the joined semantic model, as it's the same entity as the
+        one in the previous semantic model.
+        """
+        cache_key = (semantic_model_reference, max_hops)
+        reachable_entities = self._reachable_entities.get(cache_key)
+        if reachable_entities is not None:
+            return reachable_entities
+
+        entities: List[ReachableEntity] = []
+        for join_path in self.join_paths(semantic_model_reference, max_hops):
+            entity_path = join_path.entity_path
+            for entity in self.get_semantic_model(join_path.right_semantic_model).entities:
+                if entity.reference in entity_path:
+                    continue
+                entities.append(
+                    ReachableEntity(entity_reference=entity.reference, entity_path=entity_path, join_path=join_path)
+                )
+        reachable_entities = tuple(entities)
+        self._reachable_entities[cache_key] = reachable_entities
+        return reachable_entities
@@ -1,6 +1,9 @@
-from typing import Optional
+from __future__ import annotations
 
-from dbt_semantic_interfaces.parsing.yaml_loader import ParsingContext
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from dbt_semantic_interfaces.parsing.yaml_loader import ParsingContext
 
 
 class ConstraintParseException(Exception):  # noqa: D
@@ -29,3 +32,33 @@ class InvalidQuerySyntax(Exception):
 
     def __init__(self, msg: str) -> None:  # noqa: D
         super().__init__(msg)
+
+
+class MetricGraphError(Exception):
+    """Raised when the dependencies of a metric can't be resolved, e.g. when an input metric doesn't exist."""
+
+    pass
+
+
+class MetricCycleError(MetricGraphError):
+    """Raised when a metric depends on itself through its input metrics."""
+
+    pass
+
+
+class EntityJoinGraphError(Exception):
+    """Raised when a semantic model can't be found in an `EntityJoinGraph`."""
+
+    pass
+
+
+class ManifestSnapshotError(Exception):
+    """Raised when a manifest snapshot can't be read, e.g. because the file isn't a snapshot."""
+
+    pass
+
+
+class ManifestSnapshotVersionError(ManifestSnapshotError):
+    """Raised when a manifest snapshot was written by a version that isn't compatible with this one."""
+
+    pass
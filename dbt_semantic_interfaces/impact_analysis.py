@@ -0,0 +1,285 @@
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, FrozenSet, Iterable, List, Set, Union
+
+from dbt_semantic_interfaces.call_parameter_sets import JinjaCallParameterSets
+from dbt_semantic_interfaces.metric_graph import MetricGraph
+from dbt_semantic_interfaces.naming.dundered import StructuredDunderedName
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterBatchParser,
+    WhereFilterCallSiteType,
+)
+from dbt_semantic_interfaces.protocols import SemanticManifest
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    ExportReference,
+    MeasureReference,
+    MetricReference,
+    SavedQueryReference,
+    SemanticModelElementReference,
+    SemanticModelReference,
+)
+
+# The nodes in the dependency index. Dimensions, entities and measures in a specific semantic model are identified by
+# `SemanticModelElementReference`. `DimensionReference` and `EntityReference` identify all elements with that name, as
+# that's how they are referenced in filters and group-bys.
+DependencyNode = Union[
+    SemanticModelReference,
+    SemanticModelElementReference,
+    MeasureReference,
+    DimensionReference,
+    EntityReference,
+    MetricReference,
+    SavedQueryReference,
+    ExportReference,
+]
+
+
+@dataclass(frozen=True)
+class AffectedElements:
+    """The metrics, saved queries and exports that are affected by a change."""
+
+    metrics: FrozenSet[MetricReference] = frozenset()
+    saved_queries: FrozenSet[SavedQueryReference] = frozenset()
+    exports: FrozenSet[ExportReference] = frozenset()
+
+
+class ImpactAnalysisIndex:
+    """An index of the reverse dependencies in a semantic manifest, for finding what a change affects.
+
+    For example, a change to a measure affects the metrics that use it, the derived metrics that use those metrics, the
+    saved queries that query any of those metrics, and the exports of those saved queries. The index is built once
+    from the semantic manifest, and then `affected_elements` takes time proportional to the number of affected
+    elements rather than the size of the manifest.
+
+    Dependencies are tracked through:
+    * The measures of metrics, including the input measures and the measures of conversion metrics.
+    * The semantic model of simple metrics that are defined without a measure.
+    * The `agg_time_dimension` and non-additive dimension of measures.
+    * The entity and constant properties of conversion metrics.
+    * The input metrics of derived, ratio and conversion metrics.
+    * The dimensions, entities and metrics referenced in where filters and saved query group-bys.
+    * The metrics in saved queries, and the exports of saved queries.
+
+    Filters and group-bys reference dimensions and entities by name, and which semantic model they resolve to depends
+    on the query, so a change to a dimension or entity is considered to affect all filters and group-bys that use that
+    name. Filters and group-bys that can't be parsed are ignored, as they are reported during validation.
+    """
+
+    def __init__(self, semantic_manifest: SemanticManifest) -> None:  # noqa: D107
+        self._dependents: Dict[DependencyNode, Set[DependencyNode]] = {}
+
+        for semantic_model in semantic_manifest.semantic_models:
+            semantic_model_reference = semantic_model.reference
+            default_agg_time_dimension = (
+                semantic_model.defaults.agg_time_dimension if semantic_model.defaults is not None else None
+            )
+            for measure in semantic_model.measures:
+                measure_element = SemanticModelElementReference.create_from_references(
+                    semantic_model_reference, measure.reference
+                )
+                self._add_dependency(semantic_model_reference, measure_element)
+                self._add_dependency(measure_element, measure.reference)
+                agg_time_dimension = measure.agg_time_dimension or default_agg_time_dimension
+                if agg_time_dimension is not None:
+                    self._add_dependency(
+                        SemanticModelElementReference(semantic_model.name, agg_time_dimension), measure.reference
+                    )
+                if measure.non_additive_dimension is not None:
+                    self._add_dependency(
+                        SemanticModelElementReference(semantic_model.name, measure.non_additive_dimension.name),
+                        measure.reference,
+                    )
+            for dimension in semantic_model.dimensions:
+                dimension_element = SemanticModelElementReference(semantic_model.name, dimension.name)
+                self._add_dependency(semantic_model_reference, dimension_element)
+                self._add_dependency(dimension_element, DimensionReference(element_name=dimension.name))
+            for entity in semantic_model.entities:
+                entity_element = SemanticModelElementReference(semantic_model.name, entity.name)
+                self._add_dependency(semantic_model_reference, entity_element)
+                self._add_dependency(entity_element, EntityReference(element_name=entity.name))
+
+        semantic_model_index = {
+            semantic_model.name: semantic_model for semantic_model in semantic_manifest.semantic_models
+        }
+        for metric in semantic_manifest.metrics:
+            metric_reference = MetricReference(element_name=metric.name)
+            type_params = metric.type_params
+            for input_measure in (type_params.measure, *type_params.input_measures):
+                if input_measure is not None:
+                    self._add_dependency(input_measure.measure_reference, metric_reference)
+
+            metric_aggregation_params = type_params.metric_aggregation_params
+            if metric_aggregation_params is not None:
+                self._add_dependency(
+                    SemanticModelReference(semantic_model_name=metric_aggregation_params.semantic_model),
+                    metric_reference,
+                )
+                agg_time_dimension = metric_aggregation_params.agg_time_dimension
+                metric_semantic_model = semantic_model_index.get(metric_aggregation_params.semantic_model)
+                if (
+                    agg_time_dimension is None
+                    and metric_semantic_model is not None
+                    and metric_semantic_model.defaults is not None
+                ):
+                    agg_time_dimension = metric_semantic_model.defaults.agg_time_dimension
+                if agg_time_dimension is not None:
+                    self._add_dependency(
+                        SemanticModelElementReference(metric_aggregation_params.semantic_model, agg_time_dimension),
+                        metric_reference,
+                    )
+
+            conversion_type_params = type_params.conversion_type_params
+            if conversion_type_params is not None:
+                for input_measure in (conversion_type_params.base_measure, conversion_type_params.conversion_measure):
+                    if input_measure is not None:
+                        self._add_dependency(input_measure.measure_reference, metric_reference)
+                self._add_dependency(EntityReference(element_name=conversion_type_params.entity), metric_reference)
+                for constant_property in conversion_type_params.constant_properties or ():
+                    for property_name in (constant_property.base_property, constant_property.conversion_property):
+                        self._add_dependency(DimensionReference(element_name=property_name), metric_reference)
+
+        metric_graph = MetricGraph(semantic_manifest)
+        for metric_reference in metric_graph.metric_references:
+            for dependent_metric_reference in metric_graph.dependents(metric_reference):
+                self._add_dependency(metric_reference, dependent_metric_reference)
+
+        for saved_query in semantic_manifest.saved_queries:
+            saved_query_reference = SavedQueryReference(saved_query_name=saved_query.name)
+            # Add the saved query even if nothing references it, so that changes to it are reported.
+            self._dependents.setdefault(saved_query_reference, set())
+            for metric_name in saved_query.query_params.metrics:
+                self._add_dependency(MetricReference(element_name=metric_name), saved_query_reference)
+            for export in saved_query.exports:
+                self._add_dependency(
+                    saved_query_reference,
+                    ExportReference(saved_query_name=saved_query.name, export_name=export.name),
+                )
+
+        custom_granularity_names = tuple(
+            granularity.name
+            for time_spine in semantic_manifest.project_configuration.time_spines
+            for granularity in time_spine.custom_granularities
+        )
+        where_filter_batch_parser = WhereFilterBatchParser(custom_granularity_names=custom_granularity_names)
+        for call_site, call_site_result in where_filter_batch_parser.parse_semantic_manifest(semantic_manifest).items():
+            dependent: DependencyNode = (
+                SavedQueryReference(saved_query_name=call_site.element_name)
+                if call_site.call_site_type is WhereFilterCallSiteType.SAVED_QUERY
+                else MetricReference(element_name=call_site.element_name)
+            )
+            for where_filter_result in call_site_result.where_filter_results:
+                if where_filter_result.call_parameter_sets is not None:
+                    self._add_call_parameter_set_dependencies(
+                        where_filter_result.call_parameter_sets, dependent, custom_granularity_names
+                    )
+
+        saved_query_group_by_templates = {
+            SavedQueryReference(saved_query_name=saved_query.name): [
+                "{{ " + group_by_item + " }}" for group_by_item in saved_query.query_params.group_by
+            ]
+            for saved_query in semantic_manifest.saved_queries
+        }
+        template_to_parse_result = where_filter_batch_parser.parse_where_sql_templates(
+            template for templates in saved_query_group_by_templates.values() for template in templates
+        )
+        for saved_query_reference, templates in saved_query_group_by_templates.items():
+            for template in templates:
+                call_parameter_sets = template_to_parse_result[template].call_parameter_sets
+                if call_parameter_sets is not None:
+                    self._add_call_parameter_set_dependencies(
+                        call_parameter_sets, saved_query_reference, custom_granularity_names
+                    )
+
+    def _add_dependency(self, node: DependencyNode, dependent: DependencyNode) -> None:
+        self._dependents.setdefault(node, set()).add(dependent)
+
+    def _add_call_parameter_set_dependencies(
+        self,
+        call_parameter_sets: JinjaCallParameterSets,
+        dependent: DependencyNode,
+        custom_granularity_names: Iterable[str],
+    ) -> None:
+        """Add the dependencies of a metric or saved query on the elements referenced in a filter or group-by."""
+        for dimension_call_parameter_set in call_parameter_sets.dimension_call_parameter_sets:
+            self._add_entity_path_dependencies(dimension_call_parameter_set.entity_path, dependent)
+            self._add_dependency(
+                DimensionReference(element_name=dimension_call_parameter_set.dimension_reference.element_name),
+                dependent,
+            )
+        for time_dimension_call_parameter_set in call_parameter_sets.time_dimension_call_parameter_sets:
+            self._add_entity_path_dependencies(time_dimension_call_parameter_set.entity_path, dependent)
+            self._add_dependency(
+                DimensionReference(
+                    element_name=time_dimension_call_parameter_set.time_dimension_reference.element_name
+                ),
+                dependent,
+            )
+        for entity_call_parameter_set in call_parameter_sets.entity_call_parameter_sets:
+            self._add_entity_path_dependencies(entity_call_parameter_set.entity_path, dependent)
+            self._add_dependency(entity_call_parameter_set.entity_reference, dependent)
+        for metric_call_parameter_set in call_parameter_sets.metric_call_parameter_sets:
+            self._add_dependency(metric_call_parameter_set.metric_reference, dependent)
+            for group_by_reference in metric_call_parameter_set.group_by:
+                # A group-by of a metric in a filter can be an entity or a dimension.
+                structured_name = StructuredDunderedName.parse_name(
+                    group_by_reference.element_name, custom_granularity_names=tuple(custom_granularity_names)
+                )
+                self._add_entity_path_dependencies(structured_name.entity_links, dependent)
+                self._add_dependency(EntityReference(element_name=structured_name.element_name), dependent)
+                self._add_dependency(DimensionReference(element_name=structured_name.element_name), dependent)
+
+    def _add_entity_path_dependencies(self, entity_path: Iterable[EntityReference], dependent: DependencyNode) -> None:
+        for entity_reference in entity_path:
+            self._add_dependency(EntityReference(element_name=entity_reference.element_name), dependent)
+
+    @staticmethod
+    def _normalize_node(node: DependencyNode) -> DependencyNode:
+        # e.g. a `TimeDimensionReference` is indexed as a `DimensionReference` with the same name.
+        if isinstance(node, DimensionReference) and type(node) is not DimensionReference:
+            return DimensionReference(element_name=node.element_name)
+        return node
+
+    def direct_dependents(self, node: DependencyNode) -> FrozenSet[DependencyNode]:
+        """Returns the nodes that directly depend on the given one."""
+        return frozenset(self._dependents.get(ImpactAnalysisIndex._normalize_node(node), ()))
+
+    def affected_elements(self, changed_nodes: Iterable[DependencyNode]) -> AffectedElements:
+        """Returns the metrics, saved queries and exports that are affected by changes to the given nodes.
+
+        The result includes any of the changed nodes that are metrics, saved queries or exports.
+
+        Args:
+            changed_nodes: The elements that were changed, e.g. a `MeasureReference` for a changed measure, or a
+            `SemanticModelReference` for a change to the definition of a semantic model.
+        """
+        visited: Set[DependencyNode] = set()
+        queue: Deque[DependencyNode] = deque()
+        for changed_node in changed_nodes:
+            normalized_node = ImpactAnalysisIndex._normalize_node(changed_node)
+            if normalized_node not in visited:
+                visited.add(normalized_node)
+                queue.append(normalized_node)
+
+        while queue:
+            for dependent in self._dependents.get(queue.popleft(), ()):
+                if dependent not in visited:
+                    visited.add(dependent)
+                    queue.append(dependent)
+
+        metrics: List[MetricReference] = []
+        saved_queries: List[SavedQueryReference] = []
+        exports: List[ExportReference] = []
+        for node in visited:
+            if isinstance(node, MetricReference):
+                metrics.append(node)
+            elif isinstance(node, SavedQueryReference):
+                saved_queries.append(node)
+            elif isinstance(node, ExportReference):
+                exports.append(node)
+        return AffectedElements(
+            metrics=frozenset(metrics), saved_queries=frozenset(saved_queries), exports=frozenset(exports)
+        )
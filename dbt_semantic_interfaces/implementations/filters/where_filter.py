@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-import textwrap
-import traceback
-from typing import Callable, Generator, List, Sequence, Tuple
+import hashlib
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from typing_extensions import Self
 
-from dbt_semantic_interfaces.call_parameter_sets import (
-    JinjaCallParameterSets,
-    ParseJinjaObjectException,
-)
+from dbt_semantic_interfaces.call_parameter_sets import JinjaCallParameterSets
 from dbt_semantic_interfaces.implementations.base import (
     HashableBaseModel,
     PydanticCustomInputParser,
@@ -19,6 +27,82 @@ from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
     JinjaObjectParser,
     QueryItemLocation,
 )
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterParseResult,
+    filter_expression_parameter_sets_from_parse_results,
+)
+from dbt_semantic_interfaces.protocols.where_filter import WhereFilter
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+from dsi_pydantic_shim import PrivateAttr
+
+
+class PydanticParsedCallParameterSets(HashableBaseModel):
+    """The call parameter sets that were extracted from the template of a where filter.
+
+    These can be stored with the where filter in a serialized semantic manifest so that consumers don't need to render
+    the template with Jinja again after loading the manifest. The stored values are only used when they were created
+    with the current version of the format, from the same template, and with the same custom granularity names.
+    """
+
+    CURRENT_VERSION: ClassVar[int] = 1
+
+    version: int
+    where_sql_template_hash: str
+    custom_granularity_names: List[str]
+    call_parameter_sets: JinjaCallParameterSets
+
+    @staticmethod
+    def create(
+        where_sql_template: str, custom_granularity_names: Sequence[str], call_parameter_sets: JinjaCallParameterSets
+    ) -> PydanticParsedCallParameterSets:
+        """Create an instance using the current version of the format."""
+        return PydanticParsedCallParameterSets(
+            version=PydanticParsedCallParameterSets.CURRENT_VERSION,
+            where_sql_template_hash=PydanticParsedCallParameterSets._hash_where_sql_template(where_sql_template),
+            custom_granularity_names=sorted(
+                PydanticParsedCallParameterSets._non_standard_granularity_names(custom_granularity_names)
+            ),
+            call_parameter_sets=call_parameter_sets,
+        )
+
+    def matches(self, where_sql_template: str, custom_granularity_names: Sequence[str]) -> bool:
+        """Return true if these are the call parameter sets that would be parsed from the given inputs."""
+        return parsed_call_parameter_sets_match(
+            version=self.version,
+            where_sql_template_hash=self.where_sql_template_hash,
+            parsed_custom_granularity_names=self.custom_granularity_names,
+            where_sql_template=where_sql_template,
+            custom_granularity_names=custom_granularity_names,
+        )
+
+    @staticmethod
+    def _hash_where_sql_template(where_sql_template: str) -> str:
+        return hashlib.sha256(where_sql_template.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _non_standard_granularity_names(custom_granularity_names: Sequence[str]) -> FrozenSet[str]:
+        # Standard granularities are matched before custom ones during parsing, so callers that include them in the
+        # custom granularity names (e.g. validations) get the same results.
+        return frozenset(custom_granularity_names).difference(granularity.value for granularity in TimeGranularity)
+
+
+def parsed_call_parameter_sets_match(
+    version: int,
+    where_sql_template_hash: str,
+    parsed_custom_granularity_names: Sequence[str],
+    where_sql_template: str,
+    custom_granularity_names: Sequence[str],
+) -> bool:
+    """Return true if the stored call parameter sets with the given attributes can be used for the given inputs.
+
+    This is shared by the implementations of the stored call parameter sets - see `PydanticParsedCallParameterSets`.
+    """
+    return (
+        version == PydanticParsedCallParameterSets.CURRENT_VERSION
+        and PydanticParsedCallParameterSets._non_standard_granularity_names(custom_granularity_names)
+        == frozenset(parsed_custom_granularity_names)
+        and where_sql_template_hash == PydanticParsedCallParameterSets._hash_where_sql_template(where_sql_template)
+    )
 
 
 class PydanticWhereFilter(PydanticCustomInputParser, HashableBaseModel):
@@ -35,6 +119,19 @@ class PydanticWhereFilter(PydanticCustomInputParser, HashableBaseModel):
     # The where_sql_template field is used in PydanticWhereFilterIntersection.convert_legacy_input. Remove with caution.
     where_sql_template: str
 
+    # Optionally set by `AddParsedCallParameterSetsRule` so that `call_parameter_sets` can skip parsing the template.
+    parsed_call_parameter_sets: Optional[PydanticParsedCallParameterSets] = None
+
+    # Fields that are left out of the serialized filter when they are `None`, so that the serialized form (and the hash)
+    # of filters without stored call parameter sets is the same as before the field was added.
+    __EXCLUDED_IF_NONE_FIELDS__: ClassVar[Tuple[str, ...]] = ("parsed_call_parameter_sets",)
+
+    # Caches the results of `call_parameter_sets`. The template is included in the key as the instance can be copied
+    # with a different template.
+    _call_parameter_sets_cache: Dict[Tuple[str, Tuple[str, ...]], JinjaCallParameterSets] = PrivateAttr(
+        default_factory=dict
+    )
+
     @classmethod
     def _from_yaml_value(
         cls,
@@ -50,12 +147,49 @@ class PydanticWhereFilter(PydanticCustomInputParser, HashableBaseModel):
         else:
             raise ValueError(f"Expected input to be of type string, but got type {type(input)} with value: {input}")
 
+    def dict(self, **kwargs: Any) -> Dict[str, Any]:  # noqa: D
+        # Pydantic 1 also serializes nested models with `dict()`. The native Pydantic 2 backend handles
+        # `__EXCLUDED_IF_NONE_FIELDS__` itself - see `pydantic_v2_compat`.
+        return super().dict(**self._exclude_none_fields(kwargs))
+
+    def json(self, **kwargs: Any) -> str:  # noqa: D
+        return super().json(**self._exclude_none_fields(kwargs))
+
+    def _exclude_none_fields(self, serialization_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Adds the fields in `__EXCLUDED_IF_NONE_FIELDS__` that are `None` to the `exclude` argument."""
+        none_field_names = {
+            field_name for field_name in self.__EXCLUDED_IF_NONE_FIELDS__ if getattr(self, field_name) is None
+        }
+        if not none_field_names:
+            return serialization_kwargs
+
+        exclude = serialization_kwargs.get("exclude")
+        if exclude is None:
+            exclude = none_field_names
+        elif isinstance(exclude, Mapping):
+            exclude = {**exclude, **{field_name: ... for field_name in none_field_names}}
+        else:
+            exclude = set(exclude).union(none_field_names)
+        return {**serialization_kwargs, "exclude": exclude}
+
     def call_parameter_sets(self, custom_granularity_names: Sequence[str]) -> JinjaCallParameterSets:  # noqa: D
-        return JinjaObjectParser.parse_call_parameter_sets(
-            where_sql_template=self.where_sql_template,
-            custom_granularity_names=custom_granularity_names,
-            query_item_location=QueryItemLocation.NON_ORDER_BY,
-        )
+        cache_key = (self.where_sql_template, tuple(custom_granularity_names))
+        call_parameter_sets = self._call_parameter_sets_cache.get(cache_key)
+        if call_parameter_sets is not None:
+            return call_parameter_sets
+
+        if self.parsed_call_parameter_sets is not None and self.parsed_call_parameter_sets.matches(
+            where_sql_template=self.where_sql_template, custom_granularity_names=custom_granularity_names
+        ):
+            call_parameter_sets = self.parsed_call_parameter_sets.call_parameter_sets
+        else:
+            call_parameter_sets = JinjaObjectParser.parse_call_parameter_sets(
+                where_sql_template=self.where_sql_template,
+                custom_granularity_names=custom_granularity_names,
+                query_item_location=QueryItemLocation.NON_ORDER_BY,
+            )
+        self._call_parameter_sets_cache[cache_key] = call_parameter_sets
+        return call_parameter_sets
 
 
 class PydanticWhereFilterIntersection(HashableBaseModel):
@@ -123,28 +257,29 @@ class PydanticWhereFilterIntersection(HashableBaseModel):
         self, custom_granularity_names: Sequence[str]
     ) -> List[Tuple[str, JinjaCallParameterSets]]:
         """Gets the call parameter sets for each filter expression."""
-        filter_parameter_sets: List[Tuple[str, JinjaCallParameterSets]] = []
-        invalid_filter_expressions: List[Tuple[str, Exception]] = []
-        for where_filter in self.where_filters:
-            try:
-                filter_parameter_sets.append(
-                    (
-                        where_filter.where_sql_template,
-                        where_filter.call_parameter_sets(custom_granularity_names=custom_granularity_names),
-                    )
+        return collect_filter_expression_parameter_sets(
+            where_filters=self.where_filters, custom_granularity_names=custom_granularity_names
+        )
+
+
+def collect_filter_expression_parameter_sets(
+    where_filters: Sequence[WhereFilter], custom_granularity_names: Sequence[str]
+) -> List[Tuple[str, JinjaCallParameterSets]]:
+    """Gets the call parameter sets for each filter expression, raising a single exception describing all failures."""
+    parse_results: List[WhereFilterParseResult] = []
+    for where_filter in where_filters:
+        try:
+            parse_results.append(
+                WhereFilterParseResult(
+                    where_sql_template=where_filter.where_sql_template,
+                    call_parameter_sets=where_filter.call_parameter_sets(
+                        custom_granularity_names=custom_granularity_names
+                    ),
                 )
-            except Exception as e:
-                invalid_filter_expressions.append((where_filter.where_sql_template, e))
-
-        if invalid_filter_expressions:
-            lines = ["Encountered error(s) while parsing:\n"]
-            for where_sql_template, exception in invalid_filter_expressions:
-                lines.append("Filter:")
-                lines.append(textwrap.indent(where_sql_template, prefix="    "))
-                lines.append("Error Message:")
-                lines.append(textwrap.indent(str(exception), prefix="    "))
-                lines.append("Traceback:")
-                lines.append(textwrap.indent("".join(traceback.format_tb(exception.__traceback__)), prefix="  "))
-            raise ParseJinjaObjectException("\n".join(lines))
-
-        return filter_parameter_sets
+            )
+        except Exception as e:
+            parse_results.append(
+                WhereFilterParseResult(where_sql_template=where_filter.where_sql_template, exception=e)
+            )
+
+    return filter_expression_parameter_sets_from_parse_results(parse_results)
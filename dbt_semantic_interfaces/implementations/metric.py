@@ -306,7 +306,11 @@ class PydanticMetric(HashableBaseModel, ModelWithMetadataParsing, ProtocolHint[M
     def all_input_measures_for_metric(
         metric: Metric, metric_index: Dict[MetricReference, Metric]
     ) -> Set[MeasureReference]:
-        """Gets all input measures for the metric, including those defined on input metrics (recursively)."""
+        """Gets all input measures for the metric, including those defined on input metrics (recursively).
+
+        This recomputes the measures of the input metrics on every call, so use `MetricGraph.transitive_input_measures`
+        when getting the measures for many metrics.
+        """
         measures: Set[MeasureReference] = set()
         if metric.type is MetricType.SIMPLE or metric.type is MetricType.CUMULATIVE:
             assert (
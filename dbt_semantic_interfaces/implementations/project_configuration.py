@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from importlib_metadata import version
 from typing_extensions import override
 
 from dbt_semantic_interfaces.implementations.base import (
@@ -41,4 +40,6 @@ class PydanticProjectConfiguration(HashableBaseModel, ModelWithMetadataParsing,
         """Returns the version of the dbt_semantic_interfaces package that generated this manifest."""
         if value is not None and value != UNKNOWN_VERSION_SENTINEL:
             return value
+        from importlib_metadata import version
+
         return PydanticSemanticVersion.create_from_string(version("dbt_semantic_interfaces"))
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+SlottedT = TypeVar("SlottedT")
+
+# Converts a single input value into the value stored on a slotted object.
+_ValueConverter = Callable[[Any], Any]
+
+
+def slotted_dataclass(cls: Type[SlottedT]) -> Type[SlottedT]:
+    """Rebuilds a frozen dataclass so that instances store fields in `__slots__` instead of a `__dict__`.
+
+    `dataclass(slots=True)` is only available in Python 3.10+, so this follows the same approach as the standard
+    library: the class is re-created with `__slots__` set to the field names, and state helpers are added so that
+    copying and pickling work for frozen instances. This should be applied on top of `@dataclass(frozen=True)`, e.g.
+
+        @slotted_dataclass
+        @dataclass(frozen=True)
+        class SlottedFileSlice(ProtocolHint[FileSlice]):
+            ...
+
+    Methods in these classes should not use the zero-argument form of `super()` as the class is replaced.
+    """
+    assert dataclasses.is_dataclass(cls), f"{cls.__name__} should be a dataclass"
+    assert cls.__dataclass_params__.frozen, f"{cls.__name__} should be a frozen dataclass"  # type: ignore[attr-defined]
+
+    field_names = tuple(field.name for field in dataclasses.fields(cls))
+    class_dict = dict(cls.__dict__)
+    class_dict["__slots__"] = field_names
+    for field_name in field_names:
+        # Default values are kept by the generated `__init__`, so the class attributes can be removed.
+        class_dict.pop(field_name, None)
+    class_dict.pop("__dict__", None)
+    class_dict.pop("__weakref__", None)
+    class_dict["__getstate__"] = _slotted_getstate
+    class_dict["__setstate__"] = _slotted_setstate
+
+    slotted_cls: Type[SlottedT] = type(cls)(cls.__name__, cls.__bases__, class_dict)  # type: ignore[misc]
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
+def _slotted_getstate(self: Any) -> Tuple[Any, ...]:
+    return tuple(getattr(self, field.name) for field in dataclasses.fields(self))
+
+
+def _slotted_setstate(self: Any, state: Tuple[Any, ...]) -> None:
+    for field, value in zip(dataclasses.fields(self), state):
+        # Bypass the frozen `__setattr__`.
+        object.__setattr__(self, field.name, value)
+
+
+class SlottedObjectBuilder:
+    """Builds slotted objects from objects implementing the matching protocol, or from JSON-like dicts.
+
+    The field types of each slotted class are resolved once and compiled into a sequence of per-field converters that
+    are cached by class, so building a large manifest does not repeatedly inspect type hints.
+
+    Conversion rules, based on the annotated field type:
+    * Another slotted dataclass: built recursively from the attribute / dict value.
+    * `Optional[X]`: `None` is kept, otherwise the value is converted as `X`.
+    * `Tuple[X, ...]`: each item is converted as `X`. A bare string is treated as a single item.
+    * `Dict[...]`: shallow-copied.
+    * `Enum` subclasses: enum values (e.g. from JSON) are converted to the enum member.
+    * Anything else is used as-is.
+    """
+
+    _field_converters_by_class: Dict[type, Tuple[Tuple[str, _ValueConverter], ...]] = {}
+
+    @staticmethod
+    def build(slotted_class: Type[SlottedT], source: Union[Any, Mapping[str, Any]]) -> SlottedT:
+        """Create an instance of `slotted_class` using the values in `source`.
+
+        If `source` is a mapping, values are looked up by key. Otherwise, they are looked up by attribute. Fields
+        that are not present in the source use the default value defined in the slotted class.
+        """
+        if isinstance(source, slotted_class):
+            return source
+
+        field_converters = SlottedObjectBuilder._field_converters(slotted_class)
+        kwargs: Dict[str, Any] = {}
+        if isinstance(source, Mapping):
+            for field_name, converter in field_converters:
+                if field_name in source:
+                    kwargs[field_name] = converter(source[field_name])
+        else:
+            for field_name, converter in field_converters:
+                value = getattr(source, field_name, dataclasses.MISSING)
+                if value is not dataclasses.MISSING:
+                    kwargs[field_name] = converter(value)
+
+        return slotted_class(**kwargs)
+
+    @staticmethod
+    def _field_converters(slotted_class: type) -> Tuple[Tuple[str, _ValueConverter], ...]:
+        field_converters = SlottedObjectBuilder._field_converters_by_class.get(slotted_class)
+        if field_converters is None:
+            type_hints = get_type_hints(slotted_class)
+            field_converters = tuple(
+                (field.name, SlottedObjectBuilder._converter_for_type(type_hints[field.name]))
+                for field in dataclasses.fields(slotted_class)
+            )
+            SlottedObjectBuilder._field_converters_by_class[slotted_class] = field_converters
+        return field_converters
+
+    @staticmethod
+    def _converter_for_type(field_type: Any) -> _ValueConverter:  # noqa: C901
+        origin = get_origin(field_type)
+        args = get_args(field_type)
+
+        if origin is Union:
+            non_none_args = tuple(arg for arg in args if arg is not type(None))
+            assert len(non_none_args) == 1, f"Only Optional[...] unions are supported, but got {field_type}"
+            item_converter = SlottedObjectBuilder._converter_for_type(non_none_args[0])
+
+            def _convert_optional(value: Any) -> Any:
+                return None if value is None else item_converter(value)
+
+            return _convert_optional
+
+        if origin is tuple:
+            assert len(args) == 2 and args[1] is Ellipsis, f"Only Tuple[X, ...] is supported, but got {field_type}"
+            item_converter = SlottedObjectBuilder._converter_for_type(args[0])
+
+            def _convert_tuple(value: Any) -> Any:
+                if isinstance(value, str):
+                    return (item_converter(value),)
+                return tuple(item_converter(item) for item in value)
+
+            return _convert_tuple
+
+        if origin is dict:
+            return dict
+
+        if isinstance(field_type, type) and dataclasses.is_dataclass(field_type):
+
+            def _convert_dataclass(value: Any) -> Any:
+                return SlottedObjectBuilder.build(field_type, value)
+
+            return _convert_dataclass
+
+        if isinstance(field_type, type) and issubclass(field_type, Enum):
+
+            def _convert_enum(value: Any) -> Any:
+                return value if isinstance(value, field_type) else field_type(value)
+
+            return _convert_enum
+
+        return _identity
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def slotted_asdict(obj: Any) -> Dict[str, Any]:
+    """Similar to `dataclasses.asdict`, but converts tuples into lists to match the dict form of Pydantic objects."""
+    assert dataclasses.is_dataclass(obj) and not isinstance(obj, type), f"Expected a dataclass instance, got {obj}"
+    return _slotted_asdict_value(obj)
+
+
+def _slotted_asdict_value(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return {field.name: _slotted_asdict_value(getattr(value, field.name)) for field in dataclasses.fields(value)}
+    if isinstance(value, (tuple, list)):
+        return [_slotted_asdict_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _slotted_asdict_value(item) for key, item in value.items()}
+    return value
+
+
+def slotted_hash_for_meta(meta: Optional[Mapping[str, Any]]) -> int:
+    """Hash for the free-form `meta` dict, which can't be hashed directly."""
+    return hash(json.dumps(meta, sort_keys=True, default=str))
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from typing_extensions import override
+
+from dbt_semantic_interfaces.implementations.slotted.base import (
+    slotted_dataclass,
+    slotted_hash_for_meta,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.protocols.meta import SemanticLayerElementConfig
+from dbt_semantic_interfaces.protocols.metadata import FileSlice, Metadata
+from dbt_semantic_interfaces.protocols.node_relation import NodeRelation
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedFileSlice(ProtocolHint[FileSlice]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> FileSlice:  # noqa: D
+        return self
+
+    filename: str
+    content: str
+    start_line_number: int
+    end_line_number: int
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMetadata(ProtocolHint[Metadata]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> Metadata:  # noqa: D
+        return self
+
+    repo_file_path: str
+    file_slice: SlottedFileSlice
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedSemanticLayerElementConfig(ProtocolHint[SemanticLayerElementConfig]):
+    """Element config."""
+
+    @override
+    def _implements_protocol(self) -> SemanticLayerElementConfig:  # noqa: D
+        return self
+
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def __hash__(self) -> int:  # noqa: D
+        return slotted_hash_for_meta(self.meta)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedNodeRelation(ProtocolHint[NodeRelation]):
+    """Path object to where the data should be."""
+
+    @override
+    def _implements_protocol(self) -> NodeRelation:  # noqa: D
+        return self
+
+    alias: str
+    schema_name: str
+    database: Optional[str] = None
+    relation_name: str = ""
+
+    def __post_init__(self) -> None:
+        """Dynamically build the dot path for `relation_name`, if not specified."""
+        if self.relation_name:
+            return
+
+        if self.database is not None:
+            relation_name = f"{self.database}.{self.schema_name}.{self.alias}"
+        else:
+            relation_name = f"{self.schema_name}.{self.alias}"
+        object.__setattr__(self, "relation_name", relation_name)
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from typing_extensions import override
+
+from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
+from dbt_semantic_interfaces.implementations.slotted.base import slotted_dataclass
+from dbt_semantic_interfaces.implementations.slotted.metadata import (
+    SlottedMetadata,
+    SlottedSemanticLayerElementConfig,
+)
+from dbt_semantic_interfaces.implementations.slotted.semantic_model import (
+    SlottedMeasureAggregationParameters,
+    SlottedNonAdditiveDimensionParameters,
+)
+from dbt_semantic_interfaces.implementations.slotted.where_filter import (
+    SlottedWhereFilterIntersection,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.protocols.metric import (
+    ConstantPropertyInput,
+    ConversionTypeParams,
+    CumulativeTypeParams,
+    Metric,
+    MetricAggregationParams,
+    MetricInput,
+    MetricInputMeasure,
+    MetricTimeWindow,
+    MetricTypeParams,
+)
+from dbt_semantic_interfaces.references import MeasureReference, MetricReference
+from dbt_semantic_interfaces.type_enums import (
+    AggregationType,
+    ConversionCalculationType,
+    MetricType,
+    PeriodAggregation,
+    TimeGranularity,
+)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMetricInputMeasure(ProtocolHint[MetricInputMeasure]):
+    """Provides a pointer to a measure along with metric-specific processing directives."""
+
+    @override
+    def _implements_protocol(self) -> MetricInputMeasure:  # noqa: D
+        return self
+
+    name: str
+    filter: Optional[SlottedWhereFilterIntersection] = None
+    alias: Optional[str] = None
+    join_to_timespine: bool = False
+    fill_nulls_with: Optional[int] = None
+
+    @property
+    def measure_reference(self) -> MeasureReference:  # noqa: D
+        return MeasureReference(element_name=self.name)
+
+    @property
+    def post_aggregation_measure_reference(self) -> MeasureReference:  # noqa: D
+        return MeasureReference(element_name=self.alias or self.name)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMetricTimeWindow(ProtocolHint[MetricTimeWindow]):
+    """Describes the window of time the metric should be accumulated over, e.g., '1 day', '2 weeks', etc."""
+
+    @override
+    def _implements_protocol(self) -> MetricTimeWindow:  # noqa: D
+        return self
+
+    count: int
+    granularity: str
+
+    @property
+    def is_standard_granularity(self) -> bool:  # noqa: D
+        return self.granularity.casefold() in {item.value.casefold() for item in TimeGranularity}
+
+    @property
+    def window_string(self) -> str:  # noqa: D
+        return f"{self.count} {self.granularity}"
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedConstantPropertyInput(ProtocolHint[ConstantPropertyInput]):
+    """Input of a constant property used in conversion metrics."""
+
+    @override
+    def _implements_protocol(self) -> ConstantPropertyInput:  # noqa: D
+        return self
+
+    base_property: str
+    conversion_property: str
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMetricInput(ProtocolHint[MetricInput]):
+    """Provides a pointer to a metric along with the additional properties used on that metric."""
+
+    @override
+    def _implements_protocol(self) -> MetricInput:  # noqa: D
+        return self
+
+    name: str
+    filter: Optional[SlottedWhereFilterIntersection] = None
+    alias: Optional[str] = None
+    offset_window: Optional[SlottedMetricTimeWindow] = None
+    offset_to_grain: Optional[str] = None
+
+    @property
+    def as_reference(self) -> MetricReference:  # noqa: D
+        return MetricReference(element_name=self.name)
+
+    @property
+    def post_aggregation_reference(self) -> MetricReference:  # noqa: D
+        return MetricReference(element_name=self.alias or self.name)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedConversionTypeParams(ProtocolHint[ConversionTypeParams]):
+    """Type params to provide context for conversion metrics properties."""
+
+    @override
+    def _implements_protocol(self) -> ConversionTypeParams:  # noqa: D
+        return self
+
+    entity: str
+    base_measure: Optional[SlottedMetricInputMeasure] = None
+    base_metric: Optional[SlottedMetricInput] = None
+    conversion_measure: Optional[SlottedMetricInputMeasure] = None
+    conversion_metric: Optional[SlottedMetricInput] = None
+    calculation: ConversionCalculationType = ConversionCalculationType.CONVERSION_RATE
+    window: Optional[SlottedMetricTimeWindow] = None
+    constant_properties: Optional[Tuple[SlottedConstantPropertyInput, ...]] = None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedCumulativeTypeParams(ProtocolHint[CumulativeTypeParams]):
+    """Type params to provide context for cumulative metrics properties."""
+
+    @override
+    def _implements_protocol(self) -> CumulativeTypeParams:  # noqa: D
+        return self
+
+    window: Optional[SlottedMetricTimeWindow] = None
+    grain_to_date: Optional[str] = None
+    period_agg: PeriodAggregation = PeriodAggregation.FIRST
+    metric: Optional[SlottedMetricInput] = None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMetricAggregationParams(ProtocolHint[MetricAggregationParams]):
+    """Type params to provide context for metrics that are used as source nodes."""
+
+    @override
+    def _implements_protocol(self) -> MetricAggregationParams:  # noqa: D
+        return self
+
+    semantic_model: str
+    agg: AggregationType
+    agg_params: Optional[SlottedMeasureAggregationParameters] = None
+    agg_time_dimension: Optional[str] = None
+    non_additive_dimension: Optional[SlottedNonAdditiveDimensionParameters] = None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMetricTypeParams(ProtocolHint[MetricTypeParams]):
+    """Type params add additional context to certain metric types (the context depends on the metric type)."""
+
+    @override
+    def _implements_protocol(self) -> MetricTypeParams:  # noqa: D
+        return self
+
+    measure: Optional[SlottedMetricInputMeasure] = None
+    numerator: Optional[SlottedMetricInput] = None
+    denominator: Optional[SlottedMetricInput] = None
+    expr: Optional[str] = None
+    window: Optional[SlottedMetricTimeWindow] = None
+    grain_to_date: Optional[TimeGranularity] = None
+    metrics: Optional[Tuple[SlottedMetricInput, ...]] = None
+    conversion_type_params: Optional[SlottedConversionTypeParams] = None
+    cumulative_type_params: Optional[SlottedCumulativeTypeParams] = None
+    input_measures: Tuple[SlottedMetricInputMeasure, ...] = ()
+    metric_aggregation_params: Optional[SlottedMetricAggregationParams] = None
+    join_to_timespine: bool = False
+    fill_nulls_with: Optional[int] = None
+    is_private: Optional[bool] = False
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMetric(ProtocolHint[Metric]):
+    """Describes a metric."""
+
+    @override
+    def _implements_protocol(self) -> Metric:  # noqa: D
+        return self
+
+    name: str
+    type: MetricType
+    type_params: SlottedMetricTypeParams
+    description: Optional[str] = None
+    filter: Optional[SlottedWhereFilterIntersection] = None
+    metadata: Optional[SlottedMetadata] = None
+    label: Optional[str] = None
+    config: Optional[SlottedSemanticLayerElementConfig] = None
+    time_granularity: Optional[str] = None
+
+    @property
+    def input_measures(self) -> Tuple[SlottedMetricInputMeasure, ...]:  # noqa: D
+        return self.type_params.input_measures
+
+    @property
+    def measure_references(self) -> Tuple[MeasureReference, ...]:  # noqa: D
+        return tuple(input_measure.measure_reference for input_measure in self.input_measures)
+
+    @property
+    def input_metrics(self) -> Tuple[SlottedMetricInput, ...]:  # noqa: D
+        if self.type is MetricType.SIMPLE or self.type is MetricType.CUMULATIVE or self.type is MetricType.CONVERSION:
+            return ()
+        elif self.type is MetricType.DERIVED:
+            return self.type_params.metrics or ()
+        elif self.type is MetricType.RATIO:
+            assert (
+                self.type_params.numerator is not None and self.type_params.denominator is not None
+            ), f"{self} is metric type {MetricType.RATIO}, so neither the numerator and denominator should not be None"
+            return (self.type_params.numerator, self.type_params.denominator)
+        else:
+            assert_values_exhausted(self.type)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from typing_extensions import override
+
+from dbt_semantic_interfaces.implementations.slotted.base import slotted_dataclass
+from dbt_semantic_interfaces.implementations.slotted.metadata import (
+    SlottedMetadata,
+    SlottedNodeRelation,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.protocols.project_configuration import ProjectConfiguration
+from dbt_semantic_interfaces.protocols.semantic_version import SemanticVersion
+from dbt_semantic_interfaces.protocols.time_spine import (
+    TimeSpine,
+    TimeSpineCustomGranularityColumn,
+    TimeSpinePrimaryColumn,
+)
+from dbt_semantic_interfaces.protocols.time_spine_configuration import (
+    TimeSpineTableConfiguration,
+)
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedSemanticVersion(ProtocolHint[SemanticVersion]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> SemanticVersion:  # noqa: D
+        return self
+
+    major_version: str
+    minor_version: str
+    patch_version: Optional[str] = None
+
+    @staticmethod
+    def create_from_string(version_str: str) -> SlottedSemanticVersion:  # noqa: D
+        version_str_split = version_str.split(".")
+        if len(version_str_split) < 2:
+            raise ValueError(f"Expected version string to be of the form x.y or x.y.z, but got {version_str}")
+        return SlottedSemanticVersion(
+            major_version=version_str_split[0],
+            minor_version=version_str_split[1],
+            patch_version=".".join(version_str_split[2:]) if len(version_str_split) >= 3 else None,
+        )
+
+
+def _current_dsi_package_version() -> SlottedSemanticVersion:
+    from importlib_metadata import version
+
+    return SlottedSemanticVersion.create_from_string(version("dbt_semantic_interfaces"))
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedTimeSpinePrimaryColumn(ProtocolHint[TimeSpinePrimaryColumn]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> TimeSpinePrimaryColumn:  # noqa: D
+        return self
+
+    name: str
+    time_granularity: TimeGranularity
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedTimeSpineCustomGranularityColumn(ProtocolHint[TimeSpineCustomGranularityColumn]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> TimeSpineCustomGranularityColumn:  # noqa: D
+        return self
+
+    name: str
+    column_name: Optional[str] = None
+
+    @property
+    def parsed_column_name(self) -> str:
+        """The name of the column in the time spine table that contains this custom granularity."""
+        return self.column_name or self.name
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedTimeSpine(ProtocolHint[TimeSpine]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> TimeSpine:  # noqa: D
+        return self
+
+    node_relation: SlottedNodeRelation
+    primary_column: SlottedTimeSpinePrimaryColumn
+    custom_granularities: Tuple[SlottedTimeSpineCustomGranularityColumn, ...] = ()
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedTimeSpineTableConfiguration(ProtocolHint[TimeSpineTableConfiguration]):
+    """Legacy time spine configuration."""
+
+    @override
+    def _implements_protocol(self) -> TimeSpineTableConfiguration:  # noqa: D
+        return self
+
+    location: str
+    column_name: str
+    grain: TimeGranularity
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedProjectConfiguration(ProtocolHint[ProjectConfiguration]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> ProjectConfiguration:  # noqa: D
+        return self
+
+    time_spine_table_configurations: Tuple[SlottedTimeSpineTableConfiguration, ...] = ()
+    metadata: Optional[SlottedMetadata] = None
+    dsi_package_version: SlottedSemanticVersion = field(default_factory=_current_dsi_package_version)
+    time_spines: Tuple[SlottedTimeSpine, ...] = ()
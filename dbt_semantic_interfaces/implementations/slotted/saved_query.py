@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from typing_extensions import override
+
+from dbt_semantic_interfaces.implementations.slotted.base import slotted_dataclass
+from dbt_semantic_interfaces.implementations.slotted.metadata import SlottedMetadata
+from dbt_semantic_interfaces.implementations.slotted.where_filter import (
+    SlottedWhereFilterIntersection,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.protocols.export import Export, ExportConfig
+from dbt_semantic_interfaces.protocols.saved_query import (
+    SavedQuery,
+    SavedQueryQueryParams,
+)
+from dbt_semantic_interfaces.type_enums.export_destination_type import (
+    ExportDestinationType,
+)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedExportConfig(ProtocolHint[ExportConfig]):
+    """Configuration for an export."""
+
+    @override
+    def _implements_protocol(self) -> ExportConfig:  # noqa: D
+        return self
+
+    export_as: ExportDestinationType
+    schema_name: Optional[str] = None
+    alias: Optional[str] = None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedExport(ProtocolHint[Export]):
+    """An export of a saved query."""
+
+    @override
+    def _implements_protocol(self) -> Export:  # noqa: D
+        return self
+
+    name: str
+    config: SlottedExportConfig
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedSavedQueryQueryParams(ProtocolHint[SavedQueryQueryParams]):
+    """The query parameters for a saved query."""
+
+    @override
+    def _implements_protocol(self) -> SavedQueryQueryParams:  # noqa: D
+        return self
+
+    metrics: Tuple[str, ...]
+    group_by: Tuple[str, ...] = ()
+    order_by: Tuple[str, ...] = ()
+    limit: Optional[int] = None
+    where: Optional[SlottedWhereFilterIntersection] = None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedSavedQuery(ProtocolHint[SavedQuery]):
+    """A query that has been saved with a name."""
+
+    @override
+    def _implements_protocol(self) -> SavedQuery:  # noqa: D
+        return self
+
+    name: str
+    query_params: SlottedSavedQueryQueryParams
+    description: Optional[str] = None
+    metadata: Optional[SlottedMetadata] = None
+    label: Optional[str] = None
+    exports: Tuple[SlottedExport, ...] = ()
+    tags: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:  # noqa: D
+        # Match the ordering applied by the Pydantic implementation.
+        object.__setattr__(self, "tags", tuple(sorted(self.tags)))
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Tuple
+
+from typing_extensions import override
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.implementations.slotted.base import (
+    SlottedObjectBuilder,
+    slotted_asdict,
+    slotted_dataclass,
+)
+from dbt_semantic_interfaces.implementations.slotted.metric import SlottedMetric
+from dbt_semantic_interfaces.implementations.slotted.project_configuration import (
+    SlottedProjectConfiguration,
+)
+from dbt_semantic_interfaces.implementations.slotted.saved_query import (
+    SlottedSavedQuery,
+)
+from dbt_semantic_interfaces.implementations.slotted.semantic_model import (
+    SlottedSemanticModel,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedSemanticManifest(ProtocolHint[SemanticManifest]):
+    """A lightweight, immutable semantic manifest that uses `__slots__` dataclasses instead of Pydantic models.
+
+    This is useful for read-only use cases with large manifests, as the objects take less memory and are faster to
+    construct than the Pydantic implementation. Values are not validated on construction, so the source should be a
+    manifest that was produced by the Pydantic implementation (or an equivalent). Validation rules can be run on this
+    manifest directly, but transformations require the Pydantic implementation - see `to_pydantic()`.
+    """
+
+    @override
+    def _implements_protocol(self) -> SemanticManifest:  # noqa: D
+        return self
+
+    semantic_models: Tuple[SlottedSemanticModel, ...]
+    metrics: Tuple[SlottedMetric, ...]
+    project_configuration: SlottedProjectConfiguration
+    saved_queries: Tuple[SlottedSavedQuery, ...] = ()
+
+    @staticmethod
+    def from_protocol(semantic_manifest: SemanticManifest) -> SlottedSemanticManifest:
+        """Create a manifest from any object implementing the `SemanticManifest` protocol."""
+        return SlottedObjectBuilder.build(SlottedSemanticManifest, semantic_manifest)
+
+    @staticmethod
+    def from_dict(semantic_manifest_dict: Mapping[str, Any]) -> SlottedSemanticManifest:
+        """Create a manifest from the dict form of a serialized `PydanticSemanticManifest`."""
+        return SlottedObjectBuilder.build(SlottedSemanticManifest, semantic_manifest_dict)
+
+    @staticmethod
+    def from_json(semantic_manifest_json: str) -> SlottedSemanticManifest:
+        """Create a manifest from the output of `PydanticSemanticManifest.json()`."""
+        return SlottedSemanticManifest.from_dict(json.loads(semantic_manifest_json))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert this manifest into a dict that can be parsed by `PydanticSemanticManifest.parse_obj()`."""
+        return slotted_asdict(self)
+
+    def to_pydantic(self) -> PydanticSemanticManifest:
+        """Convert this manifest into the equivalent `PydanticSemanticManifest`."""
+        return PydanticSemanticManifest.parse_obj(self.to_dict())
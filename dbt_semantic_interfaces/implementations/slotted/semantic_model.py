@@ -0,0 +1,317 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from typing_extensions import override
+
+from dbt_semantic_interfaces.implementations.slotted.base import slotted_dataclass
+from dbt_semantic_interfaces.implementations.slotted.metadata import (
+    SlottedMetadata,
+    SlottedNodeRelation,
+    SlottedSemanticLayerElementConfig,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.protocols.dimension import (
+    Dimension,
+    DimensionTypeParams,
+    DimensionValidityParams,
+)
+from dbt_semantic_interfaces.protocols.entity import Entity
+from dbt_semantic_interfaces.protocols.measure import (
+    Measure,
+    MeasureAggregationParameters,
+    NonAdditiveDimensionParameters,
+)
+from dbt_semantic_interfaces.protocols.metric import Metric
+from dbt_semantic_interfaces.protocols.semantic_model import (
+    SemanticModel,
+    SemanticModelDefaults,
+)
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    LinkableElementReference,
+    MeasureReference,
+    SemanticModelReference,
+    TimeDimensionReference,
+)
+from dbt_semantic_interfaces.type_enums import (
+    AggregationType,
+    DimensionType,
+    EntityType,
+    TimeGranularity,
+)
+from dbt_semantic_interfaces.type_enums.metric_type import MetricType
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedDimensionValidityParams(ProtocolHint[DimensionValidityParams]):
+    """Parameters identifying a given dimension as an entity for validity state."""
+
+    @override
+    def _implements_protocol(self) -> DimensionValidityParams:  # noqa: D
+        return self
+
+    is_start: bool = False
+    is_end: bool = False
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedDimensionTypeParams(ProtocolHint[DimensionTypeParams]):
+    """Type params add additional context to some types (time) of dimensions."""
+
+    @override
+    def _implements_protocol(self) -> DimensionTypeParams:  # noqa: D
+        return self
+
+    time_granularity: TimeGranularity
+    validity_params: Optional[SlottedDimensionValidityParams] = None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedDimension(ProtocolHint[Dimension]):
+    """Describes a dimension."""
+
+    @override
+    def _implements_protocol(self) -> Dimension:  # noqa: D
+        return self
+
+    name: str
+    type: DimensionType
+    description: Optional[str] = None
+    is_partition: bool = False
+    type_params: Optional[SlottedDimensionTypeParams] = None
+    expr: Optional[str] = None
+    metadata: Optional[SlottedMetadata] = None
+    label: Optional[str] = None
+    config: Optional[SlottedSemanticLayerElementConfig] = None
+
+    @property
+    def reference(self) -> DimensionReference:  # noqa: D
+        return DimensionReference(element_name=self.name)
+
+    @property
+    def time_dimension_reference(self) -> Optional[TimeDimensionReference]:  # noqa: D
+        return TimeDimensionReference(element_name=self.name) if self.type is DimensionType.TIME else None
+
+    @property
+    def validity_params(self) -> Optional[SlottedDimensionValidityParams]:  # noqa: D
+        if self.type_params:
+            return self.type_params.validity_params
+        return None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedEntity(ProtocolHint[Entity]):
+    """Describes an entity."""
+
+    @override
+    def _implements_protocol(self) -> Entity:  # noqa: D
+        return self
+
+    name: str
+    type: EntityType
+    description: Optional[str] = None
+    role: Optional[str] = None
+    expr: Optional[str] = None
+    metadata: Optional[SlottedMetadata] = None
+    label: Optional[str] = None
+    config: Optional[SlottedSemanticLayerElementConfig] = None
+
+    @property
+    def reference(self) -> EntityReference:  # noqa: D
+        return EntityReference(element_name=self.name)
+
+    @property
+    def is_linkable_entity_type(self) -> bool:  # noqa: D
+        return self.type in (EntityType.PRIMARY, EntityType.UNIQUE, EntityType.NATURAL)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedNonAdditiveDimensionParameters(ProtocolHint[NonAdditiveDimensionParameters]):
+    """Describes the params for specifying non-additive dimensions in a measure."""
+
+    @override
+    def _implements_protocol(self) -> NonAdditiveDimensionParameters:  # noqa: D
+        return self
+
+    name: str
+    window_choice: AggregationType = AggregationType.MIN
+    window_groupings: Tuple[str, ...] = ()
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMeasureAggregationParameters(ProtocolHint[MeasureAggregationParameters]):
+    """Describes parameters for aggregations."""
+
+    @override
+    def _implements_protocol(self) -> MeasureAggregationParameters:  # noqa: D
+        return self
+
+    percentile: Optional[float] = None
+    use_discrete_percentile: bool = False
+    use_approximate_percentile: bool = False
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedMeasure(ProtocolHint[Measure]):
+    """Describes a measure."""
+
+    @override
+    def _implements_protocol(self) -> Measure:  # noqa: D
+        return self
+
+    name: str
+    agg: AggregationType
+    description: Optional[str] = None
+    create_metric: Optional[bool] = None
+    expr: Optional[str] = None
+    agg_params: Optional[SlottedMeasureAggregationParameters] = None
+    metadata: Optional[SlottedMetadata] = None
+    non_additive_dimension: Optional[SlottedNonAdditiveDimensionParameters] = None
+    agg_time_dimension: Optional[str] = None
+    label: Optional[str] = None
+    config: Optional[SlottedSemanticLayerElementConfig] = None
+
+    @property
+    def reference(self) -> MeasureReference:  # noqa: D
+        return MeasureReference(element_name=self.name)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedSemanticModelDefaults(ProtocolHint[SemanticModelDefaults]):  # noqa: D
+    @override
+    def _implements_protocol(self) -> SemanticModelDefaults:  # noqa: D
+        return self
+
+    agg_time_dimension: Optional[str] = None
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedSemanticModel(ProtocolHint[SemanticModel]):
+    """Describes a semantic model."""
+
+    @override
+    def _implements_protocol(self) -> SemanticModel:  # noqa: D
+        return self
+
+    name: str
+    node_relation: SlottedNodeRelation
+    defaults: Optional[SlottedSemanticModelDefaults] = None
+    description: Optional[str] = None
+    primary_entity: Optional[str] = None
+    entities: Tuple[SlottedEntity, ...] = ()
+    measures: Tuple[SlottedMeasure, ...] = ()
+    dimensions: Tuple[SlottedDimension, ...] = ()
+    label: Optional[str] = None
+    metadata: Optional[SlottedMetadata] = None
+    config: Optional[SlottedSemanticLayerElementConfig] = None
+
+    @property
+    def entity_references(self) -> Tuple[LinkableElementReference, ...]:  # noqa: D
+        return tuple(entity.reference for entity in self.entities)
+
+    @property
+    def dimension_references(self) -> Tuple[LinkableElementReference, ...]:  # noqa: D
+        return tuple(dimension.reference for dimension in self.dimensions)
+
+    @property
+    def measure_references(self) -> Tuple[MeasureReference, ...]:  # noqa: D
+        return tuple(measure.reference for measure in self.measures)
+
+    @property
+    def has_validity_dimensions(self) -> bool:  # noqa: D
+        return any(dim.validity_params is not None for dim in self.dimensions)
+
+    @property
+    def validity_start_dimension(self) -> Optional[SlottedDimension]:  # noqa: D
+        validity_start_dims = [dim for dim in self.dimensions if dim.validity_params and dim.validity_params.is_start]
+        if not validity_start_dims:
+            return None
+        assert (
+            len(validity_start_dims) == 1
+        ), "Found more than one validity start dimension. This should have been blocked in validation!"
+        return validity_start_dims[0]
+
+    @property
+    def validity_end_dimension(self) -> Optional[SlottedDimension]:  # noqa: D
+        validity_end_dims = [dim for dim in self.dimensions if dim.validity_params and dim.validity_params.is_end]
+        if not validity_end_dims:
+            return None
+        assert (
+            len(validity_end_dims) == 1
+        ), "Found more than one validity end dimension. This should have been blocked in validation!"
+        return validity_end_dims[0]
+
+    @property
+    def partitions(self) -> Tuple[SlottedDimension, ...]:  # noqa: D
+        return tuple(dim for dim in self.dimensions if dim.is_partition)
+
+    @property
+    def partition(self) -> Optional[SlottedDimension]:  # noqa: D
+        partitions = self.partitions
+        if not partitions:
+            return None
+        if len(partitions) > 1:
+            raise ValueError(f"too many partitions for semantic_model {self.name}")
+        return partitions[0]
+
+    @property
+    def reference(self) -> SemanticModelReference:  # noqa: D
+        return SemanticModelReference(semantic_model_name=self.name)
+
+    @property
+    def primary_entity_reference(self) -> Optional[EntityReference]:  # noqa: D
+        return EntityReference(element_name=self.primary_entity) if self.primary_entity is not None else None
+
+    def get_measure(self, measure_reference: MeasureReference) -> SlottedMeasure:  # noqa: D
+        for measure in self.measures:
+            if measure.reference == measure_reference:
+                return measure
+
+        raise ValueError(
+            f"No measure with name ({measure_reference.element_name}) in semantic_model with name ({self.name})"
+        )
+
+    def checked_agg_time_dimension_for_simple_metric(self, metric: Metric) -> TimeDimensionReference:  # noqa: D
+        assert metric.type == MetricType.SIMPLE, "Only simple metrics can have an agg time dimension."
+        metric_agg_params = metric.type_params.metric_aggregation_params
+        assert metric_agg_params, "Simple metrics must have metric_aggregation_params."
+        assert metric_agg_params.semantic_model == self.name, (
+            f"Cannot retrieve the agg time dimension for a metric from a different model than the one that the metric "
+            f"belongs to. Metric `{metric.name}` belongs to model `{metric_agg_params.semantic_model}`, but we "
+            f"requested the agg time dimension from model `{self.name}`."
+        )
+
+        default_agg_time_dimension = self.defaults.agg_time_dimension if self.defaults is not None else None
+        agg_time_dimension_name = metric_agg_params.agg_time_dimension or default_agg_time_dimension
+        assert agg_time_dimension_name is not None, (
+            f"Aggregation time dimension for metric {metric.name} is not set! This should either be set directly on "
+            f"the metric specification in the model, or else defaulted to the time dimension in the data "
+            f"source containing the metric."
+        )
+        return TimeDimensionReference(element_name=agg_time_dimension_name)
+
+    def checked_agg_time_dimension_for_measure(  # noqa: D
+        self, measure_reference: MeasureReference
+    ) -> TimeDimensionReference:
+        measure = self.get_measure(measure_reference=measure_reference)
+        default_agg_time_dimension = self.defaults.agg_time_dimension if self.defaults is not None else None
+
+        agg_time_dimension_name = measure.agg_time_dimension or default_agg_time_dimension
+        assert agg_time_dimension_name is not None, (
+            f"Aggregation time dimension for measure {measure.name} is not set! This should either be set directly on "
+            f"the measure specification in the model, or else defaulted to the primary time dimension in the data "
+            f"source containing the measure."
+        )
+        return TimeDimensionReference(element_name=agg_time_dimension_name)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from typing_extensions import override
+
+from dbt_semantic_interfaces.call_parameter_sets import JinjaCallParameterSets
+from dbt_semantic_interfaces.implementations.filters.where_filter import (
+    collect_filter_expression_parameter_sets,
+    parsed_call_parameter_sets_match,
+)
+from dbt_semantic_interfaces.implementations.slotted.base import slotted_dataclass
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
+    JinjaObjectParser,
+    QueryItemLocation,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.protocols.where_filter import (
+    WhereFilter,
+    WhereFilterIntersection,
+)
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedParsedCallParameterSets:
+    """The call parameter sets that were extracted from the template of a where filter.
+
+    See `PydanticParsedCallParameterSets`.
+    """
+
+    version: int
+    where_sql_template_hash: str
+    custom_granularity_names: Tuple[str, ...]
+    call_parameter_sets: JinjaCallParameterSets
+
+    def matches(self, where_sql_template: str, custom_granularity_names: Sequence[str]) -> bool:
+        """Return true if these are the call parameter sets that would be parsed from the given inputs."""
+        return parsed_call_parameter_sets_match(
+            version=self.version,
+            where_sql_template_hash=self.where_sql_template_hash,
+            parsed_custom_granularity_names=self.custom_granularity_names,
+            where_sql_template=where_sql_template,
+            custom_granularity_names=custom_granularity_names,
+        )
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedWhereFilter(ProtocolHint[WhereFilter]):
+    """A templated SQL where expression."""
+
+    @override
+    def _implements_protocol(self) -> WhereFilter:  # noqa: D
+        return self
+
+    where_sql_template: str
+    parsed_call_parameter_sets: Optional[SlottedParsedCallParameterSets] = None
+
+    def call_parameter_sets(self, custom_granularity_names: Sequence[str]) -> JinjaCallParameterSets:  # noqa: D
+        if self.parsed_call_parameter_sets is not None and self.parsed_call_parameter_sets.matches(
+            where_sql_template=self.where_sql_template, custom_granularity_names=custom_granularity_names
+        ):
+            return self.parsed_call_parameter_sets.call_parameter_sets
+        return JinjaObjectParser.parse_call_parameter_sets(
+            where_sql_template=self.where_sql_template,
+            custom_granularity_names=custom_granularity_names,
+            query_item_location=QueryItemLocation.NON_ORDER_BY,
+        )
+
+
+@slotted_dataclass
+@dataclass(frozen=True)
+class SlottedWhereFilterIntersection(ProtocolHint[WhereFilterIntersection]):
+    """A collection of where filters that should all be applied."""
+
+    @override
+    def _implements_protocol(self) -> WhereFilterIntersection:  # noqa: D
+        return self
+
+    where_filters: Tuple[SlottedWhereFilter, ...]
+
+    def filter_expression_parameter_sets(  # noqa: D
+        self, custom_granularity_names: Sequence[str]
+    ) -> List[Tuple[str, JinjaCallParameterSets]]:
+        return collect_filter_expression_parameter_sets(
+            where_filters=self.where_filters, custom_granularity_names=custom_granularity_names
+        )
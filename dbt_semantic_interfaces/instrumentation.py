@@ -0,0 +1,161 @@
+"""Hooks for instrumenting the phases of parsing, transforming and validating a semantic manifest.
+
+The library calls `instrumented_phase` around each phase, e.g. reading a file or running a validation rule. By default
+no hooks are installed and `instrumented_phase` returns a shared no-op context manager. To trace the phases, e.g. with
+OpenTelemetry spans or statsd timers, subclass `InstrumentationHooks` and install it with
+`set_instrumentation_hooks` or `use_instrumentation_hooks`:
+
+    class SpanHooks(InstrumentationHooks):
+        @override
+        def phase(self, name: str, attributes: Mapping[str, str]) -> ContextManager[None]:
+            return tracer.start_as_current_span(name, attributes=attributes)
+
+    with use_instrumentation_hooks(SpanHooks()):
+        parse_directory_of_yaml_files_to_semantic_manifest(directory)
+
+For callback-based metrics, `PhaseTimingHooks` times each phase and calls a function with the result.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    TypeVar,
+)
+
+from typing_extensions import override
+
+# Reading a YAML file. Attributes: `file_path`.
+FILE_READ_PHASE = "file_read"
+# Loading one YAML document from a file. Attributes: `file_path`.
+YAML_LOAD_PHASE = "yaml_load"
+# Validating a document against its JSON schema. Attributes: `file_path`, `document_type`.
+JSONSCHEMA_VALIDATE_PHASE = "jsonschema_validate"
+# Parsing a document into a Pydantic object. Attributes: `file_path`, `document_type`.
+PYDANTIC_PARSE_PHASE = "pydantic_parse"
+# Running one transformation rule. Attributes: `rule`.
+TRANSFORM_RULE_PHASE = "transform_rule"
+# Running one validation rule. Attributes: `rule`. Rules run in worker processes (`multi_process=True`) are not
+# instrumented.
+VALIDATION_RULE_PHASE = "validation_rule"
+# Parsing the Jinja template of a where filter or saved query parameter. Attributes: `query_item_location`.
+WHERE_FILTER_PARSE_PHASE = "where_filter_parse"
+
+T = TypeVar("T")
+
+
+class InstrumentationHooks:
+    """Callbacks for the phases of parsing, transforming and validating a semantic manifest.
+
+    The default implementation does nothing. Subclasses should override `phase`.
+    """
+
+    def phase(self, name: str, attributes: Mapping[str, str]) -> ContextManager[None]:
+        """Returns a context manager that is entered when the phase starts and exited when it finishes.
+
+        Args:
+            name: The name of the phase, e.g. `FILE_READ_PHASE`.
+            attributes: Details about the phase, e.g. the path of the file that is read. The keys for each phase are
+                listed next to its name in this module.
+
+        An exception raised in the phase propagates through the context manager.
+        """
+        return nullcontext()
+
+
+@dataclass(frozen=True)
+class PhaseTiming:
+    """The time that a phase took. See `PhaseTimingHooks`.
+
+    Attributes:
+        name: The name of the phase, e.g. `FILE_READ_PHASE`.
+        attributes: Details about the phase, e.g. the path of the file that is read.
+        seconds: The wall-clock time of the phase.
+        succeeded: Whether the phase finished without raising an exception.
+    """
+
+    name: str
+    attributes: Mapping[str, str]
+    seconds: float
+    succeeded: bool
+
+
+class PhaseTimingHooks(InstrumentationHooks):
+    """Times each phase and passes the result to a callback, e.g. to send it to statsd."""
+
+    def __init__(self, callback: Callable[[PhaseTiming], None]) -> None:  # noqa: D107
+        self._callback = callback
+
+    @override
+    @contextmanager
+    def phase(self, name: str, attributes: Mapping[str, str]) -> Iterator[None]:  # noqa: D
+        start_time = time.perf_counter()
+        succeeded = False
+        try:
+            yield
+            succeeded = True
+        finally:
+            self._callback(
+                PhaseTiming(
+                    name=name, attributes=attributes, seconds=time.perf_counter() - start_time, succeeded=succeeded
+                )
+            )
+
+
+_NO_OP_PHASE: ContextManager[None] = nullcontext()
+
+_instrumentation_hooks: Optional[InstrumentationHooks] = None
+
+
+def get_instrumentation_hooks() -> Optional[InstrumentationHooks]:
+    """Returns the installed hooks, or None if there aren't any."""
+    return _instrumentation_hooks
+
+
+def set_instrumentation_hooks(hooks: Optional[InstrumentationHooks]) -> Optional[InstrumentationHooks]:
+    """Installs the hooks for the whole process, or removes them if `hooks` is None. Returns the previous hooks."""
+    global _instrumentation_hooks
+    previous_hooks = _instrumentation_hooks
+    _instrumentation_hooks = hooks
+    return previous_hooks
+
+
+@contextmanager
+def use_instrumentation_hooks(hooks: Optional[InstrumentationHooks]) -> Iterator[None]:
+    """Installs the hooks while in the context, then restores the previous hooks."""
+    previous_hooks = set_instrumentation_hooks(hooks)
+    try:
+        yield
+    finally:
+        set_instrumentation_hooks(previous_hooks)
+
+
+def instrumented_phase(name: str, **attributes: str) -> ContextManager[None]:
+    """Returns a context manager for the phase from the installed hooks, or a no-op if no hooks are installed."""
+    hooks = _instrumentation_hooks
+    if hooks is None:
+        return _NO_OP_PHASE
+    return hooks.phase(name, attributes)
+
+
+def instrumented_iter(name: str, iterable: Iterable[T], **attributes: str) -> Iterator[T]:
+    """Iterates over the iterable, instrumenting the production of each item as a separate phase.
+
+    This is used for lazy loaders, where the work happens while getting the next item.
+    """
+    iterator = iter(iterable)
+    while True:
+        with instrumented_phase(name, **attributes):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
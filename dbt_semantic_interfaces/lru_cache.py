@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Generic, Hashable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+@dataclass(frozen=True)
+class LruCacheStats:
+    """Statistics for an `LruCache`."""
+
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits, or 0 if there haven't been any lookups."""
+        lookup_count = self.hits + self.misses
+        return self.hits / lookup_count if lookup_count > 0 else 0.0
+
+
+class LruCache(Generic[KeyT, ValueT]):
+    """A size-bounded cache that evicts the least-recently used entries, and is safe to use from multiple threads.
+
+    Values should be immutable as they are shared between callers.
+    """
+
+    def __init__(self, max_size: int) -> None:  # noqa: D107
+        if max_size < 1:
+            raise ValueError(f"The max size of the cache should be at least 1, but got {max_size}")
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[KeyT, ValueT] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_create(self, key: KeyT, create: Callable[[], ValueT]) -> ValueT:
+        """Return the value for the key, calling `create` to get the value if it's not in the cache.
+
+        `create` is called without holding the lock, so it may be called concurrently for the same key. If it raises an
+        exception, nothing is cached.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return self._entries[key]
+            self._misses += 1
+
+        value = create()
+
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    @property
+    def stats(self) -> LruCacheStats:  # noqa: D
+        with self._lock:
+            return LruCacheStats(hits=self._hits, misses=self._misses, size=len(self._entries), max_size=self._max_size)
@@ -0,0 +1,196 @@
+"""Reading and writing the JSON of a `PydanticSemanticManifest` one object at a time.
+
+`PydanticSemanticManifest.parse_raw` needs the whole document as a string, and creates the dicts for all of it before
+creating any object. `.json()` similarly creates the dicts for the whole manifest and then one string for all of it.
+For large manifests, that is several times the memory of the manifest itself. Here, each semantic model, metric and
+saved query is read from the stream and created, or serialized and written to the stream, before the next one, so only
+the manifest and one object's dicts and JSON are in memory at a time.
+
+The JSON is read with `json.JSONDecoder.raw_decode`, from a buffer that is filled from the stream as needed, so no
+streaming JSON library is needed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple, Type
+
+from dbt_semantic_interfaces.implementations.metric import PydanticMetric
+from dbt_semantic_interfaces.implementations.project_configuration import (
+    PydanticProjectConfiguration,
+)
+from dbt_semantic_interfaces.implementations.saved_query import PydanticSavedQuery
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.implementations.semantic_model import PydanticSemanticModel
+from dsi_pydantic_shim import BaseModel
+
+# The fields of the manifest that are lists of objects, with the class of the objects.
+_LIST_FIELD_CLASSES: Dict[str, Type[BaseModel]] = {
+    "semantic_models": PydanticSemanticModel,
+    "metrics": PydanticMetric,
+    "saved_queries": PydanticSavedQuery,
+}
+# The fields of the manifest that are single objects, with the class of the object.
+_OBJECT_FIELD_CLASSES: Dict[str, Type[BaseModel]] = {
+    "project_configuration": PydanticProjectConfiguration,
+}
+
+_DEFAULT_CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+
+
+class _JsonStreamReader:
+    """Reads the tokens and values of a JSON document from a text stream, keeping only part of it in memory."""
+
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:  # noqa: D107
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._at_end_of_stream = False
+
+    def _read_more(self, size: int) -> bool:
+        """Appends the next characters of the stream to the buffer. Returns False if the stream has ended."""
+        if self._at_end_of_stream:
+            return False
+        chunk = self._stream.read(size)
+        if not chunk:
+            self._at_end_of_stream = True
+            return False
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def error(self, message: str) -> json.JSONDecodeError:  # noqa: D
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def peek(self) -> str:
+        """Skips whitespace, and returns the next character without consuming it, or "" at the end of the stream."""
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in _WHITESPACE:
+                self._position += 1
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more(self._chunk_size):
+                return ""
+
+    def expect(self, characters: str) -> str:
+        """Skips whitespace, and consumes the next character, which has to be one of the given characters."""
+        character = self.peek()
+        if character == "" or character not in characters:
+            raise self.error(f"Expected one of {characters!r}")
+        self._position += 1
+        return character
+
+    def read_value(self) -> object:
+        """Skips whitespace, and reads the next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # The value may continue after the end of the buffer. Read at least as much as is already buffered, so
+                # a large value is decoded a logarithmic number of times.
+                if self._read_more(max(self._chunk_size, len(self._buffer))):
+                    continue
+                raise
+            # A number at the end of the buffer may have more digits in the stream.
+            if end == len(self._buffer) and self._read_more(self._chunk_size):
+                continue
+            self._position = end
+            return value
+
+
+def _create_object(reader: _JsonStreamReader, object_class: Type[BaseModel], field_name: str) -> BaseModel:
+    """Reads the next value and validates it as an object of the class, as when the manifest validates its fields.
+
+    That is with the initializer, as overrides of `parse_obj` aren't used for the fields of the manifest either.
+    """
+    value = reader.read_value()
+    if not isinstance(value, dict):
+        raise reader.error(f"Expected an object for {field_name!r}")
+    return object_class(**value)
+
+
+def iter_semantic_manifest_json(
+    stream: TextIO, chunk_size: int = _DEFAULT_CHUNK_SIZE
+) -> Iterator[Tuple[str, BaseModel]]:
+    """Reads the JSON of a `PydanticSemanticManifest` from the stream, and yields its objects one at a time.
+
+    Each item is the name of the field of the manifest, e.g. `metrics`, and one object of it. Fields that aren't fields
+    of the manifest are skipped, as `parse_raw` does.
+
+    Raises:
+        ValueError: If the stream isn't valid JSON (`json.JSONDecodeError`), or an object isn't valid
+            (`ValidationError`).
+    """
+    reader = _JsonStreamReader(stream, chunk_size)
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.expect("}")
+    else:
+        while True:
+            field_name = reader.read_value()
+            if not isinstance(field_name, str):
+                raise reader.error("Expected a field name")
+            reader.expect(":")
+            list_field_class = _LIST_FIELD_CLASSES.get(field_name)
+            object_field_class = _OBJECT_FIELD_CLASSES.get(field_name)
+            if list_field_class is not None:
+                if reader.peek() != "[":
+                    raise reader.error(f"Expected a list for {field_name!r}")
+                reader.expect("[")
+                if reader.peek() == "]":
+                    reader.expect("]")
+                else:
+                    while True:
+                        yield field_name, _create_object(reader, list_field_class, field_name)
+                        if reader.expect(",]") == "]":
+                            break
+            elif object_field_class is not None:
+                yield field_name, _create_object(reader, object_field_class, field_name)
+            else:
+                reader.read_value()
+            if reader.expect(",}") == "}":
+                break
+    if reader.peek() != "":
+        raise reader.error("Extra data after the semantic manifest")
+
+
+def read_semantic_manifest_json(stream: TextIO, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> PydanticSemanticManifest:
+    """Reads a `PydanticSemanticManifest` from JSON written by `.json()` or `write_semantic_manifest_json`.
+
+    This returns the same manifest as `PydanticSemanticManifest.parse_raw(stream.read())`, with a lower peak memory.
+    See `iter_semantic_manifest_json`.
+    """
+    list_fields: Dict[str, List[BaseModel]] = {}
+    object_fields: Dict[str, BaseModel] = {}
+    for field_name, obj in iter_semantic_manifest_json(stream, chunk_size):
+        if field_name in _LIST_FIELD_CLASSES:
+            list_fields.setdefault(field_name, []).append(obj)
+        else:
+            object_fields[field_name] = obj
+    return PydanticSemanticManifest.parse_obj({**list_fields, **object_fields})
+
+
+def write_semantic_manifest_json(semantic_manifest: PydanticSemanticManifest, stream: TextIO) -> None:
+    """Writes the same JSON as `semantic_manifest.json()` to the stream, serializing one object at a time."""
+    # The fields are written in the order of their definition, as `.json()` does.
+    field_names = getattr(PydanticSemanticManifest, "model_fields", None) or PydanticSemanticManifest.__fields__
+    separator: Optional[str] = None
+    stream.write("{")
+    for field_name in field_names:
+        stream.write(f"{json.dumps(field_name)}: " if separator is None else f"{separator}{json.dumps(field_name)}: ")
+        separator = ", "
+        value = getattr(semantic_manifest, field_name)
+        if isinstance(value, list):
+            stream.write("[")
+            for index, obj in enumerate(value):
+                stream.write(obj.json() if index == 0 else f", {obj.json()}")
+            stream.write("]")
+        else:
+            stream.write(value.json())
+    stream.write("}")
@@ -0,0 +1,216 @@
+"""A long-running process that keeps the semantic manifest of a project parsed, transformed and validated.
+
+Editors and pre-commit hooks can start the server once and then send it JSON-RPC 2.0 messages, one per line, on stdin.
+The responses are written to stdout, one per line. When a file changes, only that file is parsed again (see
+`IncrementalManifestBuilder`), and validation and lookup requests are answered from the current manifest.
+
+Methods:
+* `files_changed`: `{"paths": [...]}` updates the manifest for the given files, or for all files if `paths` is omitted.
+  The result has the files that were parsed again or removed, the number of issues, and the time that the update took.
+* `validate`: returns the issues of the current manifest, as serialized `SemanticManifestValidationResults`.
+* `lookup`: `{"kind": "metric", "name": "bookings"}` returns the object with the name as JSON, or null if there isn't
+  one. The kind is one of `metric`, `semantic_model`, `saved_query`, or `project_configuration` (without a name).
+* `shutdown`: stops the server after responding.
+
+Run with e.g.:
+
+    python -m dbt_semantic_interfaces.manifest_server path/to/semantic_models --template-variable source_schema=prod
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import traceback
+from typing import Any, Callable, Dict, Optional, Sequence, TextIO, Tuple
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.incremental_builder import (
+    IncrementalBuildResult,
+    IncrementalManifestBuilder,
+)
+
+logger = logging.getLogger(__name__)
+
+JSONRPC_VERSION = "2.0"
+
+# Error codes defined by JSON-RPC 2.0.
+PARSE_ERROR_CODE = -32700
+INVALID_REQUEST_CODE = -32600
+METHOD_NOT_FOUND_CODE = -32601
+INVALID_PARAMS_CODE = -32602
+INTERNAL_ERROR_CODE = -32603
+
+LOOKUP_KINDS = ("metric", "semantic_model", "saved_query", "project_configuration")
+
+
+class InvalidParamsError(Exception):
+    """Raised by a method of `ManifestServer` when the parameters of a request are invalid."""
+
+    pass
+
+
+class ManifestServer:
+    """Answers JSON-RPC requests about the semantic manifest of a directory. See the module docstring."""
+
+    def __init__(self, builder: IncrementalManifestBuilder) -> None:  # noqa: D107
+        self._builder = builder
+        self._shutdown_requested = False
+        self._methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "files_changed": self._files_changed,
+            "validate": self._validate,
+            "lookup": self._lookup,
+            "shutdown": self._shutdown,
+        }
+        self._lookup_index: Dict[str, Dict[str, Any]] = {}
+        self._lookup_index_manifest: Optional[PydanticSemanticManifest] = None
+
+    @property
+    def shutdown_requested(self) -> bool:  # noqa: D
+        return self._shutdown_requested
+
+    def serve(self, input_stream: TextIO, output_stream: TextIO) -> None:
+        """Handles the requests in the input stream, one per line, until it ends or `shutdown` is requested."""
+        for line in input_stream:
+            if not line.strip():
+                continue
+            response = self.handle_message(line)
+            if response is not None:
+                output_stream.write(response + "\n")
+                output_stream.flush()
+            if self._shutdown_requested:
+                return
+
+    def handle_message(self, message: str) -> Optional[str]:
+        """Handles a serialized request and returns the serialized response, or None for a notification."""
+        try:
+            request = json.loads(message)
+        except json.JSONDecodeError as e:
+            return json.dumps(_error_response(None, PARSE_ERROR_CODE, f"Invalid JSON: {e}"))
+        response = self.handle_request(request)
+        return json.dumps(response) if response is not None else None
+
+    def handle_request(self, request: object) -> Optional[Dict[str, Any]]:
+        """Handles a request and returns the response, or None if the request is a notification (has no `id`)."""
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error_response(None, INVALID_REQUEST_CODE, "A request should be an object with a `method`.")
+        request_id = request.get("id")
+        is_notification = "id" not in request
+
+        method = self._methods.get(request["method"])
+        if method is None:
+            response = _error_response(request_id, METHOD_NOT_FOUND_CODE, f"Unknown method {request['method']!r}.")
+        else:
+            params = request.get("params") or {}
+            try:
+                if not isinstance(params, dict):
+                    raise InvalidParamsError("The params should be an object.")
+                response = {"jsonrpc": JSONRPC_VERSION, "id": request_id, "result": method(params)}
+            except InvalidParamsError as e:
+                response = _error_response(request_id, INVALID_PARAMS_CODE, str(e))
+            except Exception as e:
+                logger.exception(f"Error while handling {request['method']!r}")
+                response = _error_response(
+                    request_id, INTERNAL_ERROR_CODE, str(e), data="".join(traceback.format_tb(e.__traceback__))
+                )
+        return None if is_notification else response
+
+    def _current_result(self) -> IncrementalBuildResult:
+        result = self._builder.last_result
+        if result is None:
+            result = self._builder.update()
+        return result
+
+    def _files_changed(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        paths = params.get("paths")
+        if paths is not None and (not isinstance(paths, list) or not all(isinstance(path, str) for path in paths)):
+            raise InvalidParamsError("`paths` should be a list of strings.")
+        result = self._builder.update(paths)
+        return {
+            "reparsed_file_paths": list(result.reparsed_file_paths),
+            "removed_file_paths": list(result.removed_file_paths),
+            "error_count": len(result.issues.errors),
+            "future_error_count": len(result.issues.future_errors),
+            "warning_count": len(result.issues.warnings),
+            "seconds": result.seconds,
+        }
+
+    def _validate(self, params: Dict[str, Any]) -> Any:
+        return json.loads(self._current_result().issues.json())
+
+    def _lookup(self, params: Dict[str, Any]) -> Any:
+        kind = params.get("kind")
+        if kind not in LOOKUP_KINDS:
+            raise InvalidParamsError(f"`kind` should be one of {LOOKUP_KINDS}, but got {kind!r}.")
+        semantic_manifest = self._current_result().semantic_manifest
+        if semantic_manifest is None:
+            return None
+        if kind == "project_configuration":
+            return json.loads(semantic_manifest.project_configuration.json())
+
+        name = params.get("name")
+        if not isinstance(name, str):
+            raise InvalidParamsError("`name` should be a string.")
+        obj = self._get_lookup_index().get(kind, {}).get(name)
+        return json.loads(obj.json()) if obj is not None else None
+
+    def _get_lookup_index(self) -> Dict[str, Dict[str, Any]]:
+        """Returns the objects in the current manifest by kind and name, which is rebuilt when the manifest changes."""
+        semantic_manifest = self._current_result().semantic_manifest
+        assert semantic_manifest is not None
+        if self._lookup_index_manifest is not semantic_manifest:
+            self._lookup_index = {
+                "metric": {metric.name: metric for metric in semantic_manifest.metrics},
+                "semantic_model": {
+                    semantic_model.name: semantic_model for semantic_model in semantic_manifest.semantic_models
+                },
+                "saved_query": {saved_query.name: saved_query for saved_query in semantic_manifest.saved_queries},
+            }
+            self._lookup_index_manifest = semantic_manifest
+        return self._lookup_index
+
+    def _shutdown(self, params: Dict[str, Any]) -> None:
+        self._shutdown_requested = True
+
+
+def _error_response(request_id: object, code: int, message: str, data: Optional[str] = None) -> Dict[str, Any]:
+    error: Dict[str, Any] = {"code": code, "message": message}
+    if data is not None:
+        error["data"] = data
+    return {"jsonrpc": JSONRPC_VERSION, "id": request_id, "error": error}
+
+
+def _parse_template_variable(template_variable: str) -> Tuple[str, str]:
+    key, separator, value = template_variable.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, but got {template_variable!r}")
+    return key, value
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Builds the manifest for the directory and then serves requests on stdin / stdout."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("directory", help="The directory with the YAML files of the semantic manifest.")
+    parser.add_argument(
+        "--template-variable",
+        type=_parse_template_variable,
+        action="append",
+        default=[],
+        help="A value for a template variable in the YAML files, as KEY=VALUE. Can be given more than once.",
+    )
+    args = parser.parse_args(argv)
+
+    builder = IncrementalManifestBuilder(
+        directory=args.directory, template_mapping={key: value for key, value in args.template_variable}
+    )
+    builder.update()
+    ManifestServer(builder).serve(sys.stdin, sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
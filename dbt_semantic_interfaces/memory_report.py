@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import enum
+import sys
+import types
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
+
+from dbt_semantic_interfaces.parsing.yaml_loader import ParsingContext
+from dbt_semantic_interfaces.protocols import (
+    Metric,
+    MetricInput,
+    MetricInputMeasure,
+    SavedQuery,
+    SemanticManifest,
+    WhereFilterIntersection,
+)
+
+# The categories in a `ManifestMemoryReport`. Objects shared between categories are counted in the first one.
+FILE_SLICE_CONTENTS = "file_slice_contents"
+METADATA = "metadata"
+WHERE_FILTERS = "where_filters"
+PARSING_CONTEXTS = "parsing_contexts"
+MEASURES = "measures"
+DIMENSIONS = "dimensions"
+ENTITIES = "entities"
+METRICS = "metrics"
+SAVED_QUERIES = "saved_queries"
+SEMANTIC_MODELS = "semantic_models"
+PROJECT_CONFIGURATION = "project_configuration"
+OTHER = "other"
+
+MEMORY_REPORT_CATEGORIES: Tuple[str, ...] = (
+    FILE_SLICE_CONTENTS,
+    METADATA,
+    WHERE_FILTERS,
+    PARSING_CONTEXTS,
+    MEASURES,
+    DIMENSIONS,
+    ENTITIES,
+    METRICS,
+    SAVED_QUERIES,
+    SEMANTIC_MODELS,
+    PROJECT_CONFIGURATION,
+    OTHER,
+)
+
+# Objects of these types are shared by the whole process, so they're not counted.
+_SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, enum.Enum)
+
+
+@dataclass(frozen=True)
+class MemoryReportEntry:
+    """The memory retained by one category of objects in a semantic manifest.
+
+    Attributes:
+        category: The category, e.g. `metrics`.
+        object_count: The number of top-level objects in the category, e.g. the number of metrics.
+        retained_bytes: The size of the objects and everything they reference that isn't in an earlier category.
+    """
+
+    category: str
+    object_count: int
+    retained_bytes: int
+
+
+@dataclass(frozen=True)
+class ManifestMemoryReport:
+    """A breakdown of the memory used by a semantic manifest. See `manifest_memory_report`."""
+
+    entries: Tuple[MemoryReportEntry, ...]
+
+    @property
+    def total_bytes(self) -> int:  # noqa: D
+        return sum(entry.retained_bytes for entry in self.entries)
+
+    def entry(self, category: str) -> MemoryReportEntry:
+        """Returns the entry for one of the `MEMORY_REPORT_CATEGORIES`."""
+        for entry in self.entries:
+            if entry.category == category:
+                return entry
+        raise KeyError(f"Unknown memory report category {category!r}. Expected one of {MEMORY_REPORT_CATEGORIES}.")
+
+    def as_dict(self) -> Dict[str, Dict[str, int]]:
+        """Returns the report as a JSON-serializable dict, e.g. for logging."""
+        return {
+            entry.category: {"object_count": entry.object_count, "retained_bytes": entry.retained_bytes}
+            for entry in self.entries
+        }
+
+    def format(self) -> str:
+        """Returns the report as a table, with the largest categories first."""
+        lines = [f"{'category':<24}{'objects':>12}{'bytes':>16}"]
+        for entry in sorted(self.entries, key=lambda entry: entry.retained_bytes, reverse=True):
+            lines.append(f"{entry.category:<24}{entry.object_count:>12}{entry.retained_bytes:>16}")
+        lines.append(f"{'total':<24}{'':>12}{self.total_bytes:>16}")
+        return "\n".join(lines)
+
+
+def _referents(obj: object) -> Iterator[object]:
+    """Returns the objects directly referenced by the object that are counted as part of its size."""
+    if isinstance(obj, dict):
+        yield from obj.keys()
+        yield from obj.values()
+        return
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        yield from obj
+        return
+    instance_dict = getattr(obj, "__dict__", None)
+    if isinstance(instance_dict, dict):
+        yield instance_dict
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get("__slots__", ()):
+            if slot != "__dict__" and slot != "__weakref__":
+                value = getattr(obj, slot, None)
+                if value is not None:
+                    yield value
+
+
+class _MemoryCounter:
+    """Counts the size of objects, counting each object only once."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self._seen: Set[int] = set()
+        self._bytes: Dict[str, int] = {category: 0 for category in MEMORY_REPORT_CATEGORIES}
+        self._object_counts: Dict[str, int] = {category: 0 for category in MEMORY_REPORT_CATEGORIES}
+
+    def add(self, category: str, roots: Iterable[object]) -> None:
+        """Adds the roots and the objects they reference (that haven't already been counted) to the category."""
+        stack: List[Tuple[str, object]] = []
+        for root in roots:
+            if root is not None and id(root) not in self._seen:
+                self._object_counts[category] += 1
+                stack.append((category, root))
+        while stack:
+            object_category, obj = stack.pop()
+            if id(obj) in self._seen or isinstance(obj, _SHARED_TYPES):
+                continue
+            self._seen.add(id(obj))
+            if isinstance(obj, ParsingContext) and object_category != PARSING_CONTEXTS:
+                # A reference to a parsing context keeps the YAML nodes of the document alive.
+                object_category = PARSING_CONTEXTS
+                self._object_counts[PARSING_CONTEXTS] += 1
+            self._bytes[object_category] += sys.getsizeof(obj)
+            for referent in _referents(obj):
+                if referent is not None and id(referent) not in self._seen:
+                    stack.append((object_category, referent))
+
+    def report(self) -> ManifestMemoryReport:  # noqa: D
+        return ManifestMemoryReport(
+            entries=tuple(
+                MemoryReportEntry(
+                    category=category,
+                    object_count=self._object_counts[category],
+                    retained_bytes=self._bytes[category],
+                )
+                for category in MEMORY_REPORT_CATEGORIES
+            )
+        )
+
+
+def _metric_filters(metric: Metric) -> Iterator[WhereFilterIntersection]:
+    type_params = metric.type_params
+    metric_inputs: List[Optional[MetricInput]] = list(type_params.metrics or ())
+    metric_inputs += [type_params.numerator, type_params.denominator]
+    if type_params.cumulative_type_params is not None:
+        metric_inputs.append(type_params.cumulative_type_params.metric)
+    if type_params.conversion_type_params is not None:
+        metric_inputs += [
+            type_params.conversion_type_params.base_metric,
+            type_params.conversion_type_params.conversion_metric,
+        ]
+    measure_inputs: List[Optional[MetricInputMeasure]] = list(type_params.input_measures)
+    measure_inputs.append(type_params.measure)
+
+    if metric.filter is not None:
+        yield metric.filter
+    inputs: Sequence[Union[MetricInput, MetricInputMeasure, None]] = [*metric_inputs, *measure_inputs]
+    for metric_input in inputs:
+        if metric_input is not None and metric_input.filter is not None:
+            yield metric_input.filter
+
+
+def _saved_query_filters(saved_query: SavedQuery) -> Iterator[WhereFilterIntersection]:
+    if saved_query.query_params.where is not None:
+        yield saved_query.query_params.where
+
+
+def manifest_memory_report(semantic_manifest: SemanticManifest) -> ManifestMemoryReport:
+    """Returns the memory used by each category of objects in the semantic manifest, e.g. for diagnostics.
+
+    The size of an object is the size of everything that it references, counting each object once. Objects are counted
+    in the first category in `MEMORY_REPORT_CATEGORIES` that they're reachable from, so e.g. the size of the metrics
+    doesn't include their metadata or where filters. Any `ParsingContext` that is still referenced is counted in
+    `parsing_contexts`, along with the YAML nodes that it keeps alive.
+
+    This walks the whole manifest, so it takes time proportional to the size of the manifest.
+    """
+    counter = _MemoryCounter()
+    elements = [
+        element
+        for semantic_model in semantic_manifest.semantic_models
+        for element in (*semantic_model.measures, *semantic_model.dimensions, *semantic_model.entities)
+    ]
+    objects_with_metadata = [
+        *semantic_manifest.semantic_models,
+        *elements,
+        *semantic_manifest.metrics,
+        *semantic_manifest.saved_queries,
+    ]
+    metadatas = [getattr(obj, "metadata", None) for obj in objects_with_metadata]
+
+    counter.add(
+        FILE_SLICE_CONTENTS,
+        (metadata.file_slice.content for metadata in metadatas if metadata is not None),
+    )
+    counter.add(METADATA, metadatas)
+    counter.add(
+        WHERE_FILTERS,
+        [
+            *(where_filter for metric in semantic_manifest.metrics for where_filter in _metric_filters(metric)),
+            *(
+                where_filter
+                for saved_query in semantic_manifest.saved_queries
+                for where_filter in _saved_query_filters(saved_query)
+            ),
+        ],
+    )
+    counter.add(
+        MEASURES,
+        (measure for semantic_model in semantic_manifest.semantic_models for measure in semantic_model.measures),
+    )
+    counter.add(
+        DIMENSIONS,
+        (dimension for semantic_model in semantic_manifest.semantic_models for dimension in semantic_model.dimensions),
+    )
+    counter.add(
+        ENTITIES,
+        (entity for semantic_model in semantic_manifest.semantic_models for entity in semantic_model.entities),
+    )
+    counter.add(METRICS, semantic_manifest.metrics)
+    counter.add(SAVED_QUERIES, semantic_manifest.saved_queries)
+    counter.add(SEMANTIC_MODELS, semantic_manifest.semantic_models)
+    counter.add(PROJECT_CONFIGURATION, (semantic_manifest.project_configuration,))
+    counter.add(OTHER, (semantic_manifest,))
+    return counter.report()
@@ -0,0 +1,414 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
+from dbt_semantic_interfaces.errors import MetricCycleError, MetricGraphError
+from dbt_semantic_interfaces.protocols import Metric, MetricInput, SemanticManifest
+from dbt_semantic_interfaces.references import (
+    MeasureReference,
+    MetricReference,
+    SemanticModelReference,
+)
+from dbt_semantic_interfaces.type_enums import MetricType
+
+
+class MetricGraph:
+    """The dependencies between the metrics in a semantic manifest.
+
+    Each metric is a node, and there is an edge from a metric to each of its input metrics. The graph is built once
+    from a semantic manifest, and the transitive inputs and dependents of each metric are computed when they are first
+    requested and then memoized. This avoids recomputing them from scratch for every metric that (transitively) uses
+    them, and the traversals are iterative, so deep chains of derived metrics don't hit the recursion limit.
+
+    If there are multiple metrics with the same name, only the first one is used. If a metric's input metric doesn't
+    exist, the edge to it is omitted. See `missing_input_metrics`.
+    """
+
+    def __init__(self, semantic_manifest: SemanticManifest) -> None:  # noqa: D107
+        self._metric_index: Dict[MetricReference, Metric] = {}
+        for metric in semantic_manifest.metrics:
+            self._metric_index.setdefault(MetricReference(element_name=metric.name), metric)
+
+        self._measure_to_semantic_model: Dict[MeasureReference, SemanticModelReference] = {}
+        for semantic_model in semantic_manifest.semantic_models:
+            for measure in semantic_model.measures:
+                self._measure_to_semantic_model.setdefault(measure.reference, semantic_model.reference)
+
+        self._input_metrics: Dict[MetricReference, Tuple[MetricReference, ...]] = {}
+        self._missing_input_metrics: Dict[MetricReference, Tuple[MetricReference, ...]] = {}
+        self._dependents: Dict[MetricReference, List[MetricReference]] = {
+            metric_reference: [] for metric_reference in self._metric_index
+        }
+        for metric_reference, metric in self._metric_index.items():
+            input_metric_references = tuple(
+                dict.fromkeys(
+                    MetricReference(element_name=input_metric.name)
+                    for input_metric in MetricGraph._input_metrics_for_metric(metric)
+                )
+            )
+            self._input_metrics[metric_reference] = tuple(
+                input_metric_reference
+                for input_metric_reference in input_metric_references
+                if input_metric_reference in self._metric_index
+            )
+            self._missing_input_metrics[metric_reference] = tuple(
+                input_metric_reference
+                for input_metric_reference in input_metric_references
+                if input_metric_reference not in self._metric_index
+            )
+            for input_metric_reference in self._input_metrics[metric_reference]:
+                self._dependents[input_metric_reference].append(metric_reference)
+
+        self._strongly_connected_components = self._find_strongly_connected_components()
+        self._cycles = tuple(
+            self._find_cycle(component)
+            for component in self._strongly_connected_components
+            if len(component) > 1 or component[0] in self._input_metrics[component[0]]
+        )
+        self._metric_to_cycle: Dict[MetricReference, Tuple[MetricReference, ...]] = {}
+        for cycle in self._cycles:
+            for metric_reference in self._transitive_dependents_including_self(cycle):
+                self._metric_to_cycle.setdefault(metric_reference, cycle)
+
+        self._transitive_input_metrics: Dict[MetricReference, FrozenSet[MetricReference]] = {}
+        self._transitive_input_measures: Dict[MetricReference, FrozenSet[MeasureReference]] = {}
+        self._transitive_semantic_models: Dict[MetricReference, FrozenSet[SemanticModelReference]] = {}
+        self._transitive_dependents: Dict[MetricReference, FrozenSet[MetricReference]] = {}
+
+    @staticmethod
+    def _input_metrics_for_metric(metric: Metric) -> Sequence[MetricInput]:
+        """Returns the metrics that the metric is computed from, without failing on invalid metrics.
+
+        Unlike `Metric.input_metrics`, this includes the input metrics of conversion metrics and the `metric` of
+        cumulative metrics.
+        """
+        type_params = metric.type_params
+        if metric.type is MetricType.SIMPLE:
+            return ()
+        elif metric.type is MetricType.CUMULATIVE:
+            cumulative_type_params = type_params.cumulative_type_params
+            if cumulative_type_params is None or cumulative_type_params.metric is None:
+                return ()
+            return (cumulative_type_params.metric,)
+        elif metric.type is MetricType.DERIVED:
+            return type_params.metrics or ()
+        elif metric.type is MetricType.RATIO:
+            return tuple(
+                input_metric
+                for input_metric in (type_params.numerator, type_params.denominator)
+                if input_metric is not None
+            )
+        elif metric.type is MetricType.CONVERSION:
+            conversion_type_params = type_params.conversion_type_params
+            if conversion_type_params is None:
+                return ()
+            return tuple(
+                input_metric
+                for input_metric in (conversion_type_params.base_metric, conversion_type_params.conversion_metric)
+                if input_metric is not None
+            )
+        else:
+            assert_values_exhausted(metric.type)
+
+    @staticmethod
+    def _direct_input_measures_for_metric(metric: Metric) -> Sequence[MeasureReference]:
+        """Returns the measures defined on the metric itself, as in `PydanticMetric.all_input_measures_for_metric`."""
+        if metric.type is MetricType.SIMPLE or metric.type is MetricType.CUMULATIVE:
+            measure = metric.type_params.measure
+            return (measure.measure_reference,) if measure is not None else ()
+        elif metric.type is MetricType.DERIVED or metric.type is MetricType.RATIO:
+            return ()
+        elif metric.type is MetricType.CONVERSION:
+            conversion_type_params = metric.type_params.conversion_type_params
+            if conversion_type_params is None:
+                return ()
+            return tuple(
+                input_measure.measure_reference
+                for input_measure in (conversion_type_params.base_measure, conversion_type_params.conversion_measure)
+                if input_measure is not None
+            )
+        else:
+            assert_values_exhausted(metric.type)
+
+    def _find_strongly_connected_components(self) -> Sequence[Tuple[MetricReference, ...]]:
+        """Returns the strongly connected components using Tarjan's algorithm.
+
+        The components are returned with the inputs of a component before it, which is a topological order when the
+        graph doesn't have any cycles.
+        """
+        index: Dict[MetricReference, int] = {}
+        lowlink: Dict[MetricReference, int] = {}
+        stack: List[MetricReference] = []
+        on_stack: Set[MetricReference] = set()
+        components: List[Tuple[MetricReference, ...]] = []
+
+        for root in self._metric_index:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work_stack: List[Tuple[MetricReference, Iterator[MetricReference]]] = [
+                (root, iter(self._input_metrics[root]))
+            ]
+            while work_stack:
+                node, input_iterator = work_stack[-1]
+                next_node: Optional[MetricReference] = None
+                for input_metric_reference in input_iterator:
+                    if input_metric_reference not in index:
+                        next_node = input_metric_reference
+                        break
+                    elif input_metric_reference in on_stack:
+                        lowlink[node] = min(lowlink[node], index[input_metric_reference])
+
+                if next_node is not None:
+                    index[next_node] = lowlink[next_node] = len(index)
+                    stack.append(next_node)
+                    on_stack.add(next_node)
+                    work_stack.append((next_node, iter(self._input_metrics[next_node])))
+                    continue
+
+                work_stack.pop()
+                if work_stack:
+                    parent = work_stack[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component: List[MetricReference] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(tuple(reversed(component)))
+
+        return components
+
+    def _find_cycle(self, component: Tuple[MetricReference, ...]) -> Tuple[MetricReference, ...]:
+        """Returns a cycle in a strongly connected component, starting from its first metric."""
+        members = set(component)
+        path: List[MetricReference] = []
+        position: Dict[MetricReference, int] = {}
+        node = component[0]
+        while node not in position:
+            position[node] = len(path)
+            path.append(node)
+            node = next(
+                input_metric_reference
+                for input_metric_reference in self._input_metrics[node]
+                if input_metric_reference in members
+            )
+        return tuple(path[position[node] :])
+
+    def _transitive_dependents_including_self(
+        self, metric_references: Sequence[MetricReference]
+    ) -> Sequence[MetricReference]:
+        visited: Dict[MetricReference, None] = dict.fromkeys(metric_references)
+        queue = deque(metric_references)
+        while queue:
+            for dependent in self._dependents[queue.popleft()]:
+                if dependent not in visited:
+                    visited[dependent] = None
+                    queue.append(dependent)
+        return tuple(visited)
+
+    def _check_metric(self, metric_reference: MetricReference) -> None:
+        if metric_reference not in self._metric_index:
+            raise MetricGraphError(f"Metric '{metric_reference.element_name}' does not exist in the semantic manifest.")
+
+    def _check_acyclic(self, metric_reference: MetricReference) -> None:
+        self._check_metric(metric_reference)
+        cycle = self._metric_to_cycle.get(metric_reference)
+        if cycle is not None:
+            raise MetricCycleError(
+                f"Metric '{metric_reference.element_name}' depends on a cycle of input metrics: "
+                f"{MetricGraph.describe_cycle(cycle)}"
+            )
+
+    def _inputs_first(
+        self,
+        metric_reference: MetricReference,
+        input_metrics: Callable[[MetricReference], Sequence[MetricReference]],
+        memo: Dict,
+    ) -> Sequence[MetricReference]:
+        """Returns the metric and its transitive inputs that aren't in `memo`, with the inputs of a metric before it.
+
+        The metric must not depend on a cycle.
+        """
+        order: List[MetricReference] = []
+        visited: Set[MetricReference] = set()
+        stack: List[Tuple[MetricReference, bool]] = [(metric_reference, False)]
+        while stack:
+            node, inputs_added = stack.pop()
+            if inputs_added:
+                order.append(node)
+                continue
+            if node in visited or node in memo:
+                continue
+            visited.add(node)
+            stack.append((node, True))
+            for input_metric_reference in input_metrics(node):
+                if input_metric_reference not in visited and input_metric_reference not in memo:
+                    stack.append((input_metric_reference, False))
+        return order
+
+    def _measure_input_metrics(self, metric_reference: MetricReference) -> Sequence[MetricReference]:
+        """Returns the input metrics that the measures of the metric come from. See `transitive_input_measures`."""
+        metric = self._metric_index[metric_reference]
+        if metric.type is MetricType.DERIVED or metric.type is MetricType.RATIO:
+            missing_input_metrics = self._missing_input_metrics[metric_reference]
+            if missing_input_metrics:
+                raise MetricGraphError(
+                    f"Could not find input metric '{missing_input_metrics[0].element_name}' of metric "
+                    f"'{metric_reference.element_name}' in the semantic manifest."
+                )
+            return self._input_metrics[metric_reference]
+        return ()
+
+    @property
+    def metric_references(self) -> Sequence[MetricReference]:
+        """Returns the metrics in the graph in the order that they are defined in the semantic manifest."""
+        return tuple(self._metric_index)
+
+    def get_metric(self, metric_reference: MetricReference) -> Metric:
+        """Returns the metric with the given name.
+
+        Raises:
+            MetricGraphError: If the metric doesn't exist.
+        """
+        self._check_metric(metric_reference)
+        return self._metric_index[metric_reference]
+
+    def input_metrics(self, metric_reference: MetricReference) -> Sequence[MetricReference]:
+        """Returns the direct input metrics of the metric that exist in the semantic manifest."""
+        self._check_metric(metric_reference)
+        return self._input_metrics[metric_reference]
+
+    def missing_input_metrics(self, metric_reference: MetricReference) -> Sequence[MetricReference]:
+        """Returns the direct input metrics of the metric that don't exist in the semantic manifest."""
+        self._check_metric(metric_reference)
+        return self._missing_input_metrics[metric_reference]
+
+    def dependents(self, metric_reference: MetricReference) -> Sequence[MetricReference]:
+        """Returns the metrics that use the metric as a direct input."""
+        self._check_metric(metric_reference)
+        return tuple(self._dependents[metric_reference])
+
+    @property
+    def cycles(self) -> Sequence[Tuple[MetricReference, ...]]:
+        """Returns a cycle for each group of metrics that depend on each other.
+
+        Each cycle is a sequence of metrics where each metric uses the next one as an input, and the last metric uses
+        the first one as an input.
+        """
+        return self._cycles
+
+    @staticmethod
+    def describe_cycle(cycle: Sequence[MetricReference]) -> str:
+        """Returns a description of a cycle from `cycles` for error messages, e.g. "'a' -> 'b' -> 'a'"."""
+        return " -> ".join(f"'{metric_reference.element_name}'" for metric_reference in (*cycle, cycle[0]))
+
+    def topological_order(self) -> Sequence[MetricReference]:
+        """Returns all metrics in an order where the input metrics of a metric are before it.
+
+        Raises:
+            MetricCycleError: If any metrics depend on each other.
+        """
+        if self._cycles:
+            raise MetricCycleError(
+                "The input metrics of the following metrics form a cycle: "
+                + "; ".join(MetricGraph.describe_cycle(cycle) for cycle in self._cycles)
+            )
+        return tuple(component[0] for component in self._strongly_connected_components)
+
+    def transitive_input_metrics(self, metric_reference: MetricReference) -> FrozenSet[MetricReference]:
+        """Returns the input metrics of the metric, the input metrics of those, and so on.
+
+        Raises:
+            MetricCycleError: If the metric depends on a cycle of input metrics.
+        """
+        self._check_acyclic(metric_reference)
+        memo = self._transitive_input_metrics
+        for node in self._inputs_first(metric_reference, lambda node: self._input_metrics[node], memo):
+            input_metrics: Set[MetricReference] = set()
+            for input_metric_reference in self._input_metrics[node]:
+                input_metrics.add(input_metric_reference)
+                input_metrics.update(memo[input_metric_reference])
+            memo[node] = frozenset(input_metrics)
+        return memo[metric_reference]
+
+    def transitive_input_measures(self, metric_reference: MetricReference) -> FrozenSet[MeasureReference]:
+        """Returns the measures of the metric, including those from its input metrics (recursively).
+
+        This is the same as `PydanticMetric.all_input_measures_for_metric`, i.e. derived and ratio metrics use the
+        measures of their input metrics, while other types of metrics use the measures defined on the metric.
+
+        Raises:
+            MetricCycleError: If the metric depends on a cycle of input metrics.
+            MetricGraphError: If any of the input metrics that the measures come from don't exist.
+        """
+        self._check_acyclic(metric_reference)
+        memo = self._transitive_input_measures
+        for node in self._inputs_first(metric_reference, self._measure_input_metrics, memo):
+            measures: Set[MeasureReference] = set(
+                MetricGraph._direct_input_measures_for_metric(self._metric_index[node])
+            )
+            for input_metric_reference in self._measure_input_metrics(node):
+                measures.update(memo[input_metric_reference])
+            memo[node] = frozenset(measures)
+        return memo[metric_reference]
+
+    def transitive_semantic_models(self, metric_reference: MetricReference) -> FrozenSet[SemanticModelReference]:
+        """Returns the semantic models that the metric and its transitive input metrics are defined on.
+
+        This includes the semantic models of the measures of each metric as well as the semantic model in the
+        `metric_aggregation_params` of simple metrics that aren't defined with a measure.
+
+        Raises:
+            MetricCycleError: If the metric depends on a cycle of input metrics.
+        """
+        self._check_acyclic(metric_reference)
+        memo = self._transitive_semantic_models
+        for node in self._inputs_first(metric_reference, lambda node: self._input_metrics[node], memo):
+            metric = self._metric_index[node]
+            semantic_models: Set[SemanticModelReference] = set()
+            for measure_reference in MetricGraph._direct_input_measures_for_metric(metric):
+                semantic_model_reference = self._measure_to_semantic_model.get(measure_reference)
+                if semantic_model_reference is not None:
+                    semantic_models.add(semantic_model_reference)
+            metric_aggregation_params = metric.type_params.metric_aggregation_params
+            if metric_aggregation_params is not None:
+                semantic_models.add(
+                    SemanticModelReference(semantic_model_name=metric_aggregation_params.semantic_model)
+                )
+            for input_metric_reference in self._input_metrics[node]:
+                semantic_models.update(memo[input_metric_reference])
+            memo[node] = frozenset(semantic_models)
+        return memo[metric_reference]
+
+    def transitive_dependents(self, metric_reference: MetricReference) -> FrozenSet[MetricReference]:
+        """Returns the metrics that use the metric as an input, directly or through other metrics.
+
+        Unlike the other transitive methods, this works for metrics in a cycle, in which case the result includes the
+        metric itself.
+        """
+        self._check_metric(metric_reference)
+        transitive_dependents = self._transitive_dependents.get(metric_reference)
+        if transitive_dependents is None:
+            transitive_dependents = frozenset(
+                self._transitive_dependents_including_self(self._dependents[metric_reference])
+            )
+            self._transitive_dependents[metric_reference] = transitive_dependents
+        return transitive_dependents
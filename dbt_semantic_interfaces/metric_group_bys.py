@@ -0,0 +1,367 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.entity_join_graph import EntityJoinGraph
+from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
+from dbt_semantic_interfaces.errors import EntityJoinGraphError, MetricGraphError
+from dbt_semantic_interfaces.metric_graph import MetricGraph
+from dbt_semantic_interfaces.naming.keywords import DUNDER, METRIC_TIME_ELEMENT_NAME
+from dbt_semantic_interfaces.protocols import (
+    Measure,
+    Metric,
+    SemanticManifest,
+    SemanticModel,
+)
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    LinkableElementReference,
+    MeasureReference,
+    MetricReference,
+    SemanticModelReference,
+    TimeDimensionReference,
+)
+from dbt_semantic_interfaces.type_enums import (
+    DimensionType,
+    MetricType,
+    TimeGranularity,
+)
+
+# A group-by item without the granularities, i.e. the element and the entity links used to refer to it.
+_GroupByKey = Tuple[LinkableElementReference, Tuple[EntityReference, ...]]
+# The group-by items mapped to the names of the granularities that they can be used with.
+_GroupByMap = Dict[_GroupByKey, FrozenSet[str]]
+
+_METRIC_TIME_KEY: _GroupByKey = (TimeDimensionReference(element_name=METRIC_TIME_ELEMENT_NAME), ())
+
+
+@dataclass(frozen=True)
+class MetricGroupBy:
+    """A dimension or entity that a metric can be grouped by, e.g. `listing__country` or `metric_time`.
+
+    Attributes:
+        element_reference: The element. This is a `TimeDimensionReference` for time dimensions (including
+        `metric_time`), a `DimensionReference` for categorical dimensions, and an `EntityReference` for entities.
+        entity_path: The entity links used to refer to the element.
+        time_granularity_names: For time dimensions, the names of the granularities that the dimension can be
+        queried with, including custom granularities. Standard granularities are first, from the smallest.
+    """
+
+    element_reference: LinkableElementReference
+    entity_path: Tuple[EntityReference, ...] = ()
+    time_granularity_names: Tuple[str, ...] = ()
+
+    @property
+    def dundered_name(self) -> str:
+        """The name without a granularity, e.g. `listing__created_at`."""
+        return DUNDER.join(
+            [entity_link.element_name for entity_link in self.entity_path] + [self.element_reference.element_name]
+        )
+
+    @property
+    def is_time_dimension(self) -> bool:  # noqa: D
+        return isinstance(self.element_reference, TimeDimensionReference)
+
+
+class MetricGroupByIndex:
+    """The dimensions and entities that each metric in a semantic manifest can be grouped by.
+
+    The group-by items of a semantic model are the dimensions and entities reachable from it through the
+    `EntityJoinGraph`. Simple and cumulative metrics can be grouped by the items of the semantic model that they're
+    defined on, as well as by `metric_time` at the granularities allowed by the `agg_time_dimension`. Conversion
+    metrics use the items of their base measure, and cumulative metrics defined on a metric use the items of that
+    metric. Derived and ratio metrics can be grouped by the items (and granularities) that all of their input metrics
+    have in common.
+
+    The items of each semantic model and each metric are computed when they are first requested and then memoized, so
+    computing them for all metrics only traverses the joins of each semantic model once, and each derived metric reuses
+    the results for its input metrics.
+    """
+
+    def __init__(  # noqa: D107
+        self,
+        semantic_manifest: SemanticManifest,
+        max_join_hops: int = EntityJoinGraph.DEFAULT_MAX_JOIN_HOPS,
+        metric_graph: Optional[MetricGraph] = None,
+        entity_join_graph: Optional[EntityJoinGraph] = None,
+    ) -> None:
+        self._max_join_hops = max_join_hops
+        self._metric_graph = metric_graph if metric_graph is not None else MetricGraph(semantic_manifest)
+        self._entity_join_graph = (
+            entity_join_graph if entity_join_graph is not None else EntityJoinGraph(semantic_manifest)
+        )
+
+        self._measure_index: Dict[MeasureReference, Tuple[Measure, SemanticModel]] = {}
+        for semantic_model in semantic_manifest.semantic_models:
+            for measure in semantic_model.measures:
+                self._measure_index.setdefault(measure.reference, (measure, semantic_model))
+
+        # The custom granularities mapped to the granularity of the time spine that defines them.
+        custom_granularities: Dict[str, TimeGranularity] = {}
+        for time_spine in semantic_manifest.project_configuration.time_spines:
+            for custom_granularity in time_spine.custom_granularities:
+                custom_granularities.setdefault(custom_granularity.name, time_spine.primary_column.time_granularity)
+        self._custom_granularities = custom_granularities
+        standard_granularities = sorted(TimeGranularity, key=lambda granularity: granularity.to_int())
+        ordered_granularity_names = [granularity.value for granularity in standard_granularities] + sorted(
+            custom_granularities, key=lambda name: (custom_granularities[name].to_int(), name)
+        )
+        self._granularity_order: Dict[str, int] = {name: i for i, name in enumerate(ordered_granularity_names)}
+
+        self._granularity_names: Dict[TimeGranularity, FrozenSet[str]] = {}
+        self._semantic_model_group_bys: Dict[SemanticModelReference, _GroupByMap] = {}
+        self._metric_group_bys: Dict[MetricReference, _GroupByMap] = {}
+        self._metric_group_by_items: Dict[MetricReference, Tuple[MetricGroupBy, ...]] = {}
+
+    def _granularity_names_for(self, time_granularity: TimeGranularity) -> FrozenSet[str]:
+        """Returns the granularities that a time dimension defined at the given granularity can be queried with."""
+        granularity_names = self._granularity_names.get(time_granularity)
+        if granularity_names is None:
+            granularity_names = frozenset(
+                [
+                    granularity.value
+                    for granularity in TimeGranularity
+                    if granularity.to_int() >= time_granularity.to_int()
+                ]
+                + [
+                    name
+                    for name, base_granularity in self._custom_granularities.items()
+                    if base_granularity.to_int() >= time_granularity.to_int()
+                ]
+            )
+            self._granularity_names[time_granularity] = granularity_names
+        return granularity_names
+
+    def _group_by_map_for_semantic_model(self, semantic_model_reference: SemanticModelReference) -> _GroupByMap:
+        group_by_map = self._semantic_model_group_bys.get(semantic_model_reference)
+        if group_by_map is not None:
+            return group_by_map
+
+        group_by_map = {}
+        for reachable_dimension in self._entity_join_graph.reachable_dimensions(
+            semantic_model_reference, self._max_join_hops
+        ):
+            element_name = reachable_dimension.dimension_reference.element_name
+            if reachable_dimension.dimension_type is DimensionType.TIME:
+                key: _GroupByKey = (TimeDimensionReference(element_name=element_name), reachable_dimension.entity_path)
+                granularity_names = (
+                    self._granularity_names_for(reachable_dimension.time_granularity)
+                    if reachable_dimension.time_granularity is not None
+                    else frozenset()
+                )
+                group_by_map[key] = group_by_map.get(key, frozenset()) | granularity_names
+            else:
+                group_by_map[
+                    (DimensionReference(element_name=element_name), reachable_dimension.entity_path)
+                ] = frozenset()
+        for reachable_entity in self._entity_join_graph.reachable_entities(
+            semantic_model_reference, self._max_join_hops
+        ):
+            group_by_map[(reachable_entity.entity_reference, reachable_entity.entity_path)] = frozenset()
+
+        self._semantic_model_group_bys[semantic_model_reference] = group_by_map
+        return group_by_map
+
+    def _group_by_map_for_aggregation(
+        self, semantic_model: Optional[SemanticModel], agg_time_dimension_name: Optional[str]
+    ) -> _GroupByMap:
+        """Returns the group-by items for a measure (or measure-like metric) that's aggregated in the semantic model."""
+        if semantic_model is None:
+            return {}
+        group_by_map = dict(self._group_by_map_for_semantic_model(semantic_model.reference))
+        if agg_time_dimension_name is None and semantic_model.defaults is not None:
+            agg_time_dimension_name = semantic_model.defaults.agg_time_dimension
+        for dimension in semantic_model.dimensions:
+            if (
+                dimension.name == agg_time_dimension_name
+                and dimension.type is DimensionType.TIME
+                and dimension.type_params is not None
+            ):
+                group_by_map[_METRIC_TIME_KEY] = self._granularity_names_for(dimension.type_params.time_granularity)
+                break
+        return group_by_map
+
+    def _group_by_map_for_measure(self, measure_reference: MeasureReference) -> _GroupByMap:
+        measure_and_semantic_model = self._measure_index.get(measure_reference)
+        if measure_and_semantic_model is None:
+            return {}
+        measure, semantic_model = measure_and_semantic_model
+        return self._group_by_map_for_aggregation(semantic_model, measure.agg_time_dimension)
+
+    def _group_by_map_for_metric_inputs(
+        self, metric_reference: MetricReference, input_metric_references: Sequence[MetricReference]
+    ) -> _GroupByMap:
+        """Returns the group-by items that all of the given (already computed) input metrics have in common."""
+        missing_input_metrics = self._metric_graph.missing_input_metrics(metric_reference)
+        if missing_input_metrics:
+            raise MetricGraphError(
+                f"Could not find input metric '{missing_input_metrics[0].element_name}' of metric "
+                f"'{metric_reference.element_name}' in the semantic manifest."
+            )
+        if len(input_metric_references) == 0:
+            return {}
+
+        input_group_by_maps = sorted(
+            (self._metric_group_bys[input_metric_reference] for input_metric_reference in input_metric_references),
+            key=len,
+        )
+        group_by_map: _GroupByMap = {}
+        for key, granularity_names in input_group_by_maps[0].items():
+            for other_group_by_map in input_group_by_maps[1:]:
+                other_granularity_names = other_group_by_map.get(key)
+                if other_granularity_names is None:
+                    break
+                granularity_names = granularity_names & other_granularity_names
+            else:
+                # Time dimensions without any granularities in common can't be used.
+                if not isinstance(key[0], TimeDimensionReference) or granularity_names:
+                    group_by_map[key] = granularity_names
+        return group_by_map
+
+    def _compute_group_by_map_for_metric(self, metric_reference: MetricReference, metric: Metric) -> _GroupByMap:
+        """Computes the items for a metric, assuming that the items of its input metrics have been computed."""
+        type_params = metric.type_params
+        cumulative_type_params = type_params.cumulative_type_params
+        if (
+            metric.type is MetricType.CUMULATIVE
+            and type_params.measure is None
+            and cumulative_type_params is not None
+            and cumulative_type_params.metric is not None
+        ):
+            return self._group_by_map_for_metric_inputs(
+                metric_reference, (MetricReference(element_name=cumulative_type_params.metric.name),)
+            )
+        if metric.type is MetricType.SIMPLE or metric.type is MetricType.CUMULATIVE:
+            if type_params.measure is not None:
+                return self._group_by_map_for_measure(type_params.measure.measure_reference)
+            metric_aggregation_params = type_params.metric_aggregation_params
+            if metric_aggregation_params is None:
+                return {}
+            return self._group_by_map_for_aggregation(
+                self._semantic_model_with_name(metric_aggregation_params.semantic_model),
+                metric_aggregation_params.agg_time_dimension,
+            )
+        elif metric.type is MetricType.CONVERSION:
+            conversion_type_params = type_params.conversion_type_params
+            if conversion_type_params is not None and conversion_type_params.base_measure is not None:
+                return self._group_by_map_for_measure(conversion_type_params.base_measure.measure_reference)
+            if conversion_type_params is not None and conversion_type_params.base_metric is not None:
+                return self._group_by_map_for_metric_inputs(
+                    metric_reference, (MetricReference(element_name=conversion_type_params.base_metric.name),)
+                )
+            return {}
+        elif metric.type is MetricType.DERIVED or metric.type is MetricType.RATIO:
+            return self._group_by_map_for_metric_inputs(
+                metric_reference, self._metric_graph.input_metrics(metric_reference)
+            )
+        else:
+            assert_values_exhausted(metric.type)
+
+    def _semantic_model_with_name(self, semantic_model_name: str) -> Optional[SemanticModel]:
+        try:
+            return self._entity_join_graph.get_semantic_model(
+                SemanticModelReference(semantic_model_name=semantic_model_name)
+            )
+        except EntityJoinGraphError:
+            return None
+
+    def _group_by_map_for_metric(self, metric_reference: MetricReference) -> _GroupByMap:
+        group_by_map = self._metric_group_bys.get(metric_reference)
+        if group_by_map is not None:
+            return group_by_map
+
+        # Raises if the metric doesn't exist or depends on a cycle.
+        self._metric_graph.transitive_input_metrics(metric_reference)
+        # Compute the items of the input metrics first, iteratively, as chains of derived metrics can be deep.
+        order: List[MetricReference] = []
+        stack: List[Tuple[MetricReference, bool]] = [(metric_reference, False)]
+        while stack:
+            node, inputs_added = stack.pop()
+            if inputs_added:
+                order.append(node)
+                continue
+            if node in self._metric_group_bys:
+                continue
+            stack.append((node, True))
+            for input_metric_reference in self._metric_graph.input_metrics(node):
+                if input_metric_reference not in self._metric_group_bys:
+                    stack.append((input_metric_reference, False))
+        for node in order:
+            if node not in self._metric_group_bys:
+                self._metric_group_bys[node] = self._compute_group_by_map_for_metric(
+                    node, self._metric_graph.get_metric(node)
+                )
+        return self._metric_group_bys[metric_reference]
+
+    def _to_group_bys(self, group_by_map: _GroupByMap) -> Tuple[MetricGroupBy, ...]:
+        group_bys = [
+            MetricGroupBy(
+                element_reference=element_reference,
+                entity_path=entity_path,
+                time_granularity_names=tuple(sorted(granularity_names, key=self._granularity_order.__getitem__)),
+            )
+            for (element_reference, entity_path), granularity_names in group_by_map.items()
+        ]
+        return tuple(
+            sorted(group_bys, key=lambda group_by: (group_by.dundered_name, type(group_by.element_reference).__name__))
+        )
+
+    @property
+    def metric_graph(self) -> MetricGraph:  # noqa: D
+        return self._metric_graph
+
+    @property
+    def entity_join_graph(self) -> EntityJoinGraph:  # noqa: D
+        return self._entity_join_graph
+
+    def group_bys_for_semantic_model(self, semantic_model_reference: SemanticModelReference) -> Sequence[MetricGroupBy]:
+        """Returns the dimensions and entities reachable from the semantic model, sorted by name.
+
+        This doesn't include `metric_time`, as that depends on the measure or metric.
+
+        Raises:
+            EntityJoinGraphError: If the semantic model doesn't exist.
+        """
+        return self._to_group_bys(self._group_by_map_for_semantic_model(semantic_model_reference))
+
+    def group_bys_for_metric(self, metric_reference: MetricReference) -> Sequence[MetricGroupBy]:
+        """Returns the dimensions and entities that the metric can be grouped by, sorted by name.
+
+        Raises:
+            MetricCycleError: If the metric depends on a cycle of input metrics.
+            MetricGraphError: If the metric or one of its input metrics doesn't exist.
+        """
+        group_bys = self._metric_group_by_items.get(metric_reference)
+        if group_bys is None:
+            group_bys = self._to_group_bys(self._group_by_map_for_metric(metric_reference))
+            self._metric_group_by_items[metric_reference] = group_bys
+        return group_bys
+
+    def group_bys_for_all_metrics(self) -> Dict[MetricReference, Sequence[MetricGroupBy]]:
+        """Returns the group-by items of each metric, for the metrics that don't depend on a cycle or missing metric."""
+        result: Dict[MetricReference, Sequence[MetricGroupBy]] = {}
+        for metric_reference in self._metric_graph.metric_references:
+            try:
+                result[metric_reference] = self.group_bys_for_metric(metric_reference)
+            except MetricGraphError:
+                continue
+        return result
+
+    def group_by_names_for_metric(self, metric_reference: MetricReference) -> FrozenSet[str]:
+        """Returns the dundered names that the metric can be grouped by, with and without a granularity suffix.
+
+        e.g. `listing__country`, `metric_time` and `metric_time__month`.
+
+        Raises:
+            MetricCycleError: If the metric depends on a cycle of input metrics.
+            MetricGraphError: If the metric or one of its input metrics doesn't exist.
+        """
+        names = set()
+        for group_by in self.group_bys_for_metric(metric_reference):
+            dundered_name = group_by.dundered_name
+            names.add(dundered_name)
+            for granularity_name in group_by.time_granularity_names:
+                names.add(dundered_name + DUNDER + granularity_name)
+        return frozenset(names)
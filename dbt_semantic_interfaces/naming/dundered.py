@@ -2,14 +2,17 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Optional, Sequence, Tuple
+from typing import ClassVar, Dict, FrozenSet, Iterable, Optional, Sequence, Tuple
 
+from dbt_semantic_interfaces.lru_cache import LruCache, LruCacheStats
 from dbt_semantic_interfaces.naming.keywords import DUNDER
 from dbt_semantic_interfaces.references import EntityReference
 from dbt_semantic_interfaces.type_enums.time_granularity import TimeGranularity
 
 logger = logging.getLogger(__name__)
 
+_STANDARD_GRANULARITY_NAMES: FrozenSet[str] = frozenset(granularity.value for granularity in TimeGranularity)
+
 
 @dataclass(frozen=True)
 class StructuredDunderedName:
@@ -25,29 +28,62 @@ class StructuredDunderedName:
     element_name: str
     time_granularity: Optional[str] = None
 
+    # Caches the results of `parse_name` as the same names are commonly parsed many times.
+    PARSE_NAME_CACHE_MAX_SIZE: ClassVar[int] = 65536
+    _parse_name_cache: ClassVar[LruCache[Tuple[str, FrozenSet[str]], StructuredDunderedName]] = LruCache(
+        max_size=PARSE_NAME_CACHE_MAX_SIZE
+    )
+
     @staticmethod
     def parse_name(name: str, custom_granularity_names: Sequence[str] = ()) -> StructuredDunderedName:
         """Construct from a string like 'listing__ds__month'."""
+        custom_granularity_name_set = frozenset(custom_granularity_names)
+        return StructuredDunderedName._parse_name_cache.get_or_create(
+            key=(name, custom_granularity_name_set),
+            create=lambda: StructuredDunderedName._parse_name(name, custom_granularity_name_set),
+        )
+
+    @staticmethod
+    def parse_names(
+        names: Iterable[str], custom_granularity_names: Sequence[str] = ()
+    ) -> Tuple[StructuredDunderedName, ...]:
+        """Construct from many strings. This is faster than calling `parse_name` for each one.
+
+        The results are in the same order as the names.
+        """
+        custom_granularity_name_set = frozenset(custom_granularity_names)
+        name_to_parsed_name: Dict[str, StructuredDunderedName] = {}
+        parsed_names = []
+        for name in names:
+            parsed_name = name_to_parsed_name.get(name)
+            if parsed_name is None:
+                parsed_name = StructuredDunderedName._parse_name(name, custom_granularity_name_set)
+                name_to_parsed_name[name] = parsed_name
+            parsed_names.append(parsed_name)
+        return tuple(parsed_names)
+
+    @staticmethod
+    def parse_name_cache_stats() -> LruCacheStats:
+        """Return the statistics for the cache used by `parse_name`."""
+        return StructuredDunderedName._parse_name_cache.stats
+
+    @staticmethod
+    def _parse_name(name: str, custom_granularity_names: FrozenSet[str]) -> StructuredDunderedName:
         name_parts = name.split(DUNDER)
 
         # No dunder, e.g. "ds"
         if len(name_parts) == 1:
             return StructuredDunderedName((), name_parts[0])
 
-        associated_granularity: Optional[str] = None
-        for granularity in TimeGranularity:
-            if name_parts[-1] == granularity.value:
-                associated_granularity = granularity.value
-                break
-
-        if associated_granularity is None:
-            for custom_grain in custom_granularity_names:
-                if name_parts[-1] == custom_grain:
-                    associated_granularity = custom_grain
-                    break
+        # Standard granularities take precedence over custom ones, but as the name is the same either way, it's enough
+        # to check if the suffix is in either set.
+        associated_granularity = name_parts[-1]
+        has_granularity = associated_granularity != "" and (
+            associated_granularity in _STANDARD_GRANULARITY_NAMES or associated_granularity in custom_granularity_names
+        )
 
         # Has a time granularity
-        if associated_granularity:
+        if has_granularity:
             #  e.g. "ds__month"
             if len(name_parts) == 2:
                 return StructuredDunderedName((), name_parts[0], associated_granularity)
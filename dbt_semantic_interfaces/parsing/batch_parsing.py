@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import platform
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    FileParsingResult,
+    parse_config_yaml,
+)
+from dbt_semantic_interfaces.parsing.objects import YamlConfigFile
+
+logger = logging.getLogger(__name__)
+
+# Increment when the format of the cache entries changes, so that older entries are ignored.
+CACHE_FORMAT_VERSION = 1
+
+# Each worker gets a few chunks of files, so that a worker that gets large files doesn't hold up the others.
+_CHUNKS_PER_WORKER = 4
+
+
+class FileParsingCache:
+    """A cache of the results of `parse_config_yaml` in a directory, keyed by the path and contents of each file.
+
+    The key also includes the versions of this package, Pydantic and Python, so the entries written by a different
+    environment are ignored. The entries are pickled, so only use a directory that other users can't write to. Entries
+    that can't be read, e.g. because they were only partly written, are treated as missing.
+    """
+
+    def __init__(self, directory: str) -> None:  # noqa: D107
+        self._directory = directory
+        self._environment_key = _environment_key()
+
+    @property
+    def directory(self) -> str:  # noqa: D
+        return self._directory
+
+    def _entry_path(self, config_file: YamlConfigFile) -> str:
+        digest = hashlib.sha256()
+        for part in (self._environment_key, config_file.filepath, config_file.contents):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return os.path.join(self._directory, f"{digest.hexdigest()}.pickle")
+
+    def get(self, config_file: YamlConfigFile) -> Optional[FileParsingResult]:
+        """Returns the cached result for the file, or None if there isn't one."""
+        entry_path = self._entry_path(config_file)
+        try:
+            with open(entry_path, "rb") as f:
+                parsing_result = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring the unreadable parsing cache entry {entry_path}: {e}")
+            return None
+        if not isinstance(parsing_result, FileParsingResult):
+            logger.warning(f"Ignoring the parsing cache entry {entry_path} as it has an unexpected type")
+            return None
+        return parsing_result
+
+    def put(self, config_file: YamlConfigFile, parsing_result: FileParsingResult) -> None:
+        """Stores the result for the file, writing it to a temporary file first so readers never see a partial entry."""
+        os.makedirs(self._directory, exist_ok=True)
+        entry_path = self._entry_path(config_file)
+        file_descriptor, temporary_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as f:
+                pickle.dump(parsing_result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, entry_path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
+
+
+def _environment_key() -> str:
+    # Imported here as `dsi_pydantic_shim` imports Pydantic, which is slow to import.
+    from importlib.metadata import PackageNotFoundError, version
+
+    from dsi_pydantic_shim import pydantic_backend, pydantic_version
+
+    try:
+        package_version = version("dbt-semantic-interfaces")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    return (
+        f"{CACHE_FORMAT_VERSION}:{package_version}:{pydantic_version}:{pydantic_backend}:"
+        f"{platform.python_implementation()}:{platform.python_version()}"
+    )
+
+
+def _parse_config_files(config_files: Sequence[YamlConfigFile]) -> List[FileParsingResult]:
+    return [parse_config_yaml(config_file) for config_file in config_files]
+
+
+def parse_config_yaml_files(
+    config_files: Sequence[YamlConfigFile],
+    max_workers: int = 1,
+    cache: Optional[FileParsingCache] = None,
+) -> List[Tuple[str, FileParsingResult]]:
+    """Parses the files with `parse_config_yaml`, optionally in parallel and with a cache.
+
+    The result can be passed to `build_semantic_manifest_from_file_parsing_results`.
+
+    Args:
+        config_files: The files to parse.
+        max_workers: The number of processes to parse the files in. If 1, the files are parsed in this process.
+        cache: If given, the files in the cache aren't parsed, and the results for the other files are added to it.
+
+    Returns:
+        The path of each file with the result of parsing it, in the same order as `config_files`.
+    """
+    parsing_results: Dict[int, FileParsingResult] = {}
+    files_to_parse: List[Tuple[int, YamlConfigFile]] = []
+    for index, config_file in enumerate(config_files):
+        cached_result = cache.get(config_file) if cache is not None else None
+        if cached_result is not None:
+            parsing_results[index] = cached_result
+        else:
+            files_to_parse.append((index, config_file))
+    if cache is not None:
+        logger.info(f"Found {len(parsing_results)} of {len(config_files)} file(s) in the cache in {cache.directory}")
+
+    if max_workers > 1 and len(files_to_parse) > 1:
+        chunk_count = min(len(files_to_parse), max_workers * _CHUNKS_PER_WORKER)
+        chunks = [files_to_parse[chunk_index::chunk_count] for chunk_index in range(chunk_count)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_results = executor.map(
+                _parse_config_files, [[config_file for _, config_file in chunk] for chunk in chunks]
+            )
+            for chunk, results in zip(chunks, chunk_results):
+                for (index, _), parsing_result in zip(chunk, results):
+                    parsing_results[index] = parsing_result
+    else:
+        for index, config_file in files_to_parse:
+            parsing_results[index] = parse_config_yaml(config_file)
+
+    if cache is not None:
+        for index, config_file in files_to_parse:
+            cache.put(config_file, parsing_results[index])
+
+    return [(config_file.filepath, parsing_results[index]) for index, config_file in enumerate(config_files)]
@@ -3,9 +3,7 @@ import os
 import traceback
 from dataclasses import dataclass
 from string import Template
-from typing import Dict, List, Optional, Sequence, Type, Union
-
-from jsonschema import exceptions
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
 
 from dbt_semantic_interfaces.errors import ParsingException
 from dbt_semantic_interfaces.implementations.element_config import (
@@ -23,13 +21,16 @@ from dbt_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
 from dbt_semantic_interfaces.implementations.semantic_model import PydanticSemanticModel
-from dbt_semantic_interfaces.parsing.objects import Version, YamlConfigFile
-from dbt_semantic_interfaces.parsing.schemas import (
-    metric_validator,
-    project_configuration_validator,
-    saved_query_validator,
-    semantic_model_validator,
+from dbt_semantic_interfaces.instrumentation import (
+    FILE_READ_PHASE,
+    JSONSCHEMA_VALIDATE_PHASE,
+    PYDANTIC_PARSE_PHASE,
+    YAML_LOAD_PHASE,
+    instrumented_iter,
+    instrumented_phase,
 )
+from dbt_semantic_interfaces.parsing import schemas
+from dbt_semantic_interfaces.parsing.objects import Version, YamlConfigFile
 from dbt_semantic_interfaces.parsing.yaml_loader import (
     PARSING_CONTEXT_KEY,
     ParsingContext,
@@ -125,6 +126,38 @@ def parse_directory_of_yaml_files_to_semantic_manifest(
     )
 
 
+def read_yaml_config_file(file_path: str, template_mapping: Optional[Dict[str, str]] = None) -> YamlConfigFile:
+    """Reads a YAML file, replacing strings following the Python string template format using the template_mapping."""
+    try:
+        with instrumented_phase(FILE_READ_PHASE, file_path=file_path), open(file_path) as f:
+            contents = Template(f.read()).substitute(template_mapping or {})
+            return YamlConfigFile(filepath=file_path, contents=contents)
+    except UnicodeDecodeError as e:
+        # We could alternatively return this as a validation issue, but this
+        # exception is hit *before* building the semantic manifest. Currently, the
+        # SemanticManifestBuildResult guarantees a SemanticManifest. We could make
+        # SemanticManifest optional on ModelBuildResult, but this has
+        # undesirable consequences.
+        raise Exception(
+            f"The content of file `{file_path}` doesn't match the encoding of the file."
+            " If you know the encoding the content is in, try resaving the file with that encoding explicitly."
+            " Alternatively this error generally arises due to copy and pasted content,"
+            " try manually typing up the problem file instead of copy and pasting"
+        ) from e
+
+
+def read_error_to_validation_error(file_path: str, error: Exception) -> ValidationError:
+    """Describes an error raised by `read_yaml_config_file` for the file as a `ValidationError`.
+
+    A `KeyError` is raised for a template variable that isn't in the template mapping.
+    """
+    if isinstance(error, KeyError):
+        message = f"Unable to read the file, as the template variable {error} isn't defined"
+    else:
+        message = f"Unable to read the file: {error}"
+    return ValidationError(context=FileContext(file_name=file_path), message=message)
+
+
 def parse_yaml_file_paths_to_semantic_manifest(
     file_paths: List[str],
     template_mapping: Optional[Dict[str, str]] = None,
@@ -137,26 +170,9 @@ def parse_yaml_file_paths_to_semantic_manifest(
     according to the template_mapping dict.
     """
     template_mapping = template_mapping or {}
-    yaml_config_files = []
-    for file_path in file_paths:
-        try:
-            with open(file_path) as f:
-                contents = Template(f.read()).substitute(template_mapping)
-                yaml_config_files.append(
-                    YamlConfigFile(filepath=file_path, contents=contents),
-                )
-        except UnicodeDecodeError as e:
-            # We could alternatively return this as a validation issue, but this
-            # exception is hit *before* building the semantic manifest. Currently, the
-            # SemanticManifestBuildResult guarantees a SemanticManifest. We could make
-            # SemanticManifest optional on ModelBuildResult, but this has
-            # undesirable consequences.
-            raise Exception(
-                f"The content of file `{file_path}` doesn't match the encoding of the file."
-                " If you know the encoding the content is in, try resaving the file with that encoding explicitly."
-                " Alternatively this error generally arises due to copy and pasted content,"
-                " try manually typing up the problem file instead of copy and pasting"
-            ) from e
+    yaml_config_files = [
+        read_yaml_config_file(file_path=file_path, template_mapping=template_mapping) for file_path in file_paths
+    ]
 
     return parse_yaml_files_to_validation_ready_semantic_manifest(
         yaml_config_files=yaml_config_files,
@@ -207,6 +223,41 @@ def parse_yaml_files_to_semantic_manifest(
     Persistent storage connection may be passed to write parsed objects=
     to storage and populate object metadata
 
+    Note: this function does not finalize the model
+    """
+    file_parsing_results = [
+        (
+            config_file.filepath,
+            parse_config_yaml(  # parse config file
+                config_file,
+                semantic_model_class=semantic_model_class,
+                metric_class=metric_class,
+                project_configuration_class=project_configuration_class,
+                saved_query_class=saved_query_class,
+            ),
+        )
+        for config_file in files
+    ]
+    return build_semantic_manifest_from_file_parsing_results(
+        file_parsing_results,
+        semantic_model_class=semantic_model_class,
+        metric_class=metric_class,
+        project_configuration_class=project_configuration_class,
+        saved_query_class=saved_query_class,
+    )
+
+
+def build_semantic_manifest_from_file_parsing_results(
+    file_parsing_results: Sequence[Tuple[str, FileParsingResult]],
+    semantic_model_class: Type[PydanticSemanticModel] = PydanticSemanticModel,
+    metric_class: Type[PydanticMetric] = PydanticMetric,
+    project_configuration_class: Type[PydanticProjectConfiguration] = PydanticProjectConfiguration,
+    saved_query_class: Type[PydanticSavedQuery] = PydanticSavedQuery,
+) -> SemanticManifestBuildResult:
+    """Builds a SemanticManifest from the results of `parse_config_yaml` for each file, given with the file path.
+
+    The results aren't modified, so they can be kept to build the manifest again when other files change.
+
     Note: this function does not finalize the model
     """
     semantic_models = []
@@ -222,15 +273,8 @@ def parse_yaml_files_to_semantic_manifest(
     ]
     issues: List[ValidationIssue] = []
 
-    for config_file in files:
-        parsing_result = parse_config_yaml(  # parse config file
-            config_file,
-            semantic_model_class=semantic_model_class,
-            metric_class=metric_class,
-            project_configuration_class=project_configuration_class,
-            saved_query_class=saved_query_class,
-        )
-        file_issues = parsing_result.issues
+    for file_path, parsing_result in file_parsing_results:
+        file_issues = list(parsing_result.issues)
         for obj in parsing_result.elements:
             if isinstance(obj, semantic_model_class):
                 semantic_models.append(obj)
@@ -243,7 +287,7 @@ def parse_yaml_files_to_semantic_manifest(
             else:
                 file_issues.append(
                     ValidationError(
-                        context=FileContext(file_name=config_file.filepath),
+                        context=FileContext(file_name=file_path),
                         message=f"Unexpected model object {obj.__class__.__name__}. Expected {valid_object_classes}.",
                     )
                 )
@@ -275,12 +319,17 @@ def parse_config_yaml(
     saved_query_class: Type[PydanticSavedQuery] = PydanticSavedQuery,
 ) -> FileParsingResult:
     """Parses transform config file passed as string - Returns list of model objects."""
+    # Imported here as importing `jsonschema` is slow, and it's only needed when parsing.
+    from jsonschema import exceptions
+
     results: List[Union[PydanticSemanticModel, PydanticMetric, PydanticProjectConfiguration, PydanticSavedQuery]] = []
     ctx: Optional[ParsingContext] = None
     issues: List[ValidationIssue] = []
     try:
-        for config_document in YamlConfigLoader.load_all_with_context(
-            name=config_yaml.filepath, contents=config_yaml.contents
+        for config_document in instrumented_iter(
+            YAML_LOAD_PHASE,
+            YamlConfigLoader.load_all_with_context(name=config_yaml.filepath, contents=config_yaml.contents),
+            file_path=config_yaml.filepath,
         ):
             # The config document can be None if there is nothing but white space between two `---`
             # this isn't really an issue, so lets just swallow it
@@ -334,13 +383,18 @@ def parse_config_yaml(
             document_type = next(iter(config_document.keys()))
             object_cfg = config_document[document_type]
 
+            phase_attributes = {"file_path": config_yaml.filepath, "document_type": document_type}
             try:
                 if document_type == METRIC_TYPE:
-                    metric_validator.validate(config_document[document_type])
-                    results.append(metric_class.parse_obj(object_cfg))
+                    with instrumented_phase(JSONSCHEMA_VALIDATE_PHASE, **phase_attributes):
+                        schemas.metric_validator.validate(config_document[document_type])
+                    with instrumented_phase(PYDANTIC_PARSE_PHASE, **phase_attributes):
+                        results.append(metric_class.parse_obj(object_cfg))
                 elif document_type == SEMANTIC_MODEL_TYPE:
-                    semantic_model_validator.validate(config_document[document_type])
-                    sm = semantic_model_class.parse_obj(object_cfg)
+                    with instrumented_phase(JSONSCHEMA_VALIDATE_PHASE, **phase_attributes):
+                        schemas.semantic_model_validator.validate(config_document[document_type])
+                    with instrumented_phase(PYDANTIC_PARSE_PHASE, **phase_attributes):
+                        sm = semantic_model_class.parse_obj(object_cfg)
                     # Combine configs according to the behavior documented here https://docs.getdbt.com/reference/configs-and-properties#combining-configs
                     elements: Sequence[Union[PydanticDimension, PydanticEntity, PydanticMeasure]] = [
                         *sm.dimensions,
@@ -355,11 +409,15 @@ def parse_config_yaml(
                                 element.config.meta = {**sm.config.meta, **element.config.meta}
                     results.append(sm)
                 elif document_type == PROJECT_CONFIGURATION_TYPE:
-                    project_configuration_validator.validate(config_document[document_type])
-                    results.append(project_configuration_class.parse_obj(object_cfg))
+                    with instrumented_phase(JSONSCHEMA_VALIDATE_PHASE, **phase_attributes):
+                        schemas.project_configuration_validator.validate(config_document[document_type])
+                    with instrumented_phase(PYDANTIC_PARSE_PHASE, **phase_attributes):
+                        results.append(project_configuration_class.parse_obj(object_cfg))
                 elif document_type == SAVED_QUERY_TYPE:
-                    saved_query_validator.validate(config_document[document_type])
-                    results.append(saved_query_class.parse_obj(object_cfg))
+                    with instrumented_phase(JSONSCHEMA_VALIDATE_PHASE, **phase_attributes):
+                        schemas.saved_query_validator.validate(config_document[document_type])
+                    with instrumented_phase(PYDANTIC_PARSE_PHASE, **phase_attributes):
+                        results.append(saved_query_class.parse_obj(object_cfg))
                 else:
                     issues.append(
                         ValidationError(
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.errors import ParsingException
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    FileParsingResult,
+    build_semantic_manifest_from_file_parsing_results,
+    collect_yaml_config_file_paths,
+    parse_config_yaml,
+    read_error_to_validation_error,
+    read_yaml_config_file,
+)
+from dbt_semantic_interfaces.parsing.yaml_loader import YamlConfigLoader
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+from dbt_semantic_interfaces.validations.validator_helpers import (
+    FileContext,
+    SemanticManifestValidationResults,
+    ValidationError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _ParsedFile:
+    """The result of parsing a file, with what's needed to tell whether the file has changed since.
+
+    Attributes:
+        stat_signature: The modification time in nanoseconds and the size of the file when it was read.
+        content_digest: The digest of the contents after replacing the template variables.
+        parsing_result: The result of `parse_config_yaml`.
+    """
+
+    stat_signature: Tuple[int, int]
+    content_digest: str
+    parsing_result: FileParsingResult
+
+
+@dataclass(frozen=True)
+class IncrementalBuildResult:
+    """The result of `IncrementalManifestBuilder.update`.
+
+    Attributes:
+        semantic_manifest: The transformed manifest, or None if it couldn't be built, e.g. if there isn't exactly one
+            project configuration. If the transformation failed, this is the untransformed manifest, as with
+            `parse_yaml_files_to_validation_ready_semantic_manifest`.
+        issues: The issues found while parsing, transforming and validating the manifest.
+        reparsed_file_paths: The files that were parsed in this update because they were added or changed.
+        removed_file_paths: The files that were removed from the manifest in this update.
+        seconds: The time that the update took.
+    """
+
+    semantic_manifest: Optional[PydanticSemanticManifest]
+    issues: SemanticManifestValidationResults
+    reparsed_file_paths: Tuple[str, ...]
+    removed_file_paths: Tuple[str, ...]
+    seconds: float
+
+    @property
+    def changed(self) -> bool:
+        """Whether any files were added, changed or removed in the update."""
+        return len(self.reparsed_file_paths) > 0 or len(self.removed_file_paths) > 0
+
+
+class IncrementalManifestBuilder:
+    """Builds the semantic manifest for a directory of YAML files, re-parsing only the files that changed.
+
+    Parsing the files is most of the time that it takes to build a manifest, so the result of parsing each file is kept
+    and a file is only parsed again if its contents changed. The manifest is then transformed and validated as a whole,
+    as the transformation and validation rules apply to the whole manifest.
+
+    Files are identified by their absolute path, and are checked for changes by their modification time and size. If
+    those changed, the file is read and it's only parsed again if the contents changed. Files that can't be read, e.g.
+    because of an undefined template variable, are reported as errors, so that the builder can be updated after the
+    files are fixed.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        template_mapping: Optional[Dict[str, str]] = None,
+        validator: Optional[SemanticManifestValidator[PydanticSemanticManifest]] = None,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            directory: The directory with the YAML files. See `collect_yaml_config_file_paths`.
+            template_mapping: The values for the template variables in the files.
+            validator: The validator for the transformed manifest. Defaults to one with the default rules.
+        """
+        self._directory = os.path.abspath(directory)
+        self._template_mapping = template_mapping or {}
+        self._validator = validator or SemanticManifestValidator[PydanticSemanticManifest]()
+        self._parsed_files: Dict[str, _ParsedFile] = {}
+        self._last_result: Optional[IncrementalBuildResult] = None
+
+    @property
+    def directory(self) -> str:  # noqa: D
+        return self._directory
+
+    @property
+    def file_paths(self) -> Sequence[str]:
+        """The absolute paths of the files in the manifest, sorted."""
+        return sorted(self._parsed_files)
+
+    @property
+    def last_result(self) -> Optional[IncrementalBuildResult]:
+        """The result of the last call to `update`, or None if it hasn't been called."""
+        return self._last_result
+
+    def update(self, changed_file_paths: Optional[Sequence[str]] = None) -> IncrementalBuildResult:
+        """Parses the files that were added or changed, and builds, transforms and validates the manifest.
+
+        Args:
+            changed_file_paths: The files that may have been added, changed or removed. If None, the directory is
+                scanned for changes. Paths that aren't YAML files in the directory are ignored.
+
+        Returns:
+            The result, which is the same as the last result (apart from the time) if no files changed.
+        """
+        start_time = time.perf_counter()
+        if changed_file_paths is None:
+            candidate_file_paths = set(self._parsed_files)
+            candidate_file_paths.update(
+                os.path.abspath(file_path) for file_path in collect_yaml_config_file_paths(self._directory)
+            )
+        else:
+            candidate_file_paths = {
+                os.path.abspath(file_path) for file_path in changed_file_paths if self._is_config_file_path(file_path)
+            }
+
+        # The changes are only applied once all files were read, so that the files are read again in the next update
+        # if reading one of them fails.
+        updated_parsed_files: Dict[str, _ParsedFile] = {}
+        reparsed_file_paths: List[str] = []
+        removed_file_paths: List[str] = []
+        for file_path in sorted(candidate_file_paths):
+            previous_parsed_file = self._parsed_files.get(file_path)
+            try:
+                stat_result = os.stat(file_path)
+                parsed_file = self._parse_if_changed(
+                    file_path, (stat_result.st_mtime_ns, stat_result.st_size), previous_parsed_file
+                )
+            except FileNotFoundError:
+                if previous_parsed_file is not None:
+                    removed_file_paths.append(file_path)
+                continue
+            if parsed_file is None:
+                continue
+            updated_parsed_files[file_path] = parsed_file
+            if previous_parsed_file is None or parsed_file.parsing_result is not previous_parsed_file.parsing_result:
+                reparsed_file_paths.append(file_path)
+        self._parsed_files.update(updated_parsed_files)
+        for file_path in removed_file_paths:
+            del self._parsed_files[file_path]
+
+        if self._last_result is not None and not reparsed_file_paths and not removed_file_paths:
+            self._last_result = IncrementalBuildResult(
+                semantic_manifest=self._last_result.semantic_manifest,
+                issues=self._last_result.issues,
+                reparsed_file_paths=(),
+                removed_file_paths=(),
+                seconds=time.perf_counter() - start_time,
+            )
+            return self._last_result
+
+        semantic_manifest, issues = self._build()
+        self._last_result = IncrementalBuildResult(
+            semantic_manifest=semantic_manifest,
+            issues=issues,
+            reparsed_file_paths=tuple(reparsed_file_paths),
+            removed_file_paths=tuple(removed_file_paths),
+            seconds=time.perf_counter() - start_time,
+        )
+        logger.info(
+            f"Updated the semantic manifest for {self._directory} in {self._last_result.seconds:.3f}s after parsing "
+            f"{len(reparsed_file_paths)} file(s) and removing {len(removed_file_paths)} file(s)"
+        )
+        return self._last_result
+
+    def _is_config_file_path(self, file_path: str) -> bool:
+        """Returns whether the path would be returned by `collect_yaml_config_file_paths` for the directory."""
+        relative_path = os.path.relpath(os.path.abspath(file_path), self._directory)
+        path_parts = relative_path.split(os.sep)
+        return (
+            relative_path != os.pardir
+            and not relative_path.startswith(os.pardir + os.sep)
+            and not any(path_part.startswith(".") for path_part in path_parts)
+            and YamlConfigLoader.is_valid_yaml_file_ending(path_parts[-1])
+        )
+
+    def _parse_if_changed(
+        self, file_path: str, stat_signature: Tuple[int, int], previous_parsed_file: Optional[_ParsedFile]
+    ) -> Optional[_ParsedFile]:
+        """Reads the file if it was added or its modification time or size changed, and parses it if its contents did.
+
+        Returns:
+            The updated entry for the file, which has the previous parsing result if the contents didn't change, or
+            None if the file wasn't read. If the file can't be read, e.g. because a template variable isn't defined,
+            the parsing result has the error.
+
+        Raises:
+            FileNotFoundError: If the file was removed.
+        """
+        if previous_parsed_file is not None and previous_parsed_file.stat_signature == stat_signature:
+            return None
+
+        try:
+            yaml_config_file = read_yaml_config_file(file_path=file_path, template_mapping=self._template_mapping)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            return _ParsedFile(
+                stat_signature=stat_signature,
+                content_digest="",
+                parsing_result=FileParsingResult(
+                    elements=[],
+                    issues=[read_error_to_validation_error(file_path=file_path, error=e)],
+                ),
+            )
+
+        content_digest = hashlib.sha256(yaml_config_file.contents.encode()).hexdigest()
+        if previous_parsed_file is not None and previous_parsed_file.content_digest == content_digest:
+            return _ParsedFile(
+                stat_signature=stat_signature,
+                content_digest=content_digest,
+                parsing_result=previous_parsed_file.parsing_result,
+            )
+        return _ParsedFile(
+            stat_signature=stat_signature,
+            content_digest=content_digest,
+            parsing_result=parse_config_yaml(yaml_config_file),
+        )
+
+    def _build(self) -> Tuple[Optional[PydanticSemanticManifest], SemanticManifestValidationResults]:
+        try:
+            build_result = build_semantic_manifest_from_file_parsing_results(
+                [(file_path, self._parsed_files[file_path].parsing_result) for file_path in self.file_paths]
+            )
+        except ParsingException as e:
+            # The issues of the files are kept, as they may be the reason, e.g. if the project configuration file
+            # couldn't be read.
+            file_issues = SemanticManifestValidationResults.from_issues_sequence(
+                [
+                    issue
+                    for file_path in self.file_paths
+                    for issue in self._parsed_files[file_path].parsing_result.issues
+                ]
+            )
+            build_issues = SemanticManifestValidationResults(
+                errors=(ValidationError(context=FileContext(file_name=self._directory), message=str(e)),)
+            )
+            return None, SemanticManifestValidationResults.merge([file_issues, build_issues])
+
+        # The transformer copies the manifest, so the parsed objects can be used again in the next update.
+        try:
+            semantic_manifest = PydanticSemanticManifestTransformer.transform(build_result.semantic_manifest)
+        except Exception as e:
+            transformation_issues = SemanticManifestValidationResults(errors=(ValidationError(message=str(e)),))
+            return build_result.semantic_manifest, SemanticManifestValidationResults.merge(
+                [build_result.issues, transformation_issues]
+            )
+
+        validation_results = self._validator.validate_semantic_manifest(semantic_manifest)
+        return semantic_manifest, SemanticManifestValidationResults.merge([build_result.issues, validation_results])
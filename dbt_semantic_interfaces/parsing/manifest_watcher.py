@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from dbt_semantic_interfaces.parsing.dir_to_model import collect_yaml_config_file_paths
+from dbt_semantic_interfaces.parsing.incremental_builder import (
+    IncrementalBuildResult,
+    IncrementalManifestBuilder,
+)
+from dbt_semantic_interfaces.validations.validator_helpers import (
+    SemanticManifestValidationResults,
+    ValidationError,
+    ValidationIssue,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class DirectoryPoller:
+    """Finds the YAML files in a directory that were added, changed or removed, by comparing their modification times.
+
+    The files are the ones returned by `collect_yaml_config_file_paths`. This polls with `os.stat` instead of using
+    file system notifications, so it works on any platform without extra dependencies.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Initializer. The files in the directory are recorded, so that only later changes are returned by `poll`."""
+        self._directory = os.path.abspath(directory)
+        self._stat_signatures = self._current_stat_signatures()
+
+    def _current_stat_signatures(self) -> Dict[str, Tuple[int, int]]:
+        stat_signatures: Dict[str, Tuple[int, int]] = {}
+        for file_path in collect_yaml_config_file_paths(self._directory):
+            try:
+                stat_result = os.stat(file_path)
+            except FileNotFoundError:
+                continue
+            stat_signatures[os.path.abspath(file_path)] = (stat_result.st_mtime_ns, stat_result.st_size)
+        return stat_signatures
+
+    def poll(self) -> Set[str]:
+        """Returns the absolute paths of the files that were added, changed or removed since the last poll."""
+        stat_signatures = self._current_stat_signatures()
+        changed_file_paths = {
+            file_path
+            for file_path in stat_signatures.keys() | self._stat_signatures.keys()
+            if stat_signatures.get(file_path) != self._stat_signatures.get(file_path)
+        }
+        self._stat_signatures = stat_signatures
+        return changed_file_paths
+
+
+@dataclass(frozen=True)
+class IssueDiff:
+    """The issues that were found or resolved between two validations. See `diff_issues`."""
+
+    new_issues: Tuple[ValidationIssue, ...]
+    resolved_issues: Tuple[ValidationIssue, ...]
+
+    @property
+    def is_empty(self) -> bool:  # noqa: D
+        return len(self.new_issues) == 0 and len(self.resolved_issues) == 0
+
+
+def _issue_key(issue: ValidationIssue) -> Tuple[str, str]:
+    """Returns what identifies the issue between validations, which is the issue without the line number."""
+    issue_dict = json.loads(issue.json())
+    context = issue_dict.get("context") or {}
+    # The context is either a `FileContext` or the context of an object, which has a `FileContext`.
+    file_context = context.get("file_context", context)
+    if isinstance(file_context, dict):
+        file_context.pop("line_number", None)
+    return issue.level.name, json.dumps(issue_dict, sort_keys=True)
+
+
+def diff_issues(
+    previous_issues: SemanticManifestValidationResults, current_issues: SemanticManifestValidationResults
+) -> IssueDiff:
+    """Returns the issues that are only in the current issues, and the ones that are only in the previous issues.
+
+    Issues are compared without their line numbers, so an issue doesn't show up as new when lines are added above it.
+    """
+    previous_keys = Counter(_issue_key(issue) for issue in previous_issues.all_issues)
+    current_keys = Counter(_issue_key(issue) for issue in current_issues.all_issues)
+
+    def _unmatched(issues: Tuple[ValidationIssue, ...], other_keys: Counter) -> Tuple[ValidationIssue, ...]:
+        remaining_keys = Counter(other_keys)
+        unmatched_issues: List[ValidationIssue] = []
+        for issue in issues:
+            key = _issue_key(issue)
+            if remaining_keys[key] > 0:
+                remaining_keys[key] -= 1
+            else:
+                unmatched_issues.append(issue)
+        return tuple(unmatched_issues)
+
+    return IssueDiff(
+        new_issues=_unmatched(current_issues.all_issues, previous_keys),
+        resolved_issues=_unmatched(previous_issues.all_issues, current_keys),
+    )
+
+
+@dataclass(frozen=True)
+class WatchUpdate:
+    """The result of updating the manifest after files changed.
+
+    Attributes:
+        build_result: The result of `IncrementalManifestBuilder.update`.
+        issue_diff: The issues that were found or resolved by the update.
+    """
+
+    build_result: IncrementalBuildResult
+    issue_diff: IssueDiff
+
+
+class ManifestWatcher:
+    """Keeps the semantic manifest of a directory up to date while the files in it are edited.
+
+    The directory is polled for changes with `DirectoryPoller`. A burst of changes, e.g. an editor saving several files
+    or writing a file in a few steps, is handled once after no more changes are seen for `debounce_seconds`. Then only
+    the changed files are parsed again, with `IncrementalManifestBuilder`, and the issues are compared with the
+    previous ones. A failed update is reported as an error instead of ending the watch, as the files may be saved in
+    an invalid state while they're edited.
+    """
+
+    def __init__(
+        self,
+        builder: IncrementalManifestBuilder,
+        poll_interval_seconds: float = 0.5,
+        debounce_seconds: float = 0.3,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializer.
+
+        Args:
+            builder: The builder for the directory to watch.
+            poll_interval_seconds: The time between polls of the directory.
+            debounce_seconds: The time without changes to wait for after a change, before updating the manifest.
+            sleep: The function to wait with. Can be replaced in tests.
+            clock: The function that returns the current time in seconds. Can be replaced in tests.
+        """
+        self._builder = builder
+        self._poll_interval_seconds = poll_interval_seconds
+        self._debounce_seconds = debounce_seconds
+        self._sleep = sleep
+        self._clock = clock
+        self._poller = DirectoryPoller(builder.directory)
+        self._issues = SemanticManifestValidationResults()
+        self._update_failed = False
+
+    def update(self, changed_file_paths: Optional[List[str]] = None) -> WatchUpdate:
+        """Updates the manifest for the changed files (or all files if None) and compares the issues with the last ones.
+
+        The first update reports all issues as new. If the update fails, the failure is reported as an error, so that
+        watching continues, and the next update checks all files, as the changed files may not have been handled.
+        """
+        if self._update_failed:
+            changed_file_paths = None
+        start_time = time.perf_counter()
+        try:
+            build_result = self._builder.update(changed_file_paths)
+            self._update_failed = False
+        except Exception as e:
+            logger.exception(f"Failed to update the semantic manifest for {self._builder.directory}")
+            self._update_failed = True
+            build_result = IncrementalBuildResult(
+                semantic_manifest=None,
+                issues=SemanticManifestValidationResults(
+                    errors=(ValidationError(message=f"Failed to update the semantic manifest: {e!r}"),)
+                ),
+                reparsed_file_paths=(),
+                removed_file_paths=(),
+                seconds=time.perf_counter() - start_time,
+            )
+        issue_diff = diff_issues(self._issues, build_result.issues)
+        self._issues = build_result.issues
+        return WatchUpdate(build_result=build_result, issue_diff=issue_diff)
+
+    def wait_for_changes(self, should_stop: Callable[[], bool] = lambda: False) -> Optional[List[str]]:
+        """Polls the directory until files change and then stay unchanged for the debounce time.
+
+        Returns:
+            The sorted absolute paths of the files that were added, changed or removed, or None if `should_stop`
+            returned True first.
+        """
+        changed_file_paths: Set[str] = set()
+        last_change_time = 0.0
+        while not should_stop():
+            self._sleep(self._poll_interval_seconds)
+            newly_changed_file_paths = self._poller.poll()
+            if newly_changed_file_paths:
+                changed_file_paths.update(newly_changed_file_paths)
+                last_change_time = self._clock()
+            elif changed_file_paths and self._clock() - last_change_time >= self._debounce_seconds:
+                return sorted(changed_file_paths)
+        return None
+
+    def watch(self, callback: Callable[[WatchUpdate], None], should_stop: Callable[[], bool] = lambda: False) -> None:
+        """Builds the manifest, then updates it whenever files change, calling the callback with each update.
+
+        This returns when `should_stop` returns True, which is checked between polls.
+        """
+        callback(self.update())
+        while True:
+            changed_file_paths = self.wait_for_changes(should_stop)
+            if changed_file_paths is None:
+                return
+            logger.info(f"Updating the semantic manifest after {len(changed_file_paths)} file(s) changed")
+            callback(self.update(changed_file_paths))
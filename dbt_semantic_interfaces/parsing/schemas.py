@@ -1,9 +1,15 @@
-from typing import List, Tuple
+"""JSON schemas for the YAML documents, and validators for them.
 
-from referencing import Registry, Resource
-from referencing.jsonschema import DRAFT7
+The schema registry and the validators are created on first use through the module `__getattr__` (PEP 562), as
+importing `jsonschema` and `referencing` and building the registry is a large part of the import time of the package.
+"""
 
-from dbt_semantic_interfaces.parsing.schema_validator import SchemaValidator
+import threading
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from jsonschema.protocols import Validator
+    from referencing import Registry, Resource
 
 TRANSFORM_OBJECT_NAME_PATTERN = "(?!.*__).*^[a-z][a-z0-9_]*[a-z0-9]$"
 
@@ -605,9 +611,54 @@ schema_store = {
     measure_config_schema["$id"]: measure_config_schema,
 }
 
-resources: List[Tuple[str, Resource]] = [(str(k), DRAFT7.create_resource(v)) for k, v in schema_store.items()]
-registry: Registry = Registry().with_resources(resources)
-semantic_model_validator = SchemaValidator(semantic_model_schema, registry=registry)
-metric_validator = SchemaValidator(metric_schema, registry=registry)
-project_configuration_validator = SchemaValidator(project_configuration_schema, registry=registry)
-saved_query_validator = SchemaValidator(saved_query_schema, registry=registry)
+if TYPE_CHECKING:
+    resources: List[Tuple[str, Resource]]
+    registry: Registry
+    semantic_model_validator: Validator
+    metric_validator: Validator
+    project_configuration_validator: Validator
+    saved_query_validator: Validator
+
+_LAZY_ATTRIBUTE_NAMES = frozenset(
+    (
+        "resources",
+        "registry",
+        "semantic_model_validator",
+        "metric_validator",
+        "project_configuration_validator",
+        "saved_query_validator",
+    )
+)
+_lazy_attributes_lock = threading.Lock()
+
+
+def _create_registry_and_validators() -> Dict[str, object]:
+    from referencing import Registry
+    from referencing.jsonschema import DRAFT7
+
+    from dbt_semantic_interfaces.parsing.schema_validator import SchemaValidator
+
+    resources = [(str(k), DRAFT7.create_resource(v)) for k, v in schema_store.items()]
+    registry = Registry().with_resources(resources)
+    return {
+        "resources": resources,
+        "registry": registry,
+        "semantic_model_validator": SchemaValidator(semantic_model_schema, registry=registry),
+        "metric_validator": SchemaValidator(metric_schema, registry=registry),
+        "project_configuration_validator": SchemaValidator(project_configuration_schema, registry=registry),
+        "saved_query_validator": SchemaValidator(saved_query_schema, registry=registry),
+    }
+
+
+def __getattr__(name: str) -> object:
+    """Creates the schema registry and the validators when one of them is first accessed.
+
+    They're then stored as module attributes, so this is only called once.
+    """
+    if name not in _LAZY_ATTRIBUTE_NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_attributes = globals()
+    with _lazy_attributes_lock:
+        if name not in module_attributes:
+            module_attributes.update(_create_registry_and_validators())
+    return module_attributes[name]
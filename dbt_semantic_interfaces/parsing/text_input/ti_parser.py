@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from dbt_semantic_interfaces.parsing.text_input.ti_description import (
+    ObjectBuilderMethod,
+    QueryItemType,
+)
+
+# A value that can be passed to a builder function or method, e.g. `'listing__country'` or `['listing']`.
+ObjectBuilderArgument = Union[str, bool, None, Tuple["ObjectBuilderArgument", ...], "ObjectBuilderListArgument"]
+
+
+@dataclass(frozen=True)
+class ObjectBuilderListArgument:
+    """A list literal in a call, e.g. `['listing']` in `Dimension('user__country', entity_path=['listing'])`.
+
+    This is stored as a tuple so that a parsed template can be shared, and converted to a new list for each call to
+    match the value that Jinja would pass.
+    """
+
+    items: Tuple[ObjectBuilderArgument, ...]
+
+
+@dataclass(frozen=True)
+class ObjectBuilderCallArguments:
+    """The positional and keyword arguments in a call."""
+
+    args: Tuple[ObjectBuilderArgument, ...]
+    kwargs: Tuple[Tuple[str, ObjectBuilderArgument], ...]
+
+    def materialize(self) -> Tuple[List, Dict]:
+        """Return the args and kwargs as the Python values that Jinja would pass to the call."""
+        return (
+            [_materialize_argument(arg) for arg in self.args],
+            {name: _materialize_argument(value) for name, value in self.kwargs},
+        )
+
+
+def _materialize_argument(argument: ObjectBuilderArgument) -> object:
+    if isinstance(argument, ObjectBuilderListArgument):
+        return [_materialize_argument(item) for item in argument.items]
+    elif isinstance(argument, tuple):
+        return tuple(_materialize_argument(item) for item in argument)
+    return argument
+
+
+@dataclass(frozen=True)
+class ObjectBuilderMethodCall:
+    """A call to a builder method, e.g. `.grain('day')`."""
+
+    method: ObjectBuilderMethod
+    arguments: ObjectBuilderCallArguments
+
+
+@dataclass(frozen=True)
+class ObjectBuilderExpression:
+    """An expression in a template, e.g. `{{ Dimension('listing__created_at').grain('day') }}`."""
+
+    item_type: QueryItemType
+    arguments: ObjectBuilderCallArguments
+    method_calls: Tuple[ObjectBuilderMethodCall, ...]
+
+
+@dataclass(frozen=True)
+class ParsedObjectBuilderTemplate:
+    """A template that was parsed by `ObjectBuilderTemplateParser`.
+
+    The parts are in the order that they appear in the template, and are either literal text or an expression.
+    """
+
+    parts: Tuple[Union[str, ObjectBuilderExpression], ...]
+
+
+class _TemplateOutsideGrammar(Exception):
+    """Raised while parsing when a template contains a construct that the parser does not handle."""
+
+    pass
+
+
+class ObjectBuilderTemplateParser:
+    """Parses templates that only use the object-builder syntax within `{{ ... }}`, without using Jinja.
+
+    Compiling and rendering a template with Jinja is relatively slow, and most templates only contain expressions like:
+
+        {{ Dimension('listing__created_at', entity_path=['host']).grain('day') }} > '2020-01-01'
+
+    This parser handles a subset of the Jinja syntax that covers those expressions. Arguments can be strings, booleans,
+    `None`, or lists / tuples of those. For any template that uses something else, including templates that are
+    invalid, `parse()` returns None so that the template can be processed by Jinja instead. Consequently, this only
+    needs to be correct for the templates that it accepts.
+    """
+
+    _BUILDER_NAME_TO_ITEM_TYPE = {item_type.value: item_type for item_type in QueryItemType}
+    _METHOD_NAME_TO_METHOD = {method.value: method for method in ObjectBuilderMethod}
+    _CONSTANT_NAME_TO_VALUE: Dict[str, ObjectBuilderArgument] = {
+        "True": True,
+        "true": True,
+        "False": False,
+        "false": False,
+        "None": None,
+        "none": None,
+    }
+
+    # Strings with escape sequences are handled by Jinja as it has its own rules for those.
+    _TOKEN_PATTERN = re.compile(
+        r"""[ \t\n]*(?:
+            (?P<name>[a-zA-Z_][a-zA-Z0-9_]*)
+            |(?P<string>'[^'\\]*'|"[^"\\]*")
+            |(?P<operator>[()\[\],.=]|}})
+        )""",
+        re.VERBOSE,
+    )
+
+    def parse(self, template: str) -> Optional[ParsedObjectBuilderTemplate]:
+        """Parse the template, or return None if it uses constructs outside the object-builder grammar."""
+        # Statements, comments, and `\r` (which Jinja normalizes to `\n`) are not handled.
+        if "{%" in template or "{#" in template or "\r" in template:
+            return None
+
+        parts: List[Union[str, ObjectBuilderExpression]] = []
+        position = 0
+        try:
+            while True:
+                expression_start = template.find("{{", position)
+                if expression_start == -1:
+                    text = template[position:]
+                    # Jinja removes a single trailing newline from the template.
+                    if text.endswith("\n"):
+                        text = text[:-1]
+                    if text:
+                        parts.append(text)
+                    break
+
+                if expression_start > position:
+                    parts.append(template[position:expression_start])
+                expression, position = _ExpressionParser(template, expression_start + 2).parse_expression()
+                parts.append(expression)
+        except _TemplateOutsideGrammar:
+            return None
+
+        return ParsedObjectBuilderTemplate(parts=tuple(parts))
+
+
+class _ExpressionParser:
+    """Recursive-descent parser for an expression between `{{` and `}}`."""
+
+    def __init__(self, template: str, position: int) -> None:  # noqa: D107
+        self._template = template
+        self._position = position
+        self._token_type: Optional[str] = None
+        self._token_value = ""
+        self._advance()
+
+    def _advance(self) -> None:
+        match = ObjectBuilderTemplateParser._TOKEN_PATTERN.match(self._template, self._position)
+        if match is None:
+            raise _TemplateOutsideGrammar()
+        self._token_type = match.lastgroup
+        self._token_value = match.group(match.lastgroup or 0)
+        self._position = match.end()
+
+    def _accept_operator(self, operator: str) -> bool:
+        if self._token_type == "operator" and self._token_value == operator:
+            self._advance()
+            return True
+        return False
+
+    def _expect_operator(self, operator: str) -> None:
+        if not self._accept_operator(operator):
+            raise _TemplateOutsideGrammar()
+
+    def _expect_name(self) -> str:
+        if self._token_type != "name":
+            raise _TemplateOutsideGrammar()
+        name = self._token_value
+        self._advance()
+        return name
+
+    def parse_expression(self) -> Tuple[ObjectBuilderExpression, int]:
+        """Parse the expression, and return it along with the position after the closing `}}`."""
+        item_type = ObjectBuilderTemplateParser._BUILDER_NAME_TO_ITEM_TYPE.get(self._expect_name())
+        if item_type is None:
+            raise _TemplateOutsideGrammar()
+        arguments = self._parse_call_arguments()
+
+        method_calls = []
+        while self._accept_operator("."):
+            method = ObjectBuilderTemplateParser._METHOD_NAME_TO_METHOD.get(self._expect_name())
+            if method is None:
+                raise _TemplateOutsideGrammar()
+            method_calls.append(ObjectBuilderMethodCall(method=method, arguments=self._parse_call_arguments()))
+
+        # The closing `}}` is the last token, so don't advance past it.
+        if not (self._token_type == "operator" and self._token_value == "}}"):
+            raise _TemplateOutsideGrammar()
+        return (
+            ObjectBuilderExpression(item_type=item_type, arguments=arguments, method_calls=tuple(method_calls)),
+            self._position,
+        )
+
+    def _parse_call_arguments(self) -> ObjectBuilderCallArguments:
+        self._expect_operator("(")
+        args: List[ObjectBuilderArgument] = []
+        kwargs: Dict[str, ObjectBuilderArgument] = {}
+        while not self._accept_operator(")"):
+            if args or kwargs:
+                self._expect_operator(",")
+                # A trailing comma is allowed.
+                if self._accept_operator(")"):
+                    break
+
+            if (
+                self._token_type == "name"
+                and self._token_value not in ObjectBuilderTemplateParser._CONSTANT_NAME_TO_VALUE
+            ):
+                keyword = self._expect_name()
+                self._expect_operator("=")
+                # Duplicate keywords would be an error at call time, so leave those to Jinja.
+                if keyword in kwargs:
+                    raise _TemplateOutsideGrammar()
+                kwargs[keyword] = self._parse_value()
+            elif kwargs:
+                # Jinja does not allow positional arguments after keyword arguments.
+                raise _TemplateOutsideGrammar()
+            else:
+                args.append(self._parse_value())
+
+        return ObjectBuilderCallArguments(args=tuple(args), kwargs=tuple(kwargs.items()))
+
+    def _parse_value(self) -> ObjectBuilderArgument:
+        token_type = self._token_type
+        token_value = self._token_value
+        if token_type == "string":
+            self._advance()
+            return token_value[1:-1]
+        elif token_type == "name":
+            if token_value not in ObjectBuilderTemplateParser._CONSTANT_NAME_TO_VALUE:
+                raise _TemplateOutsideGrammar()
+            self._advance()
+            return ObjectBuilderTemplateParser._CONSTANT_NAME_TO_VALUE[token_value]
+        elif self._accept_operator("["):
+            return ObjectBuilderListArgument(items=self._parse_sequence_items(closing_operator="]"))
+        elif self._accept_operator("("):
+            if self._accept_operator(")"):
+                return ()
+            # In Jinja, `('a')` is the same as `'a'`, but `('a',)` is a tuple.
+            first_item = self._parse_value()
+            if self._accept_operator(")"):
+                return first_item
+            self._expect_operator(",")
+            return (first_item,) + self._parse_sequence_items(closing_operator=")")
+        raise _TemplateOutsideGrammar()
+
+    def _parse_sequence_items(self, closing_operator: str) -> Tuple[ObjectBuilderArgument, ...]:
+        """Parse comma-separated values up to and including the closing operator. A trailing comma is allowed."""
+        items: List[ObjectBuilderArgument] = []
+        while not self._accept_operator(closing_operator):
+            if items:
+                self._expect_operator(",")
+                if self._accept_operator(closing_operator):
+                    break
+            items.append(self._parse_value())
+        return tuple(items)
@@ -2,25 +2,35 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from textwrap import indent
-from typing import List, Sequence
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Sequence
 
-from jinja2 import StrictUndefined, TemplateSyntaxError, UndefinedError
-from jinja2.exceptions import SecurityError
-from jinja2.sandbox import SandboxedEnvironment
 from typing_extensions import override
 
 from dbt_semantic_interfaces.errors import InvalidQuerySyntax
+from dbt_semantic_interfaces.lru_cache import LruCache, LruCacheStats
+from dbt_semantic_interfaces.parsing.text_input.description_renderer import (
+    QueryItemDescriptionRenderer,
+)
 from dbt_semantic_interfaces.parsing.text_input.rendering_helper import (
     ObjectBuilderJinjaRenderHelper,
 )
 from dbt_semantic_interfaces.parsing.text_input.ti_description import (
     ObjectBuilderItemDescription,
+    QueryItemType,
 )
 from dbt_semantic_interfaces.parsing.text_input.ti_exceptions import (
     QueryItemJinjaException,
 )
+from dbt_semantic_interfaces.parsing.text_input.ti_parser import (
+    ObjectBuilderTemplateParser,
+    ParsedObjectBuilderTemplate,
+)
 from dbt_semantic_interfaces.parsing.text_input.valid_method import ValidMethodMapping
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+    from jinja2.sandbox import SandboxedEnvironment
+
 
 class ObjectBuilderTextProcessor:
     """Performs processing actions for text containing query items specified in the object-builder syntax.
@@ -28,8 +38,23 @@ class ObjectBuilderTextProcessor:
     This currently supports:
     * Collecting `ObjectBuilderItemDescription`s from a Jinja template.
     * Rendering a Jinja template using a specified renderer.
+
+    Templates that only use the object-builder syntax are handled by `ObjectBuilderTemplateParser` as that's much faster
+    than compiling and rendering the template with Jinja. Other templates are processed with Jinja using a shared
+    environment, and the compiled templates are kept in a process-wide cache so that each distinct template is only
+    compiled once. Jinja is only imported when a template needs it.
     """
 
+    COMPILED_TEMPLATE_CACHE_MAX_SIZE: ClassVar[int] = 1024
+
+    # The sandboxed environment doesn't have any state that's modified during rendering, so it can be shared. It's
+    # created on first use. See `_get_jinja_environment`.
+    _jinja_environment: ClassVar[Optional[SandboxedEnvironment]] = None
+    _compiled_template_cache: ClassVar[LruCache[str, Template]] = LruCache(max_size=COMPILED_TEMPLATE_CACHE_MAX_SIZE)
+
+    def __init__(self) -> None:  # noqa: D107
+        self._template_parser = ObjectBuilderTemplateParser()
+
     def get_description(
         self, query_item_input: str, valid_method_mapping: ValidMethodMapping
     ) -> ObjectBuilderItemDescription:
@@ -74,6 +99,43 @@ class ObjectBuilderTextProcessor:
         )
         return description_collector.collected_descriptions()
 
+    def render_template(
+        self,
+        jinja_template: str,
+        renderer: QueryItemDescriptionRenderer,
+        valid_method_mapping: ValidMethodMapping,
+    ) -> str:
+        """Renders the Jinja template using the specified renderer.
+
+        Args:
+            jinja_template: A Jinja template string like `{{ Dimension('listing__country') }} = 'US'`.
+            renderer: The renderer to use for rendering each item.
+            valid_method_mapping: Mapping from the builder object to the valid methods. See
+            `ConfiguredValidMethodMapping`.
+
+        Returns:
+            The rendered Jinja template.
+
+        Raises:
+            QueryItemJinjaException: See definition.
+            InvalidBuilderMethodException: See definition.
+        """
+        return self._process_template(
+            jinja_template=jinja_template,
+            valid_method_mapping=valid_method_mapping,
+            description_processor=_RendererProcessor(renderer),
+        )
+
+    @staticmethod
+    def compiled_template_cache_stats() -> LruCacheStats:
+        """Return the statistics for the cache of templates compiled by Jinja."""
+        return ObjectBuilderTextProcessor._compiled_template_cache.stats
+
+    @staticmethod
+    def clear_compiled_template_cache() -> None:
+        """Clear the cache of templates compiled by Jinja."""
+        ObjectBuilderTextProcessor._compiled_template_cache.clear()
+
     def _process_template(
         self,
         jinja_template: str,
@@ -85,17 +147,68 @@ class ObjectBuilderTextProcessor:
             description_processor=description_processor,
             valid_method_mapping=valid_method_mapping,
         )
+        parsed_template = self._template_parser.parse(jinja_template)
+        if parsed_template is not None:
+            return self._process_parsed_template(parsed_template=parsed_template, render_helper=render_helper)
+        return self._process_template_using_jinja(jinja_template=jinja_template, render_helper=render_helper)
+
+    @staticmethod
+    def _process_parsed_template(
+        parsed_template: ParsedObjectBuilderTemplate, render_helper: ObjectBuilderJinjaRenderHelper
+    ) -> str:
+        """Evaluate the template in the same way as Jinja would.
+
+        The builder functions and methods are the same ones that are passed to Jinja, so the results and errors are the
+        same as well.
+        """
+        item_type_to_builder_function = {
+            QueryItemType.DIMENSION: render_helper.get_function_for_dimension(),
+            QueryItemType.TIME_DIMENSION: render_helper.get_function_for_time_dimension(),
+            QueryItemType.ENTITY: render_helper.get_function_for_entity(),
+            QueryItemType.METRIC: render_helper.get_function_for_metric(),
+        }
+        rendered_parts = []
+        for part in parsed_template.parts:
+            if isinstance(part, str):
+                rendered_parts.append(part)
+                continue
+
+            args, kwargs = part.arguments.materialize()
+            builder = item_type_to_builder_function[part.item_type](*args, **kwargs)
+            for method_call in part.method_calls:
+                args, kwargs = method_call.arguments.materialize()
+                builder = getattr(builder, method_call.method.value)(*args, **kwargs)
+            rendered_parts.append(str(builder))
+
+        return "".join(rendered_parts)
+
+    @staticmethod
+    def _get_jinja_environment() -> SandboxedEnvironment:
+        jinja_environment = ObjectBuilderTextProcessor._jinja_environment
+        if jinja_environment is None:
+            from jinja2 import StrictUndefined
+            from jinja2.sandbox import SandboxedEnvironment
+
+            # If this races with another thread, one of the environments is discarded, which is harmless.
+            jinja_environment = SandboxedEnvironment(undefined=StrictUndefined)
+            ObjectBuilderTextProcessor._jinja_environment = jinja_environment
+        return jinja_environment
+
+    @staticmethod
+    def _process_template_using_jinja(jinja_template: str, render_helper: ObjectBuilderJinjaRenderHelper) -> str:
+        from jinja2 import TemplateSyntaxError, UndefinedError
+        from jinja2.exceptions import SecurityError
+
         try:
-            # the string that the sandbox renders is unused
-            rendered = (
-                SandboxedEnvironment(undefined=StrictUndefined)
-                .from_string(jinja_template)
-                .render(
-                    Dimension=render_helper.get_function_for_dimension(),
-                    TimeDimension=render_helper.get_function_for_time_dimension(),
-                    Entity=render_helper.get_function_for_entity(),
-                    Metric=render_helper.get_function_for_metric(),
-                )
+            compiled_template = ObjectBuilderTextProcessor._compiled_template_cache.get_or_create(
+                key=jinja_template,
+                create=lambda: ObjectBuilderTextProcessor._get_jinja_environment().from_string(jinja_template),
+            )
+            rendered = compiled_template.render(
+                Dimension=render_helper.get_function_for_dimension(),
+                TimeDimension=render_helper.get_function_for_time_dimension(),
+                Entity=render_helper.get_function_for_entity(),
+                Metric=render_helper.get_function_for_metric(),
             )
         except (UndefinedError, TemplateSyntaxError, SecurityError) as e:
             raise QueryItemJinjaException(
@@ -130,3 +243,14 @@ class _CollectDescriptionProcessor(ObjectBuilderItemDescriptionProcessor):
             self._items.append(item_description)
 
         return ""
+
+
+class _RendererProcessor(ObjectBuilderItemDescriptionProcessor):
+    """Processor that renders the descriptions in a Jinja template using the given renderer."""
+
+    def __init__(self, renderer: QueryItemDescriptionRenderer) -> None:  # noqa: D107
+        self._renderer = renderer
+
+    @override
+    def process_description(self, item_description: ObjectBuilderItemDescription) -> str:
+        return self._renderer.render_description(item_description)
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import ClassVar, Sequence, Tuple
 
 from dbt_semantic_interfaces.call_parameter_sets import (
     JinjaCallParameterSets,
     ParseJinjaObjectException,
 )
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
+from dbt_semantic_interfaces.instrumentation import (
+    WHERE_FILTER_PARSE_PHASE,
+    instrumented_phase,
+)
+from dbt_semantic_interfaces.lru_cache import LruCache, LruCacheStats
 from dbt_semantic_interfaces.parsing.text_input.ti_description import (
     ObjectBuilderItemDescription,
     QueryItemType,
@@ -28,8 +33,17 @@ class JinjaObjectParser:
     """Parses the template in the Jinja object-builder syntax into JinjaCallParameterSets.
 
     These are used in where filters, saved query params, and the JDBC API.
+
+    The same templates are commonly used in many places (e.g. the same filter in different metrics) and are parsed
+    again at query time, so the results of `parse_call_parameter_sets` are kept in a process-wide cache.
     """
 
+    CALL_PARAMETER_SETS_CACHE_MAX_SIZE: ClassVar[int] = 16384
+
+    _call_parameter_sets_cache: ClassVar[
+        LruCache[Tuple[str, Tuple[str, ...], QueryItemLocation], JinjaCallParameterSets]
+    ] = LruCache(max_size=CALL_PARAMETER_SETS_CACHE_MAX_SIZE)
+
     @staticmethod
     def parse_item_descriptions(
         where_sql_template: str,
@@ -52,6 +66,36 @@ class JinjaObjectParser:
         query_item_location: QueryItemLocation,
     ) -> JinjaCallParameterSets:
         """Return the result of extracting the semantic objects referenced in the where SQL template string."""
+
+        def _create() -> JinjaCallParameterSets:
+            with instrumented_phase(WHERE_FILTER_PARSE_PHASE, query_item_location=query_item_location.value):
+                return JinjaObjectParser._parse_call_parameter_sets(
+                    where_sql_template=where_sql_template,
+                    custom_granularity_names=custom_granularity_names,
+                    query_item_location=query_item_location,
+                )
+
+        return JinjaObjectParser._call_parameter_sets_cache.get_or_create(
+            key=(where_sql_template, tuple(custom_granularity_names), query_item_location),
+            create=_create,
+        )
+
+    @staticmethod
+    def call_parameter_sets_cache_stats() -> LruCacheStats:
+        """Return the statistics for the cache used by `parse_call_parameter_sets`."""
+        return JinjaObjectParser._call_parameter_sets_cache.stats
+
+    @staticmethod
+    def clear_call_parameter_sets_cache() -> None:
+        """Clear the cache used by `parse_call_parameter_sets`."""
+        JinjaObjectParser._call_parameter_sets_cache.clear()
+
+    @staticmethod
+    def _parse_call_parameter_sets(
+        where_sql_template: str,
+        custom_granularity_names: Sequence[str],
+        query_item_location: QueryItemLocation,
+    ) -> JinjaCallParameterSets:
         valid_method_mapping = (
             ConfiguredValidMethodMapping.DEFAULT_MAPPING_FOR_ORDER_BY
             if query_item_location == QueryItemLocation.ORDER_BY
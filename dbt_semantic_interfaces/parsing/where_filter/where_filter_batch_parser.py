@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import textwrap
+import traceback
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from itertools import repeat
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.call_parameter_sets import (
+    JinjaCallParameterSets,
+    ParseJinjaObjectException,
+)
+from dbt_semantic_interfaces.enum_extension import ExtendedEnum
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
+    JinjaObjectParser,
+    QueryItemLocation,
+)
+from dbt_semantic_interfaces.protocols.semantic_manifest import SemanticManifest
+from dbt_semantic_interfaces.protocols.where_filter import WhereFilterIntersection
+
+
+class WhereFilterCallSiteType(ExtendedEnum):
+    """The places in a semantic manifest where a where filter can be specified."""
+
+    METRIC = "metric"
+    MEASURE_INPUT = "measure_input"
+    NUMERATOR = "numerator"
+    DENOMINATOR = "denominator"
+    INPUT_METRIC = "input_metric"
+    SAVED_QUERY = "saved_query"
+
+
+@dataclass(frozen=True)
+class WhereFilterCallSite:
+    """Identifies a where filter intersection in a semantic manifest.
+
+    Attributes:
+        call_site_type: Where the filter is specified.
+        element_name: The name of the metric or saved query that contains the filter.
+        input_name: For filters on an input to a metric, the name of the input measure or metric.
+        input_index: For filters on an input metric, the position of the input metric as a metric can have the same
+        input metric more than once.
+    """
+
+    call_site_type: WhereFilterCallSiteType
+    element_name: str
+    input_name: Optional[str] = None
+    input_index: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class WhereFilterParseResult:
+    """The result of parsing a where SQL template. Exactly one of `call_parameter_sets` and `exception` is set."""
+
+    where_sql_template: str
+    call_parameter_sets: Optional[JinjaCallParameterSets] = None
+    exception: Optional[Exception] = None
+
+
+@dataclass(frozen=True)
+class WhereFilterCallSiteParseResult:
+    """The results of parsing each filter in a where filter intersection."""
+
+    call_site: WhereFilterCallSite
+    where_filter_results: Tuple[WhereFilterParseResult, ...]
+
+    def filter_expression_parameter_sets(self) -> List[Tuple[str, JinjaCallParameterSets]]:
+        """Returns the same value as `WhereFilterIntersection.filter_expression_parameter_sets` for the call site.
+
+        Raises:
+            ParseJinjaObjectException: If any of the filters could not be parsed.
+        """
+        return filter_expression_parameter_sets_from_parse_results(self.where_filter_results)
+
+
+def filter_expression_parameter_sets_from_parse_results(
+    parse_results: Sequence[WhereFilterParseResult],
+) -> List[Tuple[str, JinjaCallParameterSets]]:
+    """Gets the call parameter sets for each filter expression, raising a single exception describing all failures."""
+    filter_parameter_sets: List[Tuple[str, JinjaCallParameterSets]] = []
+    invalid_filter_expressions: List[Tuple[str, Exception]] = []
+    for parse_result in parse_results:
+        if parse_result.exception is not None:
+            invalid_filter_expressions.append((parse_result.where_sql_template, parse_result.exception))
+        elif parse_result.call_parameter_sets is not None:
+            filter_parameter_sets.append((parse_result.where_sql_template, parse_result.call_parameter_sets))
+
+    if invalid_filter_expressions:
+        lines = ["Encountered error(s) while parsing:\n"]
+        for where_sql_template, exception in invalid_filter_expressions:
+            lines.append("Filter:")
+            lines.append(textwrap.indent(where_sql_template, prefix="    "))
+            lines.append("Error Message:")
+            lines.append(textwrap.indent(str(exception), prefix="    "))
+            lines.append("Traceback:")
+            lines.append(textwrap.indent("".join(traceback.format_tb(exception.__traceback__)), prefix="  "))
+        raise ParseJinjaObjectException("\n".join(lines))
+
+    return filter_parameter_sets
+
+
+def _parse_where_sql_template(
+    where_sql_template: str, custom_granularity_names: Sequence[str]
+) -> WhereFilterParseResult:
+    # This is a module-level function so that it can be used with a `ProcessPoolExecutor`.
+    try:
+        return WhereFilterParseResult(
+            where_sql_template=where_sql_template,
+            call_parameter_sets=JinjaObjectParser.parse_call_parameter_sets(
+                where_sql_template=where_sql_template,
+                custom_granularity_names=custom_granularity_names,
+                query_item_location=QueryItemLocation.NON_ORDER_BY,
+            ),
+        )
+    except Exception as e:
+        return WhereFilterParseResult(where_sql_template=where_sql_template, exception=e)
+
+
+class WhereFilterBatchParser:
+    """Parses many where filters at once, e.g. all the filters in a semantic manifest.
+
+    The same filter is commonly used in many places, so each distinct where SQL template is only parsed once and the
+    result is shared by all filters with that template. The templates can optionally be parsed using an `Executor`
+    (e.g. a `ProcessPoolExecutor`) for large manifests.
+    """
+
+    # The number of templates to send to a worker at a time when using a `ProcessPoolExecutor`.
+    _EXECUTOR_CHUNK_SIZE = 64
+
+    def __init__(self, custom_granularity_names: Sequence[str], executor: Optional[Executor] = None) -> None:
+        """Initializer.
+
+        Args:
+            custom_granularity_names: The custom granularity names to use when parsing the templates.
+            executor: If specified, the executor used to parse the templates. The caller is responsible for shutting
+            it down.
+        """
+        self._custom_granularity_names = tuple(custom_granularity_names)
+        self._executor = executor
+
+    @staticmethod
+    def collect_call_sites(
+        semantic_manifest: SemanticManifest,
+    ) -> Sequence[Tuple[WhereFilterCallSite, WhereFilterIntersection]]:
+        """Return all where filter intersections in the semantic manifest along with where they are specified.
+
+        The filters are returned in the order that they appear in the manifest: metric filters, followed by the filters
+        on the inputs for each metric, and then the where filters of saved queries.
+        """
+        call_sites: List[Tuple[WhereFilterCallSite, WhereFilterIntersection]] = []
+        for metric in semantic_manifest.metrics:
+            if metric.filter is not None:
+                call_sites.append(
+                    (
+                        WhereFilterCallSite(call_site_type=WhereFilterCallSiteType.METRIC, element_name=metric.name),
+                        metric.filter,
+                    )
+                )
+            measure = metric.type_params.measure
+            if measure is not None and measure.filter is not None:
+                call_sites.append(
+                    (
+                        WhereFilterCallSite(
+                            call_site_type=WhereFilterCallSiteType.MEASURE_INPUT,
+                            element_name=metric.name,
+                            input_name=measure.name,
+                        ),
+                        measure.filter,
+                    )
+                )
+            numerator = metric.type_params.numerator
+            if numerator is not None and numerator.filter is not None:
+                call_sites.append(
+                    (
+                        WhereFilterCallSite(
+                            call_site_type=WhereFilterCallSiteType.NUMERATOR,
+                            element_name=metric.name,
+                            input_name=numerator.name,
+                        ),
+                        numerator.filter,
+                    )
+                )
+            denominator = metric.type_params.denominator
+            if denominator is not None and denominator.filter is not None:
+                call_sites.append(
+                    (
+                        WhereFilterCallSite(
+                            call_site_type=WhereFilterCallSiteType.DENOMINATOR,
+                            element_name=metric.name,
+                            input_name=denominator.name,
+                        ),
+                        denominator.filter,
+                    )
+                )
+            for input_index, input_metric in enumerate(metric.type_params.metrics or ()):
+                if input_metric.filter is not None:
+                    call_sites.append(
+                        (
+                            WhereFilterCallSite(
+                                call_site_type=WhereFilterCallSiteType.INPUT_METRIC,
+                                element_name=metric.name,
+                                input_name=input_metric.name,
+                                input_index=input_index,
+                            ),
+                            input_metric.filter,
+                        )
+                    )
+
+        for saved_query in semantic_manifest.saved_queries:
+            if saved_query.query_params.where is not None:
+                call_sites.append(
+                    (
+                        WhereFilterCallSite(
+                            call_site_type=WhereFilterCallSiteType.SAVED_QUERY, element_name=saved_query.name
+                        ),
+                        saved_query.query_params.where,
+                    )
+                )
+
+        return call_sites
+
+    def parse_where_sql_templates(self, where_sql_templates: Iterable[str]) -> Dict[str, WhereFilterParseResult]:
+        """Parse each distinct template, and return a mapping from the template to the result."""
+        distinct_where_sql_templates = list(dict.fromkeys(where_sql_templates))
+        if self._executor is None:
+            parse_results = [
+                _parse_where_sql_template(where_sql_template, self._custom_granularity_names)
+                for where_sql_template in distinct_where_sql_templates
+            ]
+        else:
+            parse_results = list(
+                self._executor.map(
+                    _parse_where_sql_template,
+                    distinct_where_sql_templates,
+                    repeat(self._custom_granularity_names),
+                    chunksize=WhereFilterBatchParser._EXECUTOR_CHUNK_SIZE,
+                )
+            )
+        return dict(zip(distinct_where_sql_templates, parse_results))
+
+    def parse_call_sites(
+        self, call_sites: Sequence[Tuple[WhereFilterCallSite, WhereFilterIntersection]]
+    ) -> Dict[WhereFilterCallSite, WhereFilterCallSiteParseResult]:
+        """Parse the filters at the given call sites, and return a mapping from the call site to the results."""
+        where_sql_template_to_parse_result = self.parse_where_sql_templates(
+            where_filter.where_sql_template
+            for _, where_filter_intersection in call_sites
+            for where_filter in where_filter_intersection.where_filters
+        )
+        return {
+            call_site: WhereFilterCallSiteParseResult(
+                call_site=call_site,
+                where_filter_results=tuple(
+                    where_sql_template_to_parse_result[where_filter.where_sql_template]
+                    for where_filter in where_filter_intersection.where_filters
+                ),
+            )
+            for call_site, where_filter_intersection in call_sites
+        }
+
+    def parse_semantic_manifest(
+        self, semantic_manifest: SemanticManifest
+    ) -> Dict[WhereFilterCallSite, WhereFilterCallSiteParseResult]:
+        """Parse all where filters in the semantic manifest. See `collect_call_sites`.
+
+        Call sites are identified by the names of the metrics and saved queries, so these should be unique.
+        """
+        return self.parse_call_sites(WhereFilterBatchParser.collect_call_sites(semantic_manifest))
@@ -5,10 +5,11 @@ import textwrap
 from collections.abc import Mapping
 from dataclasses import fields, is_dataclass
 
-from dbt_semantic_interfaces.implementations.base import HashableBaseModel
-
 
 def is_hashable_base_model(obj):  # type:ignore # noqa: D
+    # Imported here so that importing this module doesn't import Pydantic.
+    from dbt_semantic_interfaces.implementations.base import HashableBaseModel
+
     return isinstance(obj, HashableBaseModel)
 
 
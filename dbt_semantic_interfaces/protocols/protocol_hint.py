@@ -15,6 +15,9 @@ class ProtocolHint(Generic[T], ABC):
     This is a temporary solution for inspection as Protocol enhancements are not yet fully there in the IDE.
     """
 
+    # Empty slots so that implementations using `__slots__` don't get a per-instance `__dict__` from this class.
+    __slots__ = ()
+
     @abstractmethod
     def _implements_protocol(self) -> T:
         """Helps show IDE inspections / hints for whether the given class properly implements a protocol.
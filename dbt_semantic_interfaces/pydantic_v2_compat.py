@@ -0,0 +1,325 @@
+"""Native Pydantic 2 backend for the objects exported by `dsi_pydantic_shim`.
+
+By default, `dsi_pydantic_shim` exports objects from `pydantic.v1` when Pydantic 2 is installed. Setting the
+`DSI_PYDANTIC_BACKEND=v2` environment variable instead makes the shim export the objects in this module, which back the
+implementation classes with native Pydantic 2 models (validated by `pydantic-core`) while keeping the Pydantic 1
+surface that is used throughout DSI and by dependent projects:
+
+* `parse_obj()`, `parse_raw()`, `json()`, `dict()`, `copy()` and `construct()` behave like their Pydantic 1
+  counterparts, and `json()` produces the same output.
+* `class Config` options, `validator()`, `root_validator()`, and `__get_validators__` custom input parsing are
+  translated to their Pydantic 2 equivalents.
+* As in Pydantic 1, `Optional` fields without a default value default to `None`, and equality compares field values.
+
+Only the subset of Pydantic 1 features used by DSI is supported. This module must only be imported when Pydantic 2 is
+installed, so it is excluded from type checking (which runs against Pydantic 1).
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import sys
+import typing
+import warnings
+from contextvars import ContextVar
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel as _PydanticV2BaseModel
+from pydantic import ConfigDict, Field, PrivateAttr
+from pydantic import create_model as _pydantic_v2_create_model
+from pydantic import field_validator, model_serializer, model_validator
+from pydantic._internal._model_construction import ModelMetaclass
+from pydantic.fields import FieldInfo
+from pydantic.warnings import GenericBeforeBaseModelWarning
+from pydantic_core import PydanticUndefined, core_schema
+
+__all__ = ["BaseModel", "Extra", "Field", "PrivateAttr", "create_model", "root_validator", "validator"]
+
+ModelT = TypeVar("ModelT", bound="BaseModel")
+
+# The class whose `__get_validators__` validators are running in the current context.
+_CLASS_RUNNING_CUSTOM_VALIDATORS: ContextVar[Optional[type]] = ContextVar(
+    "_CLASS_RUNNING_CUSTOM_VALIDATORS", default=None
+)
+
+# Marks the fields of a validator created with `always=True`, so that the metaclass can enable default validation.
+_ALWAYS_VALIDATE_FIELDS_ATTRIBUTE = "__dsi_always_validate_fields__"
+
+# Class attribute with the names of fields that are left out of the serialized model when they are `None`. Pydantic 1
+# models implement this by overriding `dict()` and `json()`, but Pydantic 2 doesn't use those for nested models.
+_EXCLUDED_IF_NONE_FIELDS_ATTRIBUTE = "__EXCLUDED_IF_NONE_FIELDS__"
+
+
+class Extra(str, Enum):
+    """Equivalent of the Pydantic 1 `Extra` enum used in `class Config`."""
+
+    allow = "allow"
+    ignore = "ignore"
+    forbid = "forbid"
+
+
+# Pydantic 1 `class Config` options used in DSI, mapped to a function that returns the Pydantic 2 config items.
+_CONFIG_OPTION_CONVERTERS: Dict[str, Callable[[Any], Dict[str, Any]]] = {
+    "allow_mutation": lambda value: {"frozen": not value},
+    "allow_population_by_field_name": lambda value: {"populate_by_name": value},
+    "arbitrary_types_allowed": lambda value: {"arbitrary_types_allowed": value},
+    "extra": lambda value: {"extra": value.value if isinstance(value, Enum) else value},
+    "validate_assignment": lambda value: {"validate_assignment": value},
+}
+
+
+def _convert_v1_config(config_class: type) -> ConfigDict:
+    model_config = ConfigDict()
+    for option_name, value in vars(config_class).items():
+        if option_name.startswith("__"):
+            continue
+        converter = _CONFIG_OPTION_CONVERTERS.get(option_name)
+        if converter is None:
+            raise ValueError(f"Config option {option_name!r} is not supported by the native Pydantic 2 backend")
+        model_config.update(converter(value))  # type: ignore[typeddict-item]
+    return model_config
+
+
+def _is_optional_annotation(annotation: Any, namespace: Dict[str, Any]) -> bool:
+    """Returns true if the annotation is `Optional[...]`, `Union[..., None]`, or `Any`."""
+    if isinstance(annotation, str):
+        module = sys.modules.get(namespace.get("__module__", ""))
+        try:
+            annotation = eval(annotation, dict(vars(module)) if module else {}, dict(namespace))
+        except Exception:
+            # Names that can't be resolved yet (e.g. forward references) - fall back to the annotation string.
+            return annotation.startswith(("Optional[", "typing.Optional[")) or annotation == "Any"
+    if annotation is Any:
+        return True
+    return typing.get_origin(annotation) is Union and type(None) in typing.get_args(annotation)
+
+
+def _serializer_excluding_none_fields(field_names: Tuple[str, ...]) -> Any:
+    def _serialize_excluding_none_fields(self: Any, handler: Any) -> Any:
+        serialized = handler(self)
+        if isinstance(serialized, dict):
+            for field_name in field_names:
+                if getattr(self, field_name) is None:
+                    serialized.pop(field_name, None)
+        return serialized
+
+    return model_serializer(mode="wrap")(_serialize_excluding_none_fields)
+
+
+class _PydanticV1CompatibleMetaclass(ModelMetaclass):
+    """Translates the Pydantic 1 style class definitions used in DSI before Pydantic 2 builds the model."""
+
+    def __new__(  # noqa: D
+        mcs, cls_name: str, bases: Tuple[type, ...], namespace: Dict[str, Any], **kwargs: Any
+    ) -> type:
+        config_class = namespace.pop("Config", None)
+        if config_class is not None:
+            namespace["model_config"] = _convert_v1_config(config_class)
+
+        annotations: Dict[str, Any] = namespace.get("__annotations__", {})
+        always_validate_fields: Set[str] = set()
+        for value in namespace.values():
+            wrapped = getattr(getattr(value, "wrapped", None), "__func__", None)
+            always_validate_fields.update(getattr(wrapped, _ALWAYS_VALIDATE_FIELDS_ATTRIBUTE, ()))
+
+        for field_name, annotation in annotations.items():
+            if isinstance(annotation, str) and annotation.startswith(("ClassVar", "typing.ClassVar")):
+                continue
+            default = namespace.get(field_name, PydanticUndefined)
+            if isinstance(default, FieldInfo):
+                if default.default is PydanticUndefined and default.default_factory is None:
+                    if _is_optional_annotation(annotation, namespace):
+                        default.default = None
+                if field_name in always_validate_fields:
+                    default.validate_default = True
+            elif default is PydanticUndefined:
+                # In Pydantic 1, `Optional` fields without a default are not required.
+                if _is_optional_annotation(annotation, namespace):
+                    namespace[field_name] = Field(
+                        default=None, validate_default=True if field_name in always_validate_fields else None
+                    )
+            elif field_name in always_validate_fields:
+                namespace[field_name] = Field(default=default, validate_default=True)
+
+        excluded_if_none_field_names = namespace.get(_EXCLUDED_IF_NONE_FIELDS_ATTRIBUTE)
+        if excluded_if_none_field_names:
+            namespace["_serialize_excluding_none_fields"] = _serializer_excluding_none_fields(
+                tuple(excluded_if_none_field_names)
+            )
+
+        with warnings.catch_warnings():
+            # Classes like `PydanticCustomInputParser` are generic, but they are not generic Pydantic models.
+            warnings.simplefilter("ignore", GenericBeforeBaseModelWarning)
+            return super().__new__(mcs, cls_name, bases, namespace, **kwargs)
+
+
+class BaseModel(_PydanticV2BaseModel, metaclass=_PydanticV1CompatibleMetaclass):
+    """Native Pydantic 2 model with the Pydantic 1 API used in DSI."""
+
+    model_config = ConfigDict(
+        # Pydantic 1 coerces numbers to strings, e.g. for names that look like numbers in YAML.
+        coerce_numbers_to_str=True,
+        # Pydantic 1 accepts instances of other models for a model-typed field, if the fields match.
+        from_attributes=True,
+        # Match the Pydantic 1 JSON encoding of these types.
+        ser_json_timedelta="float",
+        ser_json_inf_nan="constants",
+        # Avoid warnings for fields like `model_name`.
+        protected_namespaces=(),
+    )
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Type[Any], handler: Any) -> core_schema.CoreSchema:
+        """Support Pydantic 1 style custom input parsing via `__get_validators__`."""
+        schema = handler(source)
+        get_validators = getattr(cls, "__get_validators__", None)
+        if get_validators is None:
+            return schema
+
+        validators = tuple(get_validators())
+
+        def _run_validators(value: Any) -> Any:
+            # The validators usually create the instance with `cls(...)`, which runs this schema again. In Pydantic 1,
+            # these validators don't run on initialization, so they are skipped for those nested calls.
+            if _CLASS_RUNNING_CUSTOM_VALIDATORS.get() is cls:
+                return value
+            token = _CLASS_RUNNING_CUSTOM_VALIDATORS.set(cls)
+            try:
+                for validator_function in validators:
+                    value = validator_function(value)
+            finally:
+                _CLASS_RUNNING_CUSTOM_VALIDATORS.reset(token)
+            return value
+
+        return core_schema.no_info_before_validator_function(_run_validators, schema)
+
+    def __eq__(self, other: Any) -> bool:
+        """Pydantic 1 compares models by their field values, regardless of the type."""
+        if isinstance(other, _PydanticV2BaseModel):
+            return self.dict() == other.model_dump()
+        return self.dict() == other
+
+    @classmethod
+    def parse_obj(cls: Type[ModelT], obj: Any) -> ModelT:  # noqa: D
+        return cls.model_validate(obj)
+
+    @classmethod
+    def parse_raw(cls: Type[ModelT], b: Union[str, bytes], **kwargs: Any) -> ModelT:  # noqa: D
+        # Goes through `parse_obj` as some implementations override it to pre-process the input.
+        return cls.parse_obj(json.loads(b))
+
+    @classmethod
+    def construct(cls: Type[ModelT], _fields_set: Optional[Set[str]] = None, **values: Any) -> ModelT:  # noqa: D
+        return cls.model_construct(_fields_set=_fields_set, **values)
+
+    def dict(  # noqa: D
+        self,
+        *,
+        include: Any = None,
+        exclude: Any = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+    ) -> Dict[str, Any]:
+        return self.model_dump(
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+        )
+
+    def json(  # noqa: D
+        self,
+        *,
+        include: Any = None,
+        exclude: Any = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        **dumps_kwargs: Any,
+    ) -> str:
+        # `model_dump_json()` uses a compact format, so `json.dumps()` is used to produce the same output as Pydantic 1.
+        return json.dumps(
+            self.model_dump(
+                mode="json",
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+            ),
+            **dumps_kwargs,
+        )
+
+    def copy(self: ModelT, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> ModelT:  # noqa: D
+        return self.model_copy(update=update, deep=deep)
+
+
+def validator(*fields: str, pre: bool = False, always: bool = False) -> Callable[[Any], Any]:
+    """Equivalent of the Pydantic 1 `validator` decorator.
+
+    The decorated method can take either `(cls, value)` or `(cls, value, values)`, where `values` has the previously
+    validated fields.
+    """
+
+    def decorator(function: Any) -> Any:
+        function = function.__func__ if isinstance(function, classmethod) else function
+        takes_values = len(inspect.signature(function).parameters) > 2
+
+        def _validate(cls: Type[Any], value: Any, info: Any) -> Any:
+            if takes_values:
+                return function(cls, value, info.data)
+            return function(cls, value)
+
+        _validate.__name__ = function.__name__
+        _validate.__qualname__ = function.__qualname__
+        if always:
+            setattr(_validate, _ALWAYS_VALIDATE_FIELDS_ATTRIBUTE, fields)
+        return field_validator(*fields, mode="before" if pre else "after")(classmethod(_validate))
+
+    return decorator
+
+
+def root_validator(*, pre: bool = False) -> Callable[[Any], Any]:
+    """Equivalent of the Pydantic 1 `root_validator` decorator.
+
+    The decorated method takes `(cls, values)`, where `values` is a dict of the input values (`pre=True`), or of the
+    validated field values, and returns the updated values.
+    """
+
+    def decorator(function: Any) -> Any:
+        function = function.__func__ if isinstance(function, classmethod) else function
+
+        if pre:
+
+            def _validate_before(cls: Type[Any], values: Any) -> Any:
+                # As in Pydantic 1, this runs for dict inputs only, and the caller's dict isn't modified.
+                if not isinstance(values, dict):
+                    return values
+                return function(cls, dict(values))
+
+            _validate_before.__name__ = function.__name__
+            return model_validator(mode="before")(classmethod(_validate_before))
+
+        def _validate_after(self: BaseModel) -> BaseModel:
+            values = function(type(self), dict(self.__dict__))
+            for field_name, value in values.items():
+                object.__setattr__(self, field_name, value)
+            return self
+
+        _validate_after.__name__ = function.__name__
+        return model_validator(mode="after")(_validate_after)
+
+    return decorator
+
+
+def create_model(__model_name: str, *, __base__: Optional[Type[Any]] = None, **field_definitions: Any) -> Type[Any]:
+    """Equivalent of the Pydantic 1 `create_model`, using the compatible `BaseModel` as the default base."""
+    return _pydantic_v2_create_model(__model_name, __base__=__base__ or BaseModel, **field_definitions)
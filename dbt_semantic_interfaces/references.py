@@ -118,3 +118,22 @@ class MetricModelReference(ModelReference):
     """A reference to a metric definition in the model."""
 
     metric_name: str
+
+
+@dataclass(frozen=True, order=True)
+class SavedQueryReference(ModelReference):
+    """A reference to a saved query definition in the model."""
+
+    saved_query_name: str
+
+
+@dataclass(frozen=True, order=True)
+class ExportReference(ModelReference):
+    """A reference to an export of a saved query."""
+
+    saved_query_name: str
+    export_name: str
+
+    @property
+    def saved_query_reference(self) -> SavedQueryReference:  # noqa: D
+        return SavedQueryReference(saved_query_name=self.saved_query_name)
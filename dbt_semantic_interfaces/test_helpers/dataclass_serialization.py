@@ -4,6 +4,7 @@ from dbt_semantic_interfaces.dataclass_serialization import (
     DataClassDeserializer,
     DataclassSerializer,
     SerializableDataclass,
+    SerializedSequenceFormat,
 )
 
 
@@ -36,3 +37,19 @@ def assert_serializable(instances: Sequence[SerializableDataclass]) -> None:
             raise AssertionError(f"Error serializing {instance=}") from e
 
         assert instance == deserialized_instance
+
+
+def assert_serializable_as_sequence(instances: Sequence[SerializableDataclass]) -> None:
+    """Verify that the given instances can be serialized together in each of the sequence formats."""
+    serializer = DataclassSerializer()
+    deserializer = DataClassDeserializer()
+    instance_types = [type(instance) for instance in instances]
+
+    for sequence_format in SerializedSequenceFormat:
+        try:
+            serialized_output = serializer.serialize_many(instances, sequence_format)
+            deserialized_instances = deserializer.deserialize_many(instance_types, serialized_output, sequence_format)
+        except Exception as e:
+            raise AssertionError(f"Error serializing instances as {sequence_format}") from e
+
+        assert tuple(instances) == deserialized_instances
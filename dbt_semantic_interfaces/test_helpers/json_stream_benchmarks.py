@@ -0,0 +1,179 @@
+"""A benchmark for the peak memory of reading and writing the JSON of a semantic manifest one object at a time.
+
+The manifest is generated with `SyntheticManifestGenerator`. Reading it with `read_semantic_manifest_json` is compared
+with `PydanticSemanticManifest.parse_raw`, and writing it with `write_semantic_manifest_json` is compared with writing
+the output of `.json()`. The peak memory is traced with `tracemalloc`, and the times are measured without tracing.
+
+Run with e.g.:
+
+    python -m dbt_semantic_interfaces.test_helpers.json_stream_benchmarks --object-count 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.manifest_json_stream import (
+    read_semantic_manifest_json,
+    write_semantic_manifest_json,
+)
+from dbt_semantic_interfaces.test_helpers.synthetic_manifest import (
+    SyntheticManifestConfig,
+    SyntheticManifestGenerator,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JsonStreamBenchmarkResult:
+    """The peak memory and the times to read and write the JSON of a semantic manifest.
+
+    The peak memory is relative to before reading or writing, so for reading, it includes the manifest that was read.
+    The times are the minimum over the rounds of the benchmark.
+
+    Attributes:
+        object_count: The number of objects in the manifest. See `SyntheticManifestConfig.object_count`.
+        json_bytes: The size of the JSON file.
+        manifest_bytes: The memory retained by the manifest after reading it.
+        parse_raw_peak_bytes: The peak memory of reading the file and parsing it with `parse_raw`.
+        stream_read_peak_bytes: The peak memory of reading the file with `read_semantic_manifest_json`.
+        json_peak_bytes: The peak memory of writing the output of `.json()` to the file.
+        stream_write_peak_bytes: The peak memory of writing the file with `write_semantic_manifest_json`.
+        parse_raw_seconds: The time to read the file and parse it with `parse_raw`.
+        stream_read_seconds: The time to read the file with `read_semantic_manifest_json`.
+        json_seconds: The time to write the output of `.json()` to the file.
+        stream_write_seconds: The time to write the file with `write_semantic_manifest_json`.
+    """
+
+    object_count: int
+    json_bytes: int
+    manifest_bytes: int
+    parse_raw_peak_bytes: int
+    stream_read_peak_bytes: int
+    json_peak_bytes: int
+    stream_write_peak_bytes: int
+    parse_raw_seconds: float
+    stream_read_seconds: float
+    json_seconds: float
+    stream_write_seconds: float
+
+    def format(self) -> str:  # noqa: D
+        return "\n".join(
+            (
+                f"Manifest with {self.object_count} objects: JSON {self.json_bytes} bytes, "
+                f"{self.manifest_bytes} bytes retained after reading",
+                f"Reading: parse_raw {self.parse_raw_peak_bytes} bytes peak in {self.parse_raw_seconds:.3f}s, "
+                f"streaming {self.stream_read_peak_bytes} bytes peak in {self.stream_read_seconds:.3f}s",
+                f"Writing: .json() {self.json_peak_bytes} bytes peak in {self.json_seconds:.3f}s, "
+                f"streaming {self.stream_write_peak_bytes} bytes peak in {self.stream_write_seconds:.3f}s",
+            )
+        )
+
+
+def _traced_memory(function: Callable[[], object]) -> Tuple[int, int]:
+    """Returns the memory retained by the result of the function, and the peak memory while it ran."""
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if was_tracing:
+        # Also resets the peak.
+        tracemalloc.clear_traces()
+    else:
+        tracemalloc.start()
+    try:
+        baseline_bytes, _ = tracemalloc.get_traced_memory()
+        result = function()
+        gc.collect()
+        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        del result
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return current_bytes - baseline_bytes, peak_bytes - baseline_bytes
+
+
+def _minimum_seconds(function: Callable[[], object], rounds: int) -> float:
+    seconds = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def benchmark_json_streaming(object_count: int, seed: int = 0, rounds: int = 3) -> JsonStreamBenchmarkResult:
+    """Reads and writes the JSON of a synthetic manifest with and without streaming, and returns the peak memory."""
+    generator = SyntheticManifestGenerator(SyntheticManifestConfig.with_object_count(object_count, seed))
+    semantic_manifest = generator.semantic_manifest(apply_transformations=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "semantic_manifest.json")
+        output_path = os.path.join(directory, "output.json")
+
+        def _parse_raw() -> PydanticSemanticManifest:
+            with open(json_path) as f:
+                return PydanticSemanticManifest.parse_raw(f.read())
+
+        def _stream_read() -> PydanticSemanticManifest:
+            with open(json_path) as f:
+                return read_semantic_manifest_json(f)
+
+        def _write_json() -> None:
+            with open(output_path, "w") as f:
+                f.write(semantic_manifest.json())
+
+        def _stream_write() -> None:
+            with open(output_path, "w") as f:
+                write_semantic_manifest_json(semantic_manifest, f)
+
+        with open(json_path, "w") as f:
+            write_semantic_manifest_json(semantic_manifest, f)
+        assert _stream_read() == semantic_manifest
+
+        manifest_bytes, parse_raw_peak_bytes = _traced_memory(_parse_raw)
+        _, stream_read_peak_bytes = _traced_memory(_stream_read)
+        _, json_peak_bytes = _traced_memory(_write_json)
+        _, stream_write_peak_bytes = _traced_memory(_stream_write)
+        result = JsonStreamBenchmarkResult(
+            object_count=generator.config.object_count,
+            json_bytes=os.path.getsize(json_path),
+            manifest_bytes=manifest_bytes,
+            parse_raw_peak_bytes=parse_raw_peak_bytes,
+            stream_read_peak_bytes=stream_read_peak_bytes,
+            json_peak_bytes=json_peak_bytes,
+            stream_write_peak_bytes=stream_write_peak_bytes,
+            parse_raw_seconds=_minimum_seconds(_parse_raw, rounds),
+            stream_read_seconds=_minimum_seconds(_stream_read, rounds),
+            json_seconds=_minimum_seconds(_write_json, rounds),
+            stream_write_seconds=_minimum_seconds(_stream_write, rounds),
+        )
+    logger.info(result.format())
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the benchmark and prints the peak memory and the times."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--object-count", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(benchmark_json_streaming(object_count=args.object_count, seed=args.seed, rounds=args.rounds).format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
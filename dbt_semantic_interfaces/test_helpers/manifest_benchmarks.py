@@ -0,0 +1,404 @@
+"""Benchmarks for parsing, transforming, validating and serializing semantic manifests of different sizes.
+
+The manifests are generated with `SyntheticManifestGenerator`, so the benchmarks run offline. Each benchmark is run a
+number of times for each manifest size and the fastest time is recorded. The results can be written as JSON to compare
+them between commits, and the times for different sizes are checked for super-linear scaling.
+
+Run with e.g.:
+
+    python -m dbt_semantic_interfaces.test_helpers.manifest_benchmarks --object-counts 100 1000 10000 50000 \
+        --output results.json --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import math
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.naming.dundered import StructuredDunderedName
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    parse_directory_of_yaml_files_to_semantic_manifest,
+)
+from dbt_semantic_interfaces.parsing.text_input.ti_processor import (
+    ObjectBuilderTextProcessor,
+)
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
+    JinjaObjectParser,
+)
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterBatchParser,
+)
+from dbt_semantic_interfaces.test_helpers.synthetic_manifest import (
+    SyntheticManifestConfig,
+    SyntheticManifestGenerator,
+)
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+from dsi_pydantic_shim import pydantic_backend, pydantic_version
+
+logger = logging.getLogger(__name__)
+
+# The version of the format of the JSON results.
+RESULTS_FORMAT_VERSION = 1
+
+DEFAULT_OBJECT_COUNTS: Sequence[int] = (100, 1000, 10000, 50000)
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """The time that a benchmark took for a manifest with a given number of objects.
+
+    Attributes:
+        name: The name of the benchmark, e.g. `transform` or `validate.DerivedMetricRule`.
+        object_count: The number of objects in the manifest. See `SyntheticManifestConfig.object_count`.
+        seconds: The fastest time over all rounds.
+        rounds: The number of times that the benchmark was run.
+    """
+
+    name: str
+    object_count: int
+    seconds: float
+    rounds: int
+
+
+@dataclass(frozen=True)
+class ScalingIssue:
+    """A benchmark whose time grew faster than the number of objects between two manifest sizes.
+
+    Attributes:
+        name: The name of the benchmark.
+        smaller_object_count: The number of objects in the smaller manifest.
+        larger_object_count: The number of objects in the larger manifest.
+        exponent: `k` in `time ~ object_count ** k` between the two sizes. Linear scaling is 1.
+    """
+
+    name: str
+    smaller_object_count: int
+    larger_object_count: int
+    exponent: float
+
+    @property
+    def description(self) -> str:  # noqa: D
+        return (
+            f"{self.name}: time grows as O(n^{self.exponent:.2f}) from {self.smaller_object_count} to "
+            f"{self.larger_object_count} objects"
+        )
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A benchmark that is slower than in the baseline results.
+
+    Attributes:
+        name: The name of the benchmark.
+        object_count: The number of objects in the manifest.
+        baseline_seconds: The time in the baseline results.
+        seconds: The time in the current results.
+    """
+
+    name: str
+    object_count: int
+    baseline_seconds: float
+    seconds: float
+
+    @property
+    def description(self) -> str:  # noqa: D
+        return (
+            f"{self.name} ({self.object_count} objects): {self.baseline_seconds:.4f}s -> {self.seconds:.4f}s "
+            f"({self.seconds / self.baseline_seconds:.2f}x)"
+        )
+
+
+def clear_process_wide_caches() -> None:
+    """Clears the caches that are shared between calls, so that the benchmarks measure the uncached times."""
+    JinjaObjectParser._call_parameter_sets_cache.clear()
+    ObjectBuilderTextProcessor._compiled_template_cache.clear()
+    StructuredDunderedName._parse_name_cache.clear()
+
+
+def time_function(function: Callable[[], object], rounds: int, setup: Optional[Callable[[], None]] = None) -> float:
+    """Returns the fastest time of calling the function `rounds` times, calling `setup` (untimed) before each call."""
+    fastest_seconds = math.inf
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start_time = time.perf_counter()
+        function()
+        fastest_seconds = min(fastest_seconds, time.perf_counter() - start_time)
+    return fastest_seconds
+
+
+def run_manifest_benchmarks(
+    object_counts: Sequence[int] = DEFAULT_OBJECT_COUNTS, rounds: int = 3, seed: int = 0
+) -> List[BenchmarkResult]:
+    """Runs the benchmarks for a synthetic manifest of each size.
+
+    The benchmarks are:
+    * `parse_directory_of_yaml_files_to_semantic_manifest`: parsing the YAML files, including the transformations.
+    * `transform`: `PydanticSemanticManifestTransformer.transform` on the untransformed manifest.
+    * `validate.<rule>`: each rule in `SemanticManifestValidator.DEFAULT_RULES` on the transformed manifest.
+    * `json` / `parse_raw`: serializing the transformed manifest to JSON and parsing it back.
+    * `where_filter_parsing`: parsing all where filters in the manifest with `WhereFilterBatchParser`.
+    """
+    results: List[BenchmarkResult] = []
+
+    def _record(name: str, object_count: int, seconds: float) -> None:
+        results.append(BenchmarkResult(name=name, object_count=object_count, seconds=seconds, rounds=rounds))
+        logger.info(f"{name} ({object_count} objects): {seconds:.4f}s")
+
+    for requested_object_count in object_counts:
+        generator = SyntheticManifestGenerator(SyntheticManifestConfig.with_object_count(requested_object_count, seed))
+        object_count = generator.config.object_count
+
+        with tempfile.TemporaryDirectory() as directory:
+            generator.write_yaml_directory(directory)
+            _record(
+                "parse_directory_of_yaml_files_to_semantic_manifest",
+                object_count,
+                time_function(
+                    lambda: parse_directory_of_yaml_files_to_semantic_manifest(directory),
+                    rounds,
+                    setup=clear_process_wide_caches,
+                ),
+            )
+
+        untransformed_manifest = generator.semantic_manifest(apply_transformations=False)
+        _record(
+            "transform",
+            object_count,
+            time_function(
+                lambda: PydanticSemanticManifestTransformer.transform(untransformed_manifest),
+                rounds,
+                setup=clear_process_wide_caches,
+            ),
+        )
+
+        semantic_manifest = PydanticSemanticManifestTransformer.transform(untransformed_manifest)
+        for rule in SemanticManifestValidator[PydanticSemanticManifest]().DEFAULT_RULES:
+            _record(
+                f"validate.{type(rule).__name__}",
+                object_count,
+                time_function(
+                    lambda: rule.validate_manifest(semantic_manifest),  # noqa: B023
+                    rounds,
+                    setup=clear_process_wide_caches,
+                ),
+            )
+
+        serialized_manifest = semantic_manifest.json()
+        _record("json", object_count, time_function(semantic_manifest.json, rounds))
+        _record(
+            "parse_raw",
+            object_count,
+            time_function(lambda: PydanticSemanticManifest.parse_raw(serialized_manifest), rounds),
+        )
+
+        where_filter_parser = WhereFilterBatchParser(
+            custom_granularity_names=[
+                custom_granularity.name
+                for time_spine in semantic_manifest.project_configuration.time_spines
+                for custom_granularity in time_spine.custom_granularities
+            ]
+        )
+        _record(
+            "where_filter_parsing",
+            object_count,
+            time_function(
+                lambda: where_filter_parser.parse_call_sites(
+                    WhereFilterBatchParser.collect_call_sites(semantic_manifest)
+                ),
+                rounds,
+                setup=clear_process_wide_caches,
+            ),
+        )
+
+    return results
+
+
+def find_scaling_issues(
+    results: Sequence[BenchmarkResult], max_exponent: float = 1.3, min_seconds: float = 0.05
+) -> List[ScalingIssue]:
+    """Returns the benchmarks whose time grows super-linearly between consecutive manifest sizes.
+
+    Args:
+        results: The results of the benchmarks.
+        max_exponent: The largest allowed `k` in `time ~ object_count ** k`. This is above 1 to allow for noise.
+        min_seconds: Times in the larger manifest below this are ignored, as they're dominated by noise.
+    """
+    results_by_name: Dict[str, List[BenchmarkResult]] = {}
+    for result in results:
+        results_by_name.setdefault(result.name, []).append(result)
+
+    issues: List[ScalingIssue] = []
+    for name, name_results in results_by_name.items():
+        name_results = sorted(name_results, key=lambda result: result.object_count)
+        for smaller, larger in zip(name_results, name_results[1:]):
+            if larger.seconds < min_seconds or smaller.seconds <= 0 or larger.object_count <= smaller.object_count:
+                continue
+            exponent = math.log(larger.seconds / smaller.seconds) / math.log(larger.object_count / smaller.object_count)
+            if exponent > max_exponent:
+                issues.append(
+                    ScalingIssue(
+                        name=name,
+                        smaller_object_count=smaller.object_count,
+                        larger_object_count=larger.object_count,
+                        exponent=exponent,
+                    )
+                )
+    return issues
+
+
+def find_regressions(
+    baseline_results: Sequence[BenchmarkResult],
+    results: Sequence[BenchmarkResult],
+    max_slowdown: float = 1.25,
+    min_seconds: float = 0.05,
+) -> List[Regression]:
+    """Returns the benchmarks that are more than `max_slowdown` times slower than in the baseline.
+
+    Benchmarks that aren't in both sets of results, or that take less than `min_seconds`, are ignored.
+    """
+    baseline_seconds: Dict[Tuple[str, int], float] = {
+        (result.name, result.object_count): result.seconds for result in baseline_results
+    }
+    regressions: List[Regression] = []
+    for result in results:
+        previous_seconds = baseline_seconds.get((result.name, result.object_count))
+        if previous_seconds is None or result.seconds < min_seconds or previous_seconds <= 0:
+            continue
+        if result.seconds > previous_seconds * max_slowdown:
+            regressions.append(
+                Regression(
+                    name=result.name,
+                    object_count=result.object_count,
+                    baseline_seconds=previous_seconds,
+                    seconds=result.seconds,
+                )
+            )
+    return regressions
+
+
+def results_to_json(results: Sequence[BenchmarkResult]) -> str:
+    """Serializes the results, along with the environment that they were measured in."""
+    return json.dumps(
+        {
+            "version": RESULTS_FORMAT_VERSION,
+            "environment": {
+                "python_version": platform.python_version(),
+                "pydantic_version": pydantic_version,
+                "pydantic_backend": pydantic_backend,
+            },
+            "results": [
+                {
+                    "name": result.name,
+                    "object_count": result.object_count,
+                    "seconds": result.seconds,
+                    "rounds": result.rounds,
+                }
+                for result in results
+            ],
+        },
+        indent=2,
+    )
+
+
+def results_from_json(serialized_results: str) -> List[BenchmarkResult]:
+    """Deserializes results from `results_to_json`."""
+    results_dict = json.loads(serialized_results)
+    version = results_dict.get("version")
+    if version != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Unsupported benchmark results version {version}. Expected {RESULTS_FORMAT_VERSION}.")
+    return [
+        BenchmarkResult(
+            name=result["name"],
+            object_count=result["object_count"],
+            seconds=result["seconds"],
+            rounds=result["rounds"],
+        )
+        for result in results_dict["results"]
+    ]
+
+
+def run_and_report_manifest_benchmarks(
+    object_counts: Sequence[int] = DEFAULT_OBJECT_COUNTS,
+    rounds: int = 3,
+    seed: int = 0,
+    output_path: Optional[str] = None,
+    baseline_path: Optional[str] = None,
+    max_exponent: float = 1.3,
+    max_slowdown: float = 1.25,
+) -> int:
+    """Runs the benchmarks and prints the results, and any scaling issues or regressions to stderr.
+
+    Args:
+        object_counts: The sizes of the synthetic manifests to benchmark.
+        rounds: The number of times to run each benchmark.
+        seed: The seed for generating the synthetic manifests.
+        output_path: If set, the file to write the results to as JSON.
+        baseline_path: If set, the JSON results of a previous run to compare against.
+        max_exponent: See `find_scaling_issues`.
+        max_slowdown: See `find_regressions`.
+
+    Returns:
+        1 if there are scaling issues or regressions, 0 otherwise.
+    """
+    results = run_manifest_benchmarks(object_counts=object_counts, rounds=rounds, seed=seed)
+    for result in results:
+        print(f"{result.name:<70} {result.object_count:>8} objects {result.seconds:>10.4f}s")
+    if output_path is not None:
+        with open(output_path, "w") as f:
+            f.write(results_to_json(results))
+
+    problems = [issue.description for issue in find_scaling_issues(results, max_exponent=max_exponent)]
+    if baseline_path is not None:
+        with open(baseline_path) as f:
+            baseline_results = results_from_json(f.read())
+        problems += [
+            regression.description
+            for regression in find_regressions(baseline_results, results, max_slowdown=max_slowdown)
+        ]
+    for problem in problems:
+        print(f"WARNING: {problem}", file=sys.stderr)
+    return 1 if problems else 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the benchmarks and returns 1 if there are scaling issues or regressions."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--object-counts", type=int, nargs="+", default=list(DEFAULT_OBJECT_COUNTS))
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="The file to write the results to as JSON.")
+    parser.add_argument("--baseline", help="The JSON results of a previous run to compare against.")
+    parser.add_argument("--max-exponent", type=float, default=1.3)
+    parser.add_argument("--max-slowdown", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    return run_and_report_manifest_benchmarks(
+        object_counts=args.object_counts,
+        rounds=args.rounds,
+        seed=args.seed,
+        output_path=args.output,
+        baseline_path=args.baseline,
+        max_exponent=args.max_exponent,
+        max_slowdown=args.max_slowdown,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
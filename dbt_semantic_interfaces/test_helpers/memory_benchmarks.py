@@ -0,0 +1,172 @@
+"""A benchmark for the memory retained by a semantic manifest after parsing, transforming and validating it.
+
+The manifest is generated with `SyntheticManifestGenerator` and written to a directory of YAML files. The memory
+allocated by each phase is traced with `tracemalloc`, and the manifest is broken down by category with
+`manifest_memory_report`.
+
+Run with e.g.:
+
+    python -m dbt_semantic_interfaces.test_helpers.memory_benchmarks --object-count 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import logging
+import sys
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.memory_report import (
+    ManifestMemoryReport,
+    manifest_memory_report,
+)
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    parse_directory_of_yaml_files_to_semantic_manifest,
+)
+from dbt_semantic_interfaces.parsing.yaml_loader import ParsingContext
+from dbt_semantic_interfaces.test_helpers.manifest_benchmarks import (
+    clear_process_wide_caches,
+)
+from dbt_semantic_interfaces.test_helpers.synthetic_manifest import (
+    SyntheticManifestConfig,
+    SyntheticManifestGenerator,
+)
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+
+logger = logging.getLogger(__name__)
+
+PARSE_PHASE = "parse"
+TRANSFORM_PHASE = "transform"
+VALIDATE_PHASE = "validate"
+
+
+@dataclass(frozen=True)
+class PhaseMemory:
+    """The memory retained after one phase of loading a semantic manifest.
+
+    Attributes:
+        phase: One of `parse`, `transform` or `validate`.
+        object_count: The number of objects in the manifest. See `SyntheticManifestConfig.object_count`.
+        retained_bytes: The traced memory still allocated after the phase, relative to before parsing. This includes
+            the results of earlier phases that are still in use.
+        peak_bytes: The highest traced memory since before parsing, relative to before parsing.
+        live_parsing_contexts: The number of `ParsingContext` objects that haven't been garbage collected.
+        report: The breakdown of the manifest that the phase produced.
+        top_allocations: The source lines that allocated the most retained memory, with their sizes.
+    """
+
+    phase: str
+    object_count: int
+    retained_bytes: int
+    peak_bytes: int
+    live_parsing_contexts: int
+    report: ManifestMemoryReport
+    top_allocations: Tuple[str, ...]
+
+    def format(self) -> str:  # noqa: D
+        lines = [
+            f"After {self.phase} ({self.object_count} objects): {self.retained_bytes} bytes retained, "
+            f"{self.peak_bytes} bytes peak, {self.live_parsing_contexts} live parsing contexts",
+            self.report.format(),
+            "Top allocations:",
+        ]
+        lines.extend(f"  {allocation}" for allocation in self.top_allocations)
+        return "\n".join(lines)
+
+
+def _count_live_parsing_contexts() -> int:
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, ParsingContext))
+
+
+def measure_manifest_memory(
+    object_count: int, seed: int = 0, top_allocation_count: int = 10
+) -> Tuple[PhaseMemory, PhaseMemory, PhaseMemory]:
+    """Parses, transforms and validates a synthetic manifest, and returns the memory retained after each phase.
+
+    The untransformed manifest is released after the transformation, while the validation results are kept, so the
+    numbers are what a caller that keeps the transformed manifest and its validation results would retain.
+    """
+    generator = SyntheticManifestGenerator(SyntheticManifestConfig.with_object_count(object_count, seed))
+    actual_object_count = generator.config.object_count
+    phases: List[PhaseMemory] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        generator.write_yaml_directory(directory)
+        clear_process_wide_caches()
+        gc.collect()
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            baseline_bytes, _ = tracemalloc.get_traced_memory()
+            baseline_snapshot = tracemalloc.take_snapshot()
+
+            def _record(phase: str, semantic_manifest: PydanticSemanticManifest) -> None:
+                gc.collect()
+                current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+                top_statistics = tracemalloc.take_snapshot().compare_to(baseline_snapshot, "lineno")
+                phase_memory = PhaseMemory(
+                    phase=phase,
+                    object_count=actual_object_count,
+                    retained_bytes=current_bytes - baseline_bytes,
+                    peak_bytes=peak_bytes - baseline_bytes,
+                    live_parsing_contexts=_count_live_parsing_contexts(),
+                    report=manifest_memory_report(semantic_manifest),
+                    top_allocations=tuple(str(statistic) for statistic in top_statistics[:top_allocation_count]),
+                )
+                logger.info(phase_memory.format())
+                phases.append(phase_memory)
+
+            parsing_result = parse_directory_of_yaml_files_to_semantic_manifest(directory, apply_transformations=False)
+            untransformed_manifest: Optional[PydanticSemanticManifest] = parsing_result.semantic_manifest
+            del parsing_result
+            assert untransformed_manifest is not None
+            _record(PARSE_PHASE, untransformed_manifest)
+
+            semantic_manifest = PydanticSemanticManifestTransformer.transform(untransformed_manifest)
+            untransformed_manifest = None
+            _record(TRANSFORM_PHASE, semantic_manifest)
+
+            validation_results = SemanticManifestValidator[PydanticSemanticManifest]().validate_semantic_manifest(
+                semantic_manifest
+            )
+            _record(VALIDATE_PHASE, semantic_manifest)
+            del validation_results
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+
+    parse_memory, transform_memory, validate_memory = phases
+    return parse_memory, transform_memory, validate_memory
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the benchmark and prints the memory retained after each phase."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--object-count", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--top-allocations", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    for phase_memory in measure_manifest_memory(
+        object_count=args.object_count, seed=args.seed, top_allocation_count=args.top_allocations
+    ):
+        print(phase_memory.format())
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
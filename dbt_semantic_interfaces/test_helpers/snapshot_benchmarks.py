@@ -0,0 +1,150 @@
+"""A benchmark for loading a semantic manifest from a snapshot, compared with parsing the JSON of the manifest.
+
+The manifest is generated with `SyntheticManifestGenerator`, and saved both as JSON and with `save_snapshot`. Each
+file is then loaded in a new Python process, which is what a service pays on every start, and in this process, where
+the modules are already imported.
+
+Run with e.g.:
+
+    python -m dbt_semantic_interfaces.test_helpers.snapshot_benchmarks --object-count 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.manifest_snapshot import load_snapshot, save_snapshot
+from dbt_semantic_interfaces.test_helpers.synthetic_manifest import (
+    SyntheticManifestConfig,
+    SyntheticManifestGenerator,
+)
+
+logger = logging.getLogger(__name__)
+
+# Loads the file given as the first argument in a new process, and prints the seconds spent on it.
+_SNAPSHOT_LOADING_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from dbt_semantic_interfaces.manifest_snapshot import load_snapshot
+load_snapshot(sys.argv[1])
+print(time.perf_counter() - start)
+"""
+_JSON_LOADING_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from dbt_semantic_interfaces.implementations.semantic_manifest import PydanticSemanticManifest
+with open(sys.argv[1]) as f:
+    PydanticSemanticManifest.parse_raw(f.read())
+print(time.perf_counter() - start)
+"""
+
+
+@dataclass(frozen=True)
+class SnapshotBenchmarkResult:
+    """The times to load a semantic manifest from a snapshot and from JSON.
+
+    The times are the minimum over the rounds of the benchmark.
+
+    Attributes:
+        object_count: The number of objects in the manifest. See `SyntheticManifestConfig.object_count`.
+        snapshot_bytes: The size of the snapshot file.
+        json_bytes: The size of the JSON file.
+        save_seconds: The time to write the snapshot with `save_snapshot`.
+        cold_snapshot_seconds: The time to import the modules and load the snapshot in a new process.
+        cold_json_seconds: The time to import the modules and parse the JSON in a new process.
+        warm_snapshot_seconds: The time to load the snapshot in this process.
+        warm_json_seconds: The time to parse the JSON in this process.
+    """
+
+    object_count: int
+    snapshot_bytes: int
+    json_bytes: int
+    save_seconds: float
+    cold_snapshot_seconds: float
+    cold_json_seconds: float
+    warm_snapshot_seconds: float
+    warm_json_seconds: float
+
+    def format(self) -> str:  # noqa: D
+        return "\n".join(
+            (
+                f"Manifest with {self.object_count} objects: snapshot {self.snapshot_bytes} bytes, "
+                f"JSON {self.json_bytes} bytes, saving the snapshot {self.save_seconds:.3f}s",
+                f"New process: snapshot {self.cold_snapshot_seconds:.3f}s, JSON {self.cold_json_seconds:.3f}s",
+                f"This process: snapshot {self.warm_snapshot_seconds:.3f}s, JSON {self.warm_json_seconds:.3f}s",
+            )
+        )
+
+
+def _minimum_seconds(function: Callable[[], object], rounds: int) -> float:
+    seconds = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start)
+    return min(seconds)
+
+
+def _minimum_seconds_in_new_process(script: str, path: str, rounds: int) -> float:
+    return min(
+        float(subprocess.run([sys.executable, "-c", script, path], check=True, capture_output=True, text=True).stdout)
+        for _ in range(rounds)
+    )
+
+
+def benchmark_snapshot_loading(object_count: int, seed: int = 0, rounds: int = 3) -> SnapshotBenchmarkResult:
+    """Saves a synthetic manifest as a snapshot and as JSON, and returns the times to load each of them."""
+    generator = SyntheticManifestGenerator(SyntheticManifestConfig.with_object_count(object_count, seed))
+    semantic_manifest = generator.semantic_manifest(apply_transformations=True)
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_path = os.path.join(directory, "semantic_manifest.snapshot")
+        json_path = os.path.join(directory, "semantic_manifest.json")
+        with open(json_path, "w") as f:
+            f.write(semantic_manifest.json())
+        save_seconds = _minimum_seconds(lambda: save_snapshot(semantic_manifest, snapshot_path), rounds)
+
+        def _parse_json() -> PydanticSemanticManifest:
+            with open(json_path) as f:
+                return PydanticSemanticManifest.parse_raw(f.read())
+
+        assert load_snapshot(snapshot_path) == semantic_manifest
+        result = SnapshotBenchmarkResult(
+            object_count=generator.config.object_count,
+            snapshot_bytes=os.path.getsize(snapshot_path),
+            json_bytes=os.path.getsize(json_path),
+            save_seconds=save_seconds,
+            cold_snapshot_seconds=_minimum_seconds_in_new_process(_SNAPSHOT_LOADING_SCRIPT, snapshot_path, rounds),
+            cold_json_seconds=_minimum_seconds_in_new_process(_JSON_LOADING_SCRIPT, json_path, rounds),
+            warm_snapshot_seconds=_minimum_seconds(lambda: load_snapshot(snapshot_path), rounds),
+            warm_json_seconds=_minimum_seconds(_parse_json, rounds),
+        )
+    logger.info(result.format())
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the benchmark and prints the times."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--object-count", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    print(benchmark_snapshot_loading(object_count=args.object_count, seed=args.seed, rounds=args.rounds).format())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
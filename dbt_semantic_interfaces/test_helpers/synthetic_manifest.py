@@ -0,0 +1,425 @@
+from __future__ import annotations
+
+import os
+import random
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence
+
+import yaml
+
+from dbt_semantic_interfaces.implementations.metric import PydanticMetric
+from dbt_semantic_interfaces.implementations.project_configuration import (
+    PydanticProjectConfiguration,
+)
+from dbt_semantic_interfaces.implementations.saved_query import PydanticSavedQuery
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.implementations.semantic_model import PydanticSemanticModel
+from dbt_semantic_interfaces.parsing.objects import YamlConfigFile
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+
+# A YAML document, e.g. `{"semantic_model": {"name": ...}}`.
+YamlDocument = Dict[str, Any]
+
+
+@dataclass(frozen=True)
+class SyntheticManifestConfig:
+    """The number of each kind of object in a synthetic semantic manifest.
+
+    Attributes:
+        semantic_model_count: The number of semantic models. Each semantic model has a primary entity.
+        foreign_entities_per_semantic_model: The number of foreign entities in each semantic model. Each one is the
+        primary entity of another semantic model, so they can be joined.
+        categorical_dimensions_per_semantic_model: The number of categorical dimensions in each semantic model.
+        time_dimensions_per_semantic_model: The number of time dimensions in each semantic model, in addition to the
+        `ds` dimension that is the default `agg_time_dimension`.
+        measures_per_semantic_model: The number of measures in each semantic model. There is a simple metric for each
+        measure.
+        custom_granularity_count: The number of custom granularities in the time spine.
+        ratio_metric_count: The number of ratio metrics, each with two simple metrics as inputs.
+        derived_metric_count: The number of derived metrics.
+        derived_metric_depth: The length of the chains of derived metrics, i.e. derived metrics use other derived
+        metrics as inputs up to this depth.
+        cumulative_metric_count: The number of cumulative metrics.
+        conversion_metric_count: The number of conversion metrics.
+        filtered_metric_fraction: The fraction of simple metrics that have a where filter.
+        saved_query_count: The number of saved queries, each with a where filter and an export.
+        seed: The seed for the random choices, e.g. which semantic models are joined.
+    """
+
+    semantic_model_count: int = 10
+    foreign_entities_per_semantic_model: int = 2
+    categorical_dimensions_per_semantic_model: int = 3
+    time_dimensions_per_semantic_model: int = 1
+    measures_per_semantic_model: int = 2
+    custom_granularity_count: int = 2
+    ratio_metric_count: int = 5
+    derived_metric_count: int = 5
+    derived_metric_depth: int = 3
+    cumulative_metric_count: int = 3
+    conversion_metric_count: int = 2
+    filtered_metric_fraction: float = 0.25
+    saved_query_count: int = 3
+    seed: int = 0
+
+    def __post_init__(self) -> None:  # noqa: D105
+        if self.semantic_model_count < 1 or self.measures_per_semantic_model < 1:
+            raise ValueError("A synthetic manifest needs at least one semantic model with at least one measure.")
+        if self.derived_metric_depth < 1:
+            raise ValueError(f"`derived_metric_depth` must be at least 1. Got {self.derived_metric_depth}.")
+        if self.conversion_metric_count > 0 and (
+            self.semantic_model_count < 2 or self.foreign_entities_per_semantic_model < 1
+        ):
+            raise ValueError("Conversion metrics need at least two semantic models with a foreign entity.")
+
+    @staticmethod
+    def with_object_count(object_count: int, seed: int = 0) -> SyntheticManifestConfig:
+        """Returns a config for a manifest with roughly the given number of objects. See `object_count`.
+
+        The number of semantic models is scaled to match, and the number of each kind of metric and saved query is
+        proportional to the number of semantic models.
+        """
+        # With the default counts, there are 13 objects per semantic model, plus 1.5 for the other metrics and saved
+        # queries.
+        semantic_model_count = max(2, round(object_count / 14.5))
+        return SyntheticManifestConfig(
+            semantic_model_count=semantic_model_count,
+            ratio_metric_count=semantic_model_count // 2,
+            derived_metric_count=semantic_model_count // 2,
+            cumulative_metric_count=semantic_model_count // 5,
+            conversion_metric_count=semantic_model_count // 5,
+            saved_query_count=semantic_model_count // 10,
+            seed=seed,
+        )
+
+    @property
+    def object_count(self) -> int:
+        """The number of semantic models, entities, dimensions, measures, metrics and saved queries."""
+        semantic_model_count = self.semantic_model_count
+        foreign_entity_count = min(self.foreign_entities_per_semantic_model, semantic_model_count - 1)
+        objects_per_semantic_model = (
+            1
+            + (1 + foreign_entity_count)
+            + (1 + self.time_dimensions_per_semantic_model + self.categorical_dimensions_per_semantic_model)
+            # Each measure has a simple metric.
+            + 2 * self.measures_per_semantic_model
+        )
+        return (
+            semantic_model_count * objects_per_semantic_model
+            + self.ratio_metric_count
+            + self.derived_metric_count
+            + self.cumulative_metric_count
+            + self.conversion_metric_count
+            + self.saved_query_count
+        )
+
+
+class SyntheticManifestGenerator:
+    """Generates a semantic manifest of a configurable size for tests and benchmarks.
+
+    The same config always generates the same manifest. The manifest can be written as a directory of YAML files that
+    can be parsed with `parse_directory_of_yaml_files_to_semantic_manifest`, or built directly as a
+    `PydanticSemanticManifest`. Either way, it passes the validations in `SemanticManifestValidator`.
+    """
+
+    def __init__(self, config: SyntheticManifestConfig = SyntheticManifestConfig()) -> None:  # noqa: D107
+        self._config = config
+        self._random = random.Random(config.seed)
+        self._semantic_model_documents: List[YamlDocument] = []
+        self._metric_documents: List[YamlDocument] = []
+        self._saved_query_documents: List[YamlDocument] = []
+        # The simple metrics for each semantic model.
+        self._simple_metric_names: List[List[str]] = []
+        # The entities that each semantic model has as a foreign entity.
+        self._foreign_entity_indexes: List[List[int]] = []
+
+        self._custom_granularity_names = [
+            f"custom_granularity_{granularity_index}" for granularity_index in range(config.custom_granularity_count)
+        ]
+        self._project_configuration_document: YamlDocument = {
+            "project_configuration": {
+                "time_spines": [
+                    {
+                        "node_relation": {"schema_name": "synthetic_schema", "alias": "time_spine_day"},
+                        "primary_column": {"name": "ds", "time_granularity": "day"},
+                        "custom_granularities": [{"name": name} for name in self._custom_granularity_names],
+                    }
+                ]
+            }
+        }
+        for model_index in range(config.semantic_model_count):
+            self._add_semantic_model(model_index)
+        self._add_simple_metrics()
+        self._add_ratio_metrics()
+        self._add_derived_metrics()
+        self._add_cumulative_metrics()
+        self._add_conversion_metrics()
+        self._add_saved_queries()
+
+    @property
+    def config(self) -> SyntheticManifestConfig:  # noqa: D
+        return self._config
+
+    @staticmethod
+    def _entity_name(model_index: int) -> str:
+        return f"entity_{model_index}"
+
+    @staticmethod
+    def _categorical_dimension_name(model_index: int, dimension_index: int) -> str:
+        return f"dimension_{model_index}_{dimension_index}"
+
+    def _where_filter(self, model_index: int) -> str:
+        if self._config.categorical_dimensions_per_semantic_model == 0 or self._random.random() < 0.5:
+            return "{{ TimeDimension('metric_time', 'day') }} >= '2020-01-01'"
+        dimension_name = (
+            SyntheticManifestGenerator._entity_name(model_index)
+            + "__"
+            + SyntheticManifestGenerator._categorical_dimension_name(model_index, 0)
+        )
+        return f"{{{{ Dimension('{dimension_name}') }}}} = 'value_{self._random.randrange(10)}'"
+
+    def _add_semantic_model(self, model_index: int) -> None:
+        config = self._config
+        # Sample from the other semantic models without building a list of them, as there can be many.
+        other_model_count = config.semantic_model_count - 1
+        foreign_entity_indexes = [
+            index if index < model_index else index + 1
+            for index in self._random.sample(
+                range(other_model_count), min(config.foreign_entities_per_semantic_model, other_model_count)
+            )
+        ]
+        self._foreign_entity_indexes.append(foreign_entity_indexes)
+
+        measures: List[Dict[str, Any]] = [{"name": f"measure_{model_index}_0", "agg": "sum", "expr": "1"}]
+        for measure_index in range(1, config.measures_per_semantic_model):
+            measures.append(
+                {
+                    "name": f"measure_{model_index}_{measure_index}",
+                    "agg": self._random.choice(("sum", "max", "min", "average", "count_distinct")),
+                    "expr": f"column_{measure_index}",
+                }
+            )
+
+        dimensions: List[Dict[str, Any]] = [{"name": "ds", "type": "time", "type_params": {"time_granularity": "day"}}]
+        for dimension_index in range(config.time_dimensions_per_semantic_model):
+            dimensions.append(
+                {
+                    "name": f"time_dimension_{model_index}_{dimension_index}",
+                    "type": "time",
+                    "type_params": {"time_granularity": self._random.choice(("day", "week", "month"))},
+                }
+            )
+        for dimension_index in range(config.categorical_dimensions_per_semantic_model):
+            dimensions.append(
+                {
+                    "name": SyntheticManifestGenerator._categorical_dimension_name(model_index, dimension_index),
+                    "type": "categorical",
+                }
+            )
+
+        self._semantic_model_documents.append(
+            {
+                "semantic_model": {
+                    "name": f"semantic_model_{model_index}",
+                    "description": f"Synthetic semantic model {model_index}.",
+                    "node_relation": {"schema_name": "synthetic_schema", "alias": f"table_{model_index}"},
+                    "defaults": {"agg_time_dimension": "ds"},
+                    "entities": [{"name": SyntheticManifestGenerator._entity_name(model_index), "type": "primary"}]
+                    + [
+                        {"name": SyntheticManifestGenerator._entity_name(foreign_entity_index), "type": "foreign"}
+                        for foreign_entity_index in foreign_entity_indexes
+                    ],
+                    "measures": measures,
+                    "dimensions": dimensions,
+                }
+            }
+        )
+
+    def _add_simple_metrics(self) -> None:
+        for model_index in range(self._config.semantic_model_count):
+            metric_names = []
+            for measure_index in range(self._config.measures_per_semantic_model):
+                metric: Dict[str, Any] = {
+                    "name": f"simple_metric_{model_index}_{measure_index}",
+                    "type": "simple",
+                    "type_params": {"measure": {"name": f"measure_{model_index}_{measure_index}"}},
+                }
+                if self._random.random() < self._config.filtered_metric_fraction:
+                    metric["filter"] = self._where_filter(model_index)
+                self._metric_documents.append({"metric": metric})
+                metric_names.append(metric["name"])
+            self._simple_metric_names.append(metric_names)
+
+    def _random_simple_metric_name(self) -> str:
+        return self._random.choice(self._random.choice(self._simple_metric_names))
+
+    def _add_ratio_metrics(self) -> None:
+        for metric_index in range(self._config.ratio_metric_count):
+            self._metric_documents.append(
+                {
+                    "metric": {
+                        "name": f"ratio_metric_{metric_index}",
+                        "type": "ratio",
+                        "type_params": {
+                            "numerator": {"name": self._random_simple_metric_name()},
+                            "denominator": {"name": self._random_simple_metric_name()},
+                        },
+                    }
+                }
+            )
+
+    def _add_derived_metrics(self) -> None:
+        depth = self._config.derived_metric_depth
+        for metric_index in range(self._config.derived_metric_count):
+            # Every `depth` derived metrics form a chain, where each one uses the previous one as an input.
+            if metric_index % depth == 0:
+                input_metric_names = [self._random_simple_metric_name(), self._random_simple_metric_name()]
+            else:
+                input_metric_names = [f"derived_metric_{metric_index - 1}", self._random_simple_metric_name()]
+            input_metric_names = list(dict.fromkeys(input_metric_names))
+            self._metric_documents.append(
+                {
+                    "metric": {
+                        "name": f"derived_metric_{metric_index}",
+                        "type": "derived",
+                        "type_params": {
+                            "expr": " + ".join(input_metric_names),
+                            "metrics": [{"name": input_metric_name} for input_metric_name in input_metric_names],
+                        },
+                    }
+                }
+            )
+
+    def _add_cumulative_metrics(self) -> None:
+        for metric_index in range(self._config.cumulative_metric_count):
+            model_index = self._random.randrange(self._config.semantic_model_count)
+            cumulative_type_params = (
+                {"window": f"{self._random.randint(2, 30)} days"}
+                if metric_index % 2 == 0
+                else {"grain_to_date": "month"}
+            )
+            self._metric_documents.append(
+                {
+                    "metric": {
+                        "name": f"cumulative_metric_{metric_index}",
+                        "type": "cumulative",
+                        "type_params": {
+                            "cumulative_type_params": {
+                                **cumulative_type_params,
+                                "metric": {"name": f"simple_metric_{model_index}_0"},
+                            },
+                        },
+                    }
+                }
+            )
+
+    def _add_conversion_metrics(self) -> None:
+        for metric_index in range(self._config.conversion_metric_count):
+            base_model_index = self._random.randrange(self._config.semantic_model_count)
+            # The entity of the conversion is in both semantic models.
+            conversion_model_index = self._random.choice(self._foreign_entity_indexes[base_model_index])
+            self._metric_documents.append(
+                {
+                    "metric": {
+                        "name": f"conversion_metric_{metric_index}",
+                        "type": "conversion",
+                        "type_params": {
+                            "conversion_type_params": {
+                                "base_metric": {"name": f"simple_metric_{base_model_index}_0"},
+                                "conversion_metric": {"name": f"simple_metric_{conversion_model_index}_0"},
+                                "entity": SyntheticManifestGenerator._entity_name(conversion_model_index),
+                                "window": "7 days",
+                            }
+                        },
+                    }
+                }
+            )
+
+    def _add_saved_queries(self) -> None:
+        for saved_query_index in range(self._config.saved_query_count):
+            # The metrics are from the same semantic model, so they can be grouped by its dimensions.
+            model_index = self._random.randrange(self._config.semantic_model_count)
+            simple_metric_names = self._simple_metric_names[model_index]
+            metric_names = self._random.sample(simple_metric_names, self._random.randint(1, len(simple_metric_names)))
+            entity_name = SyntheticManifestGenerator._entity_name(model_index)
+            time_granularity_name = self._random.choice(["day", "month"] + self._custom_granularity_names)
+            group_by = [f"TimeDimension('metric_time', '{time_granularity_name}')", f"Entity('{entity_name}')"]
+            if self._config.categorical_dimensions_per_semantic_model > 0:
+                dimension_name = SyntheticManifestGenerator._categorical_dimension_name(model_index, 0)
+                group_by.append(f"Dimension('{entity_name}__{dimension_name}')")
+            self._saved_query_documents.append(
+                {
+                    "saved_query": {
+                        "name": f"saved_query_{saved_query_index}",
+                        "description": f"Synthetic saved query {saved_query_index}.",
+                        "query_params": {
+                            "metrics": metric_names,
+                            "group_by": group_by,
+                            "where": [self._where_filter(model_index)],
+                        },
+                        "exports": [
+                            {
+                                "name": f"export_{saved_query_index}",
+                                "config": {"export_as": "table", "schema": "exports_schema"},
+                            }
+                        ],
+                    }
+                }
+            )
+
+    def yaml_documents(self) -> Dict[str, Sequence[YamlDocument]]:
+        """Returns the YAML documents of each file, keyed by the path of the file relative to the project directory."""
+        files: Dict[str, Sequence[YamlDocument]] = {
+            "project_configuration.yaml": (self._project_configuration_document,)
+        }
+        for semantic_model_document in self._semantic_model_documents:
+            file_name = f"{semantic_model_document['semantic_model']['name']}.yaml"
+            files[os.path.join("semantic_models", file_name)] = (semantic_model_document,)
+        files["metrics.yaml"] = tuple(self._metric_documents)
+        files["saved_queries.yaml"] = tuple(self._saved_query_documents)
+        return files
+
+    def yaml_config_files(self, directory: str = "") -> List[YamlConfigFile]:
+        """Returns the YAML files for `parse_yaml_files_to_validation_ready_semantic_manifest`."""
+        return [
+            YamlConfigFile(
+                filepath=os.path.join(directory, relative_path),
+                contents=yaml.safe_dump_all(documents, explicit_start=True, sort_keys=False),
+            )
+            for relative_path, documents in self.yaml_documents().items()
+        ]
+
+    def write_yaml_directory(self, directory: str) -> List[str]:
+        """Writes the YAML files to the directory and returns their paths."""
+        file_paths = []
+        for yaml_config_file in self.yaml_config_files(directory):
+            os.makedirs(os.path.dirname(yaml_config_file.filepath), exist_ok=True)
+            with open(yaml_config_file.filepath, "w") as f:
+                f.write(yaml_config_file.contents)
+            file_paths.append(yaml_config_file.filepath)
+        return file_paths
+
+    def semantic_manifest(self, apply_transformations: bool = True) -> PydanticSemanticManifest:
+        """Builds the manifest from the YAML documents without writing or parsing YAML.
+
+        The objects are built in the same way as when parsing the YAML files, except that they don't have metadata.
+        """
+        semantic_manifest = PydanticSemanticManifest(
+            semantic_models=[
+                PydanticSemanticModel.parse_obj(document["semantic_model"])
+                for document in self._semantic_model_documents
+            ],
+            metrics=[PydanticMetric.parse_obj(document["metric"]) for document in self._metric_documents],
+            project_configuration=PydanticProjectConfiguration.parse_obj(
+                self._project_configuration_document["project_configuration"]
+            ),
+            saved_queries=[
+                PydanticSavedQuery.parse_obj(document["saved_query"]) for document in self._saved_query_documents
+            ],
+        )
+        if apply_transformations:
+            semantic_manifest = PydanticSemanticManifestTransformer.transform(semantic_manifest)
+        return semantic_manifest
@@ -1,9 +1,9 @@
-from typing import Set
+from typing import Dict, List, Optional, Sequence, Set, Union
 
 from typing_extensions import override
 
 from dbt_semantic_interfaces.enum_extension import assert_values_exhausted
-from dbt_semantic_interfaces.errors import ModelTransformError
+from dbt_semantic_interfaces.errors import MetricCycleError, ModelTransformError
 from dbt_semantic_interfaces.implementations.metric import (
     PydanticMetric,
     PydanticMetricInputMeasure,
@@ -11,7 +11,9 @@ from dbt_semantic_interfaces.implementations.metric import (
 from dbt_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
+from dbt_semantic_interfaces.metric_graph import MetricGraph
 from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.references import MetricReference
 from dbt_semantic_interfaces.transformations.transform_rule import (
     SemanticManifestTransformRule,
 )
@@ -27,42 +29,74 @@ class AddInputMetricMeasuresRule(ProtocolHint[SemanticManifestTransformRule[Pyda
 
     @staticmethod
     def _get_measures_for_metric(
-        semantic_manifest: PydanticSemanticManifest, metric_name: str
+        metric: PydanticMetric, input_metric_measures: Sequence[Set[PydanticMetricInputMeasure]]
     ) -> Set[PydanticMetricInputMeasure]:
-        """Returns a unique set of input measures for a given metric."""
+        """Returns a unique set of input measures for a given metric, given the input measures of its input metrics."""
         measures: Set = set()
-        matched_metric = next((metric for metric in semantic_manifest.metrics if metric.name == metric_name), None)
-        if matched_metric:
-            if matched_metric.type is MetricType.SIMPLE or matched_metric.type is MetricType.CUMULATIVE:
-                if matched_metric.type_params.measure is not None:
-                    measures.add(matched_metric.type_params.measure)
-            elif matched_metric.type is MetricType.DERIVED or matched_metric.type is MetricType.RATIO:
-                for input_metric in matched_metric.input_metrics:
-                    measures.update(
-                        AddInputMetricMeasuresRule._get_measures_for_metric(semantic_manifest, input_metric.name)
-                    )
-            elif matched_metric.type is MetricType.CONVERSION:
-                conversion_type_params = PydanticMetric.get_checked_conversion_type_params(matched_metric)
-                # TODO SL-4116: this logic will need to change when we auto-transform
-                # away measures into simple metrics.
-                if conversion_type_params.base_measure is not None:
-                    measures.add(conversion_type_params.base_measure)
-                if conversion_type_params.conversion_measure is not None:
-                    measures.add(conversion_type_params.conversion_measure)
-            else:
-                assert_values_exhausted(matched_metric.type)
+        if metric.type is MetricType.SIMPLE or metric.type is MetricType.CUMULATIVE:
+            if metric.type_params.measure is not None:
+                measures.add(metric.type_params.measure)
+        elif metric.type is MetricType.DERIVED or metric.type is MetricType.RATIO:
+            for measures_for_input_metric in input_metric_measures:
+                measures.update(measures_for_input_metric)
+        elif metric.type is MetricType.CONVERSION:
+            conversion_type_params = PydanticMetric.get_checked_conversion_type_params(metric)
+            # TODO SL-4116: this logic will need to change when we auto-transform
+            # away measures into simple metrics.
+            if conversion_type_params.base_measure is not None:
+                measures.add(conversion_type_params.base_measure)
+            if conversion_type_params.conversion_measure is not None:
+                measures.add(conversion_type_params.conversion_measure)
         else:
-            raise ModelTransformError(f"Metric '{metric_name}' is not configured as a metric in the model.")
+            assert_values_exhausted(metric.type)
         return measures
 
     @staticmethod
     def transform_model(semantic_manifest: PydanticSemanticManifest) -> PydanticSemanticManifest:  # noqa: D
-        for metric in semantic_manifest.metrics:
-            if len(metric.type_params.input_measures) > 0:
-                # These aren't missing and have already been added by an enterprising parser or earlier
-                # transformation rule.
-                continue
-            measures = AddInputMetricMeasuresRule._get_measures_for_metric(semantic_manifest, metric.name)
-            metric.type_params.input_measures = list(measures)
+        metrics_without_input_measures = [
+            metric for metric in semantic_manifest.metrics if len(metric.type_params.input_measures) == 0
+        ]
+        # Input measures that have already been added by an enterprising parser or earlier transformation rule aren't
+        # replaced.
+        if len(metrics_without_input_measures) == 0:
+            return semantic_manifest
+
+        metric_graph = MetricGraph(semantic_manifest)
+        try:
+            topological_order = metric_graph.topological_order()
+        except MetricCycleError as e:
+            raise ModelTransformError(str(e)) from e
+
+        # Computed for each metric with the input metrics first, so that the measures of a metric are only computed
+        # once. If an input metric doesn't exist, the name of the missing metric is stored instead.
+        metric_to_measures: Dict[MetricReference, Union[Set[PydanticMetricInputMeasure], MetricReference]] = {}
+        for metric_reference in topological_order:
+            metric = metric_graph.get_metric(metric_reference)
+            assert isinstance(metric, PydanticMetric)
+            missing_input_metric: Optional[MetricReference] = None
+            input_metric_measures: List[Set[PydanticMetricInputMeasure]] = []
+            if metric.type is MetricType.DERIVED or metric.type is MetricType.RATIO:
+                missing_input_metrics = metric_graph.missing_input_metrics(metric_reference)
+                if missing_input_metrics:
+                    missing_input_metric = missing_input_metrics[0]
+                for input_metric_reference in metric_graph.input_metrics(metric_reference):
+                    measures_or_missing_metric = metric_to_measures[input_metric_reference]
+                    if isinstance(measures_or_missing_metric, MetricReference):
+                        missing_input_metric = missing_input_metric or measures_or_missing_metric
+                    else:
+                        input_metric_measures.append(measures_or_missing_metric)
+            metric_to_measures[metric_reference] = (
+                missing_input_metric
+                if missing_input_metric is not None
+                else AddInputMetricMeasuresRule._get_measures_for_metric(metric, input_metric_measures)
+            )
+
+        for metric in metrics_without_input_measures:
+            measures_or_missing_metric = metric_to_measures[MetricReference(element_name=metric.name)]
+            if isinstance(measures_or_missing_metric, MetricReference):
+                raise ModelTransformError(
+                    f"Metric '{measures_or_missing_metric.element_name}' is not configured as a metric in the model."
+                )
+            metric.type_params.input_measures = list(measures_or_missing_metric)
 
         return semantic_manifest
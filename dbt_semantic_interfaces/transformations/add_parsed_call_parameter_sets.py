@@ -0,0 +1,69 @@
+from typing_extensions import override
+
+from dbt_semantic_interfaces.implementations.filters.where_filter import (
+    PydanticParsedCallParameterSets,
+    PydanticWhereFilter,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterBatchParser,
+)
+from dbt_semantic_interfaces.protocols import ProtocolHint
+from dbt_semantic_interfaces.transformations.transform_rule import (
+    SemanticManifestTransformRule,
+)
+
+
+class AddParsedCallParameterSetsRule(ProtocolHint[SemanticManifestTransformRule[PydanticSemanticManifest]]):
+    """Stores the call parameter sets parsed from each where filter in the filter itself.
+
+    When the semantic manifest is serialized, the stored values let consumers get the call parameter sets without
+    rendering the templates with Jinja. Filters that can't be parsed are left as they are so that the errors are
+    reported during validation.
+
+    This isn't one of the default rules as it adds to the size of the serialized manifest. It should run after the
+    default rules so that it includes the filters that those add, e.g.:
+
+        PydanticSemanticManifestTransformer.transform(
+            semantic_manifest,
+            ordered_rule_sequences=(
+                *PydanticSemanticManifestTransformRuleSet().all_rules,
+                (AddParsedCallParameterSetsRule(),),
+            ),
+        )
+    """
+
+    @override
+    def _implements_protocol(self) -> SemanticManifestTransformRule[PydanticSemanticManifest]:  # noqa: D
+        return self
+
+    @staticmethod
+    def transform_model(semantic_manifest: PydanticSemanticManifest) -> PydanticSemanticManifest:  # noqa: D
+        custom_granularity_names = tuple(
+            granularity.name
+            for time_spine in semantic_manifest.project_configuration.time_spines
+            for granularity in time_spine.custom_granularities
+        )
+        where_filters = [
+            where_filter
+            for _, where_filter_intersection in WhereFilterBatchParser.collect_call_sites(semantic_manifest)
+            for where_filter in where_filter_intersection.where_filters
+        ]
+        where_sql_template_to_parse_result = WhereFilterBatchParser(
+            custom_granularity_names=custom_granularity_names
+        ).parse_where_sql_templates(where_filter.where_sql_template for where_filter in where_filters)
+
+        for where_filter in where_filters:
+            if not isinstance(where_filter, PydanticWhereFilter):
+                continue
+            parse_result = where_sql_template_to_parse_result[where_filter.where_sql_template]
+            if parse_result.call_parameter_sets is not None:
+                where_filter.parsed_call_parameter_sets = PydanticParsedCallParameterSets.create(
+                    where_sql_template=where_filter.where_sql_template,
+                    custom_granularity_names=custom_granularity_names,
+                    call_parameter_sets=parse_result.call_parameter_sets,
+                )
+
+        return semantic_manifest
@@ -8,6 +8,10 @@ from typing_extensions import override
 from dbt_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
+from dbt_semantic_interfaces.instrumentation import (
+    TRANSFORM_RULE_PHASE,
+    instrumented_phase,
+)
 from dbt_semantic_interfaces.protocols import ProtocolHint, SemanticManifestT
 from dbt_semantic_interfaces.transformations.pydantic_rule_set import (
     PydanticSemanticManifestTransformRuleSet,
@@ -62,6 +66,7 @@ class PydanticSemanticManifestTransformer(ProtocolHint[SemanticManifestTransform
 
         for rule_sequence in ordered_rule_sequences:
             for rule in rule_sequence:
-                model_copy = rule.transform_model(model_copy)
+                with instrumented_phase(TRANSFORM_RULE_PHASE, rule=type(rule).__name__):
+                    model_copy = rule.transform_model(model_copy)
 
         return model_copy
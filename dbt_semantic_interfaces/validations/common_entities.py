@@ -1,10 +1,8 @@
-from typing import Dict, Generic, List, Sequence, Set
+from typing import Generic, List, Sequence
 
+from dbt_semantic_interfaces.entity_join_graph import EntityJoinGraph
 from dbt_semantic_interfaces.protocols import Entity, SemanticManifestT, SemanticModel
-from dbt_semantic_interfaces.references import (
-    EntityReference,
-    SemanticModelElementReference,
-)
+from dbt_semantic_interfaces.references import SemanticModelElementReference
 from dbt_semantic_interfaces.validations.validator_helpers import (
     FileContext,
     SemanticManifestValidationRule,
@@ -19,31 +17,19 @@ from dbt_semantic_interfaces.validations.validator_helpers import (
 class CommonEntitysRule(SemanticManifestValidationRule[SemanticManifestT], Generic[SemanticManifestT]):
     """Checks that entities exist on more than one semantic model."""
 
-    @staticmethod
-    def _map_semantic_model_entities(semantic_models: Sequence[SemanticModel]) -> Dict[EntityReference, Set[str]]:
-        """Generate mapping of entity names to the set of semantic_models where it is defined."""
-        entities_to_semantic_models: Dict[EntityReference, Set[str]] = {}
-        for semantic_model in semantic_models or []:
-            for entity in semantic_model.entities or []:
-                if entity.reference in entities_to_semantic_models:
-                    entities_to_semantic_models[entity.reference].add(semantic_model.name)
-                else:
-                    entities_to_semantic_models[entity.reference] = {semantic_model.name}
-        return entities_to_semantic_models
-
     @staticmethod
     @validate_safely(whats_being_done="checking entity exists on more than one semantic model")
     def _check_entity(
         entity: Entity,
         semantic_model: SemanticModel,
-        entities_to_semantic_models: Dict[EntityReference, Set[str]],
+        entity_join_graph: EntityJoinGraph,
     ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
-        # If the entity is the dict and if the set of semantic models minus this semantic model is empty,
-        # then we warn the user that their entity will be unused in joins
-        if (
-            entity.reference in entities_to_semantic_models
-            and len(entities_to_semantic_models[entity.reference].difference({semantic_model.name})) == 0
+        # If there are no other semantic models with this entity, then we warn the user that their entity will be
+        # unused in joins
+        if all(
+            semantic_model_reference == semantic_model.reference
+            for semantic_model_reference in entity_join_graph.semantic_models_for_entity(entity.reference)
         ):
             issues.append(
                 ValidationWarning(
@@ -67,14 +53,14 @@ class CommonEntitysRule(SemanticManifestValidationRule[SemanticManifestT], Gener
         """Issues a warning for any entity that is associated with only one semantic_model."""
         issues: List[ValidationIssue] = []
 
-        entities_to_semantic_models = CommonEntitysRule._map_semantic_model_entities(semantic_manifest.semantic_models)
+        entity_join_graph = EntityJoinGraph(semantic_manifest)
         for semantic_model in semantic_manifest.semantic_models or []:
             for entity in semantic_model.entities or []:
                 issues.extend(
                     CommonEntitysRule._check_entity(
                         entity=entity,
                         semantic_model=semantic_model,
-                        entities_to_semantic_models=entities_to_semantic_models,
+                        entity_join_graph=entity_join_graph,
                     )
                 )
 
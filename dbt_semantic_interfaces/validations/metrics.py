@@ -1,6 +1,8 @@
 from typing import Dict, Generic, List, Literal, Optional, Sequence, Set, Tuple, Union
 
+from dbt_semantic_interfaces.errors import MetricGraphError
 from dbt_semantic_interfaces.implementations.metric import PydanticMetric
+from dbt_semantic_interfaces.metric_graph import MetricGraph
 from dbt_semantic_interfaces.protocols import (
     ConversionTypeParams,
     Dimension,
@@ -274,6 +276,27 @@ class DerivedMetricRule(SemanticManifestValidationRule[SemanticManifestT], Gener
                         )
         return issues
 
+    @staticmethod
+    @validate_safely(whats_being_done="checking that the input metrics don't form a cycle")
+    def _validate_no_input_metric_cycles(semantic_manifest: SemanticManifest) -> Sequence[ValidationIssue]:
+        issues: List[ValidationIssue] = []
+
+        metric_graph = MetricGraph(semantic_manifest)
+        for cycle in metric_graph.cycles:
+            metric = metric_graph.get_metric(cycle[0])
+            issues.append(
+                ValidationError(
+                    context=MetricContext(
+                        file_context=FileContext.from_metadata(metadata=metric.metadata),
+                        metric=MetricModelReference(metric_name=metric.name),
+                    ),
+                    message=f"Metric '{metric.name}' depends on itself through its input metrics: "
+                    f"{MetricGraph.describe_cycle(cycle)}. "
+                    "Please remove the cycle.",
+                )
+            )
+        return issues
+
     @staticmethod
     @validate_safely(whats_being_done="checking that input metric time offset params are valid")
     def _validate_time_offset_params(metric: Metric, custom_granularities: Set[str]) -> Sequence[ValidationIssue]:
@@ -362,6 +385,7 @@ class DerivedMetricRule(SemanticManifestValidationRule[SemanticManifestT], Gener
         }
 
         issues += DerivedMetricRule._validate_input_metrics_exist(semantic_manifest=semantic_manifest)
+        issues += DerivedMetricRule._validate_no_input_metric_cycles(semantic_manifest=semantic_manifest)
         for metric in semantic_manifest.metrics or []:
             issues += DerivedMetricRule._validate_alias_collision(metric=metric)
             issues += DerivedMetricRule._validate_time_offset_params(
@@ -1111,7 +1135,7 @@ class MetricTimeGranularityRule(SemanticManifestValidationRule[SemanticManifestT
     @staticmethod
     def _min_queryable_granularity_for_metric(
         metric: Metric,
-        metric_index: Dict[MetricReference, Metric],
+        metric_graph: MetricGraph,
         measure_to_agg_time_dimension: Dict[MeasureReference, Optional[Dimension]],
     ) -> Optional[TimeGranularity]:
         """Get the minimum time granularity this metric is allowed to be queried with.
@@ -1119,8 +1143,14 @@ class MetricTimeGranularityRule(SemanticManifestValidationRule[SemanticManifestT
         This should be the largest granularity that any of the metric's agg_time_dimensions is defined at.
         Defaults to DAY in the
         """
+        try:
+            measure_references = metric_graph.transitive_input_measures(MetricReference(element_name=metric.name))
+        except MetricGraphError:
+            # The input metrics are invalid (e.g. they form a cycle), which is validated elsewhere.
+            return None
+
         min_queryable_granularity: Optional[TimeGranularity] = None
-        for measure_reference in PydanticMetric.all_input_measures_for_metric(metric=metric, metric_index=metric_index):
+        for measure_reference in measure_references:
             agg_time_dimension = measure_to_agg_time_dimension.get(measure_reference)
             if not agg_time_dimension:
                 # This indicates the measure or agg_time_dimension were invalid, so we can't determine granularity.
@@ -1141,7 +1171,7 @@ class MetricTimeGranularityRule(SemanticManifestValidationRule[SemanticManifestT
     )
     def _validate_metric(
         metric: Metric,
-        metric_index: Dict[MetricReference, Metric],
+        metric_graph: MetricGraph,
         measure_to_agg_time_dimension: Dict[MeasureReference, Optional[Dimension]],
     ) -> Sequence[ValidationIssue]:  # noqa: D
         issues: List[ValidationIssue] = []
@@ -1152,7 +1182,7 @@ class MetricTimeGranularityRule(SemanticManifestValidationRule[SemanticManifestT
 
         if metric.time_granularity:
             min_queryable_granularity = MetricTimeGranularityRule._min_queryable_granularity_for_metric(
-                metric=metric, metric_index=metric_index, measure_to_agg_time_dimension=measure_to_agg_time_dimension
+                metric=metric, metric_graph=metric_graph, measure_to_agg_time_dimension=measure_to_agg_time_dimension
             )
             if not min_queryable_granularity:
                 issues.append(
@@ -1211,11 +1241,11 @@ class MetricTimeGranularityRule(SemanticManifestValidationRule[SemanticManifestT
                     agg_time_dimension = None
                 measure_to_agg_time_dimension[measure.reference] = agg_time_dimension
 
-        metric_index = {MetricReference(metric.name): metric for metric in semantic_manifest.metrics}
+        metric_graph = MetricGraph(semantic_manifest)
         for metric in semantic_manifest.metrics or []:
             issues += MetricTimeGranularityRule._validate_metric(
                 metric=metric,
-                metric_index=metric_index,
+                metric_graph=metric_graph,
                 measure_to_agg_time_dimension=measure_to_agg_time_dimension,
             )
         return issues
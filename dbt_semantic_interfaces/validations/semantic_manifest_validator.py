@@ -3,6 +3,10 @@ import logging
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Generic, List, Sequence
 
+from dbt_semantic_interfaces.instrumentation import (
+    VALIDATION_RULE_PHASE,
+    instrumented_phase,
+)
 from dbt_semantic_interfaces.protocols import SemanticManifest, SemanticManifestT
 from dbt_semantic_interfaces.validations.agg_time_dimension import (
     AggregationTimeDimensionRule,
@@ -120,25 +124,38 @@ class SemanticManifestValidator(Generic[SemanticManifestT]):
         self._executor = ProcessPoolExecutor(max_workers=max_workers)
 
     def validate_semantic_manifest(
-        self, semantic_manifest: SemanticManifestT, multi_process: bool = False
+        self, semantic_manifest: SemanticManifestT, multi_process: bool = False, fail_fast: bool = False
     ) -> SemanticManifestValidationResults:
-        """Validate a manifest according to configured rules."""
+        """Validate a manifest according to configured rules.
+
+        Args:
+            semantic_manifest: The manifest to validate.
+            multi_process: Whether to run the rules in the worker processes of the validator.
+            fail_fast: Whether to stop running rules after the first rule that finds an error. The results then only
+                have the issues found by the rules that ran.
+        """
         if multi_process:
-            return self._validate_multi_process(semantic_manifest=semantic_manifest)
+            return self._validate_multi_process(semantic_manifest=semantic_manifest, fail_fast=fail_fast)
         else:
-            return self._validate_sync(semantic_manifest=semantic_manifest)
+            return self._validate_sync(semantic_manifest=semantic_manifest, fail_fast=fail_fast)
 
-    def _validate_sync(self, semantic_manifest: SemanticManifestT) -> SemanticManifestValidationResults:  # noqa: D
+    def _validate_sync(  # noqa: D
+        self, semantic_manifest: SemanticManifestT, fail_fast: bool = False
+    ) -> SemanticManifestValidationResults:
         results: List[SemanticManifestValidationResults] = []
 
         for rule in self._rules:
-            issues = rule.validate_manifest(semantic_manifest=semantic_manifest)
-            results.append(SemanticManifestValidationResults.from_issues_sequence(issues))
+            with instrumented_phase(VALIDATION_RULE_PHASE, rule=type(rule).__name__):
+                issues = rule.validate_manifest(semantic_manifest=semantic_manifest)
+            result = SemanticManifestValidationResults.from_issues_sequence(issues)
+            results.append(result)
+            if fail_fast and result.has_blocking_issues:
+                break
 
         return SemanticManifestValidationResults.merge(results)
 
     def _validate_multi_process(  # noqa: D
-        self, semantic_manifest: SemanticManifestT
+        self, semantic_manifest: SemanticManifestT, fail_fast: bool = False
     ) -> SemanticManifestValidationResults:
         results: List[SemanticManifestValidationResults] = []
 
@@ -150,6 +167,10 @@ class SemanticManifestValidator(Generic[SemanticManifestT]):
             res = future.result()
             result = SemanticManifestValidationResults.parse_raw(res)
             results.append(result)
+            if fail_fast and result.has_blocking_issues:
+                for other_future in futures:
+                    other_future.cancel()
+                break
 
         return SemanticManifestValidationResults.merge(results)
 
@@ -18,7 +18,6 @@ from typing import (
     Union,
 )
 
-import click
 from typing_extensions import ParamSpec
 
 from dbt_semantic_interfaces.implementations.base import FrozenBaseModel
@@ -61,6 +60,13 @@ ISSUE_COLOR_MAP = {
 }
 
 
+def _style(text: str, fg: str, bold: Optional[bool] = None) -> str:
+    """Styles the text for the CLI. `click` is imported here as it's only needed for CLI output."""
+    import click
+
+    return click.style(text, fg=fg, bold=bold)
+
+
 class SemanticModelElementType(Enum):
     """Maps semantic model element types to a readable string."""
 
@@ -215,7 +221,7 @@ class ValidationIssue(ABC, BaseModel):
     def as_cli_formatted_str(self, verbose: bool = False) -> str:
         """Returns a color-coded readable string for rendering issues in the CLI."""
         return self.as_readable_str(
-            verbose=verbose, prefix=click.style(self.level.name, bold=True, fg=ISSUE_COLOR_MAP[self.level])
+            verbose=verbose, prefix=_style(self.level.name, bold=True, fg=ISSUE_COLOR_MAP[self.level])
         )
 
     @property
@@ -350,15 +356,15 @@ class SemanticManifestValidationResults(FrozenBaseModel):
 
     def summary(self) -> str:
         """Returns a stylized summary string for issues."""
-        errors = click.style(
+        errors = _style(
             text=f"{ValidationIssueLevel.ERROR.name_plural}: {len(self.errors)}",
             fg=ISSUE_COLOR_MAP[ValidationIssueLevel.ERROR],
         )
-        future_errors = click.style(
+        future_errors = _style(
             text=f"{ValidationIssueLevel.FUTURE_ERROR.name_plural}: {len(self.future_errors)}",
             fg=ISSUE_COLOR_MAP[ValidationIssueLevel.FUTURE_ERROR],
         )
-        warnings = click.style(
+        warnings = _style(
             text=f"{ValidationIssueLevel.WARNING.name_plural}: {len(self.warnings)}",
             fg=ISSUE_COLOR_MAP[ValidationIssueLevel.WARNING],
         )
@@ -1,10 +1,22 @@
 import traceback
 from enum import Enum
-from typing import Generic, List, Sequence, Tuple
+from typing import Generic, List, Mapping, Sequence, Tuple
 
 from dbt_semantic_interfaces.call_parameter_sets import JinjaCallParameterSets
+from dbt_semantic_interfaces.implementations.filters.where_filter import (
+    PydanticWhereFilter,
+)
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterBatchParser,
+    WhereFilterParseResult,
+    filter_expression_parameter_sets_from_parse_results,
+)
 from dbt_semantic_interfaces.protocols import Metric, SemanticManifestT
 from dbt_semantic_interfaces.protocols.saved_query import SavedQuery
+from dbt_semantic_interfaces.protocols.where_filter import (
+    WhereFilter,
+    WhereFilterIntersection,
+)
 from dbt_semantic_interfaces.references import MetricModelReference
 from dbt_semantic_interfaces.type_enums import TimeGranularity
 from dbt_semantic_interfaces.validations.validator_helpers import (
@@ -55,32 +67,6 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
                 )
         return issues
 
-    @staticmethod
-    def _validate_time_granularity_names_for_saved_query(
-        saved_query: SavedQuery, valid_granularity_names: List[str]
-    ) -> Sequence[ValidationIssue]:
-        where_param = saved_query.query_params.where
-        if where_param is None:
-            return []
-
-        issues: List[ValidationIssue] = []
-        for where_filter in where_param.where_filters:
-            issues += WhereFiltersAreParseable._validate_time_granularity_names(
-                element_name=saved_query.name,
-                object_type=SemanticManifestNodeType.SAVED_QUERY,
-                context=SavedQueryContext(
-                    file_context=FileContext.from_metadata(metadata=saved_query.metadata),
-                    element_type=SavedQueryElementType.WHERE,
-                    element_value=where_filter.where_sql_template,
-                ),
-                filter_call_param_sets=where_filter.call_parameter_sets(
-                    custom_granularity_names=valid_granularity_names
-                ),
-                valid_granularity_names=valid_granularity_names,
-            )
-
-        return issues
-
     @staticmethod
     def _validate_time_granularity_names_for_metric(
         context: MetricContext,
@@ -100,40 +86,102 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
 
     @staticmethod
     @validate_safely("validating the where field in a saved query.")
-    def _validate_saved_query(saved_query: SavedQuery, valid_granularity_names: List[str]) -> Sequence[ValidationIssue]:
+    def _validate_saved_query(
+        saved_query: SavedQuery,
+        valid_granularity_names: List[str],
+        where_sql_template_to_parse_result: Mapping[str, WhereFilterParseResult],
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
         if saved_query.query_params.where is None:
             return issues
         for where_filter in saved_query.query_params.where.where_filters:
-            try:
-                where_filter.call_parameter_sets(custom_granularity_names=valid_granularity_names)
-            except Exception as e:
+            context = SavedQueryContext(
+                file_context=FileContext.from_metadata(metadata=saved_query.metadata),
+                element_type=SavedQueryElementType.WHERE,
+                element_value=where_filter.where_sql_template,
+            )
+            parse_result = WhereFiltersAreParseable._parse_where_filter(
+                where_filter, valid_granularity_names, where_sql_template_to_parse_result
+            )
+            if parse_result.exception is not None:
                 issues.append(
                     generate_exception_issue(
                         what_was_being_done=f"trying to parse a filter in saved query `{saved_query.name}`",
-                        e=e,
-                        context=SavedQueryContext(
-                            file_context=FileContext.from_metadata(metadata=saved_query.metadata),
-                            element_type=SavedQueryElementType.WHERE,
-                            element_value=where_filter.where_sql_template,
-                        ),
+                        e=parse_result.exception,
+                        context=context,
                         extras={
-                            "traceback": "".join(traceback.format_tb(e.__traceback__)),
+                            "traceback": "".join(traceback.format_tb(parse_result.exception.__traceback__)),
                         },
                     )
                 )
-            else:
-                issues += WhereFiltersAreParseable._validate_time_granularity_names_for_saved_query(
-                    saved_query, valid_granularity_names
+            elif parse_result.call_parameter_sets is not None:
+                issues += WhereFiltersAreParseable._validate_time_granularity_names(
+                    element_name=saved_query.name,
+                    object_type=SemanticManifestNodeType.SAVED_QUERY,
+                    context=context,
+                    filter_call_param_sets=parse_result.call_parameter_sets,
+                    valid_granularity_names=valid_granularity_names,
                 )
 
         return issues
 
+    @staticmethod
+    def _is_batch_parsed(where_filter: WhereFilter, custom_granularity_names: Sequence[str]) -> bool:
+        """Returns true if the result of `where_filter.call_parameter_sets` is the result of parsing the template.
+
+        The templates of these filters are parsed together in `validate_manifest`, so that each distinct template is
+        only parsed once. Other filters, e.g. with stored call parameter sets, are parsed via the `WhereFilter`
+        protocol.
+        """
+        return isinstance(where_filter, PydanticWhereFilter) and (
+            where_filter.parsed_call_parameter_sets is None
+            or not where_filter.parsed_call_parameter_sets.matches(
+                where_sql_template=where_filter.where_sql_template, custom_granularity_names=custom_granularity_names
+            )
+        )
+
+    @staticmethod
+    def _parse_where_filter(
+        where_filter: WhereFilter,
+        custom_granularity_names: Sequence[str],
+        where_sql_template_to_parse_result: Mapping[str, WhereFilterParseResult],
+    ) -> WhereFilterParseResult:
+        """Equivalent to `where_filter.call_parameter_sets`, using the batch-parsed templates where possible."""
+        if WhereFiltersAreParseable._is_batch_parsed(where_filter, custom_granularity_names):
+            return where_sql_template_to_parse_result[where_filter.where_sql_template]
+        try:
+            return WhereFilterParseResult(
+                where_sql_template=where_filter.where_sql_template,
+                call_parameter_sets=where_filter.call_parameter_sets(custom_granularity_names=custom_granularity_names),
+            )
+        except Exception as e:
+            return WhereFilterParseResult(where_sql_template=where_filter.where_sql_template, exception=e)
+
+    @staticmethod
+    def _filter_expression_parameter_sets(
+        where_filter_intersection: WhereFilterIntersection,
+        custom_granularity_names: Sequence[str],
+        where_sql_template_to_parse_result: Mapping[str, WhereFilterParseResult],
+    ) -> List[Tuple[str, JinjaCallParameterSets]]:
+        """Equivalent to `WhereFilterIntersection.filter_expression_parameter_sets` using the parsed templates."""
+        return filter_expression_parameter_sets_from_parse_results(
+            [
+                WhereFiltersAreParseable._parse_where_filter(
+                    where_filter, custom_granularity_names, where_sql_template_to_parse_result
+                )
+                for where_filter in where_filter_intersection.where_filters
+            ]
+        )
+
     @staticmethod
     @validate_safely(
         whats_being_done="running model validation ensuring a metric's filter properties are configured properly"
     )
-    def _validate_metric(metric: Metric, valid_granularity_names: List[str]) -> Sequence[ValidationIssue]:  # noqa: D
+    def _validate_metric(  # noqa: D
+        metric: Metric,
+        valid_granularity_names: List[str],
+        where_sql_template_to_parse_result: Mapping[str, WhereFilterParseResult],
+    ) -> Sequence[ValidationIssue]:
         issues: List[ValidationIssue] = []
         context = MetricContext(
             file_context=FileContext.from_metadata(metadata=metric.metadata),
@@ -142,7 +190,9 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
 
         if metric.filter is not None:
             try:
-                metric.filter.filter_expression_parameter_sets(custom_granularity_names=valid_granularity_names)
+                filter_expression_parameter_sets = WhereFiltersAreParseable._filter_expression_parameter_sets(
+                    metric.filter, valid_granularity_names, where_sql_template_to_parse_result
+                )
             except Exception as e:
                 issues.append(
                     generate_exception_issue(
@@ -157,9 +207,7 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
             else:
                 issues += WhereFiltersAreParseable._validate_time_granularity_names_for_metric(
                     context=context,
-                    filter_expression_parameter_sets=metric.filter.filter_expression_parameter_sets(
-                        custom_granularity_names=valid_granularity_names
-                    ),
+                    filter_expression_parameter_sets=filter_expression_parameter_sets,
                     valid_granularity_names=valid_granularity_names,
                 )
 
@@ -167,7 +215,9 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
             measure = metric.type_params.measure
             if measure is not None and measure.filter is not None:
                 try:
-                    measure.filter.filter_expression_parameter_sets(custom_granularity_names=valid_granularity_names)
+                    filter_expression_parameter_sets = WhereFiltersAreParseable._filter_expression_parameter_sets(
+                        measure.filter, valid_granularity_names, where_sql_template_to_parse_result
+                    )
                 except Exception as e:
                     issues.append(
                         generate_exception_issue(
@@ -183,16 +233,16 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
                 else:
                     issues += WhereFiltersAreParseable._validate_time_granularity_names_for_metric(
                         context=context,
-                        filter_expression_parameter_sets=measure.filter.filter_expression_parameter_sets(
-                            custom_granularity_names=valid_granularity_names
-                        ),
+                        filter_expression_parameter_sets=filter_expression_parameter_sets,
                         valid_granularity_names=valid_granularity_names,
                     )
 
             numerator = metric.type_params.numerator
             if numerator is not None and numerator.filter is not None:
                 try:
-                    numerator.filter.filter_expression_parameter_sets(custom_granularity_names=valid_granularity_names)
+                    filter_expression_parameter_sets = WhereFiltersAreParseable._filter_expression_parameter_sets(
+                        numerator.filter, valid_granularity_names, where_sql_template_to_parse_result
+                    )
                 except Exception as e:
                     issues.append(
                         generate_exception_issue(
@@ -207,17 +257,15 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
                 else:
                     issues += WhereFiltersAreParseable._validate_time_granularity_names_for_metric(
                         context=context,
-                        filter_expression_parameter_sets=numerator.filter.filter_expression_parameter_sets(
-                            custom_granularity_names=valid_granularity_names
-                        ),
+                        filter_expression_parameter_sets=filter_expression_parameter_sets,
                         valid_granularity_names=valid_granularity_names,
                     )
 
             denominator = metric.type_params.denominator
             if denominator is not None and denominator.filter is not None:
                 try:
-                    denominator.filter.filter_expression_parameter_sets(
-                        custom_granularity_names=valid_granularity_names
+                    filter_expression_parameter_sets = WhereFiltersAreParseable._filter_expression_parameter_sets(
+                        denominator.filter, valid_granularity_names, where_sql_template_to_parse_result
                     )
                 except Exception as e:
                     issues.append(
@@ -233,17 +281,15 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
                 else:
                     issues += WhereFiltersAreParseable._validate_time_granularity_names_for_metric(
                         context=context,
-                        filter_expression_parameter_sets=denominator.filter.filter_expression_parameter_sets(
-                            custom_granularity_names=valid_granularity_names
-                        ),
+                        filter_expression_parameter_sets=filter_expression_parameter_sets,
                         valid_granularity_names=valid_granularity_names,
                     )
 
             for input_metric in metric.type_params.metrics or []:
                 if input_metric.filter is not None:
                     try:
-                        input_metric.filter.filter_expression_parameter_sets(
-                            custom_granularity_names=valid_granularity_names
+                        filter_expression_parameter_sets = WhereFiltersAreParseable._filter_expression_parameter_sets(
+                            input_metric.filter, valid_granularity_names, where_sql_template_to_parse_result
                         )
                     except Exception as e:
                         issues.append(
@@ -260,9 +306,7 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
                     else:
                         issues += WhereFiltersAreParseable._validate_time_granularity_names_for_metric(
                             context=context,
-                            filter_expression_parameter_sets=input_metric.filter.filter_expression_parameter_sets(
-                                custom_granularity_names=valid_granularity_names
-                            ),
+                            filter_expression_parameter_sets=filter_expression_parameter_sets,
                             valid_granularity_names=valid_granularity_names,
                         )
         return issues
@@ -280,11 +324,26 @@ class WhereFiltersAreParseable(SemanticManifestValidationRule[SemanticManifestT]
             standard_granularity.value for standard_granularity in TimeGranularity
         ] + custom_granularity_names
 
+        # Parse the filters in the manifest that need parsing together, so that each distinct template is only parsed
+        # once. See `_is_batch_parsed`.
+        where_sql_template_to_parse_result = WhereFilterBatchParser(
+            custom_granularity_names=valid_granularity_names
+        ).parse_where_sql_templates(
+            where_filter.where_sql_template
+            for _, where_filter_intersection in WhereFilterBatchParser.collect_call_sites(semantic_manifest)
+            for where_filter in where_filter_intersection.where_filters
+            if WhereFiltersAreParseable._is_batch_parsed(where_filter, valid_granularity_names)
+        )
+
         for metric in semantic_manifest.metrics or []:
             issues += WhereFiltersAreParseable._validate_metric(
-                metric=metric, valid_granularity_names=valid_granularity_names
+                metric=metric,
+                valid_granularity_names=valid_granularity_names,
+                where_sql_template_to_parse_result=where_sql_template_to_parse_result,
             )
         for saved_query in semantic_manifest.saved_queries:
-            issues += WhereFiltersAreParseable._validate_saved_query(saved_query, valid_granularity_names)
+            issues += WhereFiltersAreParseable._validate_saved_query(
+                saved_query, valid_granularity_names, where_sql_template_to_parse_result
+            )
 
         return issues
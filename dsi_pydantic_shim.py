@@ -6,19 +6,47 @@ Pydantic objects from version 1. Throughout the repo, we import those objects fr
 directly, meaning that we essentially only use Pydantic 1 in this repo, but without forcing that restriction on dbt
 users. The development environment for this repo should be pinned to Pydantic 1 to ensure devs get appropriate type
 hints.
+
+With Pydantic 2 installed, setting the environment variable `DSI_PYDANTIC_BACKEND=v2` opts in to backing the
+implementation classes with native Pydantic 2 models instead, which are faster to parse and serialize. The objects
+exported here keep the same Pydantic 1 style API in that mode - see `dbt_semantic_interfaces.pydantic_v2_compat`.
 """
 
+import os
 from importlib.metadata import version
+from typing import TYPE_CHECKING
 
 pydantic_version = version("pydantic")
 # Pydantic uses semantic versioning, i.e. <major>.<minor>.<patch>, and we need to know the major
 pydantic_major = pydantic_version.split(".")[0]
 
-if pydantic_major == "1":
+PYDANTIC_BACKEND_ENV_VAR_NAME = "DSI_PYDANTIC_BACKEND"
+# Either "v1" (the default) or "v2". "v2" is only valid with Pydantic 2 installed.
+pydantic_backend = os.environ.get(PYDANTIC_BACKEND_ENV_VAR_NAME, "v1").lower()
+if pydantic_backend not in ("v1", "v2"):
+    raise RuntimeError(f"{PYDANTIC_BACKEND_ENV_VAR_NAME} should be one of 'v1' or 'v2', but got {pydantic_backend!r}")
+if pydantic_backend == "v2" and pydantic_major != "2":
+    raise RuntimeError(
+        f"{PYDANTIC_BACKEND_ENV_VAR_NAME}=v2 requires pydantic 2 to be installed, but found pydantic {pydantic_version}"
+    )
+
+# Type checking always uses the Pydantic 1 API, so the native backend is hidden from the type checker.
+if not TYPE_CHECKING and pydantic_backend == "v2":
+    from dbt_semantic_interfaces.pydantic_v2_compat import (  # type: ignore  # noqa
+        BaseModel,
+        Extra,
+        Field,
+        PrivateAttr,
+        create_model,
+        root_validator,
+        validator,
+    )
+elif pydantic_major == "1":
     from pydantic import (  # type: ignore  # noqa
         BaseModel,
         Extra,
         Field,
+        PrivateAttr,
         create_model,
         root_validator,
         validator,
@@ -28,6 +56,7 @@ elif pydantic_major == "2":
         BaseModel,
         Extra,
         Field,
+        PrivateAttr,
         create_model,
         root_validator,
         validator,
@@ -0,0 +1,256 @@
+import copy
+import logging
+import pickle
+import time
+import tracemalloc
+from typing import Callable, Tuple, TypeVar
+
+import pytest
+
+from dbt_semantic_interfaces.implementations.elements.dimension import (
+    PydanticDimension,
+    PydanticDimensionTypeParams,
+)
+from dbt_semantic_interfaces.implementations.elements.entity import PydanticEntity
+from dbt_semantic_interfaces.implementations.elements.measure import PydanticMeasure
+from dbt_semantic_interfaces.implementations.metric import (
+    PydanticMetric,
+    PydanticMetricInputMeasure,
+    PydanticMetricTypeParams,
+)
+from dbt_semantic_interfaces.implementations.node_relation import PydanticNodeRelation
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.implementations.semantic_model import (
+    PydanticSemanticModel,
+    PydanticSemanticModelDefaults,
+)
+from dbt_semantic_interfaces.implementations.slotted.metadata import (
+    SlottedNodeRelation,
+    SlottedSemanticLayerElementConfig,
+)
+from dbt_semantic_interfaces.implementations.slotted.semantic_manifest import (
+    SlottedSemanticManifest,
+)
+from dbt_semantic_interfaces.implementations.slotted.where_filter import (
+    SlottedWhereFilter,
+)
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
+    JinjaObjectParser,
+)
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterBatchParser,
+)
+from dbt_semantic_interfaces.transformations.add_parsed_call_parameter_sets import (
+    AddParsedCallParameterSetsRule,
+)
+from dbt_semantic_interfaces.transformations.pydantic_rule_set import (
+    PydanticSemanticManifestTransformRuleSet,
+)
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+from dbt_semantic_interfaces.type_enums import (
+    AggregationType,
+    DimensionType,
+    EntityType,
+    MetricType,
+    TimeGranularity,
+)
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+from tests.example_project_configuration import EXAMPLE_PROJECT_CONFIGURATION
+from tests.test_implements_satisfy_protocols import (
+    RuntimeCheckableDimension,
+    RuntimeCheckableEntity,
+    RuntimeCheckableMeasure,
+    RuntimeCheckableMetadata,
+    RuntimeCheckableMetric,
+    RuntimeCheckableSavedQuery,
+    RuntimeCheckableSemanticManifest,
+    RuntimeCheckableSemanticModel,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def test_slotted_objects_satisfy_protocols(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    semantic_manifest = SlottedSemanticManifest.from_protocol(simple_semantic_manifest)
+
+    assert isinstance(semantic_manifest, RuntimeCheckableSemanticManifest)
+    for semantic_model in semantic_manifest.semantic_models:
+        assert isinstance(semantic_model, RuntimeCheckableSemanticModel)
+        assert all(isinstance(entity, RuntimeCheckableEntity) for entity in semantic_model.entities)
+        assert all(isinstance(measure, RuntimeCheckableMeasure) for measure in semantic_model.measures)
+        assert all(isinstance(dimension, RuntimeCheckableDimension) for dimension in semantic_model.dimensions)
+        if semantic_model.metadata is not None:
+            assert isinstance(semantic_model.metadata, RuntimeCheckableMetadata)
+    assert all(isinstance(metric, RuntimeCheckableMetric) for metric in semantic_manifest.metrics)
+    assert all(isinstance(saved_query, RuntimeCheckableSavedQuery) for saved_query in semantic_manifest.saved_queries)
+
+
+def test_slotted_objects_do_not_have_instance_dicts(  # noqa: D
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    semantic_manifest = SlottedSemanticManifest.from_protocol(simple_semantic_manifest)
+
+    assert not hasattr(semantic_manifest, "__dict__")
+    assert not hasattr(semantic_manifest.semantic_models[0], "__dict__")
+    assert not hasattr(semantic_manifest.semantic_models[0].node_relation, "__dict__")
+    assert not hasattr(semantic_manifest.metrics[0], "__dict__")
+
+
+def test_round_trip_through_slotted_manifest(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    semantic_manifest = SlottedSemanticManifest.from_protocol(simple_semantic_manifest)
+
+    assert semantic_manifest.to_pydantic() == simple_semantic_manifest
+    assert SlottedSemanticManifest.from_json(simple_semantic_manifest.json()) == semantic_manifest
+
+
+def test_copy_and_pickle(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    semantic_manifest = SlottedSemanticManifest.from_protocol(simple_semantic_manifest)
+
+    assert copy.deepcopy(semantic_manifest) == semantic_manifest
+    assert pickle.loads(pickle.dumps(semantic_manifest)) == semantic_manifest
+    assert hash(semantic_manifest) == hash(copy.deepcopy(semantic_manifest))
+
+
+def test_round_trip_with_parsed_call_parameter_sets(  # noqa: D
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    transformed_manifest = PydanticSemanticManifestTransformer.transform(
+        simple_semantic_manifest,
+        ordered_rule_sequences=(
+            *PydanticSemanticManifestTransformRuleSet().all_rules,
+            (AddParsedCallParameterSetsRule(),),
+        ),
+    )
+    semantic_manifest = SlottedSemanticManifest.from_json(transformed_manifest.json())
+    assert semantic_manifest == SlottedSemanticManifest.from_protocol(transformed_manifest)
+    assert semantic_manifest.to_pydantic() == transformed_manifest
+
+    where_filters = [
+        where_filter
+        for _, where_filter_intersection in WhereFilterBatchParser.collect_call_sites(semantic_manifest)
+        for where_filter in where_filter_intersection.where_filters
+    ]
+    assert len(where_filters) > 0
+
+    JinjaObjectParser.clear_call_parameter_sets_cache()
+    for where_filter in where_filters:
+        assert isinstance(where_filter, SlottedWhereFilter)
+        assert where_filter.parsed_call_parameter_sets is not None
+        where_filter.call_parameter_sets(custom_granularity_names=("martian_day",))
+    # None of the templates should have been parsed.
+    assert JinjaObjectParser.call_parameter_sets_cache_stats().misses == 0
+
+
+def test_node_relation_default_relation_name() -> None:  # noqa: D
+    assert SlottedNodeRelation(alias="table", schema_name="schema").relation_name == "schema.table"
+    assert SlottedNodeRelation(alias="table", schema_name="schema", database="db").relation_name == "db.schema.table"
+    assert SlottedNodeRelation(alias="table", schema_name="schema", relation_name="custom").relation_name == "custom"
+
+
+def test_element_config_is_hashable() -> None:  # noqa: D
+    assert hash(SlottedSemanticLayerElementConfig(meta={"a": [1, 2]})) == hash(
+        SlottedSemanticLayerElementConfig(meta={"a": [1, 2]})
+    )
+
+
+@pytest.mark.parametrize(
+    "manifest_fixture_name",
+    ["simple_semantic_manifest", "measure_migrated_manifest", "simple_semantic_manifest__with_primary_transforms"],
+)
+def test_validation_results_match_pydantic_implementation(  # noqa: D
+    manifest_fixture_name: str, request: pytest.FixtureRequest
+) -> None:
+    pydantic_semantic_manifest: PydanticSemanticManifest = request.getfixturevalue(manifest_fixture_name)
+    slotted_semantic_manifest = SlottedSemanticManifest.from_protocol(pydantic_semantic_manifest)
+
+    validator = SemanticManifestValidator[SlottedSemanticManifest]()
+    assert validator.validate_semantic_manifest(slotted_semantic_manifest) == SemanticManifestValidator[
+        PydanticSemanticManifest
+    ]().validate_semantic_manifest(pydantic_semantic_manifest)
+
+
+def _build_synthetic_semantic_manifest(semantic_model_count: int) -> PydanticSemanticManifest:
+    semantic_models = []
+    metrics = []
+    for i in range(semantic_model_count):
+        semantic_models.append(
+            PydanticSemanticModel(
+                name=f"model_{i}",
+                node_relation=PydanticNodeRelation(alias=f"table_{i}", schema_name="schema"),
+                defaults=PydanticSemanticModelDefaults(agg_time_dimension="ds"),
+                primary_entity=None,
+                entities=[
+                    PydanticEntity(name=f"entity_{i}", type=EntityType.PRIMARY),
+                    PydanticEntity(name=f"entity_{i + 1}", type=EntityType.FOREIGN),
+                ],
+                measures=[PydanticMeasure(name=f"measure_{i}", agg=AggregationType.SUM, expr="1")],
+                dimensions=[
+                    PydanticDimension(
+                        name="ds",
+                        type=DimensionType.TIME,
+                        type_params=PydanticDimensionTypeParams(time_granularity=TimeGranularity.DAY),
+                    ),
+                    PydanticDimension(name=f"category_{i}", type=DimensionType.CATEGORICAL),
+                ],
+            )
+        )
+        metrics.append(
+            PydanticMetric(
+                name=f"metric_{i}",
+                type=MetricType.SIMPLE,
+                type_params=PydanticMetricTypeParams(
+                    measure=PydanticMetricInputMeasure(name=f"measure_{i}"),
+                    input_measures=[PydanticMetricInputMeasure(name=f"measure_{i}")],
+                ),
+            )
+        )
+    return PydanticSemanticManifest(
+        semantic_models=semantic_models, metrics=metrics, project_configuration=EXAMPLE_PROJECT_CONFIGURATION
+    )
+
+
+def _measure_construction(build: Callable[[], T]) -> Tuple[T, float, int]:
+    """Builds an object, returning it along with the time taken and the memory retained by the result.
+
+    Tracing allocations slows down construction considerably, so time is measured in a separate, untraced run.
+    """
+    start_time = time.perf_counter()
+    build()
+    elapsed_seconds = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    try:
+        result = build()
+        retained_bytes, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, elapsed_seconds, retained_bytes
+
+
+def test_construct_benchmark_with_large_manifest() -> None:
+    """Compares parsing a serialized 5k semantic model manifest into the Pydantic and slotted implementations."""
+    semantic_manifest_json = _build_synthetic_semantic_manifest(semantic_model_count=5000).json()
+
+    pydantic_semantic_manifest, pydantic_seconds, pydantic_retained_bytes = _measure_construction(
+        lambda: PydanticSemanticManifest.parse_raw(semantic_manifest_json)
+    )
+    del pydantic_semantic_manifest
+    slotted_semantic_manifest, slotted_seconds, slotted_retained_bytes = _measure_construction(
+        lambda: SlottedSemanticManifest.from_json(semantic_manifest_json)
+    )
+
+    logger.info(
+        f"Parsed 5k semantic models - Pydantic: {pydantic_seconds:.2f}s / {pydantic_retained_bytes} bytes, "
+        f"slotted: {slotted_seconds:.2f}s / {slotted_retained_bytes} bytes"
+    )
+    assert len(slotted_semantic_manifest.semantic_models) == 5000
+    # Timing is too noisy to assert on in CI, but retained memory is deterministic enough.
+    assert slotted_retained_bytes < pydantic_retained_bytes
@@ -0,0 +1,63 @@
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from dbt_semantic_interfaces.parsing.batch_parsing import (
+    FileParsingCache,
+    parse_config_yaml_files,
+)
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    FileParsingResult,
+    collect_yaml_config_file_paths,
+    read_yaml_config_file,
+)
+from dbt_semantic_interfaces.parsing.objects import YamlConfigFile
+
+SIMPLE_SEMANTIC_MANIFEST_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "fixtures/semantic_manifest_yamls/simple_semantic_manifest"
+)
+
+
+def _config_files(template_mapping: Dict[str, str]) -> List[YamlConfigFile]:
+    return [
+        read_yaml_config_file(file_path, template_mapping=template_mapping)
+        for file_path in collect_yaml_config_file_paths(SIMPLE_SEMANTIC_MANIFEST_DIRECTORY)
+    ]
+
+
+def _serialize(file_parsing_results: List[Tuple[str, FileParsingResult]]) -> List[Tuple[str, List[str], List[str]]]:
+    return [
+        (
+            file_path,
+            [element.json() for element in parsing_result.elements],
+            [issue.json() for issue in parsing_result.issues],
+        )
+        for file_path, parsing_result in file_parsing_results
+    ]
+
+
+def test_parallel_parsing_matches_sequential_parsing(template_mapping: Dict[str, str]) -> None:  # noqa: D
+    config_files = _config_files(template_mapping)
+    sequential_results = parse_config_yaml_files(config_files)
+    parallel_results = parse_config_yaml_files(config_files, max_workers=2)
+
+    assert [file_path for file_path, _ in sequential_results] == [config_file.filepath for config_file in config_files]
+    assert _serialize(parallel_results) == _serialize(sequential_results)
+
+
+def test_cached_results(tmp_path: Path, template_mapping: Dict[str, str]) -> None:  # noqa: D
+    config_files = _config_files(template_mapping)
+    cache = FileParsingCache(str(tmp_path / "cache"))
+    uncached_results = parse_config_yaml_files(config_files, cache=cache)
+    assert all(cache.get(config_file) is not None for config_file in config_files)
+    assert _serialize(parse_config_yaml_files(config_files, cache=cache)) == _serialize(uncached_results)
+
+    # A file with different contents isn't in the cache.
+    changed_config_file = YamlConfigFile(filepath=config_files[0].filepath, contents=config_files[0].contents + "\n")
+    assert cache.get(changed_config_file) is None
+
+    # Entries that can't be read are ignored.
+    for entry_name in os.listdir(tmp_path / "cache"):
+        (tmp_path / "cache" / entry_name).write_bytes(b"not a pickle")
+    assert cache.get(config_files[0]) is None
+    assert _serialize(parse_config_yaml_files(config_files, cache=cache)) == _serialize(uncached_results)
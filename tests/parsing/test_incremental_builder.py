@@ -0,0 +1,147 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    parse_directory_of_yaml_files_to_semantic_manifest,
+)
+from dbt_semantic_interfaces.parsing.incremental_builder import (
+    IncrementalManifestBuilder,
+)
+from dbt_semantic_interfaces.validations.validator_helpers import FileContext
+
+SIMPLE_SEMANTIC_MANIFEST_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "fixtures/semantic_manifest_yamls/simple_semantic_manifest"
+)
+
+
+@pytest.fixture
+def project_directory(tmp_path: Path) -> Path:
+    """A copy of the simple semantic manifest that can be modified."""
+    directory = tmp_path / "project"
+    shutil.copytree(SIMPLE_SEMANTIC_MANIFEST_DIRECTORY, directory)
+    return directory
+
+
+def _change_file(path: Path, old: str, new: str) -> None:
+    contents = path.read_text()
+    assert old in contents
+    path.write_text(contents.replace(old, new, 1))
+    # Make sure that the change is seen even if the file system has a coarse modification time.
+    stat_result = os.stat(path)
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+
+def test_incremental_updates(project_directory: Path, template_mapping: Dict[str, str]) -> None:  # noqa: D
+    builder = IncrementalManifestBuilder(str(project_directory), template_mapping=template_mapping)
+    assert builder.last_result is None
+
+    result = builder.update()
+    assert len(result.reparsed_file_paths) == len(builder.file_paths) > 1
+    assert not result.issues.has_blocking_issues
+    expected_semantic_manifest = parse_directory_of_yaml_files_to_semantic_manifest(
+        str(project_directory), template_mapping=template_mapping
+    ).semantic_manifest
+    assert result.semantic_manifest is not None
+    # The files are parsed in the order of their paths, so the order of the objects may be different.
+    for attribute_name in ("semantic_models", "metrics", "saved_queries"):
+        assert sorted(getattr(result.semantic_manifest, attribute_name), key=lambda obj: obj.name) == sorted(
+            getattr(expected_semantic_manifest, attribute_name), key=lambda obj: obj.name
+        )
+    assert result.semantic_manifest.project_configuration == expected_semantic_manifest.project_configuration
+
+    # Nothing changed, or only the modification time changed.
+    metrics_path = project_directory / "metrics.yaml"
+    os.utime(metrics_path, ns=(0, 0))
+    unchanged_result = builder.update()
+    assert not unchanged_result.changed
+    assert unchanged_result.semantic_manifest is result.semantic_manifest
+
+    # Only the changed file is parsed again.
+    _change_file(metrics_path, 'description: "bookings metric"', 'description: "changed bookings metric"')
+    result = builder.update()
+    assert result.reparsed_file_paths == (str(metrics_path),)
+    assert result.semantic_manifest is not None
+    bookings = next(metric for metric in result.semantic_manifest.metrics if metric.name == "bookings")
+    assert bookings.description == "changed bookings metric"
+
+    # Added and removed files.
+    new_metric_path = project_directory / "new_metric.yml"
+    new_metric_path.write_text("metric:\n  name: new_bookings\n  type: simple\n  type_params:\n    measure: bookings\n")
+    result = builder.update([str(new_metric_path), str(project_directory / "README.md")])
+    assert result.reparsed_file_paths == (str(new_metric_path),)
+    assert result.semantic_manifest is not None
+    assert "new_bookings" in {metric.name for metric in result.semantic_manifest.metrics}
+
+    new_metric_path.unlink()
+    result = builder.update()
+    assert result.removed_file_paths == (str(new_metric_path),)
+    assert result.semantic_manifest is not None
+    assert "new_bookings" not in {metric.name for metric in result.semantic_manifest.metrics}
+
+
+def test_incremental_update_with_issues(project_directory: Path, template_mapping: Dict[str, str]) -> None:
+    """Checks that parsing and validation issues are reported, and that fixing them removes them."""
+    builder = IncrementalManifestBuilder(str(project_directory), template_mapping=template_mapping)
+    builder.update()
+
+    metrics_path = project_directory / "metrics.yaml"
+    original_contents = metrics_path.read_text()
+    _change_file(metrics_path, "type_params:", "unknown_key: 1\n  type_params:")
+    result = builder.update([str(metrics_path)])
+    assert result.issues.has_blocking_issues
+    assert any(
+        isinstance(issue.context, FileContext) and issue.context.file_name == str(metrics_path)
+        for issue in result.issues.errors
+    )
+
+    metrics_path.write_text(original_contents)
+    result = builder.update([str(metrics_path)])
+    assert not result.issues.has_blocking_issues
+
+    # Without a project configuration, the manifest can't be built.
+    (project_directory / "project_configuration.yaml").unlink()
+    result = builder.update()
+    assert result.semantic_manifest is None
+    assert "Did not find exactly one project configuration" in result.issues.errors[0].message
+
+
+def test_incremental_update_with_unreadable_files(  # noqa: D
+    project_directory: Path, template_mapping: Dict[str, str]
+) -> None:
+    builder = IncrementalManifestBuilder(str(project_directory), template_mapping=template_mapping)
+    builder.update()
+
+    metrics_path = project_directory / "metrics.yaml"
+    _change_file(metrics_path, 'description: "bookings metric"', 'description: "changed bookings metric"')
+    missing_variable_path = project_directory / "missing_variable.yaml"
+    missing_variable_path.write_text("metric:\n  name: $missing_variable\n")
+    invalid_placeholder_path = project_directory / "invalid_placeholder.yaml"
+    invalid_placeholder_path.write_text("metric:\n  description: costs $ amount\n")
+
+    result = builder.update()
+    assert set(result.reparsed_file_paths) == {
+        str(metrics_path),
+        str(missing_variable_path),
+        str(invalid_placeholder_path),
+    }
+    error_messages = {
+        issue.context.file_name: issue.message
+        for issue in result.issues.errors
+        if isinstance(issue.context, FileContext)
+    }
+    assert "missing_variable" in error_messages[str(missing_variable_path)]
+    assert "Invalid placeholder" in error_messages[str(invalid_placeholder_path)]
+
+    # The other changes are applied, and are kept once the files are fixed.
+    missing_variable_path.unlink()
+    invalid_placeholder_path.unlink()
+    result = builder.update()
+    assert result.changed
+    assert not result.issues.has_blocking_issues
+    assert result.semantic_manifest is not None
+    bookings = next(metric for metric in result.semantic_manifest.metrics if metric.name == "bookings")
+    assert bookings.description == "changed bookings metric"
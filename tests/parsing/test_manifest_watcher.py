@@ -0,0 +1,175 @@
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from dbt_semantic_interfaces.parsing.incremental_builder import (
+    IncrementalBuildResult,
+    IncrementalManifestBuilder,
+)
+from dbt_semantic_interfaces.parsing.manifest_watcher import (
+    DirectoryPoller,
+    ManifestWatcher,
+    WatchUpdate,
+    diff_issues,
+)
+from dbt_semantic_interfaces.validations.validator_helpers import (
+    FileContext,
+    SemanticManifestValidationResults,
+    ValidationError,
+    ValidationWarning,
+)
+
+SIMPLE_SEMANTIC_MANIFEST_DIRECTORY = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "fixtures/semantic_manifest_yamls/simple_semantic_manifest"
+)
+
+
+@pytest.fixture
+def project_directory(tmp_path: Path) -> Path:
+    """A copy of the simple semantic manifest that can be modified."""
+    directory = tmp_path / "project"
+    shutil.copytree(SIMPLE_SEMANTIC_MANIFEST_DIRECTORY, directory)
+    return directory
+
+
+def _write_file(path: Path, contents: str) -> None:
+    path.write_text(contents)
+    # Make sure that the change is seen even if the file system has a coarse modification time.
+    stat_result = os.stat(path)
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+
+
+class _FakeClock:
+    """A clock that only advances when `sleep` is called."""
+
+    def __init__(self) -> None:  # noqa: D107
+        self.now = 0.0
+        self.sleep_count = 0
+
+    def sleep(self, seconds: float) -> None:  # noqa: D
+        self.now += seconds
+        self.sleep_count += 1
+
+    def time(self) -> float:  # noqa: D
+        return self.now
+
+
+def test_directory_poller(project_directory: Path) -> None:  # noqa: D
+    poller = DirectoryPoller(str(project_directory))
+    assert poller.poll() == set()
+
+    metrics_path = project_directory / "metrics.yaml"
+    _write_file(metrics_path, metrics_path.read_text() + "\n")
+    new_path = project_directory / "semantic_models" / "new.yaml"
+    _write_file(new_path, "")
+    (project_directory / "saved_queries.yaml").unlink()
+    _write_file(project_directory / "notes.txt", "")
+
+    assert poller.poll() == {
+        str(metrics_path),
+        str(new_path),
+        str(project_directory / "saved_queries.yaml"),
+    }
+    assert poller.poll() == set()
+
+
+def test_diff_issues() -> None:  # noqa: D
+    error = ValidationError(context=FileContext(file_name="metrics.yaml", line_number=3), message="An error")
+    moved_error = ValidationError(context=FileContext(file_name="metrics.yaml", line_number=5), message="An error")
+    warning = ValidationWarning(message="A warning")
+
+    issue_diff = diff_issues(
+        SemanticManifestValidationResults(errors=(error,), warnings=(warning,)),
+        SemanticManifestValidationResults(errors=(moved_error, error)),
+    )
+    assert issue_diff.new_issues == (error,)
+    assert issue_diff.resolved_issues == (warning,)
+
+    assert diff_issues(
+        SemanticManifestValidationResults(errors=(error,)), SemanticManifestValidationResults(errors=(moved_error,))
+    ).is_empty
+
+
+def test_watch(project_directory: Path, template_mapping: Dict[str, str]) -> None:  # noqa: D
+    clock = _FakeClock()
+    watcher = ManifestWatcher(
+        IncrementalManifestBuilder(str(project_directory), template_mapping=template_mapping),
+        poll_interval_seconds=0.1,
+        debounce_seconds=0.25,
+        sleep=clock.sleep,
+        clock=clock.time,
+    )
+    metrics_path = project_directory / "metrics.yaml"
+    original_metrics = metrics_path.read_text()
+    broken_metrics = original_metrics.replace("name: bookings\n", "name: does_not_exist\n")
+    assert broken_metrics != original_metrics
+
+    updates: List[WatchUpdate] = []
+
+    def _on_update(update: WatchUpdate) -> None:
+        updates.append(update)
+        if len(updates) == 1:
+            # Several writes to the file are handled in one update.
+            _write_file(metrics_path, original_metrics + "\n")
+            _write_file(metrics_path, broken_metrics)
+        elif len(updates) == 2:
+            _write_file(metrics_path, original_metrics)
+
+    watcher.watch(_on_update, should_stop=lambda: len(updates) == 3)
+
+    initial_update, broken_update, fixed_update = updates
+    assert initial_update.issue_diff.new_issues == initial_update.build_result.issues.all_issues
+    assert not initial_update.build_result.issues.has_blocking_issues
+
+    assert broken_update.build_result.reparsed_file_paths == (str(metrics_path),)
+    new_errors = [issue for issue in broken_update.issue_diff.new_issues if isinstance(issue, ValidationError)]
+    assert len(new_errors) > 0
+
+    assert fixed_update.build_result.reparsed_file_paths == (str(metrics_path),)
+    assert all(error in fixed_update.issue_diff.resolved_issues for error in new_errors)
+    assert not fixed_update.build_result.issues.has_blocking_issues
+    # The changes are only handled after the debounce time without further changes.
+    assert clock.sleep_count >= 2 * 4
+
+
+def test_watch_continues_after_failures(  # noqa: D
+    project_directory: Path, template_mapping: Dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    builder = IncrementalManifestBuilder(str(project_directory), template_mapping=template_mapping)
+    watcher = ManifestWatcher(builder)
+    watcher.update()
+
+    # A file saved with a stray `$` is reported as an error in that file.
+    metrics_path = project_directory / "metrics.yaml"
+    original_metrics = metrics_path.read_text()
+    _write_file(metrics_path, original_metrics.replace('"bookings metric"', '"costs $ amount"'))
+    update = watcher.update([str(metrics_path)])
+    assert any(
+        issue.message.startswith("Unable to read the file: Invalid placeholder")
+        for issue in update.issue_diff.new_issues
+    )
+
+    # An update that fails is reported as an error, and the next update checks all files.
+    original_update = builder.update
+    update_calls: List[Optional[List[str]]] = []
+
+    def _failing_update(changed_file_paths: Optional[List[str]] = None) -> IncrementalBuildResult:
+        update_calls.append(changed_file_paths)
+        if len(update_calls) == 1:
+            raise RuntimeError("Unexpected failure")
+        return original_update(changed_file_paths)
+
+    monkeypatch.setattr(builder, "update", _failing_update)
+    _write_file(metrics_path, original_metrics)
+    failed_update = watcher.update([str(metrics_path)])
+    assert failed_update.build_result.semantic_manifest is None
+    assert "Unexpected failure" in failed_update.issue_diff.new_issues[0].message
+
+    fixed_update = watcher.update([])
+    assert update_calls == [[str(metrics_path)], None]
+    assert fixed_update.build_result.reparsed_file_paths == (str(metrics_path),)
+    assert failed_update.issue_diff.new_issues[0] in fixed_update.issue_diff.resolved_issues
+    assert not fixed_update.build_result.issues.has_blocking_issues
@@ -0,0 +1,260 @@
+import logging
+import re
+import time
+from typing import Tuple
+
+import pytest
+from hypothesis import HealthCheck, given, settings
+from hypothesis import strategies as st
+from typing_extensions import override
+
+from dbt_semantic_interfaces.parsing.text_input.description_renderer import (
+    QueryItemDescriptionRenderer,
+)
+from dbt_semantic_interfaces.parsing.text_input.rendering_helper import (
+    ObjectBuilderJinjaRenderHelper,
+)
+from dbt_semantic_interfaces.parsing.text_input.ti_description import (
+    ObjectBuilderItemDescription,
+)
+from dbt_semantic_interfaces.parsing.text_input.ti_exceptions import (
+    QueryItemJinjaException,
+)
+from dbt_semantic_interfaces.parsing.text_input.ti_parser import (
+    ObjectBuilderTemplateParser,
+)
+from dbt_semantic_interfaces.parsing.text_input.ti_processor import (
+    ObjectBuilderTextProcessor,
+    _CollectDescriptionProcessor,
+)
+from dbt_semantic_interfaces.parsing.text_input.valid_method import (
+    ConfiguredValidMethodMapping,
+    ValidMethodMapping,
+)
+
+logger = logging.getLogger(__name__)
+
+_VALID_METHOD_MAPPINGS = (
+    ConfiguredValidMethodMapping.DEFAULT_MAPPING,
+    ConfiguredValidMethodMapping.DEFAULT_MAPPING_FOR_ORDER_BY,
+)
+
+
+def _process(template: str, valid_method_mapping: ValidMethodMapping, use_jinja: bool) -> Tuple:
+    """Return the rendered output and descriptions, or the exception raised while processing the template.
+
+    The descriptions are compared using `repr` as Jinja can pass in undefined values that can't be compared. Memory
+    addresses are removed as Jinja can render objects like methods.
+    """
+    text_processor = ObjectBuilderTextProcessor()
+    description_processor = _CollectDescriptionProcessor()
+    try:
+        if use_jinja:
+            rendered = text_processor._process_template_using_jinja(
+                jinja_template=template,
+                render_helper=ObjectBuilderJinjaRenderHelper(
+                    description_processor=description_processor, valid_method_mapping=valid_method_mapping
+                ),
+            )
+        else:
+            rendered = text_processor._process_template(
+                jinja_template=template,
+                valid_method_mapping=valid_method_mapping,
+                description_processor=description_processor,
+            )
+    except Exception as e:
+        return ("error", type(e), str(e))
+    return ("ok", re.sub("0x[0-9a-f]+", "0x", rendered), repr(description_processor.collected_descriptions()))
+
+
+def _assert_same_result_as_jinja(template: str) -> None:
+    for valid_method_mapping in _VALID_METHOD_MAPPINGS:
+        assert _process(template, valid_method_mapping, use_jinja=False) == _process(
+            template, valid_method_mapping, use_jinja=True
+        ), f"Got different results for template: {template!r}"
+
+
+_whitespace = st.sampled_from(["", " ", "  ", "\n", "\t"])
+_string_values = st.sampled_from(
+    [
+        "'listing__country'",
+        '"metric_time"',
+        "'user__created_at'",
+        "'listing'",
+        "'day'",
+        "'DAY'",
+        "'month'",
+        "'martian_year'",
+        "'bookings'",
+        "''",
+        "'a}}b'",
+        "'é'",
+        "'with\\'escape'",
+    ]
+)
+_constant_values = st.sampled_from(["True", "False", "None", "true", "false", "none", "1", "x"])
+_values = st.recursive(
+    st.one_of(_string_values, _constant_values),
+    lambda children: st.one_of(
+        st.lists(children, max_size=3).map(lambda items: "[" + ", ".join(items) + "]"),
+        st.lists(children, max_size=3).map(lambda items: "[" + ", ".join(items) + ",]"),
+        st.lists(children, max_size=3).map(lambda items: "(" + ", ".join(items) + ")"),
+        st.lists(children, max_size=3).map(lambda items: "(" + ", ".join(items) + ",)"),
+    ),
+    max_leaves=4,
+)
+_keywords = st.sampled_from(
+    [
+        "name",
+        "entity_path",
+        "time_dimension_name",
+        "time_granularity_name",
+        "date_part_name",
+        "descending",
+        "entity_name",
+        "metric_name",
+        "group_by",
+        "unknown",
+        "not",
+    ]
+)
+_arguments = st.tuples(st.lists(_values, max_size=3), st.lists(st.tuples(_keywords, _values), max_size=3)).map(
+    lambda args_and_kwargs: ", ".join(
+        list(args_and_kwargs[0]) + [f"{keyword}={value}" for keyword, value in args_and_kwargs[1]]
+    )
+)
+_calls = st.builds(
+    lambda builder, ws, arguments, methods: builder + ws + "(" + arguments + ")" + "".join(methods),
+    st.sampled_from(["Dimension", "TimeDimension", "Entity", "Metric", "dimension", "Unknown"]),
+    _whitespace,
+    _arguments,
+    st.lists(
+        st.builds(
+            lambda ws, method, arguments: ws + "." + method + "(" + arguments + ")",
+            _whitespace,
+            st.sampled_from(["grain", "date_part", "descending", "unknown", "_private"]),
+            _arguments,
+        ),
+        max_size=3,
+    ),
+)
+_expressions = st.builds(
+    lambda start, ws0, call, suffix, ws1, end: start + ws0 + call + suffix + ws1 + end,
+    st.sampled_from(["{{", "{{", "{{", "{{-", "{%"]),
+    _whitespace,
+    _calls,
+    st.sampled_from(["", "", "", " | lower", " + 1", "()", "['a']", ".grain"]),
+    _whitespace,
+    st.sampled_from(["}}", "}}", "}}", "-}}", "}", "%}"]),
+)
+_literals = st.sampled_from(["", " = 'US'", " AND ", "\n", "{", "}", "'{{'", "{# comment #}", "\r\n", "}}"])
+_templates = st.lists(st.one_of(_expressions, _literals), max_size=5).map("".join)
+
+
+@settings(max_examples=200, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(template=_templates)
+def test_same_result_as_jinja(template: str) -> None:
+    """Differential test that generates templates from grammar fragments, many of which are invalid."""
+    _assert_same_result_as_jinja(template)
+
+
+@settings(max_examples=200, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+@given(template=st.text(alphabet="{}()[]'\",.=_ \n-DimensionTmgraE", max_size=40))
+def test_same_result_as_jinja_for_arbitrary_text(template: str) -> None:  # noqa: D
+    _assert_same_result_as_jinja(template)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{{ Dimension('listing__country') }} = 'US'",
+        "{{ Dimension('listing__created_at', entity_path=['host']).grain('day').date_part('day') }} > '2020-01-01'\n",
+        "{{ TimeDimension('metric_time', 'month') }} > '2020' AND {{ Entity('listing', entity_path=('user',)) }} = 1",
+        "{{ Metric('bookings', group_by=['listing']) }} > 2 OR {{ Dimension('listing__country').descending(True) }}",
+        "{{Dimension(\n'a__b',\n)}}",
+        "no object-builder items",
+    ],
+)
+def test_common_templates_are_parsed(template: str) -> None:
+    """Checks that typical filters are handled by the parser rather than falling back to Jinja."""
+    assert ObjectBuilderTemplateParser().parse(template) is not None
+    _assert_same_result_as_jinja(template)
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{% if True %}{{ Dimension('a__b') }}{% endif %}",
+        "{{ Dimension('a__b') | lower }}",
+        "{{- Dimension('a__b') }}",
+        "{{ Dimension('a\\'b') }}",
+        "{{ Dimension('a__b').unknown('c') }}",
+        "{{ Dimension(name='a__b', name='c__d') }}",
+        "{{ Dimension(name='a__b', 'c') }}",
+        "{{ Dimension('a__b' }}",
+    ],
+)
+def test_templates_outside_grammar_use_jinja(template: str) -> None:  # noqa: D
+    assert ObjectBuilderTemplateParser().parse(template) is None
+    _assert_same_result_as_jinja(template)
+
+
+def test_template_processing_benchmark() -> None:  # noqa: D
+    templates = [
+        f"{{{{ Dimension('listing__country_{i}') }}}} = 'US' AND {{{{ TimeDimension('metric_time', 'day') }}}} > '2020'"
+        for i in range(1000)
+    ]
+    for use_jinja in (True, False):
+        start_time = time.perf_counter()
+        for template in templates:
+            _process(template, ConfiguredValidMethodMapping.DEFAULT_MAPPING, use_jinja=use_jinja)
+        logger.info(
+            f"Processed {len(templates)} templates {'with' if use_jinja else 'without'} Jinja in "
+            f"{time.perf_counter() - start_time:.3f}s"
+        )
+
+
+class _NameRenderer(QueryItemDescriptionRenderer):
+    @override
+    def render_description(self, item_description: ObjectBuilderItemDescription) -> str:
+        return item_description.item_name
+
+
+@pytest.mark.parametrize(
+    "template",
+    [
+        "{{ Dimension('listing__country') }} = 'US'",
+        "{# Uses Jinja #}{{ Dimension('listing__country') }} = 'US'",
+    ],
+)
+def test_render_template(template: str) -> None:  # noqa: D
+    rendered = ObjectBuilderTextProcessor().render_template(
+        jinja_template=template,
+        renderer=_NameRenderer(),
+        valid_method_mapping=ConfiguredValidMethodMapping.DEFAULT_MAPPING,
+    )
+    assert rendered == "listing__country = 'US'"
+
+
+def test_compiled_template_cache() -> None:  # noqa: D
+    ObjectBuilderTextProcessor.clear_compiled_template_cache()
+    text_processor = ObjectBuilderTextProcessor()
+    template = "{% if True %}{{ Dimension('listing__country') }}{% endif %} = 'US'"
+    for _ in range(3):
+        descriptions = text_processor.collect_descriptions_from_template(
+            jinja_template=template, valid_method_mapping=ConfiguredValidMethodMapping.DEFAULT_MAPPING
+        )
+        assert [description.item_name for description in descriptions] == ["listing__country"]
+    stats = ObjectBuilderTextProcessor.compiled_template_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (2, 1, 1)
+
+    # Templates that can't be compiled are not cached.
+    for _ in range(2):
+        with pytest.raises(QueryItemJinjaException):
+            text_processor.collect_descriptions_from_template(
+                jinja_template="{% if True %}", valid_method_mapping=ConfiguredValidMethodMapping.DEFAULT_MAPPING
+            )
+    assert ObjectBuilderTextProcessor.compiled_template_cache_stats().size == 1
+
+    ObjectBuilderTextProcessor.clear_compiled_template_cache()
+    assert ObjectBuilderTextProcessor.compiled_template_cache_stats().size == 0
@@ -0,0 +1,196 @@
+import copy
+import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, List
+
+import pytest
+
+from dbt_semantic_interfaces.call_parameter_sets import ParseJinjaObjectException
+from dbt_semantic_interfaces.implementations.filters.where_filter import (
+    PydanticWhereFilter,
+    PydanticWhereFilterIntersection,
+)
+from dbt_semantic_interfaces.implementations.metric import (
+    PydanticMetric,
+    PydanticMetricInput,
+    PydanticMetricTypeParams,
+)
+from dbt_semantic_interfaces.implementations.saved_query import (
+    PydanticSavedQuery,
+    PydanticSavedQueryQueryParams,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
+    JinjaObjectParser,
+)
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterBatchParser,
+    WhereFilterCallSite,
+    WhereFilterCallSiteType,
+)
+from dbt_semantic_interfaces.type_enums import MetricType
+
+logger = logging.getLogger(__name__)
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Executor that records the number of tasks that were submitted."""
+
+    def __init__(self) -> None:  # noqa: D107
+        super().__init__(max_workers=2)
+        self.submitted_task_count = 0
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:  # noqa: D102
+        self.submitted_task_count += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+def _where(*where_sql_templates: str) -> PydanticWhereFilterIntersection:
+    return PydanticWhereFilterIntersection(
+        where_filters=[
+            PydanticWhereFilter(where_sql_template=where_sql_template) for where_sql_template in where_sql_templates
+        ]
+    )
+
+
+@pytest.fixture
+def manifest_with_repeated_filters(  # noqa: D
+    simple_semantic_manifest__with_primary_transforms: PydanticSemanticManifest,
+) -> PydanticSemanticManifest:
+    manifest = copy.deepcopy(simple_semantic_manifest__with_primary_transforms)
+    manifest.metrics.append(
+        PydanticMetric(
+            name="derived_metric_with_filters",
+            type=MetricType.DERIVED,
+            type_params=PydanticMetricTypeParams(
+                expr="bookings - bookings_2",
+                metrics=[
+                    PydanticMetricInput(name="bookings", filter=_where("{{ Dimension('booking__is_instant') }}")),
+                    PydanticMetricInput(
+                        name="bookings",
+                        alias="bookings_2",
+                        filter=_where("{{ Dimension('booking__is_instant') }}", "{{ invalid_jinja }}"),
+                    ),
+                ],
+            ),
+            filter=_where("{{ Dimension('booking__is_instant') }}"),
+        )
+    )
+    manifest.saved_queries = [
+        PydanticSavedQuery(
+            name="saved_query_with_filters",
+            query_params=PydanticSavedQueryQueryParams(
+                metrics=["bookings"],
+                where=_where("{{ Dimension('booking__is_instant') }}", "{{ TimeDimension('metric_time', 'day') }}"),
+            ),
+        ),
+    ]
+    return manifest
+
+
+def test_results_match_filter_intersections(manifest_with_repeated_filters: PydanticSemanticManifest) -> None:
+    """Checks that the results for each call site are the same as the ones from the filter intersection."""
+    call_sites = WhereFilterBatchParser.collect_call_sites(manifest_with_repeated_filters)
+    call_site_to_result = WhereFilterBatchParser(custom_granularity_names=()).parse_call_sites(call_sites)
+    assert len(call_site_to_result) == len(call_sites)
+
+    for call_site, where_filter_intersection in call_sites:
+        result = call_site_to_result[call_site]
+        assert [parse_result.where_sql_template for parse_result in result.where_filter_results] == [
+            where_filter.where_sql_template for where_filter in where_filter_intersection.where_filters
+        ]
+        if any(parse_result.exception is not None for parse_result in result.where_filter_results):
+            with pytest.raises(ParseJinjaObjectException):
+                where_filter_intersection.filter_expression_parameter_sets(custom_granularity_names=())
+            with pytest.raises(ParseJinjaObjectException):
+                result.filter_expression_parameter_sets()
+        else:
+            assert result.filter_expression_parameter_sets() == list(
+                where_filter_intersection.filter_expression_parameter_sets(custom_granularity_names=())
+            )
+
+
+def test_call_sites(manifest_with_repeated_filters: PydanticSemanticManifest) -> None:  # noqa: D
+    call_site_to_result = WhereFilterBatchParser(custom_granularity_names=()).parse_semantic_manifest(
+        manifest_with_repeated_filters
+    )
+    input_metric_call_site = WhereFilterCallSite(
+        call_site_type=WhereFilterCallSiteType.INPUT_METRIC,
+        element_name="derived_metric_with_filters",
+        input_name="bookings",
+        input_index=1,
+    )
+    assert [
+        parse_result.exception is None
+        for parse_result in call_site_to_result[input_metric_call_site].where_filter_results
+    ] == [True, False]
+    assert (
+        WhereFilterCallSite(call_site_type=WhereFilterCallSiteType.SAVED_QUERY, element_name="saved_query_with_filters")
+        in call_site_to_result
+    )
+    assert (
+        WhereFilterCallSite(call_site_type=WhereFilterCallSiteType.METRIC, element_name="derived_metric_with_filters")
+        in call_site_to_result
+    )
+
+
+def test_distinct_templates_are_parsed_once(manifest_with_repeated_filters: PydanticSemanticManifest) -> None:
+    """Checks that each distinct template is parsed once when using an executor."""
+    call_sites = WhereFilterBatchParser.collect_call_sites(manifest_with_repeated_filters)
+    distinct_where_sql_templates = {
+        where_filter.where_sql_template
+        for _, where_filter_intersection in call_sites
+        for where_filter in where_filter_intersection.where_filters
+    }
+    with _CountingExecutor() as executor:
+        call_site_to_result = WhereFilterBatchParser(custom_granularity_names=(), executor=executor).parse_call_sites(
+            call_sites
+        )
+    assert executor.submitted_task_count == len(distinct_where_sql_templates)
+
+    # Exceptions are compared by identity, so compare the types instead.
+    expected_call_site_to_result = WhereFilterBatchParser(custom_granularity_names=()).parse_call_sites(call_sites)
+    assert {
+        call_site: [
+            (parse_result.where_sql_template, parse_result.call_parameter_sets, type(parse_result.exception))
+            for parse_result in result.where_filter_results
+        ]
+        for call_site, result in call_site_to_result.items()
+    } == {
+        call_site: [
+            (parse_result.where_sql_template, parse_result.call_parameter_sets, type(parse_result.exception))
+            for parse_result in result.where_filter_results
+        ]
+        for call_site, result in expected_call_site_to_result.items()
+    }
+
+
+def test_batch_parsing_benchmark() -> None:
+    """Compares parsing filters one at a time with parsing them as a batch, where there are many repeated filters."""
+    where_filter_intersections: List[PydanticWhereFilterIntersection] = [
+        _where(
+            f"{{{{ Dimension('listing__country_{i % 100}') }}}} = 'US'",
+            f"{{{{ TimeDimension('metric_time', 'day') }}}} > '2020-0{i % 9 + 1}-01'",
+        )
+        for i in range(5000)
+    ]
+    call_sites = [
+        (WhereFilterCallSite(call_site_type=WhereFilterCallSiteType.METRIC, element_name=f"metric_{i}"), intersection)
+        for i, intersection in enumerate(where_filter_intersections)
+    ]
+
+    JinjaObjectParser.clear_call_parameter_sets_cache()
+    start_time = time.perf_counter()
+    for where_filter_intersection in where_filter_intersections:
+        where_filter_intersection.filter_expression_parameter_sets(custom_granularity_names=())
+    logger.info(
+        f"Parsed {len(call_sites)} filter intersections one at a time in {time.perf_counter() - start_time:.3f}s"
+    )
+
+    JinjaObjectParser.clear_call_parameter_sets_cache()
+    start_time = time.perf_counter()
+    WhereFilterBatchParser(custom_granularity_names=()).parse_call_sites(call_sites)
+    logger.info(f"Parsed {len(call_sites)} filter intersections as a batch in {time.perf_counter() - start_time:.3f}s")
@@ -10,6 +10,8 @@ This module tests the various combinations we might encounter in the wild, with
 on inputs to parse_obj or parse_raw, as that is what the pydantic models will generally encounter.
 """
 
+import logging
+import time
 from typing import Tuple, Union
 
 import pytest
@@ -25,6 +27,9 @@ from dbt_semantic_interfaces.implementations.filters.where_filter import (
     PydanticWhereFilter,
     PydanticWhereFilterIntersection,
 )
+from dbt_semantic_interfaces.parsing.text_input.ti_processor import (
+    ObjectBuilderTextProcessor,
+)
 from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
     JinjaObjectParser,
     QueryItemLocation,
@@ -38,6 +43,8 @@ from dbt_semantic_interfaces.references import (
 )
 from dbt_semantic_interfaces.type_enums import DatePart, TimeGranularity
 
+logger = logging.getLogger(__name__)
+
 __BOOLEAN_EXPRESSION__ = "1 > 0"
 
 
@@ -312,3 +319,78 @@ def test_order_by_params() -> None:  # noqa
         entity_path=(EntityReference(element_name="entity"),),
         descending=True,
     )
+
+
+def test_call_parameter_sets_cache() -> None:  # noqa: D
+    JinjaObjectParser.clear_call_parameter_sets_cache()
+    where_sql_template = "{{ Dimension('listing__country') }} = 'US'"
+    for query_item_location in (
+        QueryItemLocation.NON_ORDER_BY,
+        QueryItemLocation.NON_ORDER_BY,
+        QueryItemLocation.ORDER_BY,
+    ):
+        param_sets = JinjaObjectParser.parse_call_parameter_sets(
+            where_sql_template, custom_granularity_names=(), query_item_location=query_item_location
+        )
+        assert param_sets.dimension_call_parameter_sets[0].dimension_reference == DimensionReference(
+            element_name="country"
+        )
+    stats = JinjaObjectParser.call_parameter_sets_cache_stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 2)
+
+    # Custom granularity names affect the result, so they're part of the key.
+    JinjaObjectParser.parse_call_parameter_sets(
+        where_sql_template, custom_granularity_names=("martian_day",), query_item_location=QueryItemLocation.ORDER_BY
+    )
+    assert JinjaObjectParser.call_parameter_sets_cache_stats().misses == 3
+
+    JinjaObjectParser.clear_call_parameter_sets_cache()
+    assert JinjaObjectParser.call_parameter_sets_cache_stats().size == 0
+
+
+def test_where_filter_call_parameter_sets_are_memoized() -> None:  # noqa: D
+    where_filter = PydanticWhereFilter(where_sql_template="{{ Dimension('listing__country') }} = 'US'")
+    param_sets = where_filter.call_parameter_sets(custom_granularity_names=())
+    assert where_filter.call_parameter_sets(custom_granularity_names=()) is param_sets
+
+    # The cache should not change how the filter is compared or serialized.
+    assert where_filter == PydanticWhereFilter(where_sql_template=where_filter.where_sql_template)
+    assert hash(where_filter) == hash(PydanticWhereFilter(where_sql_template=where_filter.where_sql_template))
+    assert where_filter.json() == PydanticWhereFilter(where_sql_template=where_filter.where_sql_template).json()
+
+    copied_filter = where_filter.copy(update={"where_sql_template": "{{ Entity('listing') }} = 1"})
+    copied_param_sets = copied_filter.call_parameter_sets(custom_granularity_names=())
+    assert copied_param_sets.dimension_call_parameter_sets == ()
+    assert copied_param_sets.entity_call_parameter_sets[0].entity_reference == EntityReference(element_name="listing")
+
+
+def test_jinja_where_filter_parsing_benchmark() -> None:
+    """Compares parsing filters that need Jinja with and without the cache of compiled templates."""
+    where_sql_templates = [
+        f"{{# Filter {i % 50} #}}{{{{ Dimension('listing__country_{i % 50}') }}}} = 'US' "
+        f"AND {{{{ TimeDimension('metric_time', 'day') }}}} > '2020-01-01'"
+        for i in range(2000)
+    ]
+    results = []
+    for use_compiled_template_cache in (False, True):
+        ObjectBuilderTextProcessor.clear_compiled_template_cache()
+        start_time = time.perf_counter()
+        param_sets = []
+        for where_sql_template in where_sql_templates:
+            # Clear the cache of results so that each template is processed.
+            JinjaObjectParser.clear_call_parameter_sets_cache()
+            if not use_compiled_template_cache:
+                ObjectBuilderTextProcessor.clear_compiled_template_cache()
+            param_sets.append(
+                JinjaObjectParser.parse_call_parameter_sets(
+                    where_sql_template, custom_granularity_names=(), query_item_location=QueryItemLocation.NON_ORDER_BY
+                )
+            )
+        logger.info(
+            f"Parsed {len(where_sql_templates)} filters {'with' if use_compiled_template_cache else 'without'} the "
+            f"compiled-template cache in {time.perf_counter() - start_time:.3f}s"
+        )
+        results.append(param_sets)
+
+    assert results[0] == results[1]
+    assert ObjectBuilderTextProcessor.compiled_template_cache_stats().misses == 50
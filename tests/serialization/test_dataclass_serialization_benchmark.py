@@ -0,0 +1,125 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Tuple, TypeVar
+
+import pytest
+
+from dbt_semantic_interfaces.dataclass_serialization import (
+    DataClassDeserializer,
+    DataclassSerializer,
+    SerializableDataclass,
+)
+from tests.test_dataclass_serialization import (
+    DataclassWithDefaultTuple,
+    DataclassWithOptional,
+    SimpleDataclass,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class DataclassWithNestedTuple(SerializableDataclass):  # noqa: D
+    children: Tuple[DataclassWithDefaultTuple, ...]
+
+
+@dataclass(frozen=True)
+class DataclassWithDeeplyNestedTuple(SerializableDataclass):  # noqa: D
+    children: Tuple[DataclassWithNestedTuple, ...]
+
+
+def _create_deep_object() -> DataclassWithDeeplyNestedTuple:
+    return DataclassWithDeeplyNestedTuple(
+        children=tuple(
+            DataclassWithNestedTuple(
+                children=tuple(
+                    DataclassWithDefaultTuple(
+                        field8=tuple(DataclassWithOptional(field3=SimpleDataclass(field0=i)) for i in range(10))
+                    )
+                    for _ in range(10)
+                )
+            )
+            for _ in range(20)
+        )
+    )
+
+
+def _timed(function: Callable[[], T]) -> T:
+    start_time = time.perf_counter()
+    result = function()
+    logger.info(f"Took {time.perf_counter() - start_time:.3f}s")
+    return result
+
+
+def test_serialization_benchmark() -> None:
+    """Compares the compiled serializer / deserializer with the equivalent Pydantic models."""
+    serializer = DataclassSerializer()
+    deserializer = DataClassDeserializer()
+    objects = [
+        DataclassWithDefaultTuple(
+            field8=tuple(
+                DataclassWithOptional(field3=SimpleDataclass(field0=i + j), field4=None if j % 2 else SimpleDataclass())
+                for j in range(10)
+            )
+        )
+        for i in range(2000)
+    ]
+
+    logger.info("Serializing with Pydantic models")
+    pydantic_serialized_objects: List[str] = _timed(
+        lambda: [
+            serializer._convert_dataclass_instance_to_pydantic_model(DataclassWithDefaultTuple, obj).json()
+            for obj in objects
+        ]
+    )
+    logger.info("Serializing with compiled encoders")
+    serialized_objects: List[str] = _timed(lambda: [serializer.pydantic_serialize(obj) for obj in objects])
+    assert serialized_objects == pydantic_serialized_objects
+
+    pydantic_model = deserializer._to_pydantic_type_converter.to_pydantic_type(DataclassWithDefaultTuple)
+    logger.info("Deserializing with Pydantic models")
+    pydantic_deserialized_objects = _timed(
+        lambda: [
+            deserializer._construct_dataclass_from_dataclass_like_object(
+                DataclassWithDefaultTuple, pydantic_model.parse_raw(serialized_object)
+            )
+            for serialized_object in serialized_objects
+        ]
+    )
+    logger.info("Deserializing with compiled decoders")
+    deserialized_objects = _timed(
+        lambda: [
+            deserializer.pydantic_deserialize(DataclassWithDefaultTuple, serialized_object)
+            for serialized_object in serialized_objects
+        ]
+    )
+    assert deserialized_objects == pydantic_deserialized_objects == objects
+
+
+def test_pydantic_deserialization_of_deep_objects_benchmark() -> None:
+    """Times the Pydantic-based deserialization path, which logs for every nested object when debug logging is on."""
+    obj = _create_deep_object()
+    deserializer = DataClassDeserializer()
+    pydantic_model = deserializer._to_pydantic_type_converter.to_pydantic_type(DataclassWithDeeplyNestedTuple)
+    serialized_object = DataclassSerializer().pydantic_serialize(obj)
+
+    deserialized_object = _timed(
+        lambda: deserializer._construct_dataclass_from_dataclass_like_object(
+            DataclassWithDeeplyNestedTuple, pydantic_model.parse_raw(serialized_object)
+        )
+    )
+    assert deserialized_object == obj
+
+
+def test_debug_logging(caplog: pytest.LogCaptureFixture) -> None:
+    """Checks that the debug messages are still logged when the level is enabled."""
+    deserializer = DataClassDeserializer()
+    pydantic_model = deserializer._to_pydantic_type_converter.to_pydantic_type(DataclassWithOptional)
+    with caplog.at_level(logging.DEBUG, logger="dbt_semantic_interfaces.dataclass_serialization"):
+        deserializer._construct_dataclass_from_dataclass_like_object(
+            DataclassWithOptional, pydantic_model.parse_raw('{"field3": {"field0": 1}}')
+        )
+    assert "Constructing dataclass of type" in caplog.text
@@ -1,16 +1,21 @@
+import datetime
 import itertools
 import logging
+from typing import List
 
+from dbt_semantic_interfaces.dataclass_serialization import SerializableDataclass
 from dbt_semantic_interfaces.references import (
     DimensionReference,
     ElementReference,
     EntityReference,
+    ExportReference,
     GroupByMetricReference,
     LinkableElementReference,
     MeasureReference,
     MetricModelReference,
     MetricReference,
     ModelReference,
+    SavedQueryReference,
     SemanticModelElementReference,
     SemanticModelReference,
     TimeDimensionReference,
@@ -18,11 +23,18 @@ from dbt_semantic_interfaces.references import (
 from dbt_semantic_interfaces.test_helpers.dataclass_serialization import (
     assert_includes_all_serializable_dataclass_types,
     assert_serializable,
+    assert_serializable_as_sequence,
+)
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+from tests.serialization.test_dataclass_serialization_benchmark import (
+    DataclassWithDeeplyNestedTuple,
+    DataclassWithNestedTuple,
 )
 from tests.test_dataclass_serialization import (
     DataclassWithDataclassDefault,
     DataclassWithDefaultTuple,
     DataclassWithOptional,
+    DataclassWithOtherSupportedTypes,
     DataclassWithPrimitiveTypes,
     DataclassWithTuple,
     DeeplyNestedDataclass,
@@ -35,14 +47,13 @@ from tests.test_dataclass_serialization import (
 logger = logging.getLogger(__name__)
 
 
-def test_serializable_dataclass_subclasses() -> None:
-    """Verify that all subclasses of `SerializableDataclass` are serializable."""
+def _create_reference_instances() -> List[SerializableDataclass]:
     counter = itertools.count(start=0)
 
     def _get_next_field_str() -> str:
         return f"field_{next(counter)}"
 
-    instances = [
+    return [
         LinkableElementReference(_get_next_field_str()),
         ElementReference(_get_next_field_str()),
         SemanticModelElementReference(_get_next_field_str(), _get_next_field_str()),
@@ -55,15 +66,25 @@ def test_serializable_dataclass_subclasses() -> None:
         DimensionReference(_get_next_field_str()),
         MeasureReference(_get_next_field_str()),
         ModelReference(),
+        SavedQueryReference(_get_next_field_str()),
+        ExportReference(_get_next_field_str(), _get_next_field_str()),
     ]
 
+
+def test_serializable_dataclass_subclasses() -> None:
+    """Verify that all subclasses of `SerializableDataclass` are serializable."""
+    instances = _create_reference_instances()
+
     assert_includes_all_serializable_dataclass_types(
         instances=instances,
         # These are classes defined and used in a separate test.
         excluded_classes=[
             DataclassWithDataclassDefault,
             DataclassWithDefaultTuple,
+            DataclassWithDeeplyNestedTuple,
+            DataclassWithNestedTuple,
             DataclassWithOptional,
+            DataclassWithOtherSupportedTypes,
             DataclassWithPrimitiveTypes,
             DataclassWithTuple,
             DeeplyNestedDataclass,
@@ -74,3 +95,35 @@ def test_serializable_dataclass_subclasses() -> None:
         ],
     )
     assert_serializable(instances)
+
+
+def test_serializable_dataclass_subclasses_as_sequence() -> None:
+    """Verify that instances of all subclasses of `SerializableDataclass` can be serialized together."""
+    simple_dataclass = SimpleDataclass(field0=1)
+    dataclass_with_default_tuple = DataclassWithDefaultTuple(field8=(DataclassWithOptional(field3=simple_dataclass),))
+    instances = _create_reference_instances() + [
+        DataclassWithDataclassDefault(),
+        dataclass_with_default_tuple,
+        DataclassWithDeeplyNestedTuple(children=(DataclassWithNestedTuple(children=(dataclass_with_default_tuple,)),)),
+        DataclassWithNestedTuple(children=()),
+        DataclassWithOptional(field4=simple_dataclass),
+        DataclassWithOtherSupportedTypes(
+            field0=TimeGranularity.DAY,
+            field1=datetime.datetime(2020, 1, 2, 3, 4, 5),
+            field2=datetime.date(2020, 1, 2),
+            field3=datetime.timedelta(hours=1),
+            field4=(None, TimeGranularity.WEEK),
+        ),
+        DataclassWithPrimitiveTypes(field0=1, field1=2.5, field2=True, field3="foo"),
+        # Needs conversion by the Pydantic model.
+        DataclassWithPrimitiveTypes(field0=1, field1=2, field2=True, field3="foo"),  # type: ignore[arg-type]
+        DataclassWithTuple(field5=(simple_dataclass, simple_dataclass)),
+        DeeplyNestedDataclass(field2=NestedDataclass(field1=simple_dataclass)),
+        NestedDataclass(field1=simple_dataclass),
+        NestedDataclassWithProtocol(field7=SimpleClassWithProtocol(field6=1)),
+        SimpleClassWithProtocol(field6=2),
+        simple_dataclass,
+    ]
+
+    assert_includes_all_serializable_dataclass_types(instances=instances, excluded_classes=())
+    assert_serializable_as_sequence(instances)
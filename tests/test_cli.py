@@ -0,0 +1,154 @@
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from click.testing import CliRunner
+
+from dbt_semantic_interfaces.cli import cli
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.dir_to_model import collect_yaml_config_file_paths
+from dbt_semantic_interfaces.validations.validator_helpers import (
+    SemanticManifestValidationResults,
+)
+
+SIMPLE_SEMANTIC_MANIFEST_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), "fixtures/semantic_manifest_yamls/simple_semantic_manifest"
+)
+
+
+@pytest.fixture
+def project_directory(tmp_path: Path) -> Path:
+    """A copy of the simple semantic manifest that can be modified."""
+    directory = tmp_path / "project"
+    shutil.copytree(SIMPLE_SEMANTIC_MANIFEST_DIRECTORY, directory)
+    return directory
+
+
+def _template_variable_args(template_mapping: Dict[str, str]) -> List[str]:
+    return [arg for key, value in template_mapping.items() for arg in ("--template-variable", f"{key}={value}")]
+
+
+def _break_metrics(project_directory: Path) -> None:
+    """Makes the metrics that use the `bookings` measure refer to a measure that doesn't exist."""
+    metrics_path = project_directory / "metrics.yaml"
+    metrics_path.write_text(metrics_path.read_text().replace("name: bookings\n", "name: does_not_exist\n"))
+
+
+def test_validate(project_directory: Path, template_mapping: Dict[str, str]) -> None:  # noqa: D
+    runner = CliRunner()
+    args = ["validate", str(project_directory), *_template_variable_args(template_mapping)]
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert "ERRORS: 0" in result.output
+
+    _break_metrics(project_directory)
+    result = runner.invoke(cli, [*args, "--format", "json"])
+    assert result.exit_code == 1
+    issues = SemanticManifestValidationResults.parse_raw(result.output)
+    assert issues.has_blocking_issues
+
+    result = runner.invoke(cli, [*args, "--format", "jsonl", "--max-issues", "1", "--fail-fast"])
+    assert result.exit_code == 1
+    # Older versions of click mix the note about the issues that weren't shown into the output.
+    issue_lines = [line for line in result.output.splitlines() if line.startswith("{")]
+    assert len(issue_lines) == 1
+    assert json.loads(issue_lines[0])["level"] == "ERROR"
+
+
+def test_validate_with_cache_and_jobs(  # noqa: D
+    tmp_path: Path, project_directory: Path, template_mapping: Dict[str, str]
+) -> None:
+    runner = CliRunner()
+    args = [
+        "validate",
+        str(project_directory),
+        *_template_variable_args(template_mapping),
+        "--format",
+        "json",
+        "--jobs",
+        "2",
+        "--cache-dir",
+        str(tmp_path / "cache"),
+    ]
+    uncached_result = runner.invoke(cli, args)
+    assert uncached_result.exit_code == 0, uncached_result.output
+    assert len(os.listdir(tmp_path / "cache")) == len(collect_yaml_config_file_paths(str(project_directory)))
+
+    cached_result = runner.invoke(cli, args)
+    assert cached_result.exit_code == 0, cached_result.output
+    assert SemanticManifestValidationResults.parse_raw(
+        cached_result.output
+    ) == SemanticManifestValidationResults.parse_raw(uncached_result.output)
+
+
+def test_parse(tmp_path: Path, project_directory: Path, template_mapping: Dict[str, str]) -> None:  # noqa: D
+    runner = CliRunner()
+    output_path = tmp_path / "semantic_manifest.json"
+    args = ["parse", str(project_directory), *_template_variable_args(template_mapping)]
+    result = runner.invoke(cli, [*args, "--output", str(output_path)])
+    assert result.exit_code == 0, result.output
+    semantic_manifest = PydanticSemanticManifest.parse_raw(output_path.read_text())
+    assert len(semantic_manifest.metrics) > 0
+
+    (project_directory / "project_configuration.yaml").unlink()
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 1
+    assert "Did not find exactly one project configuration" in result.output
+
+
+def test_stats(project_directory: Path, template_mapping: Dict[str, str]) -> None:  # noqa: D
+    result = CliRunner().invoke(
+        cli, ["stats", str(project_directory), *_template_variable_args(template_mapping), "--format", "json"]
+    )
+    assert result.exit_code == 0, result.output
+    stats = json.loads(result.output)
+    assert stats["files"] == len(collect_yaml_config_file_paths(str(project_directory)))
+    assert stats["metrics"] == sum(stats["metrics_by_type"].values()) > 0
+    assert stats["semantic_models"] > 0
+
+
+def test_template_variable_without_value(project_directory: Path) -> None:  # noqa: D
+    result = CliRunner().invoke(cli, ["validate", str(project_directory), "--template-variable", "source_schema"])
+    assert result.exit_code == 2
+    assert "Expected KEY=VALUE" in result.output
+
+
+def test_unreadable_files(project_directory: Path, template_mapping: Dict[str, str]) -> None:  # noqa: D
+    runner = CliRunner()
+    # The template variables aren't given.
+    result = runner.invoke(cli, ["validate", str(project_directory), "--format", "json"])
+    assert result.exit_code == 1
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+    issues = SemanticManifestValidationResults.parse_raw(result.output)
+    assert len(issues.errors) > 0
+    assert all("the template variable 'source_schema' isn't defined" in error.message for error in issues.errors)
+
+    result = runner.invoke(cli, ["validate", str(project_directory), "--format", "jsonl"])
+    assert result.exit_code == 1
+    assert all(json.loads(line)["level"] == "ERROR" for line in result.output.splitlines())
+
+    (project_directory / "bad_encoding.yaml").write_bytes(b"metric:\n  name: \xff\n")
+    args = [str(project_directory), *_template_variable_args(template_mapping)]
+    result = runner.invoke(cli, ["validate", *args])
+    assert result.exit_code == 1
+    assert "bad_encoding.yaml" in result.output
+    assert "doesn't match the encoding of the file" in result.output
+
+    result = runner.invoke(cli, ["stats", *args, "--format", "json"])
+    assert result.exit_code == 1
+    assert "doesn't match the encoding of the file" in result.output
+
+
+def test_bench(tmp_path: Path) -> None:  # noqa: D
+    output_path = tmp_path / "results.json"
+    result = CliRunner().invoke(
+        cli, ["bench", "--object-count", "100", "--rounds", "1", "--max-exponent", "100", "--output", str(output_path)]
+    )
+    assert result.exit_code == 0, result.output
+    assert "parse_raw" in result.output
+    assert len(json.loads(output_path.read_text())["results"]) > 0
@@ -1,3 +1,4 @@
+import datetime
 import logging
 from dataclasses import dataclass
 from typing import Optional, Protocol, Tuple
@@ -5,10 +6,13 @@ from typing import Optional, Protocol, Tuple
 import pytest
 
 from dbt_semantic_interfaces.dataclass_serialization import (
+    DataclassDeserializationError,
     DataClassDeserializer,
     DataclassSerializer,
     SerializableDataclass,
+    SerializedSequenceFormat,
 )
+from dbt_semantic_interfaces.type_enums import TimeGranularity
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +85,16 @@ class DataclassWithPrimitiveTypes(SerializableDataclass):  # noqa: D
     field3: str
 
 
+@dataclass(frozen=True)
+class DataclassWithOtherSupportedTypes(SerializableDataclass):  # noqa: D
+    field0: TimeGranularity
+    field1: datetime.datetime
+    field2: datetime.date
+    field3: datetime.timedelta
+    field4: Tuple[Optional[TimeGranularity], ...]
+    field5: Optional[Tuple[DataclassWithPrimitiveTypes, ...]] = None
+
+
 def test_simple_dataclass(  # noqa: D
     dataclass_serializer: DataclassSerializer, dataclass_deserializer: DataClassDeserializer
 ) -> None:
@@ -236,3 +250,142 @@ def test_all_primitive_types(
         DataclassWithPrimitiveTypes, serialized_obj=serialized_object
     )
     assert obj == deserialized_object
+
+
+def test_all_other_supported_types(
+    dataclass_serializer: DataclassSerializer, dataclass_deserializer: DataClassDeserializer
+) -> None:
+    """Tests a dataclass with enums, date / time types, and nested containers."""
+    obj = DataclassWithOtherSupportedTypes(
+        field0=TimeGranularity.DAY,
+        field1=datetime.datetime(2020, 1, 2, 3, 4, 5, 6, tzinfo=datetime.timezone.utc),
+        field2=datetime.date(2020, 1, 2),
+        field3=datetime.timedelta(days=1, microseconds=5),
+        field4=(TimeGranularity.MONTH, None),
+        field5=(DataclassWithPrimitiveTypes(field0=1, field1=1.5, field2=False, field3="foo"),),
+    )
+    serialized_object = dataclass_serializer.pydantic_serialize(obj)
+
+    deserialized_object = dataclass_deserializer.pydantic_deserialize(
+        DataclassWithOtherSupportedTypes, serialized_obj=serialized_object
+    )
+    assert obj == deserialized_object
+
+
+@pytest.mark.parametrize(
+    "obj",
+    [
+        SimpleDataclass(field0=1),
+        DeeplyNestedDataclass(field2=NestedDataclass(field1=SimpleDataclass(field0=1))),
+        DataclassWithOptional(field4=SimpleDataclass(field0=1)),
+        DataclassWithDefaultTuple(field8=(DataclassWithOptional(), DataclassWithOptional(SimpleDataclass()))),
+        NestedDataclassWithProtocol(field7=SimpleClassWithProtocol(field6=1)),
+        DataclassWithPrimitiveTypes(field0=1, field1=2.0, field2=True, field3='"quoted" \u00e9'),
+        # Values that need to be coerced to the annotated type.
+        DataclassWithPrimitiveTypes(field0=1, field1=2, field2=True, field3="foo"),  # type: ignore[arg-type]
+        DataclassWithPrimitiveTypes(field0=True, field1=2.0, field2=1, field3="foo"),  # type: ignore[arg-type]
+        DataclassWithPrimitiveTypes(field0=1, field1=float("nan"), field2=True, field3=""),
+        DataclassWithOtherSupportedTypes(
+            field0=TimeGranularity.DAY,
+            field1=datetime.datetime(2020, 1, 2, 3, 4, 5, 6),
+            field2=datetime.date(2020, 1, 2),
+            field3=datetime.timedelta(seconds=1.5),
+            field4=(TimeGranularity.MONTH, None),
+        ),
+        # A `datetime` in a `date` field is converted by Pydantic.
+        DataclassWithOtherSupportedTypes(
+            field0=TimeGranularity.DAY,
+            field1=datetime.datetime(2020, 1, 2),
+            field2=datetime.datetime(2020, 1, 2),
+            field3=datetime.timedelta(),
+            field4=(),
+        ),
+    ],
+)
+def test_serialization_matches_pydantic(dataclass_serializer: DataclassSerializer, obj: SerializableDataclass) -> None:
+    """Checks that the compiled serializer produces the same JSON as the equivalent Pydantic model."""
+    pydantic_model = dataclass_serializer._convert_dataclass_instance_to_pydantic_model(
+        object_type=obj.__class__, obj=obj
+    )
+    assert dataclass_serializer.pydantic_serialize(obj) == pydantic_model.json()
+
+
+@pytest.mark.parametrize(
+    ("serialized_object", "expected_object"),
+    [
+        # Pydantic coerces these values to the annotated type.
+        (
+            '{"field0": "1", "field1": "2.5", "field2": "true", "field3": "foo"}',
+            DataclassWithPrimitiveTypes(field0=1, field1=2.5, field2=True, field3="foo"),
+        ),
+        ('{"field1": {"field0": 1.0}}', NestedDataclass(field1=SimpleDataclass(field0=1))),
+        ('{"field5": [{"field0": 1}]}', DataclassWithTuple(field5=(SimpleDataclass(field0=1),))),
+    ],
+)
+def test_deserialization_of_values_that_need_coercion(
+    dataclass_deserializer: DataClassDeserializer, serialized_object: str, expected_object: SerializableDataclass
+) -> None:
+    """Checks that JSON that wasn't produced by the serializer is handled the same way as with Pydantic."""
+    assert (
+        dataclass_deserializer.pydantic_deserialize(expected_object.__class__, serialized_obj=serialized_object)
+        == expected_object
+    )
+
+
+@pytest.mark.parametrize("serialized_object", ["{}", '{"field1": {"field0": "a"}}', "[", "[]"])
+def test_invalid_serialized_object(dataclass_deserializer: DataClassDeserializer, serialized_object: str) -> None:
+    """Checks that invalid input raises the same error type with either path."""
+    with pytest.raises(DataclassDeserializationError):
+        dataclass_deserializer.pydantic_deserialize(NestedDataclass, serialized_obj=serialized_object)
+
+
+def test_serialize_many(  # noqa: D
+    dataclass_serializer: DataclassSerializer, dataclass_deserializer: DataClassDeserializer
+) -> None:
+    objs = [SimpleDataclass(field0=i) for i in range(3)]
+    serialized_objects = [dataclass_serializer.pydantic_serialize(obj) for obj in objs]
+
+    serialized_sequence = dataclass_serializer.serialize_many(objs)
+    assert serialized_sequence == "[" + ", ".join(serialized_objects) + "]"
+    assert dataclass_deserializer.deserialize_many(SimpleDataclass, serialized_sequence) == tuple(objs)
+
+    serialized_sequence = dataclass_serializer.serialize_many(objs, SerializedSequenceFormat.JSONL)
+    assert serialized_sequence.splitlines() == serialized_objects
+    assert dataclass_deserializer.deserialize_many(
+        SimpleDataclass, serialized_sequence, SerializedSequenceFormat.JSONL
+    ) == tuple(objs)
+
+
+def test_serialize_many_with_different_types(  # noqa: D
+    dataclass_serializer: DataclassSerializer, dataclass_deserializer: DataClassDeserializer
+) -> None:
+    objs = [
+        SimpleDataclass(field0=1),
+        NestedDataclass(field1=SimpleDataclass(field0=2)),
+        # Needs conversion by the Pydantic model.
+        DataclassWithPrimitiveTypes(field0=1, field1=2, field2=True, field3="foo"),  # type: ignore[arg-type]
+        SimpleDataclass(field0=3),
+    ]
+    serialized_sequence = dataclass_serializer.serialize_many(objs)
+
+    assert serialized_sequence == "[" + ", ".join(dataclass_serializer.pydantic_serialize(obj) for obj in objs) + "]"
+    assert dataclass_deserializer.deserialize_many([type(obj) for obj in objs], serialized_sequence) == tuple(objs)
+
+
+def test_serialize_empty_sequence(  # noqa: D
+    dataclass_serializer: DataclassSerializer, dataclass_deserializer: DataClassDeserializer
+) -> None:
+    for sequence_format in SerializedSequenceFormat:
+        serialized_sequence = dataclass_serializer.serialize_many((), sequence_format)
+        assert dataclass_deserializer.deserialize_many(SimpleDataclass, serialized_sequence, sequence_format) == ()
+
+
+@pytest.mark.parametrize(
+    "serialized_sequence", ['{"field0": 1}', '[{"field0": 1}]', '[{"field0": 1}, {"field0": 2}, {"field0": 3}]']
+)
+def test_deserialize_many_with_mismatched_types(
+    dataclass_deserializer: DataClassDeserializer, serialized_sequence: str
+) -> None:
+    """Checks that an error is raised if the JSON is not an array of the same length as the given types."""
+    with pytest.raises(DataclassDeserializationError):
+        dataclass_deserializer.deserialize_many([SimpleDataclass, SimpleDataclass], serialized_sequence)
@@ -0,0 +1,113 @@
+import logging
+import time
+
+import pytest
+
+from dbt_semantic_interfaces.entity_join_graph import EntityJoinGraph
+from dbt_semantic_interfaces.errors import EntityJoinGraphError
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    SemanticModelReference,
+)
+from dbt_semantic_interfaces.type_enums import EntityType, TimeGranularity
+
+logger = logging.getLogger(__name__)
+
+_BOOKINGS_SOURCE = SemanticModelReference(semantic_model_name="bookings_source")
+_LISTINGS_LATEST = SemanticModelReference(semantic_model_name="listings_latest")
+_USERS_LATEST = SemanticModelReference(semantic_model_name="users_latest")
+
+
+def test_join_edges(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    entity_join_graph = EntityJoinGraph(simple_semantic_manifest)
+
+    join_edges = entity_join_graph.join_edges(_BOOKINGS_SOURCE)
+    assert {edge.right_semantic_model for edge in join_edges} == {
+        _LISTINGS_LATEST,
+        SemanticModelReference(semantic_model_name="lux_listing_mapping"),
+    }
+    for edge in join_edges:
+        assert edge.entity == EntityReference(element_name="listing")
+        assert edge.left_entity_type is EntityType.FOREIGN
+        assert edge.right_entity_type is EntityType.PRIMARY
+
+    # Semantic models can't be joined to a semantic model that only has the entity as a foreign entity.
+    for semantic_model_reference in entity_join_graph.semantic_model_references:
+        for edge in entity_join_graph.join_edges(semantic_model_reference):
+            assert edge.right_entity_type is not EntityType.FOREIGN
+            assert edge.right_semantic_model != semantic_model_reference
+
+    assert set(entity_join_graph.semantic_models_for_entity(EntityReference(element_name="user"))) >= {
+        _LISTINGS_LATEST,
+        _USERS_LATEST,
+    }
+    with pytest.raises(EntityJoinGraphError):
+        entity_join_graph.join_edges(SemanticModelReference(semantic_model_name="missing"))
+
+
+def test_reachable_elements(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    entity_join_graph = EntityJoinGraph(simple_semantic_manifest)
+
+    def _dundered_names(max_hops: int) -> set:
+        return {
+            "__".join(
+                [entity_link.element_name for entity_link in reachable_dimension.entity_path]
+                + [reachable_dimension.dimension_reference.element_name]
+            )
+            for reachable_dimension in entity_join_graph.reachable_dimensions(_BOOKINGS_SOURCE, max_hops=max_hops)
+        }
+
+    local_dimension_names = _dundered_names(max_hops=0)
+    assert "booking__is_instant" in local_dimension_names
+    assert "listing__capacity_latest" not in local_dimension_names
+
+    one_hop_dimension_names = _dundered_names(max_hops=1)
+    assert local_dimension_names < one_hop_dimension_names
+    assert "listing__capacity_latest" in one_hop_dimension_names
+    assert "listing__user__home_state_latest" not in one_hop_dimension_names
+
+    assert "listing__user__home_state_latest" in _dundered_names(max_hops=2)
+
+    for reachable_dimension in entity_join_graph.reachable_dimensions(_LISTINGS_LATEST):
+        if reachable_dimension.dimension_reference == DimensionReference(element_name="created_at"):
+            assert reachable_dimension.time_granularity is TimeGranularity.DAY
+
+    reachable_entities = {
+        (reachable_entity.entity_path, reachable_entity.entity_reference)
+        for reachable_entity in entity_join_graph.reachable_entities(_BOOKINGS_SOURCE, max_hops=1)
+    }
+    listing = EntityReference(element_name="listing")
+    assert ((), listing) in reachable_entities
+    assert ((listing,), EntityReference(element_name="user")) in reachable_entities
+    assert ((listing,), listing) not in reachable_entities
+
+    # The join paths don't revisit semantic models.
+    for join_path in entity_join_graph.join_paths(_BOOKINGS_SOURCE, max_hops=3):
+        visited_semantic_models = [join_path.left_semantic_model] + [
+            edge.right_semantic_model for edge in join_path.edges
+        ]
+        assert len(set(visited_semantic_models)) == len(visited_semantic_models)
+
+    # Results are cached.
+    assert entity_join_graph.reachable_dimensions(_BOOKINGS_SOURCE) is entity_join_graph.reachable_dimensions(
+        _BOOKINGS_SOURCE
+    )
+
+
+def test_reachable_dimensions_benchmark(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Times getting the reachable dimensions for all semantic models, with and without the cached results."""
+    entity_join_graph = EntityJoinGraph(simple_semantic_manifest)
+    for description in ("without cached results", "with cached results"):
+        start_time = time.perf_counter()
+        reachable_dimension_count = sum(
+            len(entity_join_graph.reachable_dimensions(semantic_model_reference))
+            for semantic_model_reference in entity_join_graph.semantic_model_references
+        )
+        logger.info(
+            f"Got {reachable_dimension_count} reachable dimensions {description} in "
+            f"{time.perf_counter() - start_time:.6f}s"
+        )
@@ -0,0 +1,13 @@
+from dbt_semantic_interfaces.test_helpers.json_stream_benchmarks import (
+    benchmark_json_streaming,
+)
+
+
+def test_benchmark_json_streaming() -> None:  # noqa: D
+    result = benchmark_json_streaming(object_count=100, rounds=1)
+
+    assert result.object_count > 0
+    assert result.json_bytes > 0
+    assert 0 < result.manifest_bytes <= result.parse_raw_peak_bytes
+    assert result.stream_read_peak_bytes > 0
+    assert 0 < result.stream_write_peak_bytes < result.json_peak_bytes
@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.test_helpers.manifest_benchmarks import (
+    BenchmarkResult,
+    find_regressions,
+    find_scaling_issues,
+    main,
+    results_from_json,
+    results_to_json,
+)
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+
+
+def test_manifest_benchmarks(tmp_path: Path) -> None:
+    """Runs the benchmarks for small manifests and checks that the results are written for each benchmark."""
+    output_path = tmp_path / "results.json"
+    main(["--object-counts", "100", "300", "--rounds", "1", "--output", str(output_path)])
+
+    results = results_from_json(output_path.read_text())
+    benchmark_names = {result.name for result in results}
+    assert {
+        "parse_directory_of_yaml_files_to_semantic_manifest",
+        "transform",
+        "json",
+        "parse_raw",
+        "where_filter_parsing",
+    } <= benchmark_names
+    for rule in SemanticManifestValidator[PydanticSemanticManifest]().DEFAULT_RULES:
+        assert f"validate.{type(rule).__name__}" in benchmark_names
+    assert len(results) == 2 * len(benchmark_names)
+    assert results_from_json(results_to_json(results)) == results
+
+
+def _results(name: str, seconds_by_object_count: Dict[int, float]) -> List[BenchmarkResult]:
+    return [
+        BenchmarkResult(name=name, object_count=object_count, seconds=seconds, rounds=1)
+        for object_count, seconds in seconds_by_object_count.items()
+    ]
+
+
+def test_find_scaling_issues() -> None:  # noqa: D
+    results = (
+        _results("linear", {100: 0.1, 1000: 1.0, 10000: 10.5})
+        + _results("quadratic", {100: 0.01, 1000: 1.0, 10000: 100.0})
+        + _results("fast", {100: 0.00001, 1000: 0.01})
+    )
+    issues = find_scaling_issues(results)
+    assert [(issue.name, issue.smaller_object_count, issue.larger_object_count) for issue in issues] == [
+        ("quadratic", 100, 1000),
+        ("quadratic", 1000, 10000),
+    ]
+    assert issues[0].exponent == pytest.approx(2.0)
+    assert "O(n^2.00)" in issues[0].description
+
+
+def test_find_regressions() -> None:  # noqa: D
+    baseline_results = _results("a", {100: 1.0, 1000: 10.0}) + _results("b", {100: 1.0})
+    results = _results("a", {100: 1.1, 1000: 20.0}) + _results("c", {100: 5.0})
+    regressions = find_regressions(baseline_results, results)
+    assert [(regression.name, regression.object_count) for regression in regressions] == [("a", 1000)]
+    assert "(2.00x)" in regressions[0].description
+
+
+def test_results_version() -> None:  # noqa: D
+    with pytest.raises(ValueError, match="Unsupported benchmark results version"):
+        results_from_json('{"version": 0, "results": []}')
@@ -0,0 +1,21 @@
+from dbt_semantic_interfaces.memory_report import METRICS, PARSING_CONTEXTS
+from dbt_semantic_interfaces.test_helpers.memory_benchmarks import (
+    PARSE_PHASE,
+    TRANSFORM_PHASE,
+    VALIDATE_PHASE,
+    measure_manifest_memory,
+)
+
+
+def test_measure_manifest_memory() -> None:  # noqa: D
+    phases = measure_manifest_memory(object_count=100, top_allocation_count=3)
+
+    assert [phase.phase for phase in phases] == [PARSE_PHASE, TRANSFORM_PHASE, VALIDATE_PHASE]
+    for phase in phases:
+        assert phase.object_count > 0
+        assert 0 < phase.retained_bytes <= phase.peak_bytes
+        assert len(phase.top_allocations) == 3
+        assert phase.report.entry(METRICS).object_count > 0
+        # The parsing contexts are only needed while parsing, so none should be kept alive.
+        assert phase.live_parsing_contexts == 0
+        assert phase.report.entry(PARSING_CONTEXTS).retained_bytes == 0
@@ -0,0 +1,18 @@
+from dbt_semantic_interfaces.test_helpers.snapshot_benchmarks import (
+    benchmark_snapshot_loading,
+)
+
+
+def test_benchmark_snapshot_loading() -> None:  # noqa: D
+    result = benchmark_snapshot_loading(object_count=100, rounds=1)
+
+    assert result.object_count > 0
+    assert 0 < result.snapshot_bytes < result.json_bytes
+    for seconds in (
+        result.save_seconds,
+        result.cold_snapshot_seconds,
+        result.cold_json_seconds,
+        result.warm_snapshot_seconds,
+        result.warm_json_seconds,
+    ):
+        assert seconds > 0
@@ -0,0 +1,94 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    parse_directory_of_yaml_files_to_semantic_manifest,
+)
+from dbt_semantic_interfaces.test_helpers.synthetic_manifest import (
+    SyntheticManifestConfig,
+    SyntheticManifestGenerator,
+)
+from dbt_semantic_interfaces.type_enums import MetricType
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        SyntheticManifestConfig(),
+        SyntheticManifestConfig(
+            semantic_model_count=50,
+            foreign_entities_per_semantic_model=3,
+            derived_metric_count=20,
+            derived_metric_depth=5,
+            conversion_metric_count=10,
+            saved_query_count=10,
+            seed=1,
+        ),
+        SyntheticManifestConfig(
+            semantic_model_count=1,
+            foreign_entities_per_semantic_model=0,
+            categorical_dimensions_per_semantic_model=0,
+            custom_granularity_count=0,
+            conversion_metric_count=0,
+        ),
+    ],
+)
+def test_synthetic_manifest_is_valid(config: SyntheticManifestConfig) -> None:  # noqa: D
+    semantic_manifest = SyntheticManifestGenerator(config).semantic_manifest()
+    results = SemanticManifestValidator[PydanticSemanticManifest]().validate_semantic_manifest(semantic_manifest)
+    assert results.all_issues == ()
+
+    assert len(semantic_manifest.semantic_models) == config.semantic_model_count
+    metric_type_counts = {metric_type: 0 for metric_type in MetricType}
+    for metric in semantic_manifest.metrics:
+        metric_type_counts[metric.type] += 1
+    assert metric_type_counts == {
+        MetricType.SIMPLE: config.semantic_model_count * config.measures_per_semantic_model,
+        MetricType.RATIO: config.ratio_metric_count,
+        MetricType.DERIVED: config.derived_metric_count,
+        MetricType.CUMULATIVE: config.cumulative_metric_count,
+        MetricType.CONVERSION: config.conversion_metric_count,
+    }
+    assert len(semantic_manifest.saved_queries) == config.saved_query_count
+
+
+def test_synthetic_manifest_is_deterministic() -> None:  # noqa: D
+    def _contents(config: SyntheticManifestConfig) -> list:
+        return [
+            yaml_config_file.contents for yaml_config_file in SyntheticManifestGenerator(config).yaml_config_files()
+        ]
+
+    assert _contents(SyntheticManifestConfig(seed=5)) == _contents(SyntheticManifestConfig(seed=5))
+    assert _contents(SyntheticManifestConfig(seed=5)) != _contents(SyntheticManifestConfig(seed=6))
+
+
+def test_synthetic_manifest_yaml_directory(tmp_path: Path) -> None:
+    """Checks that the YAML files parse to the same manifest as the one that's built directly."""
+    generator = SyntheticManifestGenerator(SyntheticManifestConfig(seed=2))
+    file_paths = generator.write_yaml_directory(str(tmp_path))
+    assert len(file_paths) == generator.config.semantic_model_count + 3
+
+    build_result = parse_directory_of_yaml_files_to_semantic_manifest(str(tmp_path))
+    assert build_result.issues.all_issues == ()
+    parsed_manifest = build_result.semantic_manifest
+    semantic_manifest = generator.semantic_manifest()
+
+    # The parsed objects also have metadata about the files that they're defined in.
+    def _without_metadata(obj: Any) -> Any:
+        if isinstance(obj, dict):
+            return {key: _without_metadata(value) for key, value in obj.items() if key != "metadata"}
+        if isinstance(obj, list):
+            return [_without_metadata(value) for value in obj]
+        return obj
+
+    parsed_dict = _without_metadata(parsed_manifest.dict())
+    parsed_dict["semantic_models"].sort(key=lambda semantic_model: semantic_model["name"])
+    assert parsed_dict == _without_metadata(semantic_manifest.dict())
@@ -0,0 +1,114 @@
+from dbt_semantic_interfaces.impact_analysis import ImpactAnalysisIndex
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.metric_graph import MetricGraph
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    ExportReference,
+    MeasureReference,
+    MetricReference,
+    SavedQueryReference,
+    SemanticModelElementReference,
+    SemanticModelReference,
+    TimeDimensionReference,
+)
+
+_P0_BOOKING = SavedQueryReference(saved_query_name="p0_booking")
+_HIGHLY_ACTIVE_LISTINGS = SavedQueryReference(saved_query_name="highly_active_listings")
+
+
+def test_measure_changes(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Checks the affected metrics and saved queries for each measure against a scan of the manifest."""
+    index = ImpactAnalysisIndex(simple_semantic_manifest)
+    metric_graph = MetricGraph(simple_semantic_manifest)
+
+    for semantic_model in simple_semantic_manifest.semantic_models:
+        for measure in semantic_model.measures:
+            expected_metrics = set()
+            for metric in simple_semantic_manifest.metrics:
+                metric_reference = MetricReference(element_name=metric.name)
+                if measure.reference in metric_graph.transitive_input_measures(metric_reference):
+                    expected_metrics.add(metric_reference)
+                    expected_metrics.update(metric_graph.transitive_dependents(metric_reference))
+            expected_saved_queries = {
+                SavedQueryReference(saved_query_name=saved_query.name)
+                for saved_query in simple_semantic_manifest.saved_queries
+                if any(
+                    MetricReference(element_name=metric_name) in expected_metrics
+                    for metric_name in saved_query.query_params.metrics
+                )
+            }
+
+            affected_elements = index.affected_elements([measure.reference])
+            assert expected_metrics <= affected_elements.metrics, measure.name
+            assert expected_saved_queries <= affected_elements.saved_queries, measure.name
+            # Measures are unique, so the measure in the semantic model affects the same elements.
+            assert index.affected_elements(
+                [SemanticModelElementReference.create_from_references(semantic_model.reference, measure.reference)]
+            ) == index.affected_elements([measure.reference])
+
+
+def test_metric_changes(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    index = ImpactAnalysisIndex(simple_semantic_manifest)
+
+    affected_elements = index.affected_elements([MetricReference(element_name="instant_bookings")])
+    assert MetricReference(element_name="instant_bookings") in affected_elements.metrics
+    assert affected_elements.saved_queries == {_P0_BOOKING}
+    assert affected_elements.exports == {ExportReference(saved_query_name="p0_booking", export_name="bookings")}
+
+    # `highly_active_listings` uses `bookings` in a filter.
+    affected_elements = index.affected_elements([MetricReference(element_name="bookings")])
+    assert affected_elements.saved_queries == {_P0_BOOKING, _HIGHLY_ACTIVE_LISTINGS}
+    assert MetricReference(element_name="listings") not in affected_elements.metrics
+
+    derived_metric = next(metric for metric in simple_semantic_manifest.metrics if len(metric.input_metrics) > 0)
+    for input_metric in derived_metric.input_metrics:
+        assert MetricReference(element_name=derived_metric.name) in index.direct_dependents(input_metric.as_reference)
+
+
+def test_dimension_and_entity_changes(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    index = ImpactAnalysisIndex(simple_semantic_manifest)
+
+    # Used in the group-by and the where filter of the saved query.
+    affected_elements = index.affected_elements([DimensionReference(element_name="capacity_latest")])
+    assert affected_elements.metrics == set()
+    assert affected_elements.saved_queries == {_P0_BOOKING}
+    assert index.affected_elements(
+        [SemanticModelElementReference(semantic_model_name="listings_latest", element_name="capacity_latest")]
+    ) == index.affected_elements([DimensionReference(element_name="capacity_latest")])
+
+    affected_elements = index.affected_elements([DimensionReference(element_name="is_instant")])
+    assert {MetricReference(element_name="instant_booking_value")} <= affected_elements.metrics
+    assert MetricReference(element_name="bookings") not in affected_elements.metrics
+
+    # `TimeDimensionReference`s are treated as `DimensionReference`s.
+    assert index.affected_elements([TimeDimensionReference(element_name="metric_time")]).saved_queries == {
+        _P0_BOOKING,
+        _HIGHLY_ACTIVE_LISTINGS,
+    }
+
+    # `booking_paid_at` is the `agg_time_dimension` of the `booking_payments` measure.
+    affected_elements = index.affected_elements(
+        [SemanticModelElementReference(semantic_model_name="bookings_source", element_name="booking_paid_at")]
+    )
+    assert MetricReference(element_name="booking_payments") in affected_elements.metrics
+    assert MetricReference(element_name="bookings") not in affected_elements.metrics
+
+    affected_elements = index.affected_elements([EntityReference(element_name="listing")])
+    assert MetricReference(element_name="booking_value_for_non_null_listing_id") in affected_elements.metrics
+    assert MetricReference(element_name="lux_listings") in affected_elements.metrics
+    assert affected_elements.saved_queries == {_P0_BOOKING, _HIGHLY_ACTIVE_LISTINGS}
+
+
+def test_semantic_model_changes(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    index = ImpactAnalysisIndex(simple_semantic_manifest)
+    affected_elements = index.affected_elements([SemanticModelReference(semantic_model_name="bookings_source")])
+    assert affected_elements.metrics >= index.affected_elements([MeasureReference(element_name="bookings")]).metrics
+    assert affected_elements.saved_queries == {_P0_BOOKING, _HIGHLY_ACTIVE_LISTINGS}
+
+    assert index.affected_elements([_HIGHLY_ACTIVE_LISTINGS]).exports == {
+        ExportReference(saved_query_name="highly_active_listings", export_name="highly_active_listings")
+    }
+    assert index.affected_elements([]).metrics == set()
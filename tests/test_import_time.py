@@ -0,0 +1,79 @@
+"""Checks that importing the package doesn't import slow dependencies that aren't needed yet.
+
+The imports are run in a new interpreter with `python -X importtime`, which writes a line for each imported module with
+its import time in microseconds. The import times are only checked against a budget when
+`DSI_IMPORT_TIME_BUDGET_SECONDS` is set, e.g. `DSI_IMPORT_TIME_BUDGET_SECONDS=2`.
+"""
+
+import logging
+import os
+import subprocess
+import sys
+from typing import Dict, Set, Tuple
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+# Dependencies that are only needed when parsing YAML files, validating JSON schemas, rendering Jinja templates, or
+# printing to the CLI.
+_PARSING_DEPENDENCIES = ("click", "jinja2", "jsonschema", "referencing", "yaml")
+
+# Wall-clock import times depend on the machine and its load, so the budget for the cumulative import time of a module
+# is only checked when this environment variable is set to the budget in seconds, e.g. on a dedicated benchmark machine.
+_IMPORT_TIME_BUDGET_ENV_VAR_NAME = "DSI_IMPORT_TIME_BUDGET_SECONDS"
+
+
+def _cumulative_import_times(module_name: str) -> Dict[str, float]:
+    """Imports the module in a new interpreter and returns the cumulative import time in seconds of each module."""
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_times: Dict[str, float] = {}
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_microseconds, imported_module_name = line[len("import time:") :].split("|")
+        import_times[imported_module_name.strip()] = int(cumulative_microseconds) / 1_000_000
+    return import_times
+
+
+def _top_level_module_names(import_times: Dict[str, float]) -> Set[str]:
+    return {module_name.split(".")[0] for module_name in import_times}
+
+
+_MODULE_NAMES_AND_EXPECTED_UNIMPORTED_MODULES = (
+    ("dbt_semantic_interfaces.references", _PARSING_DEPENDENCIES + ("pydantic",)),
+    ("dbt_semantic_interfaces.protocols", _PARSING_DEPENDENCIES + ("pydantic",)),
+    ("dbt_semantic_interfaces.implementations.semantic_manifest", ("click", "jinja2", "jsonschema", "referencing")),
+    ("dbt_semantic_interfaces.parsing.dir_to_model", ("click", "jinja2", "jsonschema", "referencing")),
+)
+
+
+@pytest.mark.parametrize(("module_name", "expected_unimported_modules"), _MODULE_NAMES_AND_EXPECTED_UNIMPORTED_MODULES)
+def test_unneeded_modules_are_not_imported(  # noqa: D
+    module_name: str, expected_unimported_modules: Tuple[str, ...]
+) -> None:
+    import_times = _cumulative_import_times(module_name)
+    logger.info(f"Importing {module_name} took {import_times[module_name]:.3f}s")
+
+    assert _top_level_module_names(import_times).isdisjoint(expected_unimported_modules)
+
+
+@pytest.mark.skipif(
+    _IMPORT_TIME_BUDGET_ENV_VAR_NAME not in os.environ,
+    reason=f"Set {_IMPORT_TIME_BUDGET_ENV_VAR_NAME} to check the import times",
+)
+@pytest.mark.parametrize(
+    "module_name", [module_name for module_name, _ in _MODULE_NAMES_AND_EXPECTED_UNIMPORTED_MODULES]
+)
+def test_import_time_budget(module_name: str) -> None:  # noqa: D
+    import_time_budget_seconds = float(os.environ[_IMPORT_TIME_BUDGET_ENV_VAR_NAME])
+    import_times = _cumulative_import_times(module_name)
+    assert import_times[module_name] < import_time_budget_seconds, (
+        f"Importing {module_name} took {import_times[module_name]:.3f}s, which is more than the budget of "
+        f"{import_time_budget_seconds}s"
+    )
@@ -0,0 +1,105 @@
+import logging
+import os
+import time
+from typing import Dict, List
+
+import pytest
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.instrumentation import (
+    FILE_READ_PHASE,
+    JSONSCHEMA_VALIDATE_PHASE,
+    PYDANTIC_PARSE_PHASE,
+    TRANSFORM_RULE_PHASE,
+    VALIDATION_RULE_PHASE,
+    WHERE_FILTER_PARSE_PHASE,
+    YAML_LOAD_PHASE,
+    PhaseTiming,
+    PhaseTimingHooks,
+    get_instrumentation_hooks,
+    instrumented_phase,
+    use_instrumentation_hooks,
+)
+from dbt_semantic_interfaces.parsing.dir_to_model import (
+    parse_directory_of_yaml_files_to_semantic_manifest,
+)
+from dbt_semantic_interfaces.test_helpers.manifest_benchmarks import (
+    clear_process_wide_caches,
+)
+from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
+    SemanticManifestValidator,
+)
+
+logger = logging.getLogger(__name__)
+
+SIMPLE_SEMANTIC_MANIFEST_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), "fixtures/semantic_manifest_yamls/simple_semantic_manifest"
+)
+
+
+def test_phases_are_instrumented(template_mapping: Dict[str, str]) -> None:  # noqa: D
+    timings: List[PhaseTiming] = []
+    clear_process_wide_caches()
+    with use_instrumentation_hooks(PhaseTimingHooks(timings.append)):
+        semantic_manifest = parse_directory_of_yaml_files_to_semantic_manifest(
+            SIMPLE_SEMANTIC_MANIFEST_DIRECTORY, template_mapping=template_mapping
+        ).semantic_manifest
+        SemanticManifestValidator[PydanticSemanticManifest]().validate_semantic_manifest(semantic_manifest)
+    assert get_instrumentation_hooks() is None
+
+    phase_names = {timing.name for timing in timings}
+    assert phase_names == {
+        FILE_READ_PHASE,
+        YAML_LOAD_PHASE,
+        JSONSCHEMA_VALIDATE_PHASE,
+        PYDANTIC_PARSE_PHASE,
+        TRANSFORM_RULE_PHASE,
+        VALIDATION_RULE_PHASE,
+        WHERE_FILTER_PARSE_PHASE,
+    }
+    assert all(timing.succeeded and timing.seconds >= 0 for timing in timings)
+
+    parsed_document_types = {
+        timing.attributes["document_type"] for timing in timings if timing.name == PYDANTIC_PARSE_PHASE
+    }
+    assert parsed_document_types == {"metric", "semantic_model", "project_configuration", "saved_query"}
+    assert sum(1 for timing in timings if timing.name == PYDANTIC_PARSE_PHASE) == (
+        len(semantic_manifest.semantic_models)
+        + len(semantic_manifest.metrics)
+        + len(semantic_manifest.saved_queries)
+        + 1
+    )
+    file_read_timings = [timing for timing in timings if timing.name == FILE_READ_PHASE]
+    assert all(timing.attributes["file_path"].endswith(".yaml") for timing in file_read_timings)
+    validation_rules = [timing.attributes["rule"] for timing in timings if timing.name == VALIDATION_RULE_PHASE]
+    assert validation_rules == [
+        type(rule).__name__ for rule in SemanticManifestValidator[PydanticSemanticManifest]().DEFAULT_RULES
+    ]
+
+
+def test_failed_phase() -> None:  # noqa: D
+    timings: List[PhaseTiming] = []
+    with use_instrumentation_hooks(PhaseTimingHooks(timings.append)):
+        with pytest.raises(ValueError):
+            with instrumented_phase(FILE_READ_PHASE, file_path="missing.yaml"):
+                raise ValueError()
+    assert timings == [
+        PhaseTiming(
+            name=FILE_READ_PHASE, attributes={"file_path": "missing.yaml"}, seconds=timings[0].seconds, succeeded=False
+        )
+    ]
+
+
+def test_no_op_instrumentation_overhead() -> None:
+    """Times entering a phase when no hooks are installed."""
+    assert get_instrumentation_hooks() is None
+    assert instrumented_phase(FILE_READ_PHASE, file_path="a.yaml") is instrumented_phase(YAML_LOAD_PHASE)
+
+    iteration_count = 100000
+    start_time = time.perf_counter()
+    for _ in range(iteration_count):
+        with instrumented_phase(PYDANTIC_PARSE_PHASE, file_path="a.yaml", document_type="metric"):
+            pass
+    logger.info(f"Entered {iteration_count} phases without hooks in {time.perf_counter() - start_time:.3f}s")
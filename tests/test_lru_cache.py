@@ -0,0 +1,78 @@
+import threading
+from typing import List
+
+import pytest
+
+from dbt_semantic_interfaces.lru_cache import LruCache, LruCacheStats
+
+
+def test_get_or_create() -> None:  # noqa: D
+    cache: LruCache[str, int] = LruCache(max_size=2)
+    assert cache.get_or_create("a", lambda: 1) == 1
+    assert cache.get_or_create("a", lambda: 2) == 1
+    assert cache.stats == LruCacheStats(hits=1, misses=1, size=1, max_size=2)
+    assert cache.stats.hit_rate == 0.5
+
+
+def test_least_recently_used_entry_is_evicted() -> None:  # noqa: D
+    cache: LruCache[str, int] = LruCache(max_size=2)
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("b", lambda: 2)
+    # Using "a" makes "b" the least-recently used entry.
+    cache.get_or_create("a", lambda: 3)
+    cache.get_or_create("c", lambda: 4)
+
+    assert cache.stats.size == 2
+    assert cache.get_or_create("a", lambda: 5) == 1
+    assert cache.get_or_create("b", lambda: 6) == 6
+
+
+def test_exceptions_are_not_cached() -> None:  # noqa: D
+    cache: LruCache[str, int] = LruCache(max_size=2)
+
+    def _raise() -> int:
+        raise ValueError("Failed")
+
+    with pytest.raises(ValueError):
+        cache.get_or_create("a", _raise)
+    assert cache.get_or_create("a", lambda: 1) == 1
+    assert cache.stats == LruCacheStats(hits=0, misses=2, size=1, max_size=2)
+
+
+def test_clear() -> None:  # noqa: D
+    cache: LruCache[str, int] = LruCache(max_size=2)
+    cache.get_or_create("a", lambda: 1)
+    cache.get_or_create("a", lambda: 1)
+    cache.clear()
+    assert cache.stats == LruCacheStats(hits=0, misses=0, size=0, max_size=2)
+    assert cache.stats.hit_rate == 0.0
+
+
+def test_invalid_max_size() -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        LruCache(max_size=0)
+
+
+def test_concurrent_access() -> None:  # noqa: D
+    cache: LruCache[int, int] = LruCache(max_size=10)
+    thread_count = 8
+    lookup_count_per_thread = 1000
+    errors: List[str] = []
+
+    def _lookup() -> None:
+        for i in range(lookup_count_per_thread):
+            key = i % 20
+            value = cache.get_or_create(key, lambda: key * 2)
+            if value != key * 2:
+                errors.append(f"Got {value} for key {key}")
+
+    threads = [threading.Thread(target=_lookup) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    stats = cache.stats
+    assert stats.hits + stats.misses == thread_count * lookup_count_per_thread
+    assert stats.size == 10
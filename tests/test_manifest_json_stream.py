@@ -0,0 +1,60 @@
+import io
+import json
+
+import pytest
+
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.manifest_json_stream import (
+    iter_semantic_manifest_json,
+    read_semantic_manifest_json,
+    write_semantic_manifest_json,
+)
+
+
+def test_write(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    stream = io.StringIO()
+    write_semantic_manifest_json(simple_semantic_manifest, stream)
+    assert stream.getvalue() == simple_semantic_manifest.json()
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 64 * 1024])
+def test_read(simple_semantic_manifest: PydanticSemanticManifest, chunk_size: int) -> None:  # noqa: D
+    serialized_manifest = simple_semantic_manifest.json()
+    semantic_manifest = read_semantic_manifest_json(io.StringIO(serialized_manifest), chunk_size=chunk_size)
+    assert semantic_manifest == PydanticSemanticManifest.parse_raw(serialized_manifest)
+
+
+def test_iter(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    manifest_dict = json.loads(simple_semantic_manifest.json())
+    # Fields that aren't fields of the manifest are skipped, whatever their value.
+    manifest_dict["unknown_field"] = {"numbers": [12345678, 1.5e10], "text": "]}"}
+    serialized_manifest = json.dumps(manifest_dict, indent=2)
+
+    items = list(iter_semantic_manifest_json(io.StringIO(serialized_manifest), chunk_size=3))
+    assert [obj for field_name, obj in items if field_name == "metrics"] == simple_semantic_manifest.metrics
+    assert [obj for field_name, obj in items if field_name == "semantic_models"] == (
+        simple_semantic_manifest.semantic_models
+    )
+    assert [obj for field_name, obj in items if field_name == "project_configuration"] == [
+        simple_semantic_manifest.project_configuration
+    ]
+
+
+@pytest.mark.parametrize(
+    "serialized_manifest",
+    [
+        "",
+        "[]",
+        '{"metrics": [',
+        '{"metrics": {}}',
+        '{"metrics": [1]}',
+        '{"metrics": [{"name": "missing_fields"}]}',
+        '{"metrics": []} {}',
+        '{"metrics": [], "semantic_models": []}',
+    ],
+)
+def test_invalid_json(serialized_manifest: str) -> None:  # noqa: D
+    with pytest.raises(ValueError):
+        read_semantic_manifest_json(io.StringIO(serialized_manifest))
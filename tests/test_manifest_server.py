@@ -0,0 +1,90 @@
+import io
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+from dbt_semantic_interfaces.manifest_server import (
+    INVALID_PARAMS_CODE,
+    INVALID_REQUEST_CODE,
+    METHOD_NOT_FOUND_CODE,
+    PARSE_ERROR_CODE,
+    ManifestServer,
+)
+from dbt_semantic_interfaces.parsing.incremental_builder import (
+    IncrementalManifestBuilder,
+)
+
+SIMPLE_SEMANTIC_MANIFEST_DIRECTORY = os.path.join(
+    os.path.dirname(__file__), "fixtures/semantic_manifest_yamls/simple_semantic_manifest"
+)
+
+
+@pytest.fixture
+def server(tmp_path: Path, template_mapping: Dict[str, str]) -> ManifestServer:
+    """A server for a copy of the simple semantic manifest."""
+    directory = tmp_path / "project"
+    shutil.copytree(SIMPLE_SEMANTIC_MANIFEST_DIRECTORY, directory)
+    return ManifestServer(IncrementalManifestBuilder(str(directory), template_mapping=template_mapping))
+
+
+def _request(server: ManifestServer, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    response = server.handle_request({"jsonrpc": "2.0", "id": 1, "method": method, "params": params})
+    assert response is not None
+    assert response["id"] == 1
+    return response
+
+
+def test_manifest_server(server: ManifestServer, tmp_path: Path) -> None:  # noqa: D
+    validation_results = _request(server, "validate")["result"]
+    assert validation_results["errors"] == []
+
+    bookings = _request(server, "lookup", {"kind": "metric", "name": "bookings"})["result"]
+    assert bookings["name"] == "bookings"
+    assert _request(server, "lookup", {"kind": "metric", "name": "missing"})["result"] is None
+    assert _request(server, "lookup", {"kind": "semantic_model", "name": "bookings_source"})["result"] is not None
+    assert _request(server, "lookup", {"kind": "project_configuration"})["result"]["time_spines"]
+
+    metrics_path = tmp_path / "project" / "metrics.yaml"
+    metrics_path.write_text(metrics_path.read_text().replace('"bookings metric"', '"changed bookings metric"', 1))
+    update = _request(server, "files_changed", {"paths": [str(metrics_path)]})["result"]
+    assert update["reparsed_file_paths"] == [str(metrics_path)]
+    assert update["error_count"] == 0
+    bookings = _request(server, "lookup", {"kind": "metric", "name": "bookings"})["result"]
+    assert bookings["description"] == "changed bookings metric"
+
+    assert _request(server, "shutdown")["result"] is None
+    assert server.shutdown_requested
+
+
+def test_manifest_server_errors(server: ManifestServer) -> None:  # noqa: D
+    assert _request(server, "unknown")["error"]["code"] == METHOD_NOT_FOUND_CODE
+    assert _request(server, "lookup", {"kind": "unknown", "name": "bookings"})["error"]["code"] == INVALID_PARAMS_CODE
+    assert _request(server, "files_changed", {"paths": "metrics.yaml"})["error"]["code"] == INVALID_PARAMS_CODE
+    assert server.handle_request(["not", "a", "request"])["error"]["code"] == INVALID_REQUEST_CODE  # type: ignore
+    response = server.handle_message("{not json")
+    assert response is not None
+    assert json.loads(response)["error"]["code"] == PARSE_ERROR_CODE
+    # Notifications don't have responses.
+    assert server.handle_request({"jsonrpc": "2.0", "method": "files_changed"}) is None
+
+
+def test_serve(server: ManifestServer) -> None:
+    """Checks that requests are read from the input stream and responses are written to the output stream."""
+    requests = [
+        {"jsonrpc": "2.0", "id": 1, "method": "lookup", "params": {"kind": "metric", "name": "bookings"}},
+        {"jsonrpc": "2.0", "method": "files_changed"},
+        {"jsonrpc": "2.0", "id": 2, "method": "shutdown"},
+        {"jsonrpc": "2.0", "id": 3, "method": "validate"},
+    ]
+    input_stream = io.StringIO("\n".join(json.dumps(request) for request in requests) + "\n")
+    output_stream = io.StringIO()
+    server.serve(input_stream, output_stream)
+
+    responses = [json.loads(line) for line in output_stream.getvalue().splitlines()]
+    # The request after `shutdown` isn't handled.
+    assert [response["id"] for response in responses] == [1, 2]
+    assert responses[0]["result"]["name"] == "bookings"
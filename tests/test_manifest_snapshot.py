@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from dbt_semantic_interfaces import manifest_snapshot
+from dbt_semantic_interfaces.errors import (
+    ManifestSnapshotError,
+    ManifestSnapshotVersionError,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.manifest_snapshot import load_snapshot, save_snapshot
+
+
+def test_round_trip(tmp_path: Path, simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    snapshot_path = str(tmp_path / "semantic_manifest.snapshot")
+    save_snapshot(simple_semantic_manifest, snapshot_path)
+    loaded_manifest = load_snapshot(snapshot_path)
+
+    assert loaded_manifest == simple_semantic_manifest
+    assert loaded_manifest.json() == simple_semantic_manifest.json()
+    # The fields that were set are kept, so the fields that weren't set are still excluded.
+    assert loaded_manifest.json(exclude_unset=True) == simple_semantic_manifest.json(exclude_unset=True)
+
+    # The private attributes of the loaded objects are initialized.
+    filtered_metrics = [metric for metric in loaded_manifest.metrics if metric.filter is not None]
+    assert len(filtered_metrics) > 0
+    for metric in filtered_metrics:
+        assert metric.filter is not None
+        for where_filter in metric.filter.where_filters:
+            where_filter.call_parameter_sets(custom_granularity_names=())
+
+
+def test_overwrite(tmp_path: Path, simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    snapshot_path = tmp_path / "semantic_manifest.snapshot"
+    snapshot_path.write_bytes(b"An older file")
+    save_snapshot(simple_semantic_manifest, str(snapshot_path))
+
+    assert load_snapshot(str(snapshot_path)) == simple_semantic_manifest
+    # Only the snapshot is left in the directory, without temporary files.
+    assert [path.name for path in tmp_path.iterdir()] == [snapshot_path.name]
+
+
+def test_version_mismatch(  # noqa: D
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, simple_semantic_manifest: PydanticSemanticManifest
+) -> None:
+    snapshot_path = str(tmp_path / "semantic_manifest.snapshot")
+    save_snapshot(simple_semantic_manifest, snapshot_path)
+    monkeypatch.setattr(manifest_snapshot, "SNAPSHOT_FORMAT_VERSION", manifest_snapshot.SNAPSHOT_FORMAT_VERSION + 1)
+
+    with pytest.raises(ManifestSnapshotVersionError):
+        load_snapshot(snapshot_path)
+    assert load_snapshot(snapshot_path, fallback=lambda: simple_semantic_manifest) is simple_semantic_manifest
+
+
+def test_invalid_snapshot(tmp_path: Path, simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    json_path = tmp_path / "semantic_manifest.json"
+    json_path.write_text(simple_semantic_manifest.json())
+    with pytest.raises(ManifestSnapshotError):
+        load_snapshot(str(json_path))
+
+    # A fallback isn't used for a file that isn't a snapshot.
+    snapshot_path = tmp_path / "semantic_manifest.snapshot"
+    save_snapshot(simple_semantic_manifest, str(snapshot_path))
+    snapshot_path.write_bytes(snapshot_path.read_bytes()[:-100])
+    with pytest.raises(ManifestSnapshotError):
+        load_snapshot(str(snapshot_path), fallback=lambda: simple_semantic_manifest)
@@ -0,0 +1,55 @@
+import pytest
+import yaml
+
+from dbt_semantic_interfaces.implementations.element_config import (
+    PydanticSemanticLayerElementConfig,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.memory_report import (
+    FILE_SLICE_CONTENTS,
+    MEMORY_REPORT_CATEGORIES,
+    METADATA,
+    METRICS,
+    PARSING_CONTEXTS,
+    WHERE_FILTERS,
+    manifest_memory_report,
+)
+from dbt_semantic_interfaces.parsing.yaml_loader import ParsingContext
+
+
+def test_manifest_memory_report(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    report = manifest_memory_report(simple_semantic_manifest)
+
+    assert tuple(entry.category for entry in report.entries) == MEMORY_REPORT_CATEGORIES
+    assert report.entry(METRICS).object_count == len(simple_semantic_manifest.metrics)
+    assert report.entry(FILE_SLICE_CONTENTS).retained_bytes > sum(
+        len(metric.metadata.file_slice.content) for metric in simple_semantic_manifest.metrics if metric.metadata
+    )
+    for category in (METADATA, WHERE_FILTERS, METRICS):
+        assert report.entry(category).retained_bytes > 0
+    assert report.entry(PARSING_CONTEXTS).retained_bytes == 0
+    assert report.total_bytes == sum(entry["retained_bytes"] for entry in report.as_dict().values())
+    assert METRICS in report.format()
+    # Counting the same manifest again gives the same result.
+    assert manifest_memory_report(simple_semantic_manifest) == report
+
+    with pytest.raises(KeyError, match="Unknown memory report category"):
+        report.entry("unknown")
+
+
+def test_manifest_memory_report_with_parsing_context(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Checks that a parsing context that is still referenced by the manifest is reported."""
+    semantic_manifest = simple_semantic_manifest.copy(deep=True)
+    semantic_manifest.metrics[0].config = PydanticSemanticLayerElementConfig(
+        meta={
+            "context": ParsingContext(
+                start_line=1, end_line=2, filename="metrics.yaml", content_node=yaml.compose("metric:\n  name: x\n")
+            )
+        }
+    )
+
+    report = manifest_memory_report(semantic_manifest)
+    assert report.entry(PARSING_CONTEXTS).object_count == 1
+    assert report.entry(PARSING_CONTEXTS).retained_bytes > 0
@@ -0,0 +1,254 @@
+import logging
+import time
+from typing import Dict, Sequence
+
+import pytest
+
+from dbt_semantic_interfaces.errors import MetricCycleError, MetricGraphError
+from dbt_semantic_interfaces.implementations.elements.dimension import (
+    PydanticDimension,
+    PydanticDimensionTypeParams,
+)
+from dbt_semantic_interfaces.implementations.elements.measure import PydanticMeasure
+from dbt_semantic_interfaces.implementations.metric import (
+    PydanticCumulativeTypeParams,
+    PydanticMetric,
+    PydanticMetricInput,
+    PydanticMetricInputMeasure,
+    PydanticMetricTypeParams,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.metric_graph import MetricGraph
+from dbt_semantic_interfaces.protocols import Metric
+from dbt_semantic_interfaces.references import (
+    MeasureReference,
+    MetricReference,
+    SemanticModelReference,
+)
+from dbt_semantic_interfaces.test_utils import (
+    metric_with_guaranteed_meta,
+    semantic_model_with_guaranteed_meta,
+)
+from dbt_semantic_interfaces.transformations.add_input_metric_measures import (
+    AddInputMetricMeasuresRule,
+)
+from dbt_semantic_interfaces.type_enums import (
+    AggregationType,
+    DimensionType,
+    MetricType,
+    TimeGranularity,
+)
+from dbt_semantic_interfaces.validations.metrics import MetricTimeGranularityRule
+from tests.example_project_configuration import EXAMPLE_PROJECT_CONFIGURATION
+
+logger = logging.getLogger(__name__)
+
+
+def _simple_metric(name: str, measure_name: str = "measure") -> PydanticMetric:
+    return metric_with_guaranteed_meta(
+        name=name,
+        type=MetricType.SIMPLE,
+        type_params=PydanticMetricTypeParams(measure=PydanticMetricInputMeasure(name=measure_name)),
+    )
+
+
+def _derived_metric(name: str, input_metric_names: Sequence[str], time_granularity: str = "day") -> PydanticMetric:
+    return metric_with_guaranteed_meta(
+        name=name,
+        type=MetricType.DERIVED,
+        type_params=PydanticMetricTypeParams(
+            expr=" + ".join(input_metric_names),
+            metrics=[PydanticMetricInput(name=input_metric_name) for input_metric_name in input_metric_names],
+        ),
+        time_granularity=time_granularity,
+    )
+
+
+def _manifest(metrics: Sequence[PydanticMetric]) -> PydanticSemanticManifest:
+    return PydanticSemanticManifest(
+        semantic_models=[
+            semantic_model_with_guaranteed_meta(
+                name=f"semantic_model_{measure_name}",
+                measures=[PydanticMeasure(name=measure_name, agg=AggregationType.SUM, agg_time_dimension="ds")],
+                dimensions=[
+                    PydanticDimension(
+                        name="ds",
+                        type=DimensionType.TIME,
+                        type_params=PydanticDimensionTypeParams(time_granularity=TimeGranularity.DAY),
+                    ),
+                ],
+            )
+            for measure_name in ("measure", "other_measure")
+        ],
+        metrics=list(metrics),
+        project_configuration=EXAMPLE_PROJECT_CONFIGURATION,
+    )
+
+
+def _refs(*metric_names: str) -> Sequence[MetricReference]:
+    return tuple(MetricReference(element_name=metric_name) for metric_name in metric_names)
+
+
+def test_metric_graph() -> None:  # noqa: D
+    metric_graph = MetricGraph(
+        _manifest(
+            [
+                _derived_metric("d2", ["d1", "s2"]),
+                _derived_metric("d1", ["s1", "s1", "missing"]),
+                _simple_metric("s1"),
+                _simple_metric("s2", measure_name="other_measure"),
+            ]
+        )
+    )
+    d2, d1, s1, s2 = _refs("d2", "d1", "s1", "s2")
+
+    assert metric_graph.metric_references == (d2, d1, s1, s2)
+    assert metric_graph.input_metrics(d1) == (s1,)
+    assert metric_graph.missing_input_metrics(d1) == _refs("missing")
+    assert metric_graph.dependents(s1) == (d1,)
+    assert metric_graph.cycles == ()
+
+    topological_order = metric_graph.topological_order()
+    assert set(topological_order) == {d2, d1, s1, s2}
+    for metric_reference in topological_order:
+        for input_metric_reference in metric_graph.input_metrics(metric_reference):
+            assert topological_order.index(input_metric_reference) < topological_order.index(metric_reference)
+
+    assert metric_graph.transitive_input_metrics(d2) == {d1, s1, s2}
+    assert metric_graph.transitive_input_metrics(s1) == set()
+    assert metric_graph.transitive_dependents(s1) == {d1, d2}
+    assert metric_graph.transitive_semantic_models(d2) == {
+        SemanticModelReference(semantic_model_name="semantic_model_measure"),
+        SemanticModelReference(semantic_model_name="semantic_model_other_measure"),
+    }
+    assert metric_graph.transitive_input_measures(s2) == {MeasureReference(element_name="other_measure")}
+    with pytest.raises(MetricGraphError, match="Could not find input metric 'missing'"):
+        metric_graph.transitive_input_measures(d2)
+    with pytest.raises(MetricGraphError, match="does not exist"):
+        metric_graph.input_metrics(MetricReference(element_name="missing"))
+
+
+def test_cumulative_metric_with_input_metric() -> None:  # noqa: D
+    metric_graph = MetricGraph(
+        _manifest(
+            [
+                _simple_metric("s1"),
+                metric_with_guaranteed_meta(
+                    name="c1",
+                    type=MetricType.CUMULATIVE,
+                    type_params=PydanticMetricTypeParams(
+                        cumulative_type_params=PydanticCumulativeTypeParams(
+                            window=None, grain_to_date="month", metric=PydanticMetricInput(name="s1")
+                        ),
+                    ),
+                ),
+            ]
+        )
+    )
+    s1, c1 = _refs("s1", "c1")
+    assert metric_graph.input_metrics(c1) == (s1,)
+    assert metric_graph.dependents(s1) == (c1,)
+    assert metric_graph.topological_order() == (s1, c1)
+
+
+def test_metric_graph_cycles() -> None:  # noqa: D
+    metric_graph = MetricGraph(
+        _manifest(
+            [
+                _derived_metric("a", ["b", "s"]),
+                _derived_metric("b", ["c"]),
+                _derived_metric("c", ["a"]),
+                _derived_metric("self_referencing", ["self_referencing"]),
+                _derived_metric("depends_on_cycle", ["a"]),
+                _derived_metric("valid", ["s"]),
+                _simple_metric("s"),
+            ]
+        )
+    )
+    a, b, c, self_referencing, depends_on_cycle, valid, s = _refs(
+        "a", "b", "c", "self_referencing", "depends_on_cycle", "valid", "s"
+    )
+
+    assert set(metric_graph.cycles) == {(a, b, c), (self_referencing,)}
+    with pytest.raises(MetricCycleError, match="'a' -> 'b' -> 'c' -> 'a'"):
+        metric_graph.topological_order()
+    for metric_reference in (a, b, c, self_referencing, depends_on_cycle):
+        with pytest.raises(MetricCycleError):
+            metric_graph.transitive_input_metrics(metric_reference)
+        with pytest.raises(MetricCycleError):
+            metric_graph.transitive_input_measures(metric_reference)
+
+    assert metric_graph.transitive_input_metrics(valid) == {s}
+    assert metric_graph.transitive_dependents(s) == {a, b, c, depends_on_cycle, valid}
+    assert metric_graph.transitive_dependents(self_referencing) == {self_referencing}
+
+
+def test_transitive_input_measures_match_metric(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Checks that the measures are the same as the ones from `PydanticMetric.all_input_measures_for_metric`."""
+    metric_graph = MetricGraph(simple_semantic_manifest)
+    metric_index: Dict[MetricReference, Metric] = {
+        MetricReference(element_name=metric.name): metric for metric in simple_semantic_manifest.metrics
+    }
+    checked_metric_count = 0
+    for metric in simple_semantic_manifest.metrics:
+        try:
+            expected_measures = PydanticMetric.all_input_measures_for_metric(metric=metric, metric_index=metric_index)
+        except AssertionError:
+            continue
+        assert metric_graph.transitive_input_measures(MetricReference(element_name=metric.name)) == expected_measures
+        checked_metric_count += 1
+    assert checked_metric_count > 0
+
+
+def test_metric_graph_benchmark() -> None:
+    """Compares the ways of getting the input measures of 10,000 metrics in chains of 50 derived metrics."""
+    chain_count = 200
+    chain_depth = 50
+    metrics = []
+    for chain_index in range(chain_count):
+        metrics.append(_simple_metric(f"chain_{chain_index}_0"))
+        for depth in range(1, chain_depth):
+            metrics.append(
+                _derived_metric(
+                    f"chain_{chain_index}_{depth}", [f"chain_{chain_index}_{depth - 1}"], time_granularity="month"
+                )
+            )
+    semantic_manifest = _manifest(metrics)
+
+    start_time = time.perf_counter()
+    metric_index: Dict[MetricReference, Metric] = {
+        MetricReference(element_name=metric.name): metric for metric in semantic_manifest.metrics
+    }
+    expected_measures = [
+        PydanticMetric.all_input_measures_for_metric(metric=metric, metric_index=metric_index)
+        for metric in semantic_manifest.metrics
+    ]
+    logger.info(
+        f"Got the input measures of {len(metrics)} metrics using `PydanticMetric.all_input_measures_for_metric` in "
+        f"{time.perf_counter() - start_time:.3f}s"
+    )
+
+    start_time = time.perf_counter()
+    metric_graph = MetricGraph(semantic_manifest)
+    measures = [
+        metric_graph.transitive_input_measures(metric_reference) for metric_reference in metric_graph.metric_references
+    ]
+    logger.info(
+        f"Got the input measures of {len(metrics)} metrics using `MetricGraph` in "
+        f"{time.perf_counter() - start_time:.3f}s"
+    )
+    assert measures == expected_measures
+
+    start_time = time.perf_counter()
+    issues = MetricTimeGranularityRule.validate_manifest(semantic_manifest)
+    logger.info(f"Ran `MetricTimeGranularityRule` on {len(metrics)} metrics in {time.perf_counter() - start_time:.3f}s")
+    assert len(issues) == 0
+
+    start_time = time.perf_counter()
+    AddInputMetricMeasuresRule.transform_model(semantic_manifest)
+    logger.info(
+        f"Ran `AddInputMetricMeasuresRule` on {len(metrics)} metrics in {time.perf_counter() - start_time:.3f}s"
+    )
+    assert all(len(metric.type_params.input_measures) == 1 for metric in semantic_manifest.metrics)
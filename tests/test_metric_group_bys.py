@@ -0,0 +1,241 @@
+import logging
+import time
+from typing import List
+
+import pytest
+
+from dbt_semantic_interfaces.errors import MetricCycleError, MetricGraphError
+from dbt_semantic_interfaces.implementations.elements.dimension import (
+    PydanticDimension,
+    PydanticDimensionTypeParams,
+)
+from dbt_semantic_interfaces.implementations.elements.entity import PydanticEntity
+from dbt_semantic_interfaces.implementations.elements.measure import PydanticMeasure
+from dbt_semantic_interfaces.implementations.metric import (
+    PydanticCumulativeTypeParams,
+    PydanticMetric,
+    PydanticMetricInput,
+    PydanticMetricInputMeasure,
+    PydanticMetricTypeParams,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.implementations.semantic_model import PydanticSemanticModel
+from dbt_semantic_interfaces.metric_group_bys import MetricGroupByIndex
+from dbt_semantic_interfaces.references import (
+    DimensionReference,
+    EntityReference,
+    MetricReference,
+    SemanticModelReference,
+    TimeDimensionReference,
+)
+from dbt_semantic_interfaces.test_helpers.synthetic_manifest import (
+    SyntheticManifestConfig,
+    SyntheticManifestGenerator,
+)
+from dbt_semantic_interfaces.test_utils import (
+    metric_with_guaranteed_meta,
+    semantic_model_with_guaranteed_meta,
+)
+from dbt_semantic_interfaces.type_enums import (
+    AggregationType,
+    DimensionType,
+    EntityType,
+    MetricType,
+    TimeGranularity,
+)
+from tests.example_project_configuration import EXAMPLE_PROJECT_CONFIGURATION
+
+logger = logging.getLogger(__name__)
+
+
+def test_simple_metric_group_bys(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    index = MetricGroupByIndex(simple_semantic_manifest)
+    bookings = MetricReference(element_name="bookings")
+
+    group_bys = {group_by.dundered_name: group_by for group_by in index.group_bys_for_metric(bookings)}
+    assert group_bys["booking__is_instant"].element_reference == DimensionReference(element_name="is_instant")
+    assert group_bys["booking__is_instant"].time_granularity_names == ()
+    assert group_bys["listing__user__home_state_latest"].entity_path == (
+        EntityReference(element_name="listing"),
+        EntityReference(element_name="user"),
+    )
+    assert group_bys["listing"].element_reference == EntityReference(element_name="listing")
+    # Custom granularities are included for time dimensions defined at or below the granularity of the time spine.
+    assert group_bys["metric_time"].element_reference == TimeDimensionReference(element_name="metric_time")
+    assert group_bys["metric_time"].time_granularity_names == ("day", "week", "month", "quarter", "year", "martian_day")
+
+    group_by_names = index.group_by_names_for_metric(bookings)
+    assert {"listing__capacity_latest", "metric_time__martian_day", "booking__ds__month"} <= group_by_names
+    assert "metric_time__hour" not in group_by_names
+    assert set(index.group_bys_for_semantic_model(SemanticModelReference(semantic_model_name="bookings_source"))) == {
+        group_by for group_by in group_bys.values() if group_by.dundered_name != "metric_time"
+    }
+
+    # Results are cached.
+    assert index.group_bys_for_metric(bookings) is index.group_bys_for_metric(bookings)
+
+
+def test_derived_metric_group_bys(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Checks that derived and ratio metrics can only be grouped by the items that their inputs have in common."""
+    index = MetricGroupByIndex(simple_semantic_manifest)
+
+    checked_metric_count = 0
+    for metric in simple_semantic_manifest.metrics:
+        if metric.type is not MetricType.DERIVED and metric.type is not MetricType.RATIO:
+            continue
+        expected_names = frozenset.intersection(
+            *(index.group_by_names_for_metric(input_metric.as_reference) for input_metric in metric.input_metrics)
+        )
+        assert index.group_by_names_for_metric(MetricReference(element_name=metric.name)) == expected_names
+        checked_metric_count += 1
+    assert checked_metric_count > 0
+
+    group_bys = index.group_bys_for_metric(MetricReference(element_name="monthly_times_yearly_bookings"))
+    metric_time = next(group_by for group_by in group_bys if group_by.dundered_name == "metric_time")
+    assert metric_time.time_granularity_names == ("year",)
+
+    all_metric_group_bys = index.group_bys_for_all_metrics()
+    assert len(all_metric_group_bys) == len(simple_semantic_manifest.metrics)
+
+
+def test_cumulative_metric_with_input_metric_group_bys(  # noqa: D
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    semantic_manifest = simple_semantic_manifest.copy(deep=True)
+    semantic_manifest.metrics.append(
+        metric_with_guaranteed_meta(
+            name="cumulative_bookings_from_metric",
+            type=MetricType.CUMULATIVE,
+            type_params=PydanticMetricTypeParams(
+                cumulative_type_params=PydanticCumulativeTypeParams(
+                    window=None, grain_to_date="month", metric=PydanticMetricInput(name="bookings")
+                ),
+            ),
+        )
+    )
+    index = MetricGroupByIndex(semantic_manifest)
+    group_by_names = index.group_by_names_for_metric(MetricReference(element_name="cumulative_bookings_from_metric"))
+    assert "metric_time__month" in group_by_names
+    assert group_by_names == index.group_by_names_for_metric(MetricReference(element_name="bookings"))
+
+
+@pytest.mark.parametrize("apply_transformations", [False, True])
+def test_synthetic_cumulative_metric_group_bys(apply_transformations: bool) -> None:  # noqa: D
+    generator = SyntheticManifestGenerator(SyntheticManifestConfig.with_object_count(100, 0))
+    semantic_manifest = generator.semantic_manifest(apply_transformations=apply_transformations)
+    index = MetricGroupByIndex(semantic_manifest)
+    cumulative_metrics = [metric for metric in semantic_manifest.metrics if metric.type is MetricType.CUMULATIVE]
+    assert len(cumulative_metrics) > 0
+    for metric in cumulative_metrics:
+        assert "metric_time" in index.group_by_names_for_metric(MetricReference(element_name=metric.name))
+
+
+def test_metric_group_by_errors() -> None:  # noqa: D
+    semantic_manifest = PydanticSemanticManifest(
+        semantic_models=[],
+        metrics=[
+            metric_with_guaranteed_meta(
+                name=name,
+                type=MetricType.DERIVED,
+                type_params=PydanticMetricTypeParams(
+                    expr=input_metric_name, metrics=[PydanticMetricInput(name=input_metric_name)]
+                ),
+            )
+            for name, input_metric_name in (("a", "b"), ("b", "a"), ("c", "missing"))
+        ],
+        project_configuration=EXAMPLE_PROJECT_CONFIGURATION,
+    )
+    index = MetricGroupByIndex(semantic_manifest)
+    with pytest.raises(MetricCycleError):
+        index.group_bys_for_metric(MetricReference(element_name="a"))
+    with pytest.raises(MetricGraphError, match="Could not find input metric 'missing'"):
+        index.group_bys_for_metric(MetricReference(element_name="c"))
+    with pytest.raises(MetricGraphError, match="does not exist"):
+        index.group_bys_for_metric(MetricReference(element_name="missing"))
+    assert index.group_bys_for_all_metrics() == {}
+
+
+def _benchmark_semantic_model(model_index: int, semantic_model_count: int) -> PydanticSemanticModel:
+    """A semantic model that can be joined to the next two semantic models."""
+    return semantic_model_with_guaranteed_meta(
+        name=f"semantic_model_{model_index}",
+        entities=[PydanticEntity(name=f"entity_{model_index}", type=EntityType.PRIMARY)]
+        + [
+            PydanticEntity(name=f"entity_{(model_index + offset) % semantic_model_count}", type=EntityType.FOREIGN)
+            for offset in (1, 2)
+        ],
+        measures=[PydanticMeasure(name=f"measure_{model_index}", agg=AggregationType.SUM, agg_time_dimension="ds")],
+        dimensions=[
+            PydanticDimension(
+                name="ds",
+                type=DimensionType.TIME,
+                type_params=PydanticDimensionTypeParams(time_granularity=TimeGranularity.DAY),
+            )
+        ]
+        + [
+            PydanticDimension(name=f"dimension_{model_index}_{dimension_index}", type=DimensionType.CATEGORICAL)
+            for dimension_index in range(4)
+        ],
+    )
+
+
+def test_metric_group_bys_benchmark() -> None:
+    """Times computing the group-by items of all metrics in a manifest with 1,000 semantic models."""
+    semantic_model_count = 1000
+    metrics: List[PydanticMetric] = []
+    for model_index in range(semantic_model_count):
+        metrics.append(
+            metric_with_guaranteed_meta(
+                name=f"simple_{model_index}",
+                type=MetricType.SIMPLE,
+                type_params=PydanticMetricTypeParams(measure=PydanticMetricInputMeasure(name=f"measure_{model_index}")),
+            )
+        )
+        input_metric_names = [f"simple_{model_index}", f"simple_{(model_index + 1) % semantic_model_count}"]
+        metrics.append(
+            metric_with_guaranteed_meta(
+                name=f"derived_{model_index}",
+                type=MetricType.DERIVED,
+                type_params=PydanticMetricTypeParams(
+                    expr=" + ".join(input_metric_names),
+                    metrics=[PydanticMetricInput(name=input_metric_name) for input_metric_name in input_metric_names],
+                ),
+            )
+        )
+    semantic_manifest = PydanticSemanticManifest(
+        semantic_models=[
+            _benchmark_semantic_model(model_index, semantic_model_count) for model_index in range(semantic_model_count)
+        ],
+        metrics=metrics,
+        project_configuration=EXAMPLE_PROJECT_CONFIGURATION,
+    )
+
+    start_time = time.perf_counter()
+    index = MetricGroupByIndex(semantic_manifest)
+    all_metric_group_bys = index.group_bys_for_all_metrics()
+    group_by_count = sum(len(group_bys) for group_bys in all_metric_group_bys.values())
+    logger.info(
+        f"Got {group_by_count} group-by items for {len(metrics)} metrics on {semantic_model_count} semantic models "
+        f"using a shared `MetricGroupByIndex` in {time.perf_counter() - start_time:.3f}s"
+    )
+    assert len(all_metric_group_bys) == len(metrics)
+
+    # Without sharing the memoized traversal, each metric repeats the work for its semantic models and input metrics.
+    sampled_metric_references = [MetricReference(element_name=metric.name) for metric in metrics[:20]]
+    start_time = time.perf_counter()
+    for metric_reference in sampled_metric_references:
+        assert (
+            MetricGroupByIndex(semantic_manifest).group_bys_for_metric(metric_reference)
+            == all_metric_group_bys[metric_reference]
+        )
+    logger.info(
+        f"Got the group-by items for {len(sampled_metric_references)} metrics using a new `MetricGroupByIndex` for "
+        f"each metric in {time.perf_counter() - start_time:.3f}s"
+    )
+
+    derived_0_names = index.group_by_names_for_metric(MetricReference(element_name="derived_0"))
+    assert "entity_1__dimension_1_0" in derived_0_names
+    assert "entity_0__dimension_0_0" not in derived_0_names
+    assert "metric_time__day" in derived_0_names
@@ -0,0 +1,111 @@
+import os
+import subprocess
+import sys
+import textwrap
+from typing import List, Optional
+
+import pytest
+
+import dsi_pydantic_shim
+from dbt_semantic_interfaces.implementations.base import (
+    FrozenBaseModel,
+    HashableBaseModel,
+)
+from dbt_semantic_interfaces.implementations.export import PydanticExportConfig
+from dbt_semantic_interfaces.implementations.metric import PydanticMetricInputMeasure
+from dbt_semantic_interfaces.implementations.node_relation import PydanticNodeRelation
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dsi_pydantic_shim import Field
+
+# These tests should pass with either backend. Set `DSI_PYDANTIC_BACKEND` to run the test suite with a given backend.
+
+
+class _ExampleModel(HashableBaseModel):
+    name: str
+    description: Optional[str]
+    tags: List[str] = Field(default_factory=list)
+
+
+class _ExampleFrozenModel(FrozenBaseModel):
+    name: str
+
+
+def test_backend_matches_environment() -> None:  # noqa: D
+    assert (
+        dsi_pydantic_shim.pydantic_backend
+        == os.environ.get(dsi_pydantic_shim.PYDANTIC_BACKEND_ENV_VAR_NAME, "v1").lower()
+    )
+
+
+def test_optional_fields_default_to_none() -> None:  # noqa: D
+    assert _ExampleModel(name="example") == _ExampleModel(name="example", description=None, tags=[])
+
+
+def test_v1_style_api(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    serialized = simple_semantic_manifest.json()
+
+    assert PydanticSemanticManifest.parse_raw(serialized) == simple_semantic_manifest
+    assert PydanticSemanticManifest.parse_obj(simple_semantic_manifest.dict()) == simple_semantic_manifest
+    assert simple_semantic_manifest.copy(deep=True) == simple_semantic_manifest
+    assert hash(simple_semantic_manifest.copy(deep=True)) == hash(simple_semantic_manifest)
+    assert _ExampleModel(name="example").json() == '{"name": "example", "description": null, "tags": []}'
+    assert _ExampleModel(name="example").json(sort_keys=True, exclude_none=True) == '{"name": "example", "tags": []}'
+
+
+def test_frozen_model() -> None:  # noqa: D
+    model = _ExampleFrozenModel(name="example")
+    with pytest.raises(Exception):
+        model.name = "other"  # type: ignore[misc]
+
+
+def test_validators() -> None:  # noqa: D
+    # `validator(always=True)` runs for default values.
+    assert PydanticNodeRelation(alias="table", schema_name="schema").relation_name == "schema.table"
+    # Aliased fields can be populated by name or alias.
+    assert PydanticExportConfig.parse_obj({"export_as": "table", "schema": "a"}).schema_name == "a"
+    assert PydanticExportConfig.parse_obj({"export_as": "table", "schema_name": "a"}).schema_name == "a"
+    # Custom input parsing applies to fields.
+    where_filter = PydanticMetricInputMeasure.parse_obj({"name": "measure", "filter": "{{ Dimension('a__b') }} > 1"})
+    assert where_filter.filter is not None
+    assert where_filter.filter.where_filters[0].where_sql_template == "{{ Dimension('a__b') }} > 1"
+
+
+@pytest.mark.skipif(dsi_pydantic_shim.pydantic_major != "2", reason="The native backend requires Pydantic 2")
+def test_backends_produce_the_same_json() -> None:
+    """Checks that the JSON for a parsed and validated manifest is the same with either backend."""
+    script = textwrap.dedent(
+        """
+        import os
+
+        from dbt_semantic_interfaces.parsing.dir_to_model import parse_directory_of_yaml_files_to_semantic_manifest
+        from dbt_semantic_interfaces.validations.semantic_manifest_validator import SemanticManifestValidator
+
+        semantic_manifest = parse_directory_of_yaml_files_to_semantic_manifest(
+            os.path.join("tests", "fixtures", "semantic_manifest_yamls", "simple_semantic_manifest"),
+            template_mapping={"source_schema": "source_schema"},
+        ).semantic_manifest
+        print(semantic_manifest.json())
+        print(SemanticManifestValidator().validate_semantic_manifest(semantic_manifest).json())
+        """
+    )
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    outputs = []
+    for backend in ("v1", "v2"):
+        environment = dict(os.environ)
+        environment[dsi_pydantic_shim.PYDANTIC_BACKEND_ENV_VAR_NAME] = backend
+        # Some collections are ordered by hash, so use a fixed seed to make the output comparable.
+        environment["PYTHONHASHSEED"] = "0"
+        outputs.append(
+            subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=repo_root,
+                env=environment,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+
+    assert outputs[0] == outputs[1]
@@ -0,0 +1,64 @@
+import copy
+from typing import Dict
+
+import pytest
+
+from dbt_semantic_interfaces.errors import ModelTransformError
+from dbt_semantic_interfaces.implementations.metric import (
+    PydanticMetric,
+    PydanticMetricInput,
+    PydanticMetricTypeParams,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.protocols import Metric
+from dbt_semantic_interfaces.references import MetricReference
+from dbt_semantic_interfaces.transformations.add_input_metric_measures import (
+    AddInputMetricMeasuresRule,
+)
+from dbt_semantic_interfaces.type_enums import MetricType
+
+
+def _derived_metric(name: str, input_metric_name: str) -> PydanticMetric:
+    return PydanticMetric(
+        name=name,
+        type=MetricType.DERIVED,
+        type_params=PydanticMetricTypeParams(
+            expr=input_metric_name, metrics=[PydanticMetricInput(name=input_metric_name)]
+        ),
+    )
+
+
+def test_input_measures_match_metric(simple_semantic_manifest: PydanticSemanticManifest) -> None:
+    """Checks that the added measures are the same as the ones from `PydanticMetric.all_input_measures_for_metric`."""
+    manifest = copy.deepcopy(simple_semantic_manifest)
+    for metric in manifest.metrics:
+        metric.type_params.input_measures = []
+    transformed_manifest = AddInputMetricMeasuresRule.transform_model(manifest)
+
+    metric_index: Dict[MetricReference, Metric] = {
+        MetricReference(element_name=metric.name): metric for metric in transformed_manifest.metrics
+    }
+    for metric in transformed_manifest.metrics:
+        try:
+            expected_measures = PydanticMetric.all_input_measures_for_metric(metric=metric, metric_index=metric_index)
+        except AssertionError:
+            continue
+        assert set(metric.measure_references) == expected_measures
+
+
+def test_missing_input_metric(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    manifest = copy.deepcopy(simple_semantic_manifest)
+    manifest.metrics.append(_derived_metric("derived_metric_with_missing_input", "missing_metric"))
+    with pytest.raises(
+        ModelTransformError, match="Metric 'missing_metric' is not configured as a metric in the model."
+    ):
+        AddInputMetricMeasuresRule.transform_model(manifest)
+
+
+def test_input_metric_cycle(simple_semantic_manifest: PydanticSemanticManifest) -> None:  # noqa: D
+    manifest = copy.deepcopy(simple_semantic_manifest)
+    manifest.metrics.extend([_derived_metric("cycle_a", "cycle_b"), _derived_metric("cycle_b", "cycle_a")])
+    with pytest.raises(ModelTransformError, match="'cycle_a' -> 'cycle_b' -> 'cycle_a'"):
+        AddInputMetricMeasuresRule.transform_model(manifest)
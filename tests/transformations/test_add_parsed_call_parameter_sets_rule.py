@@ -0,0 +1,132 @@
+import copy
+import json
+
+from dbt_semantic_interfaces.implementations.filters.where_filter import (
+    PydanticParsedCallParameterSets,
+    PydanticWhereFilter,
+    PydanticWhereFilterIntersection,
+)
+from dbt_semantic_interfaces.implementations.semantic_manifest import (
+    PydanticSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
+    JinjaObjectParser,
+    QueryItemLocation,
+)
+from dbt_semantic_interfaces.parsing.where_filter.where_filter_batch_parser import (
+    WhereFilterBatchParser,
+)
+from dbt_semantic_interfaces.transformations.add_parsed_call_parameter_sets import (
+    AddParsedCallParameterSetsRule,
+)
+from dbt_semantic_interfaces.transformations.pydantic_rule_set import (
+    PydanticSemanticManifestTransformRuleSet,
+)
+from dbt_semantic_interfaces.transformations.semantic_manifest_transformer import (
+    PydanticSemanticManifestTransformer,
+)
+from dbt_semantic_interfaces.type_enums import TimeGranularity
+
+_CUSTOM_GRANULARITY_NAMES = ("martian_day",)
+
+
+def test_parsed_call_parameter_sets_are_used_after_deserialization(  # noqa: D
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    transformed_manifest = PydanticSemanticManifestTransformer.transform(
+        simple_semantic_manifest,
+        ordered_rule_sequences=(
+            *PydanticSemanticManifestTransformRuleSet().all_rules,
+            (AddParsedCallParameterSetsRule(),),
+        ),
+    )
+    deserialized_manifest = PydanticSemanticManifest.parse_raw(transformed_manifest.json())
+    assert deserialized_manifest == transformed_manifest
+
+    where_filters = [
+        where_filter
+        for _, where_filter_intersection in WhereFilterBatchParser.collect_call_sites(deserialized_manifest)
+        for where_filter in where_filter_intersection.where_filters
+    ]
+    assert len(where_filters) > 0
+
+    JinjaObjectParser.clear_call_parameter_sets_cache()
+    for where_filter in where_filters:
+        assert isinstance(where_filter, PydanticWhereFilter)
+        assert where_filter.parsed_call_parameter_sets is not None
+        assert where_filter.call_parameter_sets(
+            _CUSTOM_GRANULARITY_NAMES
+        ) == JinjaObjectParser._parse_call_parameter_sets(
+            where_sql_template=where_filter.where_sql_template,
+            custom_granularity_names=_CUSTOM_GRANULARITY_NAMES,
+            query_item_location=QueryItemLocation.NON_ORDER_BY,
+        )
+        # Including the standard granularities in the names shouldn't make a difference.
+        where_filter.call_parameter_sets([granularity.value for granularity in TimeGranularity] + ["martian_day"])
+
+    # None of the templates should have been parsed.
+    assert JinjaObjectParser.call_parameter_sets_cache_stats().misses == 0
+
+
+def test_invalid_filters_are_not_changed(  # noqa: D
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    manifest = copy.deepcopy(simple_semantic_manifest)
+    manifest.metrics[0].filter = PydanticWhereFilterIntersection(
+        where_filters=[PydanticWhereFilter(where_sql_template="{{ invalid_jinja }}")]
+    )
+    transformed_manifest = AddParsedCallParameterSetsRule.transform_model(manifest)
+    assert transformed_manifest.metrics[0].filter is not None
+    assert transformed_manifest.metrics[0].filter.where_filters[0].parsed_call_parameter_sets is None
+
+
+def _create_where_filter(where_sql_template: str) -> PydanticWhereFilter:
+    return PydanticWhereFilter(
+        where_sql_template=where_sql_template,
+        parsed_call_parameter_sets=PydanticParsedCallParameterSets.create(
+            where_sql_template=where_sql_template,
+            custom_granularity_names=_CUSTOM_GRANULARITY_NAMES,
+            call_parameter_sets=JinjaObjectParser.parse_call_parameter_sets(
+                where_sql_template=where_sql_template,
+                custom_granularity_names=_CUSTOM_GRANULARITY_NAMES,
+                query_item_location=QueryItemLocation.NON_ORDER_BY,
+            ),
+        ),
+    )
+
+
+def test_parsed_call_parameter_sets_are_not_used_when_inputs_differ() -> None:  # noqa: D
+    where_filter = _create_where_filter("{{ TimeDimension('metric_time__martian_day') }} > '2020-01-01'")
+    parsed_call_parameter_sets = where_filter.parsed_call_parameter_sets
+    assert parsed_call_parameter_sets is not None
+
+    assert parsed_call_parameter_sets.matches(where_filter.where_sql_template, ["day", "martian_day"])
+    # Different custom granularities can change the result.
+    assert not parsed_call_parameter_sets.matches(where_filter.where_sql_template, [])
+    # The template can be changed, e.g. via `copy()`.
+    assert not parsed_call_parameter_sets.matches("{{ Entity('listing') }}", _CUSTOM_GRANULARITY_NAMES)
+    # Values from a different version of the format should be ignored.
+    assert not parsed_call_parameter_sets.copy(update={"version": 0}).matches(
+        where_filter.where_sql_template, _CUSTOM_GRANULARITY_NAMES
+    )
+
+    call_parameter_sets = where_filter.call_parameter_sets(custom_granularity_names=())
+    assert call_parameter_sets.time_dimension_call_parameter_sets[0].time_granularity_name is None
+    assert call_parameter_sets != where_filter.call_parameter_sets(custom_granularity_names=_CUSTOM_GRANULARITY_NAMES)
+
+    copied_filter = where_filter.copy(update={"where_sql_template": "{{ Entity('listing') }}"})
+    assert len(copied_filter.call_parameter_sets(_CUSTOM_GRANULARITY_NAMES).entity_call_parameter_sets) == 1
+
+
+def test_unset_parsed_call_parameter_sets_are_not_serialized() -> None:  # noqa: D
+    where_filter = PydanticWhereFilter(where_sql_template="{{ Entity('listing') }}")
+    assert json.loads(where_filter.json()) == {"where_sql_template": "{{ Entity('listing') }}"}
+    assert where_filter.dict(exclude={"where_sql_template"}) == {}
+
+    where_filter_intersection = PydanticWhereFilterIntersection(
+        where_filters=[where_filter, _create_where_filter(where_filter.where_sql_template)]
+    )
+    serialized_where_filters = json.loads(where_filter_intersection.json())["where_filters"]
+    assert serialized_where_filters[0] == {"where_sql_template": "{{ Entity('listing') }}"}
+    assert serialized_where_filters[1]["parsed_call_parameter_sets"]["version"] == 1
+    assert PydanticWhereFilterIntersection.parse_raw(where_filter_intersection.json()) == where_filter_intersection
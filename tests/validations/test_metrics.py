@@ -1527,3 +1527,58 @@ def test_simple_metric_with_expr_generates_warning() -> None:
         error_substrings=["should not have an expr set if it's proxy from measures"],
         issues=validation_results.all_issues,
     )
+
+
+def test_input_metric_cycles() -> None:
+    """Test that cycles of input metrics are reported instead of causing infinite recursion."""
+    measure_name = "foo"
+    model_validator = SemanticManifestValidator[PydanticSemanticManifest](
+        [DerivedMetricRule(), MetricTimeGranularityRule()]
+    )
+    validation_results = model_validator.validate_semantic_manifest(
+        PydanticSemanticManifest(
+            semantic_models=[
+                semantic_model_with_guaranteed_meta(
+                    name="sum_measure",
+                    measures=[PydanticMeasure(name=measure_name, agg=AggregationType.SUM, agg_time_dimension="ds")],
+                    dimensions=[
+                        PydanticDimension(
+                            name="ds",
+                            type=DimensionType.TIME,
+                            type_params=PydanticDimensionTypeParams(time_granularity=TimeGranularity.DAY),
+                        ),
+                    ],
+                ),
+            ],
+            metrics=[
+                metric_with_guaranteed_meta(
+                    name="simple_metric",
+                    type=MetricType.SIMPLE,
+                    type_params=PydanticMetricTypeParams(measure=PydanticMetricInputMeasure(name=measure_name)),
+                ),
+                metric_with_guaranteed_meta(
+                    name="cycle_a",
+                    type=MetricType.DERIVED,
+                    type_params=PydanticMetricTypeParams(
+                        expr="cycle_b + simple_metric",
+                        metrics=[PydanticMetricInput(name="cycle_b"), PydanticMetricInput(name="simple_metric")],
+                    ),
+                    time_granularity=TimeGranularity.MONTH.value,
+                ),
+                metric_with_guaranteed_meta(
+                    name="cycle_b",
+                    type=MetricType.DERIVED,
+                    type_params=PydanticMetricTypeParams(expr="cycle_a", metrics=[PydanticMetricInput(name="cycle_a")]),
+                ),
+            ],
+            project_configuration=EXAMPLE_PROJECT_CONFIGURATION,
+        )
+    )
+
+    build_issues = validation_results.all_issues
+    assert len(build_issues) == 2
+    expected_substrings = [
+        "Metric 'cycle_a' depends on itself through its input metrics: 'cycle_a' -> 'cycle_b' -> 'cycle_a'.",
+        "Unable to validate `time_granularity` for metric 'cycle_a'",
+    ]
+    check_error_in_issues(error_substrings=expected_substrings, issues=build_issues)
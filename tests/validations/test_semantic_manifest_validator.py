@@ -67,3 +67,18 @@ def test_multi_process_validator_results_same_as_sync(  # noqa:D
     assert default_results.has_blocking_issues
     assert multi_process_results.has_blocking_issues
     assert default_results.all_issues == multi_process_results.all_issues
+
+
+def test_fail_fast_stops_after_first_rule_with_errors(  # noqa:D
+    simple_semantic_manifest: PydanticSemanticManifest,
+) -> None:
+    semantic_manifest = deepcopy(simple_semantic_manifest)
+    semantic_manifest.metrics = []
+    semantic_manifest.semantic_models = []
+
+    validator = SemanticManifestValidator[PydanticSemanticManifest]()
+    results = validator.validate_semantic_manifest(semantic_manifest)
+    fail_fast_results = validator.validate_semantic_manifest(semantic_manifest, fail_fast=True)
+    assert fail_fast_results.has_blocking_issues
+    assert len(fail_fast_results.all_issues) < len(results.all_issues)
+    assert all(error in results.errors for error in fail_fast_results.errors)
@@ -3,6 +3,10 @@ import logging
 
 import pytest
 
+from dbt_semantic_interfaces.call_parameter_sets import (
+    JinjaCallParameterSets,
+    TimeDimensionCallParameterSet,
+)
 from dbt_semantic_interfaces.implementations.filters.where_filter import (
     PydanticWhereFilter,
     PydanticWhereFilterIntersection,
@@ -14,12 +18,23 @@ from dbt_semantic_interfaces.implementations.saved_query import (
 from dbt_semantic_interfaces.implementations.semantic_manifest import (
     PydanticSemanticManifest,
 )
+from dbt_semantic_interfaces.implementations.slotted.semantic_manifest import (
+    SlottedSemanticManifest,
+)
+from dbt_semantic_interfaces.parsing.where_filter.jinja_object_parser import (
+    JinjaObjectParser,
+)
+from dbt_semantic_interfaces.references import TimeDimensionReference
 from dbt_semantic_interfaces.test_utils import (
+    check_expected_issues,
     check_no_errors_or_warnings,
     check_only_one_error_with_message,
     check_only_one_warning_with_message,
     find_metric_with,
 )
+from dbt_semantic_interfaces.transformations.add_parsed_call_parameter_sets import (
+    AddParsedCallParameterSetsRule,
+)
 from dbt_semantic_interfaces.validations.semantic_manifest_validator import (
     SemanticManifestValidator,
 )
@@ -285,6 +300,37 @@ def test_saved_query_where_filter_validations_invalid_granularity(  # noqa: D
     )
 
 
+def test_saved_query_with_multiple_invalid_granularities(  # noqa: D
+    simple_semantic_manifest__with_primary_transforms: PydanticSemanticManifest,
+) -> None:
+    manifest = copy.deepcopy(simple_semantic_manifest__with_primary_transforms)
+
+    manifest.saved_queries = [
+        PydanticSavedQuery(
+            name="Example Saved Query",
+            description="Example description.",
+            query_params=PydanticSavedQueryQueryParams(
+                metrics=["bookings"],
+                group_by=["Dimension('booking__is_instant')"],
+                where=PydanticWhereFilterIntersection(
+                    where_filters=[
+                        PydanticWhereFilter(where_sql_template="{{ TimeDimension('metric_time', 'cool') }}"),
+                        PydanticWhereFilter(where_sql_template="{{ TimeDimension('metric_time', 'cooler') }}"),
+                    ]
+                ),
+            ),
+        ),
+    ]
+
+    # Each filter should only be reported once.
+    manifest_validator = SemanticManifestValidator[PydanticSemanticManifest]([WhereFiltersAreParseable()])
+    check_expected_issues(
+        manifest_validator.validate_semantic_manifest(manifest),
+        num_expected_warnings=2,
+        expected_warning_msgs=["`cool` is not a valid granularity name", "`cooler` is not a valid granularity name"],
+    )
+
+
 def test_metric_filter_error(  # noqa: D
     simple_semantic_manifest__with_primary_transforms: PydanticSemanticManifest,
 ) -> None:
@@ -307,3 +353,44 @@ def test_metric_filter_error(  # noqa: D
         manifest_validator.validate_semantic_manifest(manifest),
         "An error occurred while trying to parse a filter in saved query",
     )
+
+
+# ------------------------------------------------------------------------------
+# Stored call parameter sets
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("use_slotted_manifest", [False, True])
+def test_stored_call_parameter_sets_are_used(  # noqa: D
+    simple_semantic_manifest__with_primary_transforms: PydanticSemanticManifest, use_slotted_manifest: bool
+) -> None:
+    manifest = AddParsedCallParameterSetsRule.transform_model(
+        copy.deepcopy(simple_semantic_manifest__with_primary_transforms)
+    )
+    # The filters are validated via `WhereFilter.call_parameter_sets`, which uses the stored values instead of parsing.
+    metric, _ = find_metric_with(manifest, lambda metric: metric.filter is not None)
+    assert metric.filter is not None
+    where_filter = metric.filter.where_filters[0]
+    assert where_filter.parsed_call_parameter_sets is not None
+    where_filter.parsed_call_parameter_sets.call_parameter_sets = JinjaCallParameterSets(
+        time_dimension_call_parameter_sets=(
+            TimeDimensionCallParameterSet(
+                entity_path=(),
+                time_dimension_reference=TimeDimensionReference(element_name="metric_time"),
+                time_granularity_name="cool",
+            ),
+        )
+    )
+
+    JinjaObjectParser.clear_call_parameter_sets_cache()
+    if use_slotted_manifest:
+        results = SemanticManifestValidator[SlottedSemanticManifest](
+            [WhereFiltersAreParseable()]
+        ).validate_semantic_manifest(SlottedSemanticManifest.from_protocol(manifest))
+    else:
+        results = SemanticManifestValidator[PydanticSemanticManifest](
+            [WhereFiltersAreParseable()]
+        ).validate_semantic_manifest(manifest)
+    check_only_one_warning_with_message(results, "`cool` is not a valid granularity name")
+    # None of the templates should have been parsed.
+    assert JinjaObjectParser.call_parameter_sets_cache_stats().misses == 0